@@ -0,0 +1,206 @@
+"""
+Benchmarks of the classification, the booking page parsing, the payload rendering and the state storage.
+
+Run `python benchmark.py -o results.json` to save the results, then `python benchmark.py -c results.json` to compare a
+new run with them: the benchmarks slower by more than the threshold are reported and the exit code is 1.
+The parsing is measured on the recorded booking page of `--page` and on a page generated with the requested count of
+options. `python benchmark.py --record-page URL` records the booking page of another reservation form URL to `--page`.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from functools import partial
+
+import premium_numbers
+import scraping
+from booking_queue import BookingQueue, applicant_fields
+from seen_numbers import SeenNumbersStore
+
+default_page = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'booking_page.html')
+
+
+def measure(function, repeat):
+    """
+    Run a function several times.
+    :return: the shortest duration in seconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def generate_numbers(count, seed=0):
+    generator = random.Random(seed)
+    codes = premium_numbers.operator_codes
+    return [generator.choice(codes) * 1000000 + generator.randrange(1000000) for _ in range(count)]
+
+
+def generate_booking_page(numbers):
+    options = '\n'.join(f'<option value="{index:04}|{number}">{number}</option>'
+                        for index, number in enumerate(numbers))
+    return ('<html><head><title>Online Reservation</title></head><body><form class="forms" method="post">'
+            '<input type="hidden" name="typ" value="1"><select name="CatReg"><option>MICRO</option></select>'
+            f'<select name="frmGSM" size="10">\n{options}\n</select></form>'
+            + '<div class="footer"><p>touch</p></div>' * 200 + '</body></html>')
+
+
+def record_booking_page(reservation_url, file_name):
+    async def get_page():
+        async with scraping.open_poll_session():
+            return await scraping.get_booking_page_content()
+
+    scraping.configure_url(reservation_url)
+    page = asyncio.run(get_page())
+    with open(file_name, 'w') as page_file:
+        page_file.write(page)
+
+
+def benchmark_classification(results, args):
+    # The batches smaller than lookup_tables_min_count, as the polled numbers, are classified with the predicates
+    # until the lookup tables are built, so they are measured first
+    premium_numbers.get_category_tables.cache_clear()
+    for size in args.sizes:
+        if size < premium_numbers.lookup_tables_min_count:
+            results[f'classification.total.predicates.{size}'] = measure(
+                partial(premium_numbers.get_premium_numbers, generate_numbers(size)), args.repeat
+            )
+    results['classification.build_tables'] = measure(
+        lambda: (premium_numbers.get_category_tables.cache_clear(), premium_numbers.get_category_tables()), 1
+    )
+    for size in args.sizes:
+        numbers = generate_numbers(size)
+        results[f'classification.total.tables.{size}'] = measure(
+            partial(premium_numbers.get_premium_numbers, numbers), args.repeat
+        )
+        try:
+            import numpy as np
+        except ImportError:
+            continue
+        numbers_array = np.array(numbers, dtype=np.int64)
+        results[f'classification.numpy.{size}'] = measure(
+            partial(premium_numbers.get_premium_number_indices, numbers_array), args.repeat
+        )
+    numbers_str = list(map(str, generate_numbers(args.category_size)))
+    for category in premium_numbers.categories:
+        results[f'classification.category.{category}.{args.category_size}'] = measure(
+            lambda: [premium_numbers.get_category_mask(number_str, (category,)) for number_str in numbers_str],
+            args.repeat
+        )
+
+
+def benchmark_parsing(results, args):
+    with open(args.page) as page_file:
+        pages = {'recorded': page_file.read()}
+    pages[f'generated.{args.page_options}'] = generate_booking_page(generate_numbers(args.page_options))
+    for name, page in pages.items():
+        numbers, _ = scraping.get_gsm_options(page)
+        results[f'parsing.{name}.get_gsm_options'] = measure(partial(scraping.get_gsm_options, page), args.repeat)
+        results[f'parsing.{name}.get_selected_gsm'] = measure(
+            partial(scraping.get_selected_gsm, page, numbers[-1] if numbers else 0), args.repeat
+        )
+        results[f'parsing.{name}.frm_gsm_select'] = measure(partial(scraping.frm_gsm_re.search, page), args.repeat)
+
+
+def benchmark_payloads(results, args):
+    count = 1000
+    results[f'payloads.booking_info.{count}'] = measure(lambda: [scraping.booking_info_template.render(
+        first_name=scraping.quote_bytes(f'First {index}'), father_name=scraping.quote_bytes('Father'),
+        last_name=scraping.quote_bytes('Last'), mother_name=scraping.quote_bytes('Mother'), birth_day='1',
+        birth_month='1', birth_year='1990', id=str(index), gsm=scraping.quote_bytes('1234|71123456'), ref_code='961',
+        ref_number='3123456', id_type='C', category=b'MICRO'
+    ) for index in range(count)], args.repeat)
+    results[f'payloads.gsm_booking.{count}'] = measure(lambda: [scraping.gsm_booking_template.render(
+        gsm=scraping.quote_bytes('1234|71123456'), id=str(index), id_type='C', category=b'MICRO'
+    ) for index in range(count)], args.repeat)
+    results[f'payloads.booking_confirmation.{count}'] = measure(lambda: [scraping.booking_confirmation_template.render(
+        confirmation_code=str(index), gsm=scraping.quote_bytes('1234|71123456')
+    ) for index in range(count)], args.repeat)
+
+
+def benchmark_state(results, args):
+    count = args.state_size
+    numbers = generate_numbers(count)
+    applicants = [{field: f'{field}{index}' for field in applicant_fields} for index in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        seen_numbers = SeenNumbersStore(os.path.join(directory, 'seen_numbers.bits'))
+        results[f'state.seen_numbers.add_new.{count}'] = measure(partial(seen_numbers.add_new, numbers), 1)
+        results[f'state.seen_numbers.contains.{count}'] = measure(
+            lambda: [number in seen_numbers for number in numbers], args.repeat
+        )
+        json_file_name = os.path.join(directory, 'old_numbers.json')
+        results['state.seen_numbers.export_json'] = measure(partial(seen_numbers.export_json, json_file_name), 1)
+        results['state.seen_numbers.import_json'] = measure(partial(seen_numbers.import_json, json_file_name), 1)
+        seen_numbers.close()
+        booking_queue = BookingQueue(os.path.join(directory, 'booking_queue.sqlite3'))
+        results[f'state.booking_queue.add_applicants.{count}'] = measure(
+            partial(booking_queue.add_applicants, applicants), 1
+        )
+        booking_queue.add_premium_numbers(numbers[:100])
+        results['state.booking_queue.claim_and_book.100'] = measure(
+            lambda: [booking_queue.mark_booked(number, applicant['id'])
+                     for number, applicant in iter(booking_queue.claim_booking, None)], 1
+        )
+        csv_file_name = os.path.join(directory, 'numbers_to_book.csv')
+        results['state.booking_queue.export_applicants_csv'] = measure(
+            partial(booking_queue.export_applicants_csv, csv_file_name), args.repeat
+        )
+        results['state.booking_queue.import_applicants_csv'] = measure(
+            partial(booking_queue.import_applicants_csv, csv_file_name), args.repeat
+        )
+
+
+def compare(results, previous_results, threshold):
+    """
+    Find the regressions between two runs.
+    :return: the (name, previous duration, duration) triplets of the benchmarks slower by more than the threshold.
+    """
+    return [(name, previous_results[name], duration) for name, duration in results.items()
+            if name in previous_results and duration > previous_results[name] * (1 + threshold)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the numbers processing')
+    parser.add_argument('--sizes', type=lambda sizes: [int(size) for size in sizes.split(',')],
+                        default=[1000, 10000, 100000, 1000000],
+                        help='Comma separated counts of numbers to classify, up to 10000000')
+    parser.add_argument('--category-size', type=int, default=10000,
+                        help='Count of numbers checked against each category separately')
+    parser.add_argument('--page', type=str, default=default_page, help='Recorded booking page HTML file')
+    parser.add_argument('--record-page', type=str, metavar='URL',
+                        help='Online reservation form URL whose booking page is recorded to the --page file, before '
+                             'exiting')
+    parser.add_argument('--page-options', type=int, default=500, help='Count of options of the generated page')
+    parser.add_argument('--state-size', type=int, default=10000, help='Count of numbers and applicants stored')
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='Count of runs of each benchmark')
+    parser.add_argument('--output', '-o', type=str, help='JSON file to save the results to')
+    parser.add_argument('--compare', '-c', type=str, help='JSON file of previous results to compare with')
+    parser.add_argument('--threshold', '-t', type=float, default=0.1,
+                        help='Slowdown ratio from which a benchmark is reported as a regression')
+    args = parser.parse_args()
+    if args.record_page:
+        record_booking_page(args.record_page, args.page)
+        sys.exit()
+    results = {}
+    for benchmark in (benchmark_classification, benchmark_parsing, benchmark_payloads, benchmark_state):
+        benchmark(results, args)
+    for name, duration in results.items():
+        print(f'{name}: {duration * 1000:.3f} ms')
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({'python': sys.version, 'platform': platform.platform(), 'time': time.time(),
+                       'results': results}, output_file, indent=4)
+    if args.compare:
+        with open(args.compare) as previous_file:
+            regressions = compare(results, json.load(previous_file)['results'], args.threshold)
+        for name, previous_duration, duration in regressions:
+            print(f'Regression: {name}: {previous_duration * 1000:.3f} ms -> {duration * 1000:.3f} ms')
+        sys.exit(1 if regressions else 0)
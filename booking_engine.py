@@ -0,0 +1,556 @@
+"""
+The long-running mode of touch_lb_numbers.py: poll the booking page, record and notify the new numbers and book the
+premium ones. It is only imported when polling, so the offline modes do not load the network and bot libraries.
+"""
+import asyncio
+import csv
+import io
+import math
+import os
+import platform
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import chain
+from logging import getLogger
+from threading import Lock
+
+import aiohttp
+from telebot import TeleBot, apihelper
+from telebot.util import smart_split
+
+import metrics
+from scraping import (get_availability_snapshot, merge_snapshots, do_number_booking, configure_connection_pool,
+                      configure_url, configure_timeouts, open_poll_session, get_booking_page_request_count)
+from premium_numbers import get_premium_numbers, get_excluded_abc_only
+from poll_scheduler import PollScheduler
+from seen_numbers import SeenNumbersStore
+from booking_queue import BookingQueue, applicant_fields
+from telegram_outbox import TelegramOutbox
+from watchlist import Watchlist
+
+logger = getLogger(__name__)
+
+source_csv_fieldnames = list(applicant_fields)
+
+destination_csv_fieldnames = ['booked_number'] + source_csv_fieldnames
+
+lock = Lock()
+
+
+def save_booked_info(file_name, id, first_name, last_name, father_name, mother_name, ref_number, birth_day,
+                     birth_month, birth_year, confirmation_code, booked_number, id_type):
+    row = io.StringIO()
+    writer = csv.DictWriter(
+        row,
+        fieldnames=destination_csv_fieldnames
+    )
+    writer.writerow({
+        'booked_number': booked_number, 'id': id, 'first_name': first_name, 'last_name': last_name,
+        'father_name': father_name, 'mother_name': mother_name, 'ref_number': ref_number,
+        'birth_day': birth_day, 'birth_month': birth_month, 'birth_year': birth_year,
+        'confirmation_code': confirmation_code, 'id_type': id_type
+    })
+    # The row is appended in a single write, so the rows of the other workers sharing the file are not interleaved
+    with lock:
+        with open(file_name, 'a') as numbers_file:
+            numbers_file.write(row.getvalue())
+
+
+def find_new_numbers(numbers, seen_numbers, watchlist=None):
+    """
+    Classify the numbers not seen yet without recording anything, so that their booking can start first.
+    :return: the new numbers, the premium ones per category, the other ones and the priorities of the watched ones.
+    """
+    new_numbers = [number for number in dict.fromkeys(numbers) if number not in seen_numbers]
+    if not new_numbers:
+        return new_numbers, {}, [], {}
+    with metrics.timer('classification_seconds'):
+        premium_number_categories, other_numbers = get_premium_numbers(new_numbers)
+    watched_numbers = watchlist.get_priorities(new_numbers, premium_number_categories) if watchlist else {}
+    return new_numbers, premium_number_categories, other_numbers, watched_numbers
+
+
+def get_booking_priorities(premium_number_categories, watched_numbers):
+    """
+    Get the numbers to book: the premium numbers but the excluded abc_only ones with the priority 0, and the watched
+    numbers with their own priority.
+    """
+    priorities = {}
+    if premium_number_categories:
+        premium_numbers_set = set(chain(*premium_number_categories.values()))
+        priorities = dict.fromkeys(premium_numbers_set - get_excluded_abc_only(premium_number_categories), 0)
+    priorities.update(watched_numbers)
+    return priorities
+
+
+def update_numbers(new_numbers, premium_number_categories, other_numbers, watched_numbers, seen_numbers,
+                   booking_queue, number_categories=None):
+    """
+    Record the new numbers found by find_new_numbers and queue the ones to book.
+    :param number_categories: a dict mapping the numbers to their reservation category.
+    :return: the notification messages.
+    """
+    messages = []
+    recorded_numbers = seen_numbers.add_new(new_numbers) if new_numbers else set()
+    if len(recorded_numbers) < len(new_numbers):
+        # Another worker recorded some of the numbers first, so it notifies them
+        new_numbers = [number for number in new_numbers if number in recorded_numbers]
+        premium_number_categories = {category: [number for number in p_numbers if number in recorded_numbers]
+                                     for category, p_numbers in premium_number_categories.items()}
+        other_numbers = [number for number in other_numbers if number in recorded_numbers]
+        watched_numbers = {number: priority for number, priority in watched_numbers.items()
+                           if number in recorded_numbers}
+    if new_numbers:
+        for category, p_numbers in chain(premium_number_categories.items(), [('other', other_numbers)]):
+            if p_numbers:
+                metrics.increment('new_numbers_total', len(p_numbers), category=category)
+        if any(premium_number_categories.values()):
+            logger.info('Premium numbers:')
+            for category, p_numbers in premium_number_categories.items():
+                if len(p_numbers) > 0:
+                    logger.info(f'{category}: {p_numbers}')
+        if watched_numbers:
+            watched_numbers_list = sorted(watched_numbers, key=lambda number: (-watched_numbers[number], number))
+            logger.info('Watched numbers: %s', watched_numbers_list)
+            messages.append(f'Watched numbers\n{" ".join(map(str, watched_numbers_list))}')
+        priorities = get_booking_priorities(premium_number_categories, watched_numbers)
+        if priorities:
+            booking_queue.add_premium_numbers(priorities, priorities, number_categories)
+        logger.info('Other new numbers:')
+        for number in other_numbers:
+            logger.info('Number: %s', number)
+        for category, p_numbers in premium_number_categories.items():
+            if len(p_numbers) > 0:
+                messages.append(f'Premium numbers: {category}\n{" ".join(map(str, p_numbers))}')
+        for start_index in range(0, len(other_numbers), 30):
+            messages.append(" ".join([str(x) for x in other_numbers[start_index:start_index + 30]]))
+    else:
+        logger.info('No new numbers')
+    return messages
+
+
+def send_telegram_message(bot, channel_id, message):
+    for part in smart_split(message):
+        if platform.node() == 'Hamza-XPS-15-7590':
+            print('TELEGRAM:', message)
+        else:
+            bot.send_message(channel_id, part)
+
+
+async def booking_process(premium_number, info_row, outbox, args, snapshot=None, detected_at=None, category=None):
+    booked_message = await do_number_booking(premium_number, **info_row, snapshot=snapshot,
+                                             max_snapshot_age=args.max_snapshot_age, detected_at=detected_at,
+                                             deadline=time.monotonic() + args.booking_deadline,
+                                             retries=args.booking_retries, category=category)
+    if booked_message:
+        await asyncio.to_thread(outbox.put, booked_message)
+        await asyncio.to_thread(save_booked_info, args.booked_numbers, booked_number=premium_number, **info_row)
+        return premium_number
+    return False
+
+
+class BookingEngine:
+    """
+    Process the polled numbers without blocking the polling: the new numbers are recorded by one task at a time, while
+    the bookings run as independent tasks limited by a semaphore. The polls and the bookings send their requests with
+    the async HTTP client in the event loop, so they need no thread, and only the file and database updates run in the
+    default executor. The notifications are left to the Telegram outbox, paced by its own rate.
+
+    A few applicants are claimed ahead of time, so that the booking of a new premium or watched number starts as soon
+    as it is classified, before the numbers are recorded, logged and notified. The queued numbers are only claimed by
+    the free booking workers, with the waiting applicants first and the ready ones when no new number waits for them,
+    and the ones gone from the booking page are retired instead of being booked again.
+
+    Several engines can share the state files as workers. Each category is polled by the worker holding its lease, up
+    to a fair share of the categories per worker, and the workers polling nothing book the numbers queued by the
+    others. The seen numbers, the booking queue and the outbox make sure a number is notified and booked only once.
+    The leases are renewed every third of their duration: the categories of a stopped worker are polled again after
+    one lease duration by a worker below its share, after two by a worker already at its share. A worker holding more
+    than its share releases the extra categories as soon as another live worker is below its share.
+    """
+
+    def __init__(self, outbox, seen_numbers, booking_queue, args):
+        self.outbox = outbox
+        self.seen_numbers = seen_numbers
+        self.booking_queue = booking_queue
+        self.args = args
+        self.state_lock = asyncio.Lock()
+        self.claim_lock = asyncio.Lock()
+        self.booking_limit = asyncio.Semaphore(args.booking_workers)
+        self.applicants_mtime = None
+        self.watchlist = None
+        self.watchlist_mtime = None
+        self.tasks = set()
+        self.booking_count = 0
+        self.ready_applicants = deque()
+        self.snapshot = None
+        self.category_snapshots = {}
+        self.poll_categories = []
+        self.lease_duration = args.lease_duration
+        self.retry_bookings = False
+        self.stopping = False
+        # The time each premium number was detected at, to measure the delay until its booking
+        self.detected_at = {}
+        self.scheduler = PollScheduler(args.min_interval, args.interval, args.requests_per_minute)
+        self.request_count = 0
+
+    def spawn(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def spawn_booking(self, premium_number, info_row):
+        self.booking_count += 1
+        self.spawn(self.book_number(premium_number, info_row))
+
+    async def poll_loop(self, snapshot_queue):
+        while True:
+            try:
+                snapshot = await self.poll()
+                if snapshot is None:
+                    # The categories are polled by the other workers, book the numbers they queue
+                    self.spawn(self.claim_bookings())
+                    await asyncio.sleep(max(self.scheduler.min_interval,
+                                            self.scheduler.get_budget_delay(self.count_requests())))
+                    continue
+            except (aiohttp.ClientError, TimeoutError) as e:
+                logger.error('Request failed: %s', e)
+                self.scheduler.record_error()
+                metrics.increment('polls_total', result='error')
+            except Exception as e:
+                logger.exception('Unknown error occurred: %s', e)
+                self.scheduler.record_error()
+                metrics.increment('polls_total', result='error')
+            else:
+                self.scheduler.record_poll(snapshot.changed)
+                metrics.increment('polls_total', result='changed' if snapshot.changed else 'unchanged')
+                self.snapshot = snapshot
+                if not snapshot.numbers:
+                    logger.warning('No numbers found!')
+                # An unchanged snapshot is only processed again to retry the failed bookings
+                elif snapshot.changed or self.retry_bookings:
+                    self.retry_bookings = False
+                    # Only the latest snapshot matters, drop the one that was not processed yet
+                    if snapshot_queue.full():
+                        snapshot_queue.get_nowait()
+                    snapshot_queue.put_nowait(snapshot)
+            metrics.set_gauge('poll_interval_seconds', self.scheduler.interval)
+            delay = self.scheduler.next_delay(self.count_requests())
+            logger.debug('Next poll in %.1f seconds', delay)
+            await asyncio.sleep(delay)
+
+    def count_requests(self):
+        # The requests sent since the previous poll, charged to the request budget
+        request_count = get_booking_page_request_count()
+        requests_sent = request_count - self.request_count
+        self.request_count = request_count
+        return requests_sent
+
+    async def poll(self):
+        """
+        Fetch the booking pages of the categories polled by this worker at once and merge them. A category whose request
+        fails keeps its previous numbers, unless all of them fail.
+        :return: the merged snapshot, or None if the worker polls no category.
+        """
+        categories = self.poll_categories
+        if not categories:
+            return None
+        results = await asyncio.gather(*(
+            get_availability_snapshot(None, self.category_snapshots.get(category), category) for category in categories
+        ), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if len(errors) == len(results):
+            raise errors[0]
+        for category, result in zip(categories, results):
+            if isinstance(result, Exception):
+                logger.error('Request of category %s failed: %s', category, result)
+                if category in self.category_snapshots:
+                    self.category_snapshots[category] = replace(self.category_snapshots[category], changed=False)
+            else:
+                self.category_snapshots[category] = result
+        return merge_snapshots({category: self.category_snapshots[category] for category in categories
+                                if category in self.category_snapshots})
+
+    async def lease_loop(self):
+        # Renewed on their own schedule, so the leases never depend on the delay between two polls
+        while True:
+            await asyncio.sleep(self.lease_duration / 3)
+            try:
+                await asyncio.to_thread(self.acquire_poll_categories)
+            except sqlite3.Error as e:
+                logger.error('Error on renewing the leases: %s', e)
+
+    def acquire_poll_categories(self):
+        """
+        Renew the leases of the worker and get the categories it polls.
+        """
+        booking_queue = self.booking_queue
+        booking_queue.acquire_worker_lease(self.lease_duration)
+        booking_queue.release_claims()
+        share = math.ceil(len(self.args.categories) / self.args.workers)
+        # A worker started after the others takes the categories they hold over their share
+        poll_counts = booking_queue.count_leases('poll:')
+        rebalance = any(poll_counts.get(owner, 0) < share for owner in booking_queue.count_leases('worker:')
+                        if owner != booking_queue.owner)
+        categories = []
+        # The leases already held are renewed first, so they count in the share before any new one is taken
+        for category in sorted(self.args.categories, key=lambda category: category not in self.poll_categories):
+            if len(categories) >= share and rebalance:
+                if category in self.poll_categories:
+                    booking_queue.release_lease(f'poll:{category}')
+                continue
+            # Over its share, a worker only takes the categories left by the other workers for a whole lease duration
+            takeover_delay = 0 if len(categories) < share else self.lease_duration
+            if booking_queue.acquire_lease(f'poll:{category}', self.lease_duration, takeover_delay):
+                categories.append(category)
+        categories = [category for category in self.args.categories if category in categories]
+        if categories != self.poll_categories:
+            logger.info('Polling the categories %s', categories)
+            self.poll_categories = categories
+        return categories
+
+    async def process_loop(self, snapshot_queue):
+        while True:
+            snapshot = await snapshot_queue.get()
+            try:
+                await self.process_numbers(snapshot)
+            except Exception as e:
+                logger.exception('Unknown error occurred: %s', e)
+
+    async def process_numbers(self, snapshot):
+        async with self.state_lock:
+            new_numbers = await asyncio.to_thread(self.find_new_numbers, snapshot.numbers)
+            priorities = get_booking_priorities(new_numbers[1], new_numbers[3])
+            numbers_to_book = sorted(priorities, key=lambda number: (-priorities[number], number))
+            self.record_detection(numbers_to_book, snapshot)
+            if numbers_to_book and self.ready_applicants:
+                await self.book_new_numbers(numbers_to_book, priorities, snapshot.categories)
+            await asyncio.to_thread(self.import_applicants)
+            messages = await asyncio.to_thread(update_numbers, *new_numbers, self.seen_numbers, self.booking_queue,
+                                               snapshot.categories)
+            # The queued numbers gone from the booking page are not claimed again until they are listed again
+            await asyncio.to_thread(self.booking_queue.retire_unlisted, snapshot.categories,
+                                    self.poll_categories == self.args.categories)
+        if messages:
+            await asyncio.to_thread(self.outbox.put, *messages)
+        await self.claim_bookings()
+
+    def record_detection(self, numbers, snapshot):
+        # Only the bookings starting before the booking deadline measure the delay since the detection, so the older
+        # detections are dropped. Each number is detected when its own category was fetched.
+        now = time.monotonic()
+        self.detected_at = {number: number_detected_at for number, number_detected_at in self.detected_at.items()
+                            if now - number_detected_at < self.args.booking_deadline}
+        self.detected_at.update({number: snapshot.get_fetched_at(snapshot.categories.get(number))
+                                 for number in numbers})
+
+    async def book_new_numbers(self, numbers, priorities, categories):
+        # The applicants are taken before claiming the numbers, as another task may take them meanwhile
+        applicants = [self.ready_applicants.popleft() for _ in range(min(len(numbers), len(self.ready_applicants)))]
+        # One short transaction, so that a number found by several workers is booked by only one of them
+        claimed_numbers = await asyncio.to_thread(self.booking_queue.claim_new_numbers, numbers[:len(applicants)],
+                                                  priorities, categories)
+        for number, applicant in zip(claimed_numbers, applicants):
+            self.spawn_booking(number, applicant)
+        self.ready_applicants.extendleft(reversed(applicants[len(claimed_numbers):]))
+
+    def find_new_numbers(self, numbers):
+        self.load_watchlist()
+        return find_new_numbers(numbers, self.seen_numbers, self.watchlist)
+
+    async def claim_bookings(self):
+        # Only the free booking workers claim the queued numbers, the others are left to the other workers. The claims
+        # are made one task at a time, so the tasks running together never claim more than the free booking workers.
+        async with self.claim_lock:
+            while self.booking_count < self.args.booking_workers:
+                booking = await asyncio.to_thread(self.booking_queue.claim_booking)
+                if booking is None:
+                    break
+                self.spawn_booking(*booking)
+            # The ready applicants book the queued numbers too while no snapshot is processed, as no new number waits
+            # for them then
+            if not self.state_lock.locked():
+                await self.book_queued_numbers()
+            await asyncio.to_thread(self.refill_applicants)
+
+    async def book_queued_numbers(self):
+        count = min(self.args.booking_workers - self.booking_count, len(self.ready_applicants))
+        if count <= 0:
+            return
+        # The applicants are taken before claiming the numbers, as another task may take them meanwhile
+        applicants = [self.ready_applicants.popleft() for _ in range(count)]
+        numbers = await asyncio.to_thread(self.booking_queue.claim_numbers, count)
+        for number, applicant in zip(numbers, applicants):
+            self.spawn_booking(number, applicant)
+        self.ready_applicants.extendleft(reversed(applicants[len(numbers):]))
+
+    def refill_applicants(self):
+        if count := self.args.booking_workers - len(self.ready_applicants):
+            self.ready_applicants.extend(self.booking_queue.claim_applicants(count))
+
+    def import_applicants(self):
+        # The applicants file is imported again whenever it is modified, the known applicants are ignored
+        try:
+            mtime = os.stat(self.args.numbers_to_book).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self.applicants_mtime:
+            if count := self.booking_queue.import_applicants_csv(self.args.numbers_to_book):
+                logger.info('Imported %s applicants from %s', count, self.args.numbers_to_book)
+            self.applicants_mtime = mtime
+
+    def load_watchlist(self):
+        # The watchlist is compiled again whenever it is modified, and kept as it was if the new one is invalid
+        try:
+            mtime = os.stat(self.args.watchlist).st_mtime
+        except FileNotFoundError:
+            self.watchlist = None
+            return
+        if mtime != self.watchlist_mtime:
+            self.watchlist_mtime = mtime
+            try:
+                self.watchlist = Watchlist.load(self.args.watchlist)
+            except ValueError as e:
+                logger.error('Invalid watchlist %s: %s', self.args.watchlist, e)
+            else:
+                logger.info('Loaded the watchlist from %s', self.args.watchlist)
+
+    async def book_number(self, premium_number, info_row):
+        try:
+            await self.run_booking(premium_number, info_row)
+        finally:
+            self.booking_count -= 1
+
+    async def run_booking(self, premium_number, info_row):
+        # The detection is only measured on the first attempt
+        detected_at = self.detected_at.pop(premium_number, None)
+        category = self.snapshot.categories.get(premium_number) if self.snapshot else None
+        if category is None:
+            # A number queued by another worker, in a category this one may not poll
+            category = await asyncio.to_thread(self.booking_queue.get_category, premium_number)
+        async with self.booking_limit:
+            if self.stopping:
+                await asyncio.to_thread(self.booking_queue.release, premium_number, info_row['id'])
+                return
+            start = time.monotonic()
+            try:
+                booked = await booking_process(premium_number, info_row, self.outbox, self.args, self.snapshot,
+                                               detected_at, category)
+            except Exception as e:
+                logger.error('Error on booking: %s', e)
+                booked = False
+            metrics.observe('booking_seconds', time.monotonic() - start)
+        metrics.increment('bookings_total', result='booked' if booked else 'failed')
+        if booked and detected_at is not None:
+            metrics.observe('detection_to_booking_seconds', time.monotonic() - detected_at)
+        if booked:
+            await asyncio.to_thread(self.booking_queue.mark_booked, premium_number, info_row['id'])
+            # The booking worker is free again for the queued numbers
+            if not self.stopping:
+                self.spawn(self.claim_bookings())
+        else:
+            self.retry_bookings = True
+            logger.warning('Premium number %s was not booked', premium_number)
+            await asyncio.to_thread(self.booking_queue.release, premium_number, info_row['id'])
+
+
+def open_seen_numbers(args):
+    seen_numbers = SeenNumbersStore(args.seen_numbers)
+    if seen_numbers.created and os.path.exists(args.old_numbers_file_name):
+        logger.info('Importing the old numbers from %s...', args.old_numbers_file_name)
+        seen_numbers.import_json(args.old_numbers_file_name)
+    return seen_numbers
+
+
+def open_booking_queue(args):
+    booking_queue = BookingQueue(args.booking_queue, args.worker_id)
+    if booking_queue.created:
+        if os.path.exists(args.booked_numbers):
+            logger.info('Importing the booked numbers from %s...', args.booked_numbers)
+            booking_queue.import_booked_csv(args.booked_numbers)
+        if os.path.exists(args.available_premium_numbers):
+            logger.info('Importing the available premium numbers from %s...', args.available_premium_numbers)
+            booking_queue.import_premium_numbers_json(args.available_premium_numbers)
+    # The lease of the worker is taken first, so its own claims are never released by the other workers
+    booking_queue.acquire_worker_lease(args.lease_duration)
+    booking_queue.release_claims()
+    return booking_queue
+
+
+def export_booking_queue(args):
+    booking_queue = BookingQueue(args.booking_queue)
+    booking_queue.export_applicants_csv(args.numbers_to_book)
+    booking_queue.export_booked_csv(args.booked_numbers)
+    booking_queue.export_premium_numbers_json(args.available_premium_numbers)
+
+
+def open_telegram_outbox(args):
+    if args.telegram_token:
+        notification_bot = TeleBot(args.telegram_token, threaded=False)
+        send = lambda text: send_telegram_message(notification_bot, args.telegram_channel_id, text)
+    else:
+        # Without a token (as with the simulator) the messages are only logged
+        send = lambda text: logger.info('TELEGRAM: %s', text)
+    # A send waits for the connection and the response at most, before failing
+    return TelegramOutbox(args.telegram_outbox, send, rate=args.telegram_rate, capacity=args.telegram_burst,
+                          owner=args.worker_id, send_timeout=apihelper.CONNECT_TIMEOUT + apihelper.READ_TIMEOUT).start()
+
+
+async def run_engine(args):
+    # The bookkeeping threads: one for the bookings of each booking worker, and one each for the processing, the leases
+    # and the metrics
+    max_workers = args.booking_workers + 3
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
+    engine = BookingEngine(open_telegram_outbox(args), open_seen_numbers(args), open_booking_queue(args), args)
+    logger.info('Starting worker %s', args.worker_id)
+    await asyncio.to_thread(engine.import_applicants)
+    await asyncio.to_thread(engine.refill_applicants)
+    await asyncio.to_thread(engine.acquire_poll_categories)
+    snapshot_queue = asyncio.Queue(maxsize=1)
+    loops = [engine.poll_loop(snapshot_queue), engine.process_loop(snapshot_queue), engine.lease_loop()]
+    if args.metrics_file:
+        loops.append(write_metrics_loop(args.metrics_file, args.metrics_interval))
+    poll_session = open_poll_session()
+    try:
+        await asyncio.gather(*loops)
+    finally:
+        # The bookings in progress are completed first, so that their claims are not released under them, then the
+        # other workers can take over at once instead of waiting for the leases to expire
+        engine.stopping = True
+        await asyncio.gather(*engine.tasks, return_exceptions=True)
+        engine.booking_queue.release_worker()
+        engine.outbox.release_lease()
+        await poll_session.close()
+
+
+async def write_metrics_loop(file_name, interval):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(metrics.write, file_name)
+        except OSError as e:
+            logger.error('Error on writing the metrics: %s', e)
+
+
+def run(args):
+    """
+    Poll and book until interrupted. The Telegram bot, the thread pool and the HTTP connection pool are created once
+    and reused for the whole run.
+    """
+    if args.metrics_file or args.metrics_port:
+        metrics.enable()
+    if args.metrics_port:
+        metrics.serve(args.metrics_port)
+    if args.url:
+        configure_url(args.url)
+    configure_timeouts(args.request_timeout, args.hedge_delay)
+    # The booking page is requested by the polls of each category and the bookings at once, and the hedged requests
+    # may need a second connection for each of them
+    configure_connection_pool((args.booking_workers + len(args.categories)) * (1 if args.hedge_delay is None else 2))
+    try:
+        asyncio.run(run_engine(args))
+    except KeyboardInterrupt:
+        logger.info('Stopped.')
@@ -0,0 +1,402 @@
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import leases
+
+applicant_fields = ('id', 'first_name', 'last_name', 'father_name', 'mother_name', 'ref_number', 'birth_day',
+                    'birth_month', 'birth_year', 'confirmation_code', 'id_type')
+
+schema = f'''
+CREATE TABLE IF NOT EXISTS applicants (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    {', '.join(f'{field} TEXT' for field in applicant_fields)},
+    status TEXT NOT NULL DEFAULT 'waiting',
+    claimed_by TEXT,
+    UNIQUE (id)
+);
+CREATE INDEX IF NOT EXISTS applicants_status ON applicants (status, position);
+CREATE TABLE IF NOT EXISTS premium_numbers (
+    number INTEGER PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'available',
+    priority INTEGER NOT NULL DEFAULT 0,
+    category TEXT,
+    claimed_by TEXT
+);
+CREATE INDEX IF NOT EXISTS premium_numbers_status ON premium_numbers (status);
+CREATE TABLE IF NOT EXISTS booked_numbers (
+    number INTEGER PRIMARY KEY,
+    applicant_id TEXT NOT NULL,
+    booked_at REAL NOT NULL
+);
+'''
+
+# The columns missing from the queues created by the previous versions
+added_columns = (
+    ('premium_numbers', 'priority', 'INTEGER NOT NULL DEFAULT 0'),
+    ('premium_numbers', 'category', 'TEXT'),
+    ('premium_numbers', 'claimed_by', 'TEXT'),
+    ('applicants', 'claimed_by', 'TEXT'),
+)
+
+
+class BookingQueue:
+    """
+    The booking queue stored in SQLite: the applicants waiting for a number, the available premium numbers and the
+    booked ones.
+
+    A booking claims a premium number and an applicant in one transaction, then either marks them as booked or
+    releases them. Every thread uses its own connection, and the database is in WAL mode so the workers only wait for
+    each other during the short write transactions.
+
+    Several processes can share the queue: the claims record the worker that made them, and they are only released
+    once the lease of that worker has expired, so a worker never releases the bookings another one is running.
+    """
+
+    def __init__(self, file_name, owner=None):
+        """
+        :param file_name: the SQLite database, created if it does not exist.
+        :param owner: the ID of the worker, recorded with its claims and its leases.
+        """
+        self.file_name = file_name
+        self.owner = owner
+        self.created = not os.path.exists(file_name)
+        self.local = threading.local()
+        self.connection.executescript(schema)
+        self.connection.execute(leases.schema)
+        # In a transaction, so that two workers starting together do not both add a column
+        with self.transaction() as connection:
+            for table, column, definition in added_columns:
+                if column not in {row['name'] for row in connection.execute(f'PRAGMA table_info({table})')}:
+                    connection.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS premium_numbers_priority ON premium_numbers (status, priority DESC, number)'
+        )
+
+    @property
+    def connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.file_name, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self.local.connection = connection
+        return connection
+
+    @contextmanager
+    def transaction(self):
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def add_applicants(self, applicants):
+        """
+        Add applicants at the end of the queue, ignoring the ones whose ID is already known.
+        :param applicants: dicts with the `applicant_fields` keys.
+        :return: the count of the added applicants.
+        """
+        with self.transaction() as connection:
+            cursor = connection.executemany(
+                f'INSERT OR IGNORE INTO applicants ({", ".join(applicant_fields)}) '
+                f'VALUES ({", ".join("?" * len(applicant_fields))})',
+                [[applicant.get(field) for field in applicant_fields] for applicant in applicants]
+            )
+            return cursor.rowcount
+
+    def add_premium_numbers(self, numbers, priorities=None, categories=None):
+        """
+        Add available premium numbers, raising the priority of the ones already known if it is higher.
+        :param numbers: the numbers to add.
+        :param priorities: a dict mapping numbers to their priority, 0 by default.
+        :param categories: a dict mapping numbers to the reservation category they are listed in.
+        """
+        priorities = priorities or {}
+        categories = categories or {}
+        with self.transaction() as connection:
+            connection.executemany(
+                'INSERT INTO premium_numbers (number, priority, category) VALUES (?, ?, ?) '
+                'ON CONFLICT (number) DO UPDATE SET priority = max(priority, excluded.priority), '
+                'category = coalesce(excluded.category, category)',
+                [(int(number), priorities.get(number, 0), categories.get(number)) for number in numbers]
+            )
+
+    def claim_new_numbers(self, numbers, priorities=None, categories=None):
+        """
+        Add premium numbers already claimed, for the applicants claimed beforehand. A number already in the queue is
+        left as it is, so that only one worker books a number found by several ones.
+        :return: the numbers added.
+
+        :Example:
+        >>> queue = BookingQueue(':memory:', 'worker')
+        >>> queue.add_premium_numbers([71111111])
+        >>> queue.claim_new_numbers([71111111, 71222222])
+        [71222222]
+        >>> queue.get_premium_numbers(), queue.get_premium_numbers('claimed')
+        ([71111111], [71222222])
+        """
+        priorities = priorities or {}
+        categories = categories or {}
+        claimed_numbers = []
+        with self.transaction() as connection:
+            for number in numbers:
+                cursor = connection.execute(
+                    'INSERT OR IGNORE INTO premium_numbers (number, priority, category, status, claimed_by) '
+                    "VALUES (?, ?, ?, 'claimed', ?)",
+                    (int(number), priorities.get(number, 0), categories.get(number), self.owner)
+                )
+                if cursor.rowcount:
+                    claimed_numbers.append(number)
+        return claimed_numbers
+
+    def get_category(self, number):
+        row = self.connection.execute('SELECT category FROM premium_numbers WHERE number = ?',
+                                      (int(number),)).fetchone()
+        return row['category'] if row else None
+
+    def retire_unlisted(self, number_categories, all_categories=False):
+        """
+        Retire the available numbers no longer listed in their category, so that they are not claimed again, and make
+        the retired numbers listed again available.
+        :param number_categories: a dict mapping the listed numbers to their category, the listing of each of these
+        categories being complete.
+        :param all_categories: True if all the categories are listed, so that the numbers of unknown category (as the
+        imported ones) are retired too.
+        :return: the count of the retired numbers.
+
+        :Example:
+        >>> queue = BookingQueue(':memory:')
+        >>> queue.add_premium_numbers([71111111, 71222222, 3333333], categories={71111111: 'MICRO', 71222222: 'MICRO'})
+        >>> queue.retire_unlisted({71111111: 'MICRO'}), queue.get_premium_numbers()
+        (1, [3333333, 71111111])
+        >>> queue.retire_unlisted({71111111: 'MICRO', 71222222: 'MICRO'}, all_categories=True)
+        1
+        >>> queue.get_premium_numbers()
+        [71111111, 71222222]
+        """
+        categories = sorted(set(number_categories.values()))
+        with self.transaction() as connection:
+            connection.execute('CREATE TEMP TABLE IF NOT EXISTS listed_numbers (number INTEGER PRIMARY KEY, '
+                               'category TEXT)')
+            connection.execute('DELETE FROM listed_numbers')
+            connection.executemany('INSERT INTO listed_numbers (number, category) VALUES (?, ?)',
+                                   [(int(number), category) for number, category in number_categories.items()])
+            connection.execute(
+                "UPDATE premium_numbers SET status = 'available', category = (SELECT category FROM listed_numbers "
+                "WHERE listed_numbers.number = premium_numbers.number) WHERE status = 'unlisted' "
+                'AND number IN (SELECT number FROM listed_numbers)'
+            )
+            cursor = connection.execute(
+                "UPDATE premium_numbers SET status = 'unlisted' WHERE status = 'available' "
+                'AND number NOT IN (SELECT number FROM listed_numbers) '
+                f'AND (category IN ({", ".join("?" * len(categories))}) OR category IS NULL AND ?)',
+                (*categories, all_categories)
+            )
+            return cursor.rowcount
+
+    def get_premium_numbers(self, status='available'):
+        return [row['number'] for row in self.connection.execute(
+            'SELECT number FROM premium_numbers WHERE status = ? ORDER BY priority DESC, number', (status,)
+        )]
+
+    def get_applicants(self, status='waiting'):
+        return [{field: row[field] for field in applicant_fields} for row in self.connection.execute(
+            'SELECT * FROM applicants WHERE status = ? ORDER BY position', (status,)
+        )]
+
+    def claim_booking(self):
+        """
+        Claim the available premium number with the highest priority and the first waiting applicant together.
+        :return: the number and the applicant dict, or None if either is missing.
+
+        :Example:
+        >>> queue = BookingQueue(':memory:', 'worker')
+        >>> queue.add_premium_numbers([71111111, 71222222], {71222222: 1})
+        >>> queue.add_applicants([{'id': '1'}])
+        1
+        >>> number, applicant = queue.claim_booking()
+        >>> number, applicant['id']
+        (71222222, '1')
+        >>> queue.claim_booking() is None
+        True
+        """
+        with self.transaction() as connection:
+            number_row = connection.execute(
+                "SELECT number FROM premium_numbers WHERE status = 'available' "
+                "ORDER BY priority DESC, number LIMIT 1"
+            ).fetchone()
+            applicant_row = connection.execute(
+                "SELECT * FROM applicants WHERE status = 'waiting' ORDER BY position LIMIT 1"
+            ).fetchone()
+            if number_row is None or applicant_row is None:
+                return None
+            connection.execute("UPDATE premium_numbers SET status = 'claimed', claimed_by = ? WHERE number = ?",
+                               (self.owner, number_row['number']))
+            connection.execute("UPDATE applicants SET status = 'claimed', claimed_by = ? WHERE position = ?",
+                               (self.owner, applicant_row['position']))
+        return number_row['number'], {field: applicant_row[field] for field in applicant_fields}
+
+    def claim_numbers(self, count):
+        """
+        Claim the available premium numbers with the highest priority for applicants claimed beforehand.
+        :return: the numbers.
+
+        :Example:
+        >>> queue = BookingQueue(':memory:', 'worker')
+        >>> queue.add_premium_numbers([71111111, 71222222, 71333333], {71333333: 1})
+        >>> queue.claim_numbers(2), queue.get_premium_numbers()
+        ([71333333, 71111111], [71222222])
+        """
+        with self.transaction() as connection:
+            numbers = [row['number'] for row in connection.execute(
+                "SELECT number FROM premium_numbers WHERE status = 'available' "
+                'ORDER BY priority DESC, number LIMIT ?', (count,)
+            )]
+            connection.executemany("UPDATE premium_numbers SET status = 'claimed', claimed_by = ? WHERE number = ?",
+                                   [(self.owner, number) for number in numbers])
+        return numbers
+
+    def claim_applicants(self, count):
+        """
+        Claim the first waiting applicants ahead of the numbers they will book.
+        :return: the applicant dicts.
+        """
+        with self.transaction() as connection:
+            rows = connection.execute(
+                "SELECT * FROM applicants WHERE status = 'waiting' ORDER BY position LIMIT ?", (count,)
+            ).fetchall()
+            connection.executemany("UPDATE applicants SET status = 'claimed', claimed_by = ? WHERE position = ?",
+                                   [(self.owner, row['position']) for row in rows])
+        return [{field: row[field] for field in applicant_fields} for row in rows]
+
+    def mark_booked(self, number, applicant_id):
+        with self.transaction() as connection:
+            connection.execute("UPDATE premium_numbers SET status = 'booked' WHERE number = ?", (int(number),))
+            connection.execute("UPDATE applicants SET status = 'booked' WHERE id = ?", (applicant_id,))
+            connection.execute(
+                'INSERT OR REPLACE INTO booked_numbers (number, applicant_id, booked_at) VALUES (?, ?, ?)',
+                (int(number), applicant_id, time.time())
+            )
+
+    def release(self, number, applicant_id):
+        """
+        Make a claimed number and applicant available again after a failed booking.
+
+        :Example:
+        >>> queue = BookingQueue(':memory:', 'worker')
+        >>> queue.add_premium_numbers([71111111])
+        >>> queue.add_applicants([{'id': '1'}])
+        1
+        >>> number, applicant = queue.claim_booking()
+        >>> queue.release(number, applicant['id'])
+        >>> queue.get_premium_numbers(), [applicant['id'] for applicant in queue.get_applicants()]
+        ([71111111], ['1'])
+        """
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE premium_numbers SET status = 'available' WHERE number = ? AND status = 'claimed'",
+                (int(number),)
+            )
+            connection.execute("UPDATE applicants SET status = 'waiting' WHERE id = ? AND status = 'claimed'",
+                               (applicant_id,))
+
+    def release_claims(self):
+        """
+        Release the claims left by the stopped workers, whose worker lease has expired.
+
+        :Example:
+        >>> import tempfile
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> file_name = os.path.join(directory.name, 'booking_queue.sqlite3')
+        >>> running, stopped = BookingQueue(file_name, 'running'), BookingQueue(file_name, 'stopped')
+        >>> running.acquire_worker_lease(60), stopped.acquire_worker_lease(-1)
+        (True, True)
+        >>> running.claim_new_numbers([71111111]), stopped.claim_new_numbers([71222222])
+        ([71111111], [71222222])
+        >>> running.release_claims()
+        >>> running.get_premium_numbers(), running.get_premium_numbers('claimed')
+        ([71222222], [71111111])
+        >>> directory.cleanup()
+        """
+        stopped = "status = 'claimed' AND NOT EXISTS (SELECT 1 FROM leases WHERE name = 'worker:' || claimed_by " \
+                  'AND expires_at >= ?)'
+        now = time.time()
+        with self.transaction() as connection:
+            connection.execute(f"UPDATE premium_numbers SET status = 'available' WHERE {stopped}", (now,))
+            connection.execute(f"UPDATE applicants SET status = 'waiting' WHERE {stopped}", (now,))
+
+    def acquire_lease(self, name, duration, takeover_delay=0.0):
+        return leases.acquire_lease(self.connection, name, self.owner, duration, takeover_delay)
+
+    def release_lease(self, name):
+        leases.release_lease(self.connection, name, self.owner)
+
+    def count_leases(self, prefix):
+        return leases.count_leases(self.connection, prefix)
+
+    def acquire_worker_lease(self, duration):
+        """
+        Renew the lease keeping the claims of the worker from being released by the other ones.
+        """
+        return self.acquire_lease(f'worker:{self.owner}', duration)
+
+    def release_worker(self):
+        """
+        Release the claims and the leases of the worker when it stops.
+        """
+        with self.transaction() as connection:
+            connection.execute(
+                "UPDATE premium_numbers SET status = 'available' WHERE status = 'claimed' AND claimed_by = ?",
+                (self.owner,)
+            )
+            connection.execute("UPDATE applicants SET status = 'waiting' WHERE status = 'claimed' AND claimed_by = ?",
+                               (self.owner,))
+            connection.execute('DELETE FROM leases WHERE owner = ?', (self.owner,))
+
+    def import_applicants_csv(self, file_name):
+        with open(file_name) as applicants_file:
+            return self.add_applicants(csv.DictReader(applicants_file, fieldnames=applicant_fields))
+
+    def export_applicants_csv(self, file_name):
+        # The claimed applicants are not booked yet, so they are exported with the waiting ones
+        with open(file_name, 'w') as applicants_file:
+            csv.DictWriter(applicants_file, fieldnames=applicant_fields).writerows(
+                {field: row[field] for field in applicant_fields} for row in self.connection.execute(
+                    "SELECT * FROM applicants WHERE status != 'booked' ORDER BY position"
+                )
+            )
+
+    def import_booked_csv(self, file_name):
+        """
+        Import a booked numbers CSV file (the booked number followed by the applicant fields).
+        """
+        with open(file_name) as booked_file:
+            rows = list(csv.DictReader(booked_file, fieldnames=('booked_number',) + applicant_fields))
+        self.add_applicants(rows)
+        for row in rows:
+            self.mark_booked(row['booked_number'], row['id'])
+
+    def export_booked_csv(self, file_name):
+        with open(file_name, 'w') as booked_file:
+            writer = csv.DictWriter(booked_file, fieldnames=('booked_number',) + applicant_fields)
+            for row in self.connection.execute(
+                    'SELECT * FROM booked_numbers JOIN applicants ON applicant_id = applicants.id ORDER BY booked_at'
+            ):
+                writer.writerow({'booked_number': row['number'], **{field: row[field] for field in applicant_fields}})
+
+    def import_premium_numbers_json(self, file_name):
+        with open(file_name) as numbers_file:
+            self.add_premium_numbers(json.load(numbers_file))
+
+    def export_premium_numbers_json(self, file_name):
+        with open(file_name, 'w') as numbers_file:
+            json.dump(self.get_premium_numbers(), numbers_file, indent=4)
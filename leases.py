@@ -0,0 +1,67 @@
+"""
+Leases stored in SQLite, so that the workers sharing a database agree on which one does a task: a lease is held by one
+owner until it expires, and the owner keeps it by acquiring it again before then.
+"""
+import time
+
+schema = 'CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)'
+
+
+def acquire_lease(connection, name, owner, duration, takeover_delay=0.0):
+    """
+    Acquire or renew a lease in a single statement.
+    :param connection: the SQLite connection, in autocommit mode.
+    :param name: the name of the lease.
+    :param owner: the ID of the worker.
+    :param duration: the time in seconds the lease is held.
+    :param takeover_delay: the time in seconds the lease of another owner must have expired for.
+    :return: True if the lease is held by the owner, False otherwise.
+
+    :Example:
+    >>> import sqlite3
+    >>> connection = sqlite3.connect(':memory:', isolation_level=None)
+    >>> _ = connection.execute(schema)
+    >>> acquire_lease(connection, 'poll', 'a', 10), acquire_lease(connection, 'poll', 'b', 10)
+    (True, False)
+    >>> release_lease(connection, 'poll', 'a')
+    >>> acquire_lease(connection, 'poll', 'b', 10)
+    True
+    >>> acquire_lease(connection, 'other', 'b', 10, takeover_delay=10)
+    False
+    """
+    now = time.time()
+    if takeover_delay:
+        # A lease never held is only taken after the delay too, counted from now
+        connection.execute("INSERT OR IGNORE INTO leases (name, owner, expires_at) VALUES (?, '', ?)", (name, now))
+    cursor = connection.execute(
+        'INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?) ON CONFLICT (name) DO UPDATE SET '
+        'owner = excluded.owner, expires_at = excluded.expires_at WHERE owner = excluded.owner OR expires_at < ?',
+        (name, owner, now + duration, now - takeover_delay)
+    )
+    return cursor.rowcount == 1
+
+
+def release_lease(connection, name, owner):
+    connection.execute('DELETE FROM leases WHERE name = ? AND owner = ?', (name, owner))
+
+
+def count_leases(connection, prefix):
+    """
+    Count the live leases whose name starts with a prefix, per owner.
+    :return: a dict mapping the owners to the count of their leases.
+
+    :Example:
+    >>> import sqlite3
+    >>> connection = sqlite3.connect(':memory:', isolation_level=None)
+    >>> _ = connection.execute(schema)
+    >>> acquire_lease(connection, 'poll:a', 'a', 10), acquire_lease(connection, 'poll:b', 'a', 10)
+    (True, True)
+    >>> acquire_lease(connection, 'poll:c', 'b', -1), acquire_lease(connection, 'worker:b', 'b', 10)
+    (True, True)
+    >>> count_leases(connection, 'poll:'), count_leases(connection, 'worker:')
+    ({'a': 2}, {'b': 1})
+    """
+    return {owner: count for owner, count in connection.execute(
+        "SELECT owner, count(*) FROM leases WHERE name LIKE ? || '%' AND expires_at >= ? AND owner != '' "
+        'GROUP BY owner ORDER BY owner', (prefix, time.time())
+    )}
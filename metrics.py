@@ -0,0 +1,165 @@
+"""
+Counters, gauges and histograms of the stages of the polling and booking pipeline, in the Prometheus text format.
+
+The metrics are disabled by default: until `enable` is called, recording them only costs a global check.
+"""
+import os
+import threading
+import time
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+prefix = 'touch_lb_'
+default_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+enabled = False
+lock = threading.Lock()
+counters = {}
+gauges = {}
+histograms = {}
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def get_key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def increment(name, value=1, **labels):
+    if enabled:
+        key = get_key(name, labels)
+        with lock:
+            counters[key] = counters.get(key, 0) + value
+
+
+def set_gauge(name, value, **labels):
+    if enabled:
+        with lock:
+            gauges[get_key(name, labels)] = value
+
+
+def observe(name, value, **labels):
+    """
+    Add a value to a histogram. The histograms store the count of the values per bucket, their sum and their count.
+    """
+    if enabled:
+        key = get_key(name, labels)
+        with lock:
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = [0] * (len(default_buckets) + 2)
+            for index, bucket in enumerate(default_buckets):
+                if value <= bucket:
+                    histogram[index] += 1
+                    break
+            histogram[-2] += value
+            histogram[-1] += 1
+
+
+class Timer:
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        observe(self.name, time.perf_counter() - self.start, **self.labels)
+
+
+null_timer = nullcontext()
+
+
+def timer(name, **labels):
+    """
+    Get a context manager adding the duration of its block to a histogram.
+    """
+    return Timer(name, labels) if enabled else null_timer
+
+
+def format_labels(labels, **extra_labels):
+    labels = list(labels) + list(extra_labels.items())
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in labels) + '}'
+
+
+def render():
+    """
+    Render all the metrics in the Prometheus text format.
+
+    :Example:
+    >>> enable()
+    >>> increment('polls_total', result='changed')
+    >>> observe('poll_seconds', 0.2)
+    >>> print(render())  # doctest: +ELLIPSIS
+    # TYPE touch_lb_polls_total counter
+    touch_lb_polls_total{result="changed"} 1
+    # TYPE touch_lb_poll_seconds histogram
+    touch_lb_poll_seconds_bucket{le="0.005"} 0
+    ...
+    touch_lb_poll_seconds_bucket{le="0.25"} 1
+    ...
+    touch_lb_poll_seconds_bucket{le="+Inf"} 1
+    touch_lb_poll_seconds_sum 0.2
+    touch_lb_poll_seconds_count 1
+    <BLANKLINE>
+    """
+    lines = []
+    with lock:
+        for metric_type, values in (('counter', counters), ('gauge', gauges)):
+            for name in sorted({name for name, _ in values}):
+                lines.append(f'# TYPE {prefix}{name} {metric_type}')
+                for (metric_name, labels), value in values.items():
+                    if metric_name == name:
+                        lines.append(f'{prefix}{name}{format_labels(labels)} {value}')
+        for name in sorted({name for name, _ in histograms}):
+            lines.append(f'# TYPE {prefix}{name} histogram')
+            for (metric_name, labels), histogram in histograms.items():
+                if metric_name == name:
+                    cumulative_count = 0
+                    for bucket, count in zip(default_buckets, histogram):
+                        cumulative_count += count
+                        lines.append(f'{prefix}{name}_bucket{format_labels(labels, le=bucket)} {cumulative_count}')
+                    lines.append(f'{prefix}{name}_bucket{format_labels(labels, le="+Inf")} {histogram[-1]}')
+                    lines.append(f'{prefix}{name}_sum{format_labels(labels)} {histogram[-2]}')
+                    lines.append(f'{prefix}{name}_count{format_labels(labels)} {histogram[-1]}')
+    return '\n'.join(lines) + '\n'
+
+
+def write(file_name):
+    """
+    Write the metrics to a text file, replacing it at once so a reader never sees it partially written.
+    """
+    temporary_file_name = f'{file_name}.tmp'
+    with open(temporary_file_name, 'w') as metrics_file:
+        metrics_file.write(render())
+    os.replace(temporary_file_name, file_name)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = render().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port, host='127.0.0.1'):
+    """
+    Serve the metrics over HTTP from a background thread.
+    """
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    return server
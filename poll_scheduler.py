@@ -0,0 +1,119 @@
+import random
+import time
+
+
+class PollScheduler:
+    """
+    Choose the delay before the next poll from how often the numbers change.
+
+    Right after a change, the polls are done every `min_interval` seconds, then the interval grows by `backoff_factor`
+    on each unchanged poll until the quiet interval. The quiet interval is a fraction (`detection_ratio`) of the
+    expected time between two changes, learned per hour of the day, and never exceeds `max_interval`. The interval
+    doubles on each consecutive error, and the delay never goes under the budget of the requests sent since the
+    previous poll, so that the polls of several categories and the requests of the bookings are charged too.
+    """
+
+    def __init__(self, min_interval=1.0, max_interval=30.0, requests_per_minute=60, backoff_factor=1.5, jitter=0.2,
+                 detection_ratio=0.1, decay=0.9):
+        """
+        :param min_interval: the shortest interval in seconds, used right after a change.
+        :param max_interval: the longest interval in seconds, also the limit of the error back off.
+        :param requests_per_minute: the request budget, each request sent delaying the next poll by
+        60 / requests_per_minute seconds at least.
+        :param backoff_factor: the growth of the interval on each unchanged poll.
+        :param jitter: the maximal random deviation of the delay, as a fraction of the interval.
+        :param detection_ratio: the quiet interval as a fraction of the expected time between two changes.
+        :param decay: the weight of the history of each hour against the latest observation.
+        """
+        self.request_interval = 60 / requests_per_minute
+        self.min_interval = max(min_interval, self.request_interval)
+        self.max_interval = max(max_interval, self.min_interval)
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.detection_ratio = detection_ratio
+        self.decay = decay
+        self.hourly_changes = [0.0] * 24
+        self.hourly_seconds = [0.0] * 24
+        self.interval = self.min_interval
+        self.errors = 0
+        self.last_poll = None
+
+    def update_history(self, changed, now=None, hour=None):
+        now = time.monotonic() if now is None else now
+        hour = time.localtime().tm_hour if hour is None else hour
+        if self.last_poll is not None:
+            self.hourly_seconds[hour] = self.decay * self.hourly_seconds[hour] + (now - self.last_poll)
+            self.hourly_changes[hour] = self.decay * self.hourly_changes[hour] + changed
+        self.last_poll = now
+        return hour
+
+    def record_poll(self, changed, now=None, hour=None):
+        """
+        Update the interval after a successful poll.
+        :param changed: True if the numbers changed since the previous poll.
+        :param now: the monotonic time of the poll, the current one by default.
+        :param hour: the hour of the day of the poll, the current one by default.
+
+        :Example:
+        >>> scheduler = PollScheduler(min_interval=1, max_interval=30, requests_per_minute=60)
+        >>> scheduler.record_poll(True, now=0, hour=0)
+        >>> scheduler.interval
+        1
+        >>> scheduler.record_poll(False, now=1, hour=0)
+        >>> scheduler.interval
+        1.5
+        >>> for now in range(2, 200):
+        ...     scheduler.record_poll(False, now=now, hour=0)
+        >>> scheduler.interval
+        30
+        """
+        hour = self.update_history(changed, now, hour)
+        self.errors = 0
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff_factor, self.get_quiet_interval(hour))
+            self.interval = max(self.interval, self.min_interval)
+
+    def record_error(self):
+        """
+        Back off exponentially after a failed poll.
+
+        :Example:
+        >>> scheduler = PollScheduler(min_interval=1, max_interval=30)
+        >>> for _ in range(3):
+        ...     scheduler.record_error()
+        >>> scheduler.interval
+        8
+        """
+        self.errors += 1
+        self.interval = min(self.min_interval * 2 ** self.errors, self.max_interval)
+
+    def get_quiet_interval(self, hour):
+        if self.hourly_changes[hour] <= 0:
+            return self.max_interval
+        expected_change_interval = self.hourly_seconds[hour] / self.hourly_changes[hour]
+        return min(max(expected_change_interval * self.detection_ratio, self.min_interval), self.max_interval)
+
+    def get_budget_delay(self, requests):
+        """
+        Get the shortest delay in seconds keeping the requests within the budget.
+        :param requests: the count of requests sent since the previous poll, including the ones of the poll.
+        """
+        return requests * self.request_interval
+
+    def next_delay(self, requests=1):
+        """
+        Get the delay in seconds before the next poll: the current interval with a random jitter, but never under the
+        budget of the requests sent since the previous poll.
+        :param requests: the count of requests sent since the previous poll, including the ones of the poll.
+
+        :Example:
+        >>> scheduler = PollScheduler(min_interval=1, max_interval=30, requests_per_minute=60)
+        >>> min(scheduler.next_delay() for _ in range(1000))
+        1.0
+        >>> scheduler.next_delay(requests=3)
+        3.0
+        """
+        delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(delay, self.get_budget_delay(requests))
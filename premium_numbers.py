@@ -1,5 +1,8 @@
-from itertools import chain
+from array import array
+from functools import cache
+from itertools import chain, permutations, product
 import re
+from typing import Iterable
 
 code = '(?:0?3|70|71|76|78|81)'
 phone_number_re = re.compile(rf'^{code}\d{{6}}$')
@@ -115,83 +118,291 @@ def diff_by_one_each_two_digits(number, ascending=None):
                 diff_by_one_each_two_digits(number, ascending=False))
 
 
+def is_ascending_and_descending(number_str):
+    return bool(phone_number_re.match(number_str)) and (
+            (has_digits_ordered_by_one_diff(number_str[-6:-3], 3, ascending=True) and
+             has_digits_ordered_by_one_diff(number_str[-3:], 3, ascending=False)) or
+            (has_digits_ordered_by_one_diff(number_str[-6:-3], 3, ascending=False) and
+             has_digits_ordered_by_one_diff(number_str[-3:], 3, ascending=True))
+    )
+
+
+category_predicates = {
+    'ab_only': lambda number_str: bool(phone_number_re.match(number_str)) and len(set(number_str[-6:])) == 2,
+    'aab_ccb': aab_ccb_re.match,
+    'abb_acc': abb_acc_re.match,
+    'aa_cd_aa': aa_cd_aa_re.match,
+    '03_ab_xc_ab': z3_ab_xc_ab_re.match,
+    'ab_ac_ac': ab_ac_ac_re.match,
+    '03_abc_bbc': z3_abc_bbc_re.match,
+    '03_abc_adc': z3_abc_adc_re.match,
+    'aba_aca': aba_aca_re.match,
+    'xxx_abx': xxx_abx_re.match,
+    'code_ab_code_ab': code_ab_code_ab_re.match,
+    '03_70_ab_ac_ad': z3_70_ab_ac_ad_re.match,
+    'ab_ac_ab': ab_ac_ab_re.match,
+    '81_a1_b1_c1': e1_a1_b1_c1_re.match,
+    'abc_only': lambda number_str: bool(phone_number_re.match(number_str)) and len(set(number_str[-6:])) == 3,
+    '03_abb_ccd': z3_abb_ccd_re.match,
+    '03_aa_bc_xx': z3_aa_bc_xx_re.match,
+    '03_ab_cc_dd': z3_ab_cc_dd_re.match,
+    'abc_mod_10': lambda number_str: bool(phone_number_re.match(number_str)) and
+    abs(int(number_str[-6:-3]) - int(number_str[-3:])) % 10 == 0 and number_str[-6] == number_str[-3],
+    'three_times_code': lambda number_str: number_str.count(number_str[:2]) >= 3,
+    '03_aab_ccd': z3_aab_ccd_re.match,
+    'xxx_abc': xxx_abc_re.match,
+    'five_digits_ordered': lambda number_str: (has_digits_ordered_by_one_diff(number_str[-6:], 5, ascending=True) or
+                                               has_digits_ordered_by_one_diff(number_str[-6:], 5, ascending=False)),
+    '03_aca_bca': z3_aca_bca_re.match,
+    '03_bca_aca': z3_bca_aca_re.match,
+    '03_a_cd_cd_x': z3_a_cd_cd_x_re.match,
+    'ascending_and_descending': is_ascending_and_descending,
+    'diff_by_one_each_two_digits': lambda number_str: bool(phone_number_re.match(number_str)) and
+    diff_by_one_each_two_digits(number_str[-6:]),
+    'ab_cb_xb': ab_cb_xb_re.match,
+}
+categories = tuple(category_predicates)
+category_bits = {category: 1 << index for index, category in enumerate(categories)}
+
+# Operator codes of the numbers as integers (the leading zero of 03 is lost), each followed by a 6-digit suffix.
+operator_codes = (3, 70, 71, 76, 78, 81)
+# Categories that compare the suffix digits to fixed values. All the others only depend on which digits of the
+# suffix are equal to each other.
+digit_value_categories = ('code_ab_code_ab', '81_a1_b1_c1', 'three_times_code', 'five_digits_ordered',
+                          'ascending_and_descending', 'diff_by_one_each_two_digits')
+digit_pattern_categories = tuple(category for category in categories if category not in digit_value_categories)
+
+
+def get_category_mask(number_str, checked_categories=categories):
+    """
+    Get the bitmask of the categories matched by a number.
+    :param number_str: the number as a string.
+    :param checked_categories: the categories to check, all of them by default.
+    :return: the sum of the bits (from `category_bits`) of the matched categories.
+
+    :Example:
+    >>> get_category_mask('71112211') == category_bits['ab_only'] | category_bits['aa_cd_aa']
+    True
+    >>> get_category_mask('71203145')
+    0
+    """
+    mask = 0
+    for category in checked_categories:
+        if category_predicates[category](number_str):
+            mask |= category_bits[category]
+    return mask
+
+
+def get_digit_patterns():
+    """
+    Generate the equality patterns of 6 digits, each digit being replaced by the index of its first occurrence.
+    :return: a generator of the 203 patterns as tuples.
+    """
+    def extend(pattern):
+        if len(pattern) == 6:
+            yield tuple(pattern)
+            return
+        for index in sorted(set(pattern)) + [len(pattern)]:
+            yield from extend(pattern + [index])
+    return extend([])
+
+
+def get_pattern_suffixes(pattern):
+    """
+    Get all the 6-digit suffixes having the given equality pattern.
+    :param pattern: a pattern generated by `get_digit_patterns`.
+    :return: the list of the suffixes as integers.
+    """
+    blocks = sorted(set(pattern))
+    weights = [sum(10 ** (5 - position) for position, index in enumerate(pattern) if index == block)
+               for block in blocks]
+    return [sum(digit * weight for digit, weight in zip(digits, weights))
+            for digits in permutations(range(10), len(blocks))]
+
+
+def with_two_occurrences(part, length):
+    """
+    Generate the digit strings of the given length that contain the given part twice without overlapping.
+    """
+    for first in range(length - 2 * len(part) + 1):
+        for second in range(first + len(part), length - len(part) + 1):
+            free_positions = [position for position in range(length)
+                              if not first <= position < first + len(part)
+                              and not second <= position < second + len(part)]
+            for free_digits in product('0123456789', repeat=len(free_positions)):
+                digits = [''] * length
+                digits[first:first + len(part)] = part
+                digits[second:second + len(part)] = part
+                for position, digit in zip(free_positions, free_digits):
+                    digits[position] = digit
+                yield ''.join(digits)
+
+
+def get_digit_value_candidates(code):
+    """
+    Generate suffixes that may match one of the `digit_value_categories` after the given operator code.
+    Every matching suffix is generated, the others are filtered out by the caller.
+    """
+    digits = '0123456789'
+    code_str = str(code)
+    runs = [''.join(map(str, range(start, start + step * length, step)))
+            for length in (3, 5) for step in (1, -1) for start in range(10) if 0 <= start + step * (length - 1) <= 9]
+    for run in runs:
+        if len(run) == 5:
+            for digit in digits:
+                yield run + digit
+                yield digit + run
+        else:
+            for other_run in runs:
+                if len(other_run) == 3:
+                    yield run + other_run
+    for start in range(100):
+        for step in (1, -1):
+            if 0 <= start + 2 * step <= 99:
+                yield f'{start:02}{start + step:02}{start + 2 * step:02}'
+    for a, b, c in product(digits, repeat=3):
+        yield f'{a}1{b}1{c}1'
+    if len(code_str) == 2:
+        for a, b in product(digits, repeat=2):
+            yield f'{a}{b}{code_str}{a}{b}'
+        yield from with_two_occurrences(code_str, 6)
+    else:
+        for first_digit in digits:
+            for rest in with_two_occurrences(code_str + first_digit, 5):
+                yield first_digit + rest
+
+
+@cache
+def get_category_tables():
+    """
+    Build, once per process, the category bitmasks of all the numbers of each operator code.
+    :return: a dict mapping each operator code to an array of the masks indexed by the 6-digit suffix.
+    """
+    tables = {code: array('I', [0]) * 1000000 for code in operator_codes}
+    for pattern in get_digit_patterns():
+        representative = ''.join(map(str, pattern))
+        masks = {code: get_category_mask(f'{code}{representative}', digit_pattern_categories)
+                 for code in operator_codes}
+        if any(masks.values()):
+            suffixes = get_pattern_suffixes(pattern)
+            for code, mask in masks.items():
+                if mask:
+                    table = tables[code]
+                    for suffix in suffixes:
+                        table[suffix] = mask
+    for code, table in tables.items():
+        for suffix_str in set(get_digit_value_candidates(code)):
+            table[int(suffix_str)] |= get_category_mask(f'{code}{suffix_str}', digit_value_categories)
+    return tables
+
+
+def classify_number(number):
+    """
+    Get the bitmask of the categories matched by a number, looking it up in `get_category_tables` when possible.
+    :param number: the number as an integer (or a string).
+    :return: the sum of the bits (from `category_bits`) of the matched categories.
+
+    :Example:
+    >>> classify_number(71112211) == get_category_mask('71112211')
+    True
+    >>> classify_number(3123456) == get_category_mask('3123456')
+    True
+    """
+    if type(number) is int and 1000000 <= number < 100000000:
+        code, suffix = divmod(number, 1000000)
+        table = get_category_tables().get(code)
+        if table is not None:
+            return table[suffix]
+    return get_category_mask(str(number))
+
+
+# Building the lookup tables takes longer than checking fewer numbers against the predicates
+lookup_tables_min_count = 10000
+
+
+def get_premium_number_categories(numbers):
+    """
+    Classify numbers into the categories, without listing the other numbers as `get_premium_numbers` does.
+    :return: a dict mapping each category to its numbers.
+
+    :Example:
+    >>> premium_number_categories = get_premium_number_categories([71112211, 70123456, 3123456])
+    >>> premium_number_categories == get_premium_numbers([71112211, 70123456, 3123456])[0]
+    True
+    """
+    premium_numbers = {category: [] for category in categories}
+    category_lists = list(premium_numbers.values())
+    if get_category_tables.cache_info().currsize or len(numbers) >= lookup_tables_min_count:
+        classify = classify_number
+    else:
+        classify = lambda number: get_category_mask(str(number))
+    for number in numbers:
+        mask = classify(number)
+        if mask:
+            number = int(number)
+            while mask:
+                bit = mask & -mask
+                category_lists[bit.bit_length() - 1].append(number)
+                mask ^= bit
+    return premium_numbers
+
+
 def get_premium_numbers(numbers):
-    numbers_str = list(map(str, numbers))
-    ab_only = [int(number_str) for number_str in numbers_str if phone_number_re.match(number_str)
-               and len(set(number_str[-6:])) == 2]
-    aab_ccb = [int(number_str) for number_str in numbers_str if aab_ccb_re.match(number_str)]
-    abb_acc = [int(number_str) for number_str in numbers_str if abb_acc_re.match(number_str)]
-    aa_cd_aa = [int(number_str) for number_str in numbers_str if aa_cd_aa_re.match(number_str)]
-    z3_ab_xc_ab = [int(number_str) for number_str in numbers_str if z3_ab_xc_ab_re.match(number_str)]
-    ab_ac_ac = [int(number_str) for number_str in numbers_str if ab_ac_ac_re.match(number_str)]
-    z3_abc_bbc = [int(number_str) for number_str in numbers_str if z3_abc_bbc_re.match(number_str)]
-    z3_abc_adc = [int(number_str) for number_str in numbers_str if z3_abc_adc_re.match(number_str)]
-    aba_aca = [int(number_str) for number_str in numbers_str if aba_aca_re.match(number_str)]
-    xxx_abx = [int(number_str) for number_str in numbers_str if xxx_abx_re.match(number_str)]
-    code_ab_code_ab = [int(number_str) for number_str in numbers_str if code_ab_code_ab_re.match(number_str)]
-    z3_70_ab_ac_ad = [int(number_str) for number_str in numbers_str if z3_70_ab_ac_ad_re.match(number_str)]
-    ab_ac_ab = [int(number_str) for number_str in numbers_str if ab_ac_ab_re.match(number_str)]
-    e1_a1_b1_c1 = [int(number_str) for number_str in numbers_str if e1_a1_b1_c1_re.match(number_str)]
-    abc_only = [int(number_str) for number_str in numbers_str if phone_number_re.match(number_str)
-                and len(set(number_str[-6:])) == 3]
-    z3_abb_ccd = [int(number_str) for number_str in numbers_str if z3_abb_ccd_re.match(number_str)]
-    z3_aa_bc_xx = [int(number_str) for number_str in numbers_str if z3_aa_bc_xx_re.match(number_str)]
-    z3_ab_cc_dd = [int(number_str) for number_str in numbers_str if z3_ab_cc_dd_re.match(number_str)]
-    abc_mod_10 = [int(number_str) for number_str in numbers_str if phone_number_re.match(number_str) and
-                  abs(int(number_str[-6:-3]) - int(number_str[-3:])) % 10 == 0 and number_str[-6] == number_str[-3]]
-    three_times_code = [int(number_str) for number_str in numbers_str if number_str.count(number_str[:2]) >= 3]
-    z3_aab_ccd = [int(number_str) for number_str in numbers_str if z3_aab_ccd_re.match(number_str)]
-    xxx_abc = [int(number_str) for number_str in numbers_str if xxx_abc_re.match(number_str)]
-    five_digits_ordered = [int(number_str) for number_str in numbers_str if
-                           has_digits_ordered_by_one_diff(number_str[-6:], 5, ascending=True) or
-                           has_digits_ordered_by_one_diff(number_str[-6:], 5, ascending=False)]
-    z3_aca_bca = [int(number_str) for number_str in numbers_str if z3_aca_bca_re.match(number_str)]
-    z3_bca_aca = [int(number_str) for number_str in numbers_str if z3_bca_aca_re.match(number_str)]
-    z3_a_cd_cd_x = [int(number_str) for number_str in numbers_str if z3_a_cd_cd_x_re.match(number_str)]
-    ascending_and_descending = [
-        int(number_str) for number_str in numbers_str
-        if phone_number_re.match(number_str) and (
-                (has_digits_ordered_by_one_diff(number_str[-6:-3], 3, ascending=True) and
-                 has_digits_ordered_by_one_diff(number_str[-3:], 3, ascending=False)) or
-                (has_digits_ordered_by_one_diff(number_str[-6:-3], 3, ascending=False) and
-                 has_digits_ordered_by_one_diff(number_str[-3:], 3, ascending=True))
-        )
-    ]
-    diff_by_one_each_two_digits_numbers = [
-        int(number_str) for number_str in numbers_str
-        if phone_number_re.match(number_str) and diff_by_one_each_two_digits(number_str[-6:])
-    ]
-    ab_cb_xb = [int(number_str) for number_str in numbers_str if ab_cb_xb_re.match(number_str)]
-    premium_numbers = {
-        'ab_only': ab_only,
-        'aab_ccb': aab_ccb,
-        'abb_acc': abb_acc,
-        'aa_cd_aa': aa_cd_aa,
-        '03_ab_xc_ab': z3_ab_xc_ab,
-        'ab_ac_ac': ab_ac_ac,
-        '03_abc_bbc': z3_abc_bbc,
-        '03_abc_adc': z3_abc_adc,
-        'aba_aca': aba_aca,
-        'xxx_abx': xxx_abx,
-        'code_ab_code_ab': code_ab_code_ab,
-        '03_70_ab_ac_ad': z3_70_ab_ac_ad,
-        'ab_ac_ab': ab_ac_ab,
-        '81_a1_b1_c1': e1_a1_b1_c1,
-        'abc_only': abc_only,
-        '03_abb_ccd': z3_abb_ccd,
-        '03_aa_bc_xx': z3_aa_bc_xx,
-        '03_ab_cc_dd': z3_ab_cc_dd,
-        'abc_mod_10': abc_mod_10,
-        'three_times_code': three_times_code,
-        '03_aab_ccd': z3_aab_ccd,
-        'xxx_abc': xxx_abc,
-        'five_digits_ordered': five_digits_ordered,
-        '03_aca_bca': z3_aca_bca,
-        '03_bca_aca': z3_bca_aca,
-        '03_a_cd_cd_x': z3_a_cd_cd_x,
-        'ascending_and_descending': ascending_and_descending,
-        'diff_by_one_each_two_digits': diff_by_one_each_two_digits_numbers,
-        'ab_cb_xb': ab_cb_xb
-    }
+    premium_numbers = get_premium_number_categories(numbers)
     other_numbers = sorted(set(numbers) - set(chain(*premium_numbers.values())))
     return premium_numbers, other_numbers
+
+
+def get_excluded_abc_only(premium_number_categories: dict[str, Iterable[int]]) -> set[int]:
+    premium_number_categories_without_abc_only = premium_number_categories.copy()
+    del premium_number_categories_without_abc_only['abc_only']
+    excluded_abc_only = set(premium_number_categories['abc_only']).difference(
+        *premium_number_categories_without_abc_only.values()
+    )
+    return excluded_abc_only
+
+
+@cache
+def get_category_table_array():
+    """
+    Stack the arrays of `get_category_tables` into a NumPy matrix, one row per operator code.
+    :return: the matrix and an array mapping each 2-digit code to its row (-1 for the unknown codes).
+    """
+    import numpy as np
+    tables = get_category_tables()
+    table_array = np.stack([np.frombuffer(tables[code], dtype=np.uintc) for code in operator_codes])
+    code_rows = np.full(100, -1, dtype=np.intp)
+    code_rows[list(operator_codes)] = np.arange(len(operator_codes))
+    return table_array, code_rows
+
+
+def classify_number_array(numbers):
+    """
+    Get the category bitmasks of a batch of numbers at once.
+    :param numbers: a NumPy int64 array (or any sequence of integers).
+    :return: a NumPy array of the bitmasks (see `category_bits`), one per number.
+    """
+    import numpy as np
+    numbers = np.asarray(numbers, dtype=np.int64)
+    table_array, code_rows = get_category_table_array()
+    codes, suffixes = np.divmod(numbers, 1000000)
+    rows = np.where((numbers >= 1000000) & (numbers < 100000000), code_rows[np.clip(codes, 0, 99)], -1)
+    known = rows >= 0
+    masks = np.zeros(numbers.shape, dtype=np.uintc)
+    masks[known] = table_array[rows[known], suffixes[known]]
+    for index in np.flatnonzero(~known):
+        masks[index] = get_category_mask(str(numbers[index]))
+    return masks
+
+
+def get_premium_number_indices(numbers):
+    """
+    Vectorized version of `get_premium_numbers` for large batches of numbers.
+    :param numbers: a NumPy int64 array (or any sequence of integers).
+    :return: a dict mapping each category to the array of the indices of its numbers, and the indices of the other
+     numbers.
+    """
+    import numpy as np
+    masks = classify_number_array(numbers)
+    premium_indices = {category: np.flatnonzero(masks & bit) for category, bit in category_bits.items()}
+    return premium_indices, np.flatnonzero(masks == 0)
@@ -1,23 +1,32 @@
+import asyncio
 import os
-from urllib.parse import quote
-from logging import getLogger, basicConfig, FileHandler, StreamHandler
+import re
+import threading
+import time
+import hashlib
+from dataclasses import dataclass, field, replace
+from html.parser import HTMLParser
+from functools import lru_cache
+from string import Formatter
+from urllib.parse import quote, urlsplit
+from logging import getLogger
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 
-basicConfig(
-    level=os.getenv('LOG_LEVEL', 'INFO'), format='%(asctime)s [%(levelname)s]: %(message)s',
-    handlers=[FileHandler('touch_lb_numbers.log'), StreamHandler()]
-)
+import metrics
+
 logger = getLogger(__name__)
 
-url = "https://touch.com.lb/autoforms/portal/touch/onlinereservation"
+default_category = 'MICRO'
+
+url = os.getenv('TOUCH_LB_URL', "https://touch.com.lb/autoforms/portal/touch/onlinereservation")
 
-booking_page_payload = 'nb1=&nb2=&nb3=&nb4=&nb5=&nb6=&nb7=&nb8=&CatReg=MICRO&Category=&typ=1'
+booking_page_payload = 'nb1=&nb2=&nb3=&nb4=&nb5=&nb6=&nb7=&nb8=&CatReg={category}&Category=&typ=1'
 
-gsm_booking_payload = 'idtyp={id_type}&id={id}&id2=%24id2&expid=%24expid&gsmsearch=________&selectedGSM={gsm}&selectedcategory=MICRO&selectedtyp=MICRO&typ=2'
+gsm_booking_payload = 'idtyp={id_type}&id={id}&id2=%24id2&expid=%24expid&gsmsearch=________&selectedGSM={gsm}&selectedcategory={category}&selectedtyp={category}&typ=2'
 
-booking_info_payload = 'formName=OnlineReservationForm&justvalidate=0&formvalidated=0&hiddenregion=001-001%2C%D8%A7%D8%AF%D9%85%D8%A7+%D8%A7%D9%84%D8%AF%D9%81%D9%86%D9%87%3B001-002%2C%D8%A7%D9%84%D8%BA%D8%A8%D9%8A%D8%B1%D9%8A+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B001-003%2C%D8%A7%D9%81%D9%82%D8%A7%3B001-004%2C%D8%A7%D8%A8%D9%88+%D9%85%D9%8A%D8%B2%D8%A7%D9%86%3B001-005%2C%D8%A7%D9%84%D9%85%D8%B4%D8%B1%D9%81%D9%87%3B001-006%2C%D8%AF%D9%8A%D8%B1+%D8%A8%D8%A7%D8%A8%D8%A7%3B001-007%2C%D8%AA%D9%84%D8%A8%D9%8A%D8%A8%D8%A9%3B001-008%2C%D8%A7%D9%84%D9%85%D9%87%D8%A7%D8%AA%D8%B1%D9%87%3B001-009%2C%D8%A7%D9%84%D8%AF%D9%8A%D9%85%D8%A7%D9%86%3B001-010%2C%D8%AC%D8%B1%D8%A7%D9%86%3B001-011%2C%D8%A7%D8%AC%D8%A8%D8%B9%3B001-012%2C%D8%B6%D9%87%D9%88%D8%B1+%D8%A7%D9%84%D9%87%D9%88%D8%A7%3B001-013%2C%D8%B9%D8%B2%D9%82%D9%8A%3B001-014%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%AA%D8%A7%D9%86%3B001-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B001-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%85%D8%A7%D8%B1+%D8%A7%D9%86%D8%B7%D9%88%D9%86%D9%8A%D9%88%D8%B3%3B001-017%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D8%B1%D9%87%3B001-018%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%D9%87%3B001-019%2C%D9%83%D9%81%D8%B1%D8%A8%D9%8A%D8%AA%3B001-020%2C%D8%A7%D9%84%D9%86%D8%A7%D9%82%D9%88%D8%B1%D8%A9%3B001-021%2C%D8%B2%D8%AD%D9%84%D8%AA%D8%A7%3B001-022%2C%D8%A7%D8%B1%D9%86%D9%88%D9%86%3B001-023%2C%D8%A7%D9%84%D9%85%D8%AC%D9%8A%D8%AF%D9%8A%D8%A9%3B001-024%2C%D8%A7%D8%A8%D9%84+%D8%A7%D9%84%D8%B3%D9%82%D9%8A%3B001-025%2C%D8%A7%D9%84%D8%AC%D9%85%D9%8A%D8%AC%D9%85%D9%87%3B001-026%2C%D8%A7%D9%84%D8%B1%D9%85%D9%8A%D9%84%3B001-027%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%B4%D9%88%D8%B1%D8%A9%3B001-028%2C%D9%85%D9%8A%D9%86%D8%A7%D8%A1+%D8%A7%D9%84%D8%AD%D8%B5%D9%86%3B001-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AF%D9%83%D8%B1%D9%85%D8%A7%D9%86%3B002-001%2C%D8%A7%D8%BA%D8%A8%D9%87%3B002-002%2C%D8%A7%D9%84%D8%BA%D8%A8%D9%8A%D8%B1%D9%8A+%D8%A8%D8%A6%D8%B1+%D8%AD%D8%B3%D9%86%3B002-003%2C%D8%A7%D8%AF%D9%87%3B002-004%2C%D8%A7%D9%84%D8%A8%D9%88%D8%B4%D8%B1%D9%8A%D8%A9%3B002-005%2C%D8%A8%D8%B9%D9%88%D8%B1%D8%AA%D9%87%3B002-006%2C%D8%AF%D9%8A%D8%B1+%D8%AF%D9%88%D8%B1%D9%8A%D8%AA%3B002-007%2C%D8%A7%D9%84%D9%87%D9%8A%D8%B4%D9%87%3B002-008%2C%D8%A7%D9%84%D9%85%D9%8A%D9%86%D8%A7%D8%A1%3B002-009%2C%D8%A7%D9%84%D9%85%D8%BA%D8%B1+%D9%88%D8%A8%D9%84%D8%A7%3B002-010%2C%D8%AC%D8%B1%D8%A8%D8%AA%D8%A7%3B002-011%2C%D8%A7%D8%B1%D8%AF%D9%87%3B002-012%2C%D8%A7%D8%AC%D8%AF%D8%B9%D8%A8%D8%B1%D9%8A%D9%86%3B002-013%2C%D9%86%D9%85%D8%B1%D9%8A%D9%86%3B002-014%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9%3B002-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7+%D8%AD%D9%8A+%D8%AD%D9%82%D9%84+%D8%A7%D9%84%D8%B9%D8%B1%D8%AC%D8%A9%3B002-016%2C%D8%A7%D8%A8%D9%84%D8%AD%3B002-017%2C%D8%A7%D9%84%D8%AF%D9%83%D9%88%D8%A9%3B002-018%2C%D8%A7%D9%84%D8%AD%D9%88%D8%B4%3B002-019%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%B2%D9%8A%D8%A9%3B002-020%2C%D8%AC%D9%86%D8%A7%D8%AA%D8%A7%3B002-021%2C%D8%B9%D8%A7%D8%B2%D9%88%D8%B1%3B002-022%2C%D8%AC%D8%A8%D8%A7%D8%B9%3B002-023%2C%D8%A7%D8%A8%D9%88+%D9%82%D9%85%D8%AD%D8%A9%3B002-024%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9%3B002-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D8%B1%D9%83%D9%87%3B002-026%2C%D8%A7%D9%84%D8%B5%D9%8A%D9%81%D9%8A%3B002-027%2C%D8%A7%D9%84%D9%85%D8%AF%D9%88%D8%B1%3B002-028%2C%D8%A7%D9%84%D9%85%D8%B2%D8%B1%D8%B9%D8%A9%3B002-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D8%B3%D8%B7%D8%A7%D9%86%D9%8A%3B003-001%2C%D8%A7%D9%84%D8%A8%D9%88%D8%A7%D8%B1%3B003-002%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D8%AC%D9%86%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%86%D8%B4%D9%8A%D8%A9%3B003-003%2C%D8%A7%D8%AF%D9%88%D9%86%D9%8A%D8%B3+%D9%88%D8%B3%D9%86%D9%88%D8%B1%3B003-004%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B003-005%2C%D8%AF%D9%8A%D8%B1+%D9%82%D9%88%D8%A8%D9%84%3B003-006%2C%D8%AF%D9%8A%D8%B1+%D9%83%D9%88%D8%B4%D9%87%3B003-007%2C%D8%A7%D9%84%D8%B1%D8%A7%D9%85%D9%87%3B003-008%2C%D8%A7%D9%84%D8%B2%D9%87%D8%B1%D9%8A%D8%A9%3B003-009%2C%D8%A8%D8%A7%D9%86%3B003-010%2C%D8%AD%D8%A7%D9%85%D8%A7%D8%AA%3B003-011%2C%D8%A7%D8%B5%D9%86%D9%88%D9%86%3B003-012%2C%D8%A7%D9%84%D8%A8%D8%AD%D8%B5%D8%A7%D8%B5%3B003-013%2C%D8%A7%D9%84%D8%AD%D8%A7%D8%B2%D9%85%D9%8A%D8%A9%3B003-014%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%D8%A9%3B003-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B003-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D8%A8%D8%B1%D8%A8%D8%A7%D8%B1%D9%87%3B003-017%2C%D8%A7%D9%84%D8%B1%D9%88%D8%B6%D9%87%3B003-018%2C%D8%A7%D9%84%D8%B1%D9%81%D9%8A%D8%AF%3B003-019%2C%D8%A8%D8%B1%D8%AA%D9%8A%3B003-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B5%D8%A7%D8%B1%D9%88%D9%8A%3B003-021%2C%D9%83%D9%81%D8%B1%D8%AD%D9%88%D9%86%D8%A9%3B003-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86%3B003-023%2C%D8%A7%D9%84%D8%AE%D9%84%D9%88%D8%A7%D8%AA%3B003-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B003-025%2C%D8%B9%D9%8A%D8%AA%D8%B1%D9%88%D9%86%3B003-026%2C%D8%A7%D9%84%D8%A7%D8%B4%D8%B1%D9%81%D9%8A%D8%A9%3B003-027%2C%D8%A7%D9%84%D9%85%D8%B1%D9%81%D8%A3%3B003-028%2C%D8%A7%D9%84%D9%85%D8%B5%D9%8A%D8%B7%D8%A8%D8%A9%3B003-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D9%86%D9%82%D9%88%D9%84%D8%A7%3B004-001%2C%D8%A7%D9%84%D8%AD%D8%B5%D9%8A%D9%86%3B004-002%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D8%AC%D9%86%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%A7%D8%AF%3B004-003%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%A8%D8%A7%D8%B1%D9%87%3B004-004%2C%D8%A7%D9%84%D8%AC%D9%88%D8%A7%D8%B1%3B004-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B004-006%2C%D8%B3%D8%A8%D9%84%D9%8A%D9%86%3B004-007%2C%D8%B1%D8%AC%D9%85+%D8%B9%D9%8A%D8%B3%D9%89%3B004-008%2C%D8%A7%D9%84%D8%B3%D9%88%D9%8A%D9%82%D8%A9%3B004-009%2C%D8%A8%D8%B1%D8%AD%D9%84%D9%8A%D9%88%D9%86%3B004-010%2C%D8%AD%D8%AF%D8%AA%D9%88%D9%86%3B004-011%2C%D8%A7%D9%84%D8%A8%D8%AD%D9%8A%D8%B1%D9%87%3B004-012%2C%D8%A7%D9%84%D9%85%D8%AC%D8%AF%D9%84%3B004-013%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%86%D9%88%D8%A8%3B004-014%2C%D8%A7%D9%84%D8%AD%D8%B1%D9%8A%D9%82%D8%A9%3B004-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B004-016%2C%D8%A7%D9%84%D8%AA%D9%88%D9%8A%D8%AA%D8%A9%3B004-017%2C%D8%A7%D9%84%D8%B3%D9%84%D8%B7%D8%A7%D9%86+%D9%8A%D8%B9%D9%82%D9%88%D8%A8+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B004-018%2C%D8%A7%D9%84%D8%B9%D9%82%D8%A8%D8%A9%3B004-019%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D9%85%D9%8A%D8%A9%3B004-020%2C%D8%B4%D8%AD%D9%88%D8%B1%3B004-021%2C%D8%A7%D9%84%D8%AC%D8%B1%D9%85%D9%82%3B004-022%2C%D8%B2%D9%88%D8%B7%D8%B1+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%D8%A9%3B004-023%2C%D8%A7%D9%84%D8%AF%D9%84%D8%A7%D9%81%D9%87%3B004-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%8A%D9%88%D9%86%3B004-025%2C%D9%8A%D8%A7%D8%B7%D8%B1%3B004-028%2C%D8%B1%D8%A7%D8%B3+%D8%A8%D9%8A%D8%B1%D9%88%D8%AA%3B004-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B2%D9%88%D9%8A%D8%AA%D9%8A%D9%86%D9%8A%3B005-001%2C%D8%A7%D9%84%D8%B2%D8%B9%D9%8A%D8%AA%D8%B1%D9%87%3B005-002%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D8%AC%D9%86%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%86%D8%AF%D9%8A%D8%A7%D9%86%3B005-003%2C%D8%A7%D9%84%D8%AC%D9%84%D9%8A%D8%B3%D8%A9%3B005-004%2C%D8%A7%D9%84%D8%AE%D9%84%D9%87%3B005-005%2C%D8%B9%D9%8A%D9%86+%D8%AF%D8%B1%D8%A7%D9%81%D9%8A%D9%84%3B005-006%2C%D8%B3%D8%B1%D8%AC%D8%A8%D8%A7%D9%84%3B005-007%2C%D8%AE%D8%B7+%D8%A7%D9%84%D8%A8%D8%AA%D8%B1%D9%88%D9%84%3B005-008%2C%D8%A7%D9%84%D9%82%D8%A8%D8%A9%3B005-009%2C%D8%A8%D8%B1%D9%8A%D8%B3%D8%A7%D8%AA%3B005-010%2C%D8%AD%D8%B1%D8%AF%D9%8A%D9%86%3B005-011%2C%D8%A7%D9%84%D9%82%D8%A7%D8%AF%D8%B1%D9%8A%D9%87%3B005-012%2C%D8%A7%D9%84%D9%86%D8%AE%D9%84%D8%A9%3B005-013%2C%D8%A7%D9%84%D8%B1%D9%88%D8%B6%D8%A9%3B005-014%2C%D8%A7%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D9%8A%3B005-015%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D9%87+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B005-016%2C%D8%A7%D9%84%D8%AF%D9%84%D9%87%D9%85%D9%8A%D8%A9%3B005-017%2C%D8%A7%D9%84%D8%B3%D9%84%D8%B7%D8%A7%D9%86+%D9%8A%D8%B9%D9%82%D9%88%D8%A8+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B005-018%2C%D8%A7%D9%84%D9%85%D8%AD%D9%8A%D8%AF%D8%AB%D8%A9%3B005-020%2C%D8%B7%D9%8A%D8%B1+%D8%AF%D8%A8%D8%A7%3B005-021%2C%D8%A7%D9%84%D8%AD%D8%B1%D9%81%3B005-022%2C%D8%A7%D9%84%D8%AF%D9%88%D9%8A%D8%B1%3B005-023%2C%D8%A7%D9%84%D9%81%D8%B1%D8%AF%D9%8A%D8%B3%3B005-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%82%D9%84%D8%B9%D8%A9%3B005-025%2C%D8%A7%D9%84%D8%B3%D9%84%D8%B7%D8%A7%D9%86%D9%8A%D9%87%3B005-028%2C%D8%AF%D8%A7%D8%B1+%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%B3%D8%A9%3B005-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%A8%D9%8A%D9%84%3B006-001%2C%D8%A7%D9%84%D8%B5%D9%81%D8%B1%D8%A7%3B006-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D8%B1%D9%8A%D9%83+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B006-003%2C%D8%A7%D9%84%D8%AD%D8%B5%D9%88%D9%86%3B006-004%2C%D8%A7%D9%84%D8%AE%D9%86%D8%B4%D8%A7%D8%B1%D8%A9%3B006-005%2C%D8%A7%D8%BA%D9%85%D9%8A%D8%AF%3B006-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B006-007%2C%D8%A7%D9%84%D8%B9%D9%88%D8%A7%D8%AF%D9%87%3B006-008%2C%D8%A7%D9%84%D9%82%D9%84%D9%85%D9%88%D9%86%3B006-009%2C%D8%A8%D8%B2%D8%B9%D9%88%D9%86%3B006-010%2C%D8%AD%D9%84%D8%AA%D8%A7%3B006-011%2C%D8%A7%D9%8A%D8%B7%D9%88%3B006-012%2C%D8%A7%D9%85%D9%8A%D9%88%D9%86+%D8%B4%D8%B1%D9%82%D9%8A%3B006-013%2C%D8%A7%D9%84%D8%B3%D9%81%D9%8A%D8%B1%D8%A9%3B006-014%2C%D8%A7%D9%84%D8%AE%D8%B1%D8%A7%D9%8A%D8%A8%3B006-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B006-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D8%B1%D8%A7%D8%B3%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B006-017%2C%D8%A7%D9%84%D8%B4%D8%A8%D8%B1%D9%82%D9%8A%D8%A9%3B006-018%2C%D8%A8%D9%83%D8%A7%3B006-019%2C%D8%B2%D8%BA%D8%AF%D8%B1%D8%A7%D9%8A%D8%A7%3B006-020%2C%D9%82%D8%A7%D9%86%D8%A7%3B006-021%2C%D8%A7%D9%84%D8%AD%D8%B3%D8%A7%D9%86%D9%8A%D9%87%3B006-022%2C%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%D8%A9%3B006-023%2C%D8%A7%D9%84%D9%83%D9%81%D9%8A%D8%B1%3B006-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%AF%D8%A7%D8%B1%D8%B3%3B006-025%2C%D8%A7%D9%84%D8%B7%D9%8A%D8%B1%D9%8A%3B006-028%2C%D8%B2%D9%82%D8%A7%D9%82+%D8%A7%D9%84%D8%A8%D9%84%D8%A7%D8%B7%3B006-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B007-001%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%B1%D9%87+%D9%88%D8%B4%D9%88%D8%A7%D9%86%3B007-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D8%B1%D9%8A%D9%83+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B1%D9%88%D9%8A%D8%B3%3B007-003%2C%D8%A7%D9%84%D8%AE%D8%A7%D8%B1%D8%A8%D8%A9%3B007-004%2C%D8%A7%D9%84%D8%AF%D9%83%D9%88%D8%A7%D9%86%D9%87%3B007-005%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%A7%D8%AA%D9%8A%D9%86%3B007-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%87%D9%84%D8%A9%3B007-007%2C%D8%AC%D8%B1%D9%85%D9%86%D8%A7%D9%8A%D8%A7%3B007-008%2C%D8%A7%D9%84%D9%86%D9%88%D8%B1%D9%8A%3B007-009%2C%D8%A8%D9%82%D8%A7%D8%B9%D9%83%D9%81%D8%B1%D8%A7%3B007-010%2C%D8%AF%D8%A7%D8%B9%D9%84%3B007-011%2C%D8%A7%D9%8A%D8%B9%D8%A7%D9%84%3B007-012%2C%D8%A7%D9%85%D9%8A%D9%88%D9%86+%D8%BA%D8%B1%D8%A8%D9%8A%3B007-013%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D9%86%3B007-014%2C%D8%A7%D9%84%D8%B2%D9%88%D9%8A%D8%AA%D9%8A%D9%86%D9%8A%3B007-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%A7%D8%B1%D8%A9%3B007-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D8%B1%D8%A7%D8%B3%D9%8A%D8%A9+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B007-017%2C%D8%A7%D9%84%D8%B5%D9%88%D9%8A%D8%B1%D9%8A%3B007-018%2C%D8%A8%D9%83%D9%8A%D9%81%D8%A7%3B007-019%2C%D8%B2%D9%8A%D8%AA%D8%A7%3B007-020%2C%D9%8A%D8%A7%D8%B1%D9%8A%D9%86%3B007-021%2C%D8%A7%D9%84%D8%AD%D9%85%D8%B5%D9%8A%D9%87%3B007-022%2C%D8%A7%D9%84%D9%82%D8%B5%D9%8A%D8%A8%D8%A9%3B007-023%2C%D8%A7%D9%84%D9%87%D8%A8%D8%A7%D8%B1%D9%8A%D8%A9%3B007-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B007-025%2C%D8%A7%D9%84%D8%BA%D9%86%D8%AF%D9%88%D8%B1%D9%8A%D9%87%3B007-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%A7%D8%B1%D8%B9%3B008-001%2C%D8%A7%D9%84%D8%B9%D8%B0%D8%B1%D8%A7%3B008-002%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%A7%D8%AD+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B008-003%2C%D8%A7%D9%84%D8%B1%D8%A7%D9%85%D9%88%D8%B7%3B008-004%2C%D8%A7%D9%84%D8%AF%D9%88%D8%A7%D8%B1%3B008-005%2C%D8%A7%D9%84%D8%A8%D9%86%D9%8A%D9%87%3B008-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B1%D9%8A%D9%81%D8%A9%3B008-007%2C%D9%83%D8%B1%D9%85+%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B008-008%2C%D8%A7%D9%84%D8%AA%D8%A8%D8%A7%D9%86%D8%A9%3B008-009%2C%D8%A8%D9%82%D8%B1%D9%82%D8%A7%D8%B4%D8%A7%3B008-010%2C%D8%AF%D8%B1%D9%8A%D8%A7%3B008-011%2C%D8%A8%D8%B3%D9%84%D9%88%D9%82%D9%8A%D8%B7%3B008-012%2C%D8%A7%D9%86%D9%81%D9%87%3B008-013%2C%D8%A7%D9%84%D9%82%D8%B7%D9%8A%D9%86%3B008-014%2C%D8%A7%D9%84%D8%B3%D9%88%D9%8A%D8%B3%D8%A9%3B008-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B008-016%2C%D8%A7%D9%84%D9%81%D8%B1%D8%B2%D9%84+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B008-017%2C%D8%A7%D9%84%D9%82%D8%B1%D8%B9%D9%88%D9%86%3B008-018%2C%D8%A8%D9%8A%D8%AA+%D9%84%D9%87%D9%8A%D8%A7%3B008-019%2C%D8%B7%D8%A8%D8%A7%D9%8A%D8%A7%3B008-020%2C%D8%A7%D8%B1%D8%B2%D9%88%D9%86%3B008-021%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%3B008-022%2C%D8%A7%D9%84%D9%83%D9%81%D9%88%D8%B1%3B008-023%2C%D8%A8%D8%B1%D8%BA%D8%B2%3B008-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%B4%D8%B1%D9%82%D9%8A%3B008-025%2C%D8%A7%D9%84%D9%82%D9%88%D8%B2%D8%AD%3B008-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%82%D9%86%D8%A7%D9%8A%D8%A9%3B009-001%2C%D8%A7%D9%84%D8%B9%D9%82%D9%8A%D8%A8%D9%87%3B009-002%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%A7%D8%AD+%D8%AD%D9%8A+%D9%83%D8%B1%D9%85+%D8%A7%D9%84%D8%B2%D9%8A%D8%AA%D9%88%D9%86%3B009-003%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%87%3B009-004%2C%D8%A7%D9%84%D8%AF%D9%8A%D8%B4%D9%88%D9%86%D9%8A%D8%A9%3B009-005%2C%D8%A7%D9%84%D8%AA%D8%B9%D8%B2%D8%A7%D9%86%D9%8A%D9%87%3B009-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%B4%D8%AD%D8%B1%D9%88%D8%B1%3B009-007%2C%D8%A8%D9%86%D9%8A+%D8%B5%D8%AE%D8%B1%3B009-008%2C%D8%A7%D9%84%D8%AA%D9%84%3B009-009%2C%D8%A8%D9%84%D9%88%D8%B2%D8%A7%3B009-010%2C%D8%AF%D9%88%D9%85%D8%A7%3B009-011%2C%D8%A8%D8%B4%D9%86%D9%8A%D9%86%3B009-012%2C%D8%A8%D8%AA%D8%B1%D9%88%D9%85%D9%8A%D9%86%3B009-013%2C%D8%A7%D9%84%D9%82%D9%85%D8%A7%D9%85%D9%8A%D9%86%3B009-014%2C%D8%A7%D9%84%D8%B4%D8%B1%D8%A8%D9%8A%D9%86%3B009-015%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%AA%3B009-016%2C%D8%A7%D9%84%D9%81%D8%B1%D8%B2%D9%84+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B009-017%2C%D8%A7%D9%84%D9%85%D9%86%D8%A7%D8%B1%D9%87%3B009-018%2C%D8%AA%D9%86%D9%88%D8%B1%D9%87%3B009-019%2C%D8%B7%D9%86%D8%A8%D9%88%D8%B1%D9%8A%D8%AA%3B009-020%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%B2%D9%88%D8%B1%D9%8A%D8%A9%3B009-021%2C%D8%A7%D9%84%D8%B3%D8%B1%D9%8A%D8%B1%D8%A9%3B009-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B009-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B009-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B009-025%2C%D8%A8%D8%B1%D8%AC+%D9%82%D9%84%D8%A7%D9%88%D9%8A%D9%87%3B009-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D8%B4%D9%83%3B010-001%2C%D8%A7%D9%84%D8%BA%D9%8A%D9%86%D9%87%3B010-002%2C%D8%A7%D8%B1%D8%B5%D9%88%D9%86%3B010-003%2C%D8%A7%D9%84%D8%B9%D8%A7%D9%82%D9%88%D8%B1%D8%A9%3B010-004%2C%D8%A7%D9%84%D8%B1%D8%A7%D8%A8%D9%8A%D8%A9%3B010-005%2C%D8%A7%D9%84%D8%B1%D8%AC%D9%85%D8%A9%3B010-006%2C%D8%B4%D9%88%D8%B1%D9%8A%D8%AA%3B010-007%2C%D8%A7%D9%84%D9%81%D8%B1%D8%B6%3B010-008%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%A7%D8%AF%D9%8A%D9%86%3B010-009%2C%D8%A8%D9%8A%D8%AA+%D9%85%D9%86%D8%B0%D8%B1%3B010-010%2C%D8%AF%D9%8A%D8%B1+%D8%A8%D9%84%D8%A7%3B010-011%2C%D8%A8%D9%86%D8%B4%D8%B9%D9%8A%3B010-012%2C%D8%A8%D8%AA%D8%B9%D8%A8%D9%88%D8%B1%D8%A9%3B010-013%2C%D8%A7%D9%84%D9%88%D8%A7%D8%B7%D9%8A%D9%87%3B010-014%2C%D8%A7%D9%84%D8%B4%D9%88%D8%A7%D8%BA%D9%8A%D8%B1%3B010-015%2C%D8%A7%D9%84%D8%AD%D9%84%D8%A7%D9%86%D9%8A%D8%A9%3B010-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%83%D8%B1%D9%83+%D9%86%D9%88%D8%AD%3B010-017%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D8%A9%3B010-018%2C%D8%AD%D9%84%D9%88%D8%A9%3B010-019%2C%D8%B9%D8%A8%D8%B1%D8%A7%3B010-020%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%BA%D9%84%D9%8A%D8%A9%3B010-021%2C%D8%A7%D9%84%D8%B9%D9%8A%D8%B4%D9%8A%D9%87%3B010-022%2C%D8%A7%D9%84%D9%86%D9%85%D9%8A%D8%B1%D9%8A%D8%A9%3B010-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B010-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%BA%D8%B1%D8%A8%D9%8A%3B010-025%2C%D8%A8%D8%B1%D8%B9%D8%B4%D9%8A%D8%AA%3B010-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D8%A7%D9%86%3B011-001%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D8%B9%D8%A7%D8%AA%3B011-002%2C%D8%A7%D9%84%D8%AD%D8%A7%D8%B2%D9%85%D9%8A%D8%A9%3B011-003%2C%D8%A7%D9%84%D8%B9%D8%A7%D9%82%D9%88%D8%B1%D8%A9+-+%D9%85%3B011-004%2C%D8%A7%D9%84%D8%B2%D8%BA%D8%B1%D9%8A%D9%86%3B011-005%2C%D8%A7%D9%84%D8%B1%D9%85%D9%84%D9%8A%D8%A9%3B011-006%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D9%85%D8%BA%D8%A7%D8%B1%D8%A9%3B011-007%2C%D8%B9%D9%85%D8%A7%D8%B1%D9%87%3B011-008%2C%D8%A7%D9%84%D8%AD%D8%AF%D9%8A%D8%AF%3B011-009%2C%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%AC%D8%A8%D8%A9%3B011-010%2C%D8%B1%D8%A7%D8%B3+%D9%86%D8%AD%D8%A7%D8%B4%3B011-011%2C%D8%A8%D9%88%D8%B3%D9%8A%D8%B7%3B011-012%2C%D8%A8%D8%AA%D9%88%D8%B1%D8%A7%D8%AA%D9%8A%D8%AC%3B011-013%2C%D8%A7%D9%8A%D8%B2%D8%A7%D9%84%3B011-014%2C%D8%A7%D9%84%D8%B4%D9%88%D8%A7%D8%BA%D9%8A%D8%B1+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B011-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D8%A7%D8%AF%D9%8A%3B011-016%2C%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%AC%D8%A7%D8%AA%3B011-017%2C%D8%A8%D8%A7%D8%A8+%D9%85%D8%A7%D8%B1%D8%B9%3B011-018%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%B1%D9%88%D8%AD%D8%A7%3B011-019%2C%D8%B9%D8%AF%D9%84%D9%88%D9%86%3B011-020%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%A7%D8%AA%D9%8A%D9%86%3B011-021%2C%D8%A7%D9%84%D8%BA%D8%A8%D8%A7%D8%B7%D9%8A%D8%A9%3B011-022%2C%D8%A7%D9%86%D8%B5%D8%A7%D8%B1%3B011-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%D9%86%D9%8A%3B011-024%2C%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%D8%A9%3B011-025%2C%D8%A8%D9%8A%D8%AA+%D9%84%D9%8A%D9%81%3B011-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%B1%D8%AC%D8%A7%D9%84+%D8%A7%D9%84%D8%A7%D8%B1%D8%A8%D8%B9%D9%8A%D9%86%3B012-001%2C%D8%A7%D9%84%D9%83%D9%81%D9%88%D8%B1%3B012-002%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B012-003%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%A8%D8%A7%D8%AA%3B012-004%2C%D8%A7%D9%84%D8%B2%D9%84%D9%82%D8%A7%3B012-005%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D9%81%D8%A7%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A7%D9%85%D8%B1%D8%A7%D8%A1%3B012-006%2C%D8%B9%D8%A7%D9%86%D9%88%D8%AA%3B012-007%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%A7%D8%AA%D9%8A%D9%86%3B012-008%2C%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%D8%A9%3B012-009%2C%D8%AD%D8%AF%D8%B4%D9%8A%D8%AA%3B012-010%2C%D8%B1%D8%A7%D8%B4%D8%A7%3B012-011%2C%D8%A8%D9%8A%D8%AA+%D8%B9%D9%88%D9%83%D8%B1%3B012-012%2C%D8%A8%D8%AD%D8%A8%D9%88%D8%B4%3B012-013%2C%D8%A8%D8%AD%D9%88%D9%8A%D8%AA%D8%A7%3B012-014%2C%D8%A7%D9%84%D8%B4%D9%88%D8%A7%D8%BA%D9%8A%D8%B1+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B012-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B012-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D8%B9%D9%84%D9%82%D8%A9+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B012-017%2C%D8%A8%D8%B9%D9%84%D9%88%D9%84%3B012-018%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%B9%D8%B4%D8%A7%D9%8A%D8%B1%3B012-019%2C%D8%B9%D8%B1%D8%A8+%D8%A7%D9%84%D8%AC%D9%84%3B012-020%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%AA%D8%A7%D9%86%3B012-021%2C%D8%A7%D9%84%D9%82%D8%B7%D8%B1%D8%A7%D9%86%D9%8A%3B012-022%2C%D8%A8%D8%B1%D9%8A%D9%82%D8%B9%3B012-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%B5%D9%81%D9%8A%D9%81%D8%A9%3B012-024%2C%D8%A7%D9%84%D8%B7%D9%8A%D8%A8%D8%A9%3B012-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D8%A7%D8%AB%D9%88%D9%84%D9%8A%D9%83%3B012-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D9%85%D9%83%D8%B3%D8%B1+%D8%A7%D9%84%D8%B9%D8%A8%D8%AF%3B013-001%2C%D8%A7%D9%84%D9%85%D8%B1%D8%A7%D8%AF%D9%8A%D9%87%3B013-002%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D9%82%D8%A8%D9%84%D9%8A%3B013-003%2C%D8%A7%D9%84%D9%81%D9%8A%D8%AF%D8%A7%D8%B1%3B013-004%2C%D8%A7%D9%84%D8%B3%D9%81%D9%8A%D9%84%D8%A9%3B013-005%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D9%81%D8%A7%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%85%D8%B1%D9%88%D8%B3%D9%8A%D8%A9%3B013-006%2C%D8%B9%D8%AA%D8%B1%D9%8A%D9%86%3B013-007%2C%D8%AC%D8%A8%D9%84+%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%87%3B013-009%2C%D8%AD%D8%B5%D8%B1%D9%88%D9%86%3B013-010%2C%D8%B1%D8%A7%D8%B4%D8%A7%D9%86%D8%A7%3B013-011%2C%D8%AA%D9%88%D9%84%D8%A7+%D8%A7%D9%84%D8%AC%D8%A8%D9%87%3B013-012%2C%D8%A8%D8%AF%D8%A8%D8%A7%3B013-013%2C%D8%A8%D8%AE%D8%B9%D9%88%D9%86%3B013-014%2C%D8%A7%D9%84%D9%82%D8%B5%D8%B1%3B013-015%2C%D9%82%D8%A8%D8%A9+%D8%AF%D9%88%D8%B1%D8%B3%3B013-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B013-017%2C%D8%AA%D9%84+%D8%B0%D9%86%D9%88%D8%A8%3B013-018%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B013-019%2C%D8%B9%D9%82%D8%AA%D8%A7%D9%86%D9%8A%D8%AA%3B013-020%2C%D8%A7%D9%84%D8%A8%D8%B5+%D9%82%D8%B3%D9%85+1%3B013-021%2C%D8%A7%D9%84%D9%84%D9%88%D9%8A%D8%B2%D9%87%3B013-022%2C%D9%83%D9%81%D8%B1%D9%88%D9%87%3B013-023%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%A7%D9%84%D9%81%D8%AE%D8%A7%D8%B1%3B013-024%2C%D8%A7%D9%84%D9%82%D8%B5%D9%8A%D8%B1%3B013-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A2%D9%84+%D8%A8%D8%B1%D9%8A%3B013-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B3%D8%A7%D9%84%D8%AE%D9%8A%D8%A9%3B014-001%2C%D8%A7%D9%84%D9%85%D8%B9%D9%8A%D8%B5%D8%B1%D9%87%3B014-002%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D9%87%3B014-003%2C%D8%A7%D9%84%D9%82%D8%B7%D8%A7%D8%B1%D9%87%3B014-004%2C%D8%A7%D9%84%D8%B4%D8%A7%D9%88%D9%8A%D9%87+%D9%88%D8%A7%D9%84%D9%82%D9%86%D9%8A%D8%B7%D8%B1%D9%87%3B014-005%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D9%81%D8%A7%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D9%82%D8%A8%D8%A9%3B014-006%2C%D8%B9%D9%84%D9%85%D8%A7%D9%86+%D9%88%D8%A7%D9%84%D8%A8%D8%B1%D8%BA%D9%88%D9%86%D9%8A%D8%A9%3B014-007%2C%D8%A7%D9%84%D8%B9%D9%85%D8%A7%D9%8A%D8%B1%3B014-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B014-010%2C%D8%B1%D8%A7%D8%B4%D9%83%D9%8A%D8%AF%D8%A7%3B014-011%2C%D8%AD%D8%B1%D9%81+%D8%A7%D8%B1%D8%AF%D9%87%3B014-012%2C%D8%A8%D8%AF%D8%A8%D9%87%D9%88%D9%86%3B014-013%2C%D8%A8%D8%B7%D8%B1%D9%85%D8%A7%D8%B2%3B014-014%2C%D8%A7%D9%84%D9%83%D9%88%D8%A7%D8%AE%3B014-015%2C%D9%82%D9%84%D8%B9%D9%87+%D8%BA%D8%B1%D8%A8%D9%8A%3B014-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B014-017%2C%D8%AC%D8%A8+%D8%AC%D9%86%D9%8A%D9%86%3B014-018%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86%3B014-019%2C%D8%B9%D9%86%D9%82%D9%88%D9%86%3B014-020%2C%D8%A7%D9%84%D8%A8%D8%B5+%D9%82%D8%B3%D9%85+3%3B014-021%2C%D8%A7%D9%84%D9%85%D8%AC%D9%8A%D8%AF%D9%84%3B014-022%2C%D8%AA%D9%88%D9%84%3B014-023%2C%D8%B4%D8%A8%D8%B9%D8%A7+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B014-024%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D8%B9%D8%A9%3B014-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%D9%86%D9%8A%3B015-001%2C%D8%A7%D9%84%D9%86%D9%85%D9%88%D8%B1%D8%A9+%D9%88+%D9%83%D9%81%D8%B1%D8%AC%D8%B1%D9%8A%D9%81%3B015-002%2C%D8%A7%D9%84%D8%AF%D9%84%D9%8A%D8%A8%D9%87%3B015-003%2C%D8%A7%D9%84%D9%83%D9%81%D8%B1%3B015-004%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D8%B1%3B015-005%2C%D8%A7%D9%84%D8%B9%D8%B2%D9%88%D9%86%D9%8A%D9%87%3B015-006%2C%D8%B9%D9%85%D8%A7%D8%B7%D9%88%D8%B1%3B015-007%2C%D9%83%D9%81%D8%B1+%D8%A7%D9%84%D9%81%D8%AA%D9%88%D8%AD%3B015-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%82%D8%AF%D9%85%D9%8A%D9%86%3B015-010%2C%D8%B1%D8%B4%D9%83%D8%AF%D9%87%3B015-011%2C%D8%AD%D8%B1%D9%81+%D9%85%D8%B2%D9%8A%D8%A7%D8%B1%D9%87%3B015-012%2C%D8%A8%D8%AF%D9%86%D8%A7%D9%8A%D9%84%3B015-013%2C%D8%A8%D9%82%D8%A7%D8%B9%D8%B5%D9%81%D8%B1%D9%8A%D9%86%3B015-014%2C%D8%A7%D9%84%D9%85%D8%B9%D8%A7%D8%B5%D8%B1%3B015-015%2C%D8%B9%D8%B1%D8%B3%D8%A7%D9%84+%D8%B4%D8%B1%D9%82%D9%8A%3B015-016%2C%D8%A7%D9%84%D9%86%D8%A7%D8%B5%D8%B1%D9%8A%D8%A9%3B015-017%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%AD%D8%B1%D9%8A%D9%85%D8%A9%3B015-018%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D8%A7%D8%AD%D9%85%D8%B1%3B015-019%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AF%D9%84%D8%A8%3B015-020%2C%D8%A7%D9%84%D8%A8%D8%B5+%D9%82%D8%B3%D9%85+5%3B015-021%2C%D8%A7%D9%84%D9%85%D8%AD%D8%A7%D8%B1%D8%A8%D9%8A%D9%87%3B015-022%2C%D8%AC%D8%A8%D8%B4%D9%8A%D8%AA%3B015-023%2C%D8%B4%D8%A8%D8%B9%D8%A7+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B015-024%2C%D8%A7%D9%84%D9%82%D9%86%D8%B7%D8%B1%D8%A9%3B015-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%D9%86%D9%8A%3B016-001%2C%D8%A8%D8%B2%D8%AD%D9%84%3B016-002%2C%D8%A7%D9%84%D8%B4%D8%A8%D8%A7%D9%86%D9%8A%D8%A9%3B016-003%2C%D8%A7%D9%84%D9%84%D9%82%D9%84%D9%88%D9%82%3B016-004%2C%D8%A7%D9%84%D8%B6%D8%A8%D9%8A%D9%87%3B016-005%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%A8%D9%88%D9%86%3B016-006%2C%D8%B9%D9%85%D9%8A%D9%82%3B016-007%2C%D9%82%D9%84%D9%88%D8%AF+%D8%A7%D9%84%D8%A8%D8%A7%D9%82%D9%8A%D8%A9%3B016-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D8%B3%D8%A7%D8%A8%D8%A7%3B016-010%2C%D8%B2%D8%A7%D9%86%3B016-011%2C%D8%AD%D9%85%D9%8A%D8%B5%3B016-012%2C%D8%A8%D8%B1%D8%B3%D8%A7%3B016-013%2C%D8%A8%D9%82%D8%B1%D8%B5%D9%88%D9%86%D8%A7%3B016-014%2C%D8%A7%D9%84%D9%85%D8%B9%D9%8A%D8%B5%D8%B1%D8%A9%3B016-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%AD%D9%8A+%D8%A2%D9%84+%D8%A7%D9%84%D8%A7%D8%B4%D8%B9%D9%84%3B016-016%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%A7%D9%8A%D9%84%D8%A7%3B016-017%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D9%82%D9%86%D8%A7%D9%81%D8%A7%D8%B1%3B016-018%2C%D8%B9%D9%8A%D8%AA%D8%A7+%D8%A7%D9%84%D9%81%D8%AE%D8%A7%D8%B1%3B016-019%2C%D9%82%D8%A7%D9%82%D8%B9%D9%8A%D8%A9+%D8%A7%D9%84%D8%B5%D9%86%D9%88%D8%A8%D8%B1%3B016-020%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%A7%D8%B6%3B016-021%2C%D8%A7%D9%84%D9%85%D9%83%D9%86%D9%88%D9%86%D9%8A%D8%A9%3B016-022%2C%D8%AC%D8%B1%D8%AC%D9%88%D8%B9%3B016-023%2C%D8%B4%D9%88%D9%8A%D8%A7%3B016-024%2C%D8%A7%D9%84%D9%88%D8%B2%D8%A7%D9%86%D9%8A%3B016-025%2C%D8%AD%D8%A7%D8%B1%D9%8A%D8%B5%3B017-001%2C%D8%A8%D8%B7%D8%AD%D8%A7%3B017-002%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%A7%D8%AD+%D8%A8%D8%A6%D8%B1+%D8%A7%D9%84%D8%B9%D8%A8%D8%AF%3B017-003%2C%D8%A7%D9%84%D9%85%D8%AC%D8%AF%D9%84%3B017-004%2C%D8%A7%D9%84%D8%B9%D8%B7%D8%B4%D8%A7%D9%86%D8%A9%3B017-005%2C%D8%A7%D9%84%D9%82%D9%85%D8%A7%D8%B7%D9%8A%D9%87%3B017-006%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%A7%D8%B3%D8%AF+%D8%A7%D9%84%D8%B4%D9%85%D9%8A%D8%B3%3B017-007%2C%D8%B9%D8%B1%D9%82%D8%A7%3B017-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D9%8A%D9%88%D8%AD%D9%86%D8%A7%3B017-010%2C%D8%B3%D9%84%D8%B9%D8%A7%D8%AA%D8%A7%3B017-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B017-012%2C%D8%A8%D8%B1%D8%BA%D9%88%D9%86%3B017-013%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D9%81%D9%82%D8%B3%3B017-014%2C%D8%A8%D8%B1%D9%8A%D8%B5%D8%A7%3B017-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%3B017-016%2C%D8%A7%D9%84%D9%88%D9%82%D9%81%3B017-017%2C%D8%B2%D9%84%D8%A7%D9%8A%D8%A7%3B017-018%2C%D8%B9%D9%8A%D8%AD%D8%A7%3B017-019%2C%D9%82%D9%86%D8%A7%D8%B1%D9%8A%D8%AA%3B017-020%2C%D8%A7%D9%84%D8%AC%D8%A8%D9%8A%D9%86%3B017-021%2C%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86%3B017-022%2C%D8%AD%D8%A7%D8%B1%D9%88%D9%81%3B017-023%2C%D8%B9%D9%8A%D9%86+%D8%AC%D8%B1%D9%81%D8%A7%3B017-024%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D9%85%D9%84%D9%88%D9%83%3B017-025%2C%D8%AD%D8%A7%D9%86%D9%8A%D9%86%3B018-001%2C%D8%A8%D9%82%D8%B9%D8%A7%D8%AA%D8%A9+%D8%B9%D8%B4%D9%82%D9%88%D8%AA%3B018-002%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%A7%D8%AF%D9%8A%D8%A9%3B018-003%2C%D8%A7%D9%84%D9%85%D8%B2%D8%A7%D8%B1%D9%8A%D8%A8%3B018-004%2C%D8%A7%D9%84%D8%B9%D9%8A%D8%B1%D9%88%D9%86%3B018-005%2C%D8%A7%D9%84%D9%83%D8%AD%D8%A7%D9%84%D9%87%3B018-006%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AD%D9%88%D8%B1%3B018-007%2C%D8%AF%D9%8A%D8%B1+%D8%AF%D9%84%D9%88%D9%85%3B018-009%2C%D8%B7%D9%88%D8%B1%D8%B2%D8%A7%3B018-010%2C%D8%B3%D9%85%D8%A7%D8%B1+%D8%AC%D8%A8%D9%8A%D9%84%3B018-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B5%D9%84%D9%8A%D8%A8+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B018-012%2C%D8%A8%D8%B2%D9%8A%D8%B2%D8%A7%3B018-013%2C%D8%A8%D9%8A%D8%AA+%D8%AD%D8%A7%D9%88%D9%8A%D9%83%3B018-014%2C%D8%AC%D9%88%D8%A7%D8%B1+%D8%A7%D9%84%D8%AD%D8%B4%D9%8A%D8%B4%3B018-015%2C%D8%A7%D9%84%D8%A7%D9%86%D8%B5%D8%A7%D8%B1%3B018-016%2C%D8%A8%D8%AA%D9%8A%D8%A7%D8%B3%3B018-017%2C%D8%B3%D8%AD%D9%85%D8%B1%3B018-018%2C%D8%B9%D9%8A%D9%86+%D8%AD%D8%B1%D8%B4%D9%87%3B018-019%2C%D9%83%D9%81%D8%B1%D8%B4%D9%84%D8%A7%D9%84%3B018-020%2C%D8%A7%D9%84%D8%AD%D9%84%D9%88%D8%B3%D9%8A%D8%A9%3B018-021%2C%D8%A7%D9%86%D8%A7%D9%86%3B018-022%2C%D8%AD%D8%A8%D9%88%D8%B4%3B018-023%2C%D8%B9%D9%8A%D9%86+%D9%82%D9%86%D9%8A%D8%A7%3B018-024%2C%D8%A8%D9%84%D8%A7%D8%B7%3B018-025%2C%D8%AD%D8%AF%D8%A7%D8%AB%D8%A7%3B019-001%2C%D8%A8%D9%82%D8%B9%D8%A7%D8%AA%D8%A9+%D9%83%D9%86%D8%B9%D8%A7%D9%86%3B019-002%2C%D8%A7%D9%84%D8%B9%D8%B1%D8%A8%D8%A7%D9%86%D9%8A%D8%A9%3B019-003%2C%D8%A7%D9%84%D9%85%D8%BA%D9%8A%D8%B1%D9%8A%3B019-004%2C%D8%A7%D9%84%D8%B9%D9%8A%D9%88%D9%86%3B019-005%2C%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%AC%D8%A7%D8%AA%3B019-006%2C%D8%B9%D9%8A%D9%86+%D8%B2%D8%AD%D9%84%D8%AA%D8%A7%3B019-007%2C%D8%A7%D9%84%D9%83%D9%88%D9%8A%D8%AE%D8%A7%D8%AA%3B019-009%2C%D8%B9%D8%A8%D8%AF%D9%8A%D9%86%3B019-010%2C%D8%B4%D8%A7%D8%AA%D9%8A%D9%86%3B019-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B5%D9%84%D9%8A%D8%A8+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B019-012%2C%D8%A8%D8%B4%D9%85%D8%B2%D9%8A%D9%86%3B019-013%2C%D8%AD%D8%B1%D9%81+%D8%B3%D9%8A%D8%A7%D8%AF%3B019-014%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF+%D8%B9%D9%84%D9%8A%3B019-015%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D9%86%D9%8A%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B3%D9%8A%D8%AD%D9%8A%D9%8A%D9%86%3B019-016%2C%D8%A8%D8%B1+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3%3B019-017%2C%D8%B5%D8%BA%D8%A8%D9%8A%D9%86%3B019-018%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%B1%D8%A8%3B019-019%2C%D9%83%D9%81%D8%B1%D8%AD%D8%AA%D9%89%3B019-020%2C%D8%A7%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D9%8A%3B019-021%2C%D8%A8%D8%AA%D8%AF%D9%8A%D9%86+%D8%A7%D9%84%D9%84%D9%82%D8%B4%3B019-022%2C%D8%AD%D9%88%D9%85%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B019-023%2C%D9%83%D9%81%D8%B1+%D8%AD%D9%85%D8%A7%D9%85%3B019-024%2C%D8%A8%D9%84%D9%8A%D8%AF%D8%A7%3B019-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B020-001%2C%D8%A8%D9%82%D8%B9%D8%AA%D9%88%D8%AA%D9%87%3B020-002%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D8%A9%3B020-003%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%81%3B020-004%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%A8%D8%A9%3B020-005%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%8A%D8%A9%3B020-006%2C%D8%B9%D9%8A%D9%86+%D9%82%D9%86%D9%8A%3B020-007%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D9%82%D9%86%D8%A8%D8%B1%3B020-009%2C%D9%82%D9%86%D8%A7%D8%AA%3B020-010%2C%D8%B4%D8%A8%D8%B7%D9%8A%D9%86%3B020-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B9%D8%A7%D8%B5%D8%B1%3B020-012%2C%D8%A8%D8%B5%D8%B1%D9%85%D8%A7%3B020-013%2C%D8%AD%D9%82%D9%84+%D8%A7%D9%84%D8%B9%D8%B2%D9%8A%D9%85%D8%A9%3B020-014%2C%D8%A7%D9%84%D9%87%D8%B1%D9%85%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%A7%D8%B1%D8%A9%3B020-015%2C%D8%A7%D9%84%D8%AA%D9%88%D9%81%D9%8A%D9%82%D9%8A%D9%87%3B020-016%2C%D8%A8%D9%88%D8%A7%D8%B1%D8%AC%3B020-017%2C%D8%B9%D8%A7%D9%86%D8%A7%3B020-018%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%B7%D8%A7%3B020-019%2C%D9%83%D9%81%D8%B1%D9%85%D9%84%D9%83%D9%8A%3B020-020%2C%D8%A7%D9%84%D8%AD%D9%86%D9%8A%D9%87%3B020-021%2C%D8%A8%D8%AD%D9%86%D9%8A%D9%86+%D9%88%D9%83%D9%81%D8%B1%D8%AA%D8%B9%D9%84%D8%A7%3B020-022%2C%D8%AD%D9%88%D9%85%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B020-023%2C%D9%83%D9%81%D8%B1%D8%B4%D9%88%D8%A8%D8%A7%3B020-024%2C%D8%A8%D9%86%D9%8A+%D8%AD%D9%8A%D8%A7%D9%86%3B020-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%B3%D9%8A%D9%86%D9%8A%D9%87%3B021-001%2C%D8%A8%D9%84%D9%88%D9%86%D9%87%3B021-002%2C%D8%A7%D9%84%D9%82%D8%B5%D9%8A%D8%A8%D8%A9%3B021-003%2C%D8%A7%D9%87%D9%85%D8%AC%3B021-004%2C%D8%A7%D9%84%D9%81%D8%B1%D9%8A%D9%83%D9%87%3B021-005%2C%D8%A8%D8%AA%D8%A7%D8%AA%D8%B1%3B021-006%2C%D8%B9%D9%8A%D9%86+%D9%88%D8%B2%D9%8A%D9%86%3B021-007%2C%D8%A7%D9%84%D9%86%D9%87%D8%B1%D9%8A%D9%87+%D9%88%D8%A8%D8%B3%D8%AA%D8%A7%D9%86+%D8%A7%D9%84%D8%AD%D8%B1%D8%B4%3B021-009%2C%D9%82%D9%86%D9%8A%D9%88%D8%B1%3B021-010%2C%D8%B4%D9%83%D8%A7%3B021-011%2C%D8%AD%D9%8A%D9%84%D8%A7%D9%86%3B021-012%2C%D8%A8%D8%B7%D8%B1%D8%A7%D9%85%3B021-013%2C%D8%AD%D9%88%D8%A7%D8%B1%D9%87%3B021-014%2C%D8%A7%D9%84%D9%87%D8%B1%D9%85%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D9%82%D9%81%3B021-015%2C%D8%A7%D9%84%D8%AC%D8%A8%D8%A7%D9%86%D9%8A%D9%87%3B021-016%2C%D8%AA%D8%B1%D8%A8%D9%84%3B021-017%2C%D8%B9%D9%8A%D8%AA%D9%86%D9%8A%D8%AA%3B021-018%2C%D9%83%D9%81%D8%B1%D8%AF%D9%86%D9%8A%D8%B3%3B021-019%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B021-020%2C%D8%A7%D9%84%D8%B1%D8%B4%D9%8A%D8%AF%D9%8A%D9%87%3B021-021%2C%D8%A8%D8%B3%D8%B1%D9%8A%3B021-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%8A%D8%A7%D8%B6%3B021-023%2C%D9%83%D9%88%D9%83%D8%A8%D8%A7%3B021-024%2C%D8%AA%D9%88%D9%84%D9%8A%D9%86%3B021-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D9%88%D8%A7%D8%B1%D8%A9%3B022-001%2C%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%BA%D8%B2%D9%8A%D8%B1%3B022-002%2C%D8%A7%D9%84%D9%82%D9%84%D8%B9%D8%A9%3B022-003%2C%D8%A8%D8%AC%D9%87%3B022-004%2C%D8%A7%D9%84%D9%81%D9%86%D8%A7%D8%B1%3B022-005%2C%D8%A8%D8%AD%D9%85%D8%AF%D9%88%D9%86%3B022-006%2C%D8%B9%D9%8A%D9%86%D8%A8%D8%A7%D9%84%3B022-007%2C%D8%A7%D9%83%D8%B1%D9%88%D9%85%3B022-009%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%86%D9%8A+%D8%B5%D8%B9%D8%A8%3B022-010%2C%D8%B5%D8%BA%D8%A7%D8%B1%3B022-011%2C%D8%AF%D8%A7%D8%B1%D9%8A%D8%A7%3B022-012%2C%D8%A8%D9%83%D9%81%D8%AA%D9%8A%D9%86%3B022-013%2C%D8%AF%D8%A8%D8%B9%D9%84%3B022-014%2C%D8%A7%D9%84%D9%87%D8%B1%D9%85%D9%84+%D8%AD%D9%8A+%D8%A8%D8%AF%D9%8A%D8%AA%D8%A7%3B022-015%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B022-016%2C%D8%AA%D8%B9%D9%84%D8%A8%D8%A7%D9%8A%D8%A7%3B022-017%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%D9%87%3B022-018%2C%D9%83%D9%81%D8%B1%D9%82%D9%88%D9%82%3B022-019%2C%D9%83%D9%88%D8%AB%D8%B1%D9%8A%D8%A9+%D8%A7%D9%84%D8%B3%D9%8A%D8%A7%D8%AF%3B022-020%2C%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D8%AF%D9%8A%D8%A9%3B022-021%2C%D8%A8%D8%B5%D9%84%D9%8A%D8%A7%3B022-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B022-023%2C%D8%A7%D9%84%D9%85%D8%A7%D8%B1%D9%8A%3B022-024%2C%D8%AD%D9%88%D9%84%D8%A7%3B022-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B5%D8%BA%D9%8A%D8%B1%D9%87%3B023-001%2C%D8%AC%D8%B9%D9%8A%D8%AA%D8%A7%3B023-002%2C%D8%A7%D9%84%D9%83%D8%AD%D9%84%D9%88%D9%86%D9%8A%D8%A9%3B023-003%2C%D8%A8%D8%AD%D8%AF%D9%8A%D8%AF%D8%A7%D8%AA%3B023-004%2C%D8%A7%D9%84%D9%82%D8%B9%D9%82%D9%88%D8%B1%3B023-005%2C%D8%A8%D8%AD%D9%88%D8%A7%D8%B1%D9%87%3B023-006%2C%D8%BA%D8%B1%D9%8A%D9%81%D8%A9%3B023-007%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%AC%3B023-009%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%B9%D8%B3%D8%A7%D9%81%3B023-010%2C%D8%B5%D9%88%D8%B1%D8%A7%D8%AA%3B023-011%2C%D8%B1%D8%B4%D8%B9%D9%8A%D9%86%3B023-012%2C%D8%A8%D9%86%D9%87%D8%B1%D8%A7%D9%86%3B023-013%2C%D8%AF%D9%8A%D8%B1+%D9%86%D8%A8%D9%88%D8%AD%3B023-014%2C%D8%B2%D8%BA%D8%B1%D9%8A%D9%86%3B023-015%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B023-016%2C%D8%AA%D8%B9%D9%86%D8%A7%D9%8A%D9%84%3B023-017%2C%D8%B9%D9%8A%D9%86+%D8%B2%D8%A8%D8%AF%D9%87%3B023-018%2C%D9%83%D9%81%D8%B1%D9%85%D8%B4%D9%83%D9%8A%3B023-019%2C%D8%A7%D9%84%D9%84%D9%88%D8%A8%D9%8A%D9%87%3B023-020%2C%D8%A7%D9%84%D8%B2%D9%84%D9%88%D8%B7%D9%8A%D9%87%3B023-021%2C%D8%A8%D9%83%D8%A7%D8%B3%D9%8A%D9%86%3B023-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B3%D9%8A%D8%AD%D9%8A%D9%8A%D9%86%3B023-023%2C%D9%85%D8%B1%D8%AC+%D8%A7%D9%84%D8%B2%D9%87%D9%88%D8%B1%3B023-024%2C%D8%AF%D8%A8%D9%8A%D9%86%3B023-025%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%B3%D9%84%D9%85%3B024-001%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A7%D9%84%D8%AA%D8%B1%D9%85%D8%B3%3B024-002%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D9%87%3B024-003%2C%D8%A8%D8%AE%D8%B9%D8%A7%D8%B2%3B024-004%2C%D8%A7%D9%84%D9%85%D8%AA%D9%8A%D9%86%3B024-005%2C%D8%A8%D8%AE%D8%B4%D8%AA%D9%8A%D9%87%3B024-006%2C%D9%83%D8%AA%D8%B1%D9%85%D8%A7%D9%8A%D8%A7%3B024-007%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%D9%87%3B024-009%2C%D9%88%D8%A7%D8%AF%D9%8A+%D9%82%D9%86%D9%88%D8%A8%D9%8A%D9%86%3B024-010%2C%D8%B9%D8%A8%D8%AF%D9%84%D9%84%D9%8A%3B024-011%2C%D8%B3%D8%A8%D8%B9%D9%84%3B024-012%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D8%AE%D8%A7%D8%B5%D8%A9%3B024-013%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%BA%D8%B1%D9%8A%D9%86%3B024-014%2C%D8%B3%D9%87%D9%84%D8%A7%D8%AA+%D8%A7%D9%84%D9%85%D8%A7%D8%A1%3B024-015%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B024-016%2C%D8%AA%D9%84+%D8%A7%D9%84%D8%A7%D8%AE%D8%B6%D8%B1%3B024-017%2C%D8%BA%D8%B2%D9%87%3B024-018%2C%D9%83%D9%88%D9%83%D8%A8%D8%A7%3B024-019%2C%D8%A7%D9%84%D9%85%D8%B1%D9%88%D8%A7%D9%86%D9%8A%D8%A9%3B024-020%2C%D8%A7%D9%84%D8%B3%D9%85%D8%A7%D8%B9%D9%8A%D8%A9%3B024-021%2C%D8%A8%D9%86%D9%88%D8%A7%D8%AA%D9%8A%3B024-022%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%B2%D9%87%D8%B1%D8%A7%D9%86%D9%8A%3B024-023%2C%D9%85%D9%8A%D9%85%D8%B3%3B024-024%2C%D8%AF%D9%8A%D8%B1+%D8%B3%D8%B1%D9%8A%D8%A7%D9%86%3B024-025%2C%D9%81%D8%B1%D9%88%D9%86%3B025-001%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A8%D8%AF%D8%B1%D8%A7%D9%86%3B025-002%2C%D8%A7%D9%84%D9%84%D9%88%D9%8A%D8%B2%D9%87%3B025-003%2C%D8%A8%D8%B2%D9%8A%D9%88%D9%86%3B025-004%2C%D8%A7%D9%84%D9%85%D8%AC%D8%B0%D9%88%D8%A8+%D9%88+%D9%85%D8%B2%D9%87%D8%B1%3B025-005%2C%D8%A8%D8%AF%D8%A7%D8%AF%D9%88%D9%86%3B025-006%2C%D9%83%D9%81%D8%B1%D8%AD%D9%8A%3B025-007%2C%D8%A7%D9%84%D8%AA%D9%84%D9%8A%D9%84%3B025-010%2C%D8%B9%D8%A8%D8%B1%D9%8A%D9%86%3B025-011%2C%D8%B3%D8%B1%D8%B9%D9%84%3B025-012%2C%D8%AF%D8%A7%D8%B1+%D8%A8%D8%B9%D8%B4%D8%AA%D8%A7%D8%B1%3B025-013%2C%D8%B3%D9%8A%D8%B1%3B025-014%2C%D9%81%D9%8A%D8%B3%D8%A7%D9%86%3B025-015%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D8%A9%3B025-016%2C%D8%AC%D8%AF%D9%8A%D8%AA%D8%A7%3B025-017%2C%D9%82%D9%84%D9%8A%D8%A7%3B025-018%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%A8%D9%84%D9%87%D9%8A%D8%B5%3B025-019%2C%D8%A7%D9%84%D9%82%D9%86%D9%8A%D8%B7%D8%B1%D8%A9%3B025-020%2C%D8%B4%D8%A8%D8%B1%D9%8A%D8%AD%D8%A7%3B025-021%2C%D8%A8%D9%8A%D8%B5%D9%88%D8%B1%3B025-022%2C%D8%B1%D9%88%D9%85%D9%8A%D9%86%3B025-024%2C%D8%AF%D9%8A%D8%B1+%D9%85%D9%8A%D9%85%D8%A7%D8%B3%3B025-025%2C%D8%AF%D8%A8%D9%84%3B026-001%2C%D8%AD%D8%B1%D8%A7%D8%AC%D9%84%3B026-002%2C%D8%A7%D9%84%D9%84%D9%8A%D9%84%D9%83%D9%8A%3B026-003%2C%D8%A8%D8%B4%D8%AA%D9%84%D9%8A%D8%AF%D8%A7+%D9%88%D9%81%D8%AF%D8%A7%D8%B1%3B026-004%2C%D8%A7%D9%84%D9%85%D8%AD%D9%8A%D8%AF%D8%AB%D8%A9%3B026-005%2C%D8%A8%D8%AF%D8%BA%D8%A7%D9%86%3B026-006%2C%D9%83%D9%81%D8%B1%D8%AD%D9%8A%D9%85%3B026-007%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B026-010%2C%D8%B9%D8%B1%D8%B7%D8%B2%3B026-011%2C%D8%B9%D8%B1%D8%A8%D8%A9+%D9%82%D8%B2%D8%AD%D9%8A%D8%A7%3B026-012%2C%D8%AF%D8%A7%D8%B1+%D8%B4%D9%85%D8%B2%D9%8A%D9%86%3B026-013%2C%D8%B7%D8%A7%D8%B1%D8%A7%D9%86%3B026-014%2C%D9%82%D9%86%D8%A7%D9%81%D8%B0%3B026-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%B4%D8%B1%D9%82%D9%8A%3B026-016%2C%D8%AC%D9%84%D8%A7%D9%84%D8%A7%3B026-017%2C%D9%83%D8%A7%D9%85%D8%AF+%D8%A7%D9%84%D9%84%D9%88%D8%B2%3B026-018%2C%D9%85%D8%AF%D9%88%D8%AE%D8%A7%3B026-019%2C%D8%A7%D9%84%D8%B2%D8%B1%D8%A7%D8%B1%D9%8A%D8%A9%3B026-020%2C%D8%A7%D9%84%D8%B4%D8%B9%D9%8A%D8%AA%D9%8A%D8%A9%3B026-021%2C%D8%AA%D8%B9%D9%8A%D8%AF%3B026-022%2C%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B026-024%2C%D8%B1%D8%A8%D8%AB%D9%84%D8%A7%D8%AB%D9%8A%D9%86%3B026-025%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%86%D8%B7%D8%A7%D8%B1%3B027-001%2C%D8%AD%D8%B1%D9%8A%D8%B5%D8%A7%3B027-002%2C%D8%A7%D9%84%D9%85%D8%B1%D8%AF%D8%A7%D8%B4%D8%A9%3B027-003%2C%D8%A8%D8%B4%D9%84%D9%84%D9%8A%3B027-004%2C%D8%A7%D9%84%D9%85%D8%B1%D9%88%D8%AC%3B027-005%2C%D8%A8%D8%B3%D8%B1%D9%8A%D9%86%3B027-006%2C%D9%83%D9%81%D8%B1%D9%81%D8%A7%D9%82%D9%88%D8%AF%3B027-007%2C%D8%A7%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D8%A9%3B027-010%2C%D8%B9%D9%88%D8%B1%D9%87%3B027-011%2C%D8%B9%D8%B1%D8%AC%D8%B3%3B027-012%2C%D8%AF%D8%AF%D9%87%3B027-013%2C%D8%B9%D8%A7%D8%B5%D9%88%D9%86%3B027-014%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B027-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%BA%D8%B1%D8%A8%D9%8A%3B027-016%2C%D8%AD%D8%A7%D8%AC%D9%8A+%D8%AC%D8%A8%D9%8A%D9%84%D9%8A%3B027-017%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B027-018%2C%D8%B3%D9%84%D8%B3%D8%A7%D8%AA%D8%A7%3B027-019%2C%D8%A7%D9%84%D8%B5%D8%A7%D9%84%D8%AD%D9%8A%D8%A9%3B027-020%2C%D8%A7%D9%84%D8%B4%D9%87%D8%A7%D8%A8%D9%8A%D9%87%3B027-021%2C%D8%AC%D8%B1%D9%86%D8%A7%D9%8A%D8%A7%3B027-022%2C%D8%B2%D9%81%D8%AA%D8%A7%3B027-024%2C%D8%B3%D8%B1%D8%AF%D8%A7+%D9%88%D8%A7%D9%84%D8%B9%D9%85%D8%B1%D8%A7%3B027-025%2C%D8%B1%D8%A7%D9%85%D9%8A%D9%87%3B028-001%2C%D8%AD%D9%8A%D8%A7%D8%B7%D8%A7%3B028-002%2C%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%AC%D8%A9%3B028-003%2C%D8%A8%D9%84%D8%A7%D8%B7%3B028-004%2C%D8%A7%D9%84%D9%85%D8%B3%D9%82%D9%89%3B028-005%2C%D8%A8%D8%B3%D9%88%D8%B3%3B028-006%2C%D9%83%D9%81%D8%B1%D9%82%D8%B7%D8%B1%D8%A9%3B028-007%2C%D8%A7%D9%84%D8%AD%D9%88%D8%B4%D8%A8%3B028-010%2C%D8%BA%D9%88%D9%85%D8%A7%3B028-011%2C%D8%B9%D8%B4%D8%A7%D8%B4%3B028-012%2C%D8%B1%D8%A7%D8%B3+%D9%85%D8%B3%D9%82%D8%A7+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%D8%A9%3B028-013%2C%D8%B9%D9%8A%D9%85%D8%A7%D8%B1%3B028-014%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%B7%D8%B4%D9%85%3B028-015%2C%D8%A7%D9%84%D8%B1%D8%A7%D9%85%3B028-016%2C%D8%AD%D8%B2%D8%B1%D8%AA%D8%A7%3B028-017%2C%D9%84%D8%A7%D9%84%D8%A7%3B028-018%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%88%D8%A7%D8%B3%D8%A8%D9%8A%3B028-019%2C%D8%A7%D9%84%D8%B5%D8%B1%D9%81%D9%86%D8%AF%3B028-020%2C%D8%A7%D9%84%D8%B8%D9%87%D9%8A%D8%B1%D8%A9%3B028-021%2C%D8%AC%D8%B2%D9%8A%D9%86%3B028-022%2C%D8%B2%D9%88%D8%B7%D8%B1+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%D8%A9%3B028-024%2C%D8%B7%D9%84%D9%88%D8%B3%D9%87%3B028-025%2C%D8%B1%D8%B4%D8%A7%D9%81%3B029-001%2C%D8%AF%D8%A7%D8%B1%D9%8A%D8%A7%3B029-002%2C%D8%A7%D9%84%D9%87%D9%84%D8%A7%D9%84%D9%8A%D8%A9%3B029-003%2C%D8%A8%D9%86%D8%AA%D8%A7%D8%B9%D9%84%3B029-004%2C%D8%A7%D9%84%D9%85%D8%B4%D8%B1%D8%B9%3B029-005%2C%D8%A8%D8%B4%D8%A7%D9%85%D9%88%D9%86%3B029-006%2C%D9%83%D9%81%D8%B1%D9%86%D8%A8%D8%B1%D8%AE%3B029-007%2C%D8%A7%D9%84%D8%AD%D9%88%D9%8A%D8%B4%3B029-010%2C%D9%83%D9%81%D8%B1%D8%AD%D8%AA%D9%86%D8%A7%3B029-011%2C%D8%B9%D9%84%D9%85%D8%A7%3B029-012%2C%D8%B1%D8%A7%D8%B3+%D9%85%D8%B3%D9%82%D8%A7+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%D8%A9%3B029-013%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%D9%87%3B029-014%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D9%81%D9%82%D9%8A%D9%87%3B029-015%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%B4+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B029-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%A7%D9%85%D8%B1%D8%A7%D8%A1%3B029-017%2C%D9%84%D8%A8%D8%A7%D9%8A%D8%A7%3B029-018%2C%D9%8A%D9%86%D8%B7%D8%A7%3B029-019%2C%D8%A7%D9%84%D8%B9%D8%AF%D9%88%D8%B3%D9%8A%D9%87%3B029-020%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D9%84%D8%A9%3B029-021%2C%D8%AC%D9%86%D8%B3%D9%86%D8%A7%D9%8A%D8%A7%3B029-022%2C%D8%B3%D9%8A%D9%86%D9%8A%3B029-024%2C%D8%B9%D8%AF%D8%B4%D9%8A%D8%AA%3B029-025%2C%D8%B1%D9%85%D9%8A%D8%B4%3B030-001%2C%D8%AF%D8%B1%D8%B9%D9%88%D9%86%3B030-002%2C%D8%A8%D8%AA%D8%A8%D9%8A%D8%A7%D8%AA%3B030-003%2C%D8%A8%D9%8A%D8%AA+%D8%AD%D8%A8%D8%A7%D9%82%3B030-004%2C%D8%A7%D9%84%D9%85%D8%B7%D9%8A%D9%84%D8%A8%3B030-005%2C%D8%A8%D8%B7%D9%84%D9%88%D9%86%3B030-006%2C%D9%83%D9%81%D8%B1%D9%86%D9%8A%D8%B3%3B030-007%2C%D8%A7%D9%84%D8%AD%D9%8A%D8%B5%D8%A7%3B030-010%2C%D9%83%D9%81%D8%B1%D8%AD%D9%84%D8%AF%D8%A7%3B030-011%2C%D8%B9%D9%8A%D9%86%D8%B7%D9%88%D8%B1%D9%8A%D9%86%3B030-012%2C%D8%B1%D8%B4%D8%AF%D8%A8%D9%8A%D9%86%3B030-013%2C%D9%82%D8%B1%D8%AD%D9%8A%D8%A7%3B030-014%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%B3%D8%AC%D8%AF%3B030-015%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%B4+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D9%85%D9%8A%D8%B3%3B030-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B2%D8%B1%D8%A7%D8%B9%D9%86%D8%A9%3B030-017%2C%D9%84%D9%88%D8%B3%D9%8A%D8%A7%3B030-019%2C%D8%A7%D9%84%D8%BA%D8%B3%D8%A7%D9%86%D9%8A%D9%87%3B030-020%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B030-021%2C%D8%AD%D9%8A%D8%AA%D9%88%D9%84%D9%8A+%D9%88%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%84%D9%8A%D9%85%D9%88%D9%86%3B030-022%2C%D8%B4%D9%88%D9%83%D9%8A%D9%86%3B030-024%2C%D8%B9%D8%AF%D9%8A%D8%B3%D8%A9%3B030-025%2C%D8%B4%D9%82%D8%B1%D8%A7%3B031-001%2C%D8%AF%D9%84%D8%A8%D8%AA%D8%A7%3B031-002%2C%D8%A8%D8%AA%D8%AE%D9%86%D9%8A%D9%87%3B031-003%2C%D8%AA%D8%B1%D8%AA%D8%AC%3B031-004%2C%D8%A7%D9%84%D9%85%D9%83%D9%84%D8%B3%3B031-005%2C%D8%A8%D9%84%D9%8A%D8%A8%D9%84%3B031-006%2C%D9%83%D9%84%D9%8A%D9%84%D9%8A%D9%87%3B031-007%2C%D8%A7%D9%84%D8%AF%D8%A8%D8%A7%D8%A8%D9%8A%D8%A9%3B031-010%2C%D9%83%D9%81%D8%B1%D8%AD%D9%8A%3B031-011%2C%D9%82%D8%B1%D9%87+%D8%A8%D8%A7%D8%B4%3B031-012%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%A7%D9%84%D9%85%D8%AA%D8%A7%D9%88%D9%84%D8%A9%3B031-013%2C%D9%82%D8%B1%D8%B5%D9%8A%D8%AA%D8%A7%3B031-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AA%D8%B1%D9%83%D9%85%D8%A7%D9%86%3B031-015%2C%D8%A7%D9%84%D8%B2%D8%B1%D8%A7%D8%B2%D9%8A%D8%B1%3B031-016%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%BA%D9%86%D9%85%3B031-017%2C%D9%85%D8%B4%D8%BA%D8%B1%D9%87+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B031-019%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D8%A9%3B031-020%2C%D8%A7%D9%84%D9%85%D8%A7%D9%84%D9%83%D9%8A%D9%87%3B031-021%2C%D8%AD%D9%8A%D8%B7%D9%88%D8%B1%D8%A9%3B031-022%2C%D8%B5%D8%B1%D8%A8%D8%A7%3B031-024%2C%D8%B9%D9%84%D9%85%D8%A7%D9%86%3B031-025%2C%D8%B5%D8%B1%D8%A8%D9%8A%D9%86%3B032-001%2C%D8%B2%D9%88%D9%82+%D9%85%D8%B5%D8%A8%D8%AD%3B032-002%2C%D8%A8%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B032-003%2C%D8%AC%D8%A7%D8%AC%3B032-004%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%8A%D8%A9%3B032-005%2C%D8%A8%D9%85%D9%83%D9%8A%D9%86%3B032-006%2C%D9%85%D8%AC%D8%AF+%D8%A7%D9%84%D9%85%D8%B9%D9%88%D8%B4%3B032-007%2C%D8%A7%D9%84%D8%AF%D8%BA%D9%84%D8%A9%3B032-010%2C%D9%83%D9%81%D8%B1%D8%B4%D9%84%D9%8A%D9%85%D8%A7%D9%86%3B032-011%2C%D9%83%D8%B1%D9%85+%D8%B3%D8%AF%D9%87%3B032-012%2C%D8%B2%D9%83%D8%B1%D9%88%D9%86%3B032-013%2C%D9%83%D8%B1%D9%85+%D8%A7%D9%84%D9%85%D9%87%D8%B1%3B032-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B1%D8%B7%D9%84%3B032-015%2C%D8%A7%D9%84%D8%B3%D8%B9%D9%8A%D8%AF%D9%87%3B032-016%2C%D8%AD%D9%88%D8%B4+%D8%AD%D8%A7%D9%84%D8%A7%3B032-017%2C%D9%85%D9%8A%D8%AF%D9%88%D9%86%3B032-019%2C%D8%A7%D9%84%D8%B3%D9%83%D8%B3%D9%83%D9%8A%D8%A9%3B032-020%2C%D8%A7%D9%84%D9%85%D8%AC%D8%A7%D8%AF%D9%84%3B032-021%2C%D8%B1%D9%88%D9%85%3B032-022%2C%D8%B5%D9%8A%D8%B1+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%D8%A9%3B032-024%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%B1%D8%A8%3B032-025%2C%D8%B5%D9%81%D8%AF+%D8%A7%D9%84%D8%A8%D8%B7%D9%8A%D8%AE%3B033-001%2C%D8%B2%D9%88%D9%82+%D9%85%D9%83%D8%A7%D9%8A%D9%84%3B033-002%2C%D8%A8%D8%B3%D8%A7%D8%A8%D8%A7%3B033-003%2C%D8%AC%D8%A8%D9%8A%D9%84%3B033-004%2C%D8%A7%D9%84%D9%85%D9%8A%D8%A7%D8%B3%D8%A9%3B033-005%2C%D8%A8%D9%85%D9%87%D8%B1%D9%8A%D9%87%3B033-006%2C%D9%85%D8%AC%D8%AF%D9%84%D9%88%D9%86%D8%A7%3B033-007%2C%D8%A7%D9%84%D8%AF%D9%88%D8%B1%D9%87%3B033-010%2C%D9%83%D9%81%D8%B1%D8%B9%D8%A8%D9%8A%D8%AF%D8%A7%3B033-011%2C%D9%83%D9%81%D8%B1%D8%AD%D9%88%D8%B1%D8%A7%3B033-012%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B033-013%2C%D9%83%D9%81%D8%B1%D8%A8%D9%86%D9%8A%D9%86%3B033-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B9%D8%B3%3B033-015%2C%D8%A7%D9%84%D8%B3%D9%81%D8%B1%D9%8A%3B033-017%2C%D9%8A%D8%AD%D9%85%D8%B1%3B033-019%2C%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D9%88%D9%86%3B033-020%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%8A%3B033-021%2C%D8%B1%D9%8A%D9%85%D8%A7%D8%AA+%D9%88%D8%B4%D9%82%D8%A7%D8%AF%D9%8A%D9%81%3B033-022%2C%D8%B9%D8%A8%D8%A7%3B033-024%2C%D9%82%D8%A8%D8%B1%D9%8A%D8%AE%D8%A7%3B033-025%2C%D8%B9%D9%8A%D8%AA%D8%A7+%D8%A7%D9%84%D8%AC%D8%A8%D9%84%3B034-001%2C%D8%B1%D8%B9%D8%B4%D9%8A%D9%86%3B034-002%2C%D8%A8%D8%B7%D8%B4%D9%8A%D9%87%3B034-003%2C%D8%AC%D8%AF%D8%A7%D9%8A%D9%84%3B034-004%2C%D8%A7%D9%84%D9%86%D9%82%D8%A7%D8%B4%3B034-005%2C%D8%A8%D9%88+%D8%B2%D8%B1%D9%8A%D8%AF%D9%87%3B034-006%2C%D9%85%D8%B1%D8%AC+%D8%A8%D8%B1%D8%AC%D8%A7%3B034-007%2C%D8%A7%D9%84%D8%AF%D9%88%D8%B3%D9%87%3B034-010%2C%D9%83%D9%81%D9%88%D8%B1+%D8%A7%D9%84%D8%B9%D8%B1%D8%A8%D9%8A%3B034-011%2C%D9%83%D9%81%D8%B1%D8%AF%D9%84%D8%A7%D9%82%D9%88%D8%B3%3B034-012%2C%D8%B9%D8%A7%D8%A8%D8%A7%3B034-013%2C%D9%83%D9%81%D8%B1%D8%AD%D8%A8%D9%88%3B034-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%83%D8%B1%D9%85%3B034-015%2C%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%D9%8A%D8%A9%3B034-016%2C%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%8A%D9%83%D8%A7%D9%86%D9%8A%3B034-017%2C%D8%A7%D9%84%D9%85%D8%B1%D8%AC%3B034-019%2C%D9%85%D8%BA%D8%AF%D9%88%D8%B4%D8%A9%3B034-020%2C%D8%A7%D9%84%D9%86%D9%81%D8%A7%D8%AE%D9%8A%D8%A9%3B034-021%2C%D8%B3%D8%AC%D8%AF%3B034-022%2C%D8%B9%D8%AF%D8%B4%D9%8A%D8%AA%3B034-024%2C%D9%83%D9%81%D8%B1%D9%83%D9%84%D8%A7%3B034-025%2C%D8%B9%D9%8A%D8%AA%D8%A7+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B035-001%2C%D8%B1%D9%8A%D9%81%D9%88%D9%86%3B035-002%2C%D8%A8%D8%B9%D8%A8%D8%AF%D8%A7%3B035-003%2C%D8%AC%D9%86%D9%87+%D9%88%D9%85%D8%A7%D8%B1+%D8%B3%D8%B1%D9%83%D9%8A%D8%B3%3B035-004%2C%D8%A7%D9%86%D8%B7%D9%84%D9%8A%D8%A7%D8%B3%3B035-005%2C%D8%A8%D9%8A%D8%B5%D9%88%D8%B1%3B035-006%2C%D9%85%D8%B1%D8%B3%D8%AA%D9%8A%3B035-007%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%8A%D8%A9%3B035-010%2C%D9%83%D9%81%D9%8A%D9%81%D8%A7%D9%86%3B035-011%2C%D9%83%D9%81%D8%B1%D8%B2%D9%8A%D9%86%D8%A7%3B035-012%2C%D8%B9%D9%81%D8%B5%D8%AF%D9%8A%D9%82%3B035-013%2C%D9%83%D9%81%D8%B1%D8%B4%D9%84%D8%A7%D9%86%3B035-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%86%D9%8A%D8%B1%D8%A9%3B035-015%2C%D8%A7%D9%84%D8%B7%D9%8A%D8%A8%D8%A9%3B035-016%2C%D8%AE%D8%B6%D8%B1%D8%A8%D9%83%3B035-017%2C%D8%B9%D9%85%D9%8A%D9%82%3B035-019%2C%D8%A7%D9%84%D9%85%D8%B9%D9%85%D8%B1%D9%8A%D8%A9%3B035-020%2C%D8%A8%D8%A7%D8%AA%D9%88%D9%84%D9%8A%D9%87%3B035-021%2C%D8%B3%D9%86%D9%8A%D8%A7%3B035-022%2C%D8%B9%D8%B1%D8%A8%D8%B5%D8%A7%D9%84%D9%8A%D9%85%3B035-024%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%A7%D9%84%D8%B3%D9%84%D9%85%3B035-025%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AF%D9%8A%D8%B1%3B036-001%2C%D8%B2%D9%8A%D8%AA%D9%88%D9%86%3B036-002%2C%D8%A8%D8%B9%D9%84%D8%B4%D9%85%D9%8A%D9%87%3B036-003%2C%D8%AD%D8%A7%D9%82%D9%84%3B036-004%2C%D8%A8%D8%AA%D8%BA%D8%B1%D9%8A%D9%86%3B036-005%2C%D8%AC%D8%B3%D8%B1+%D8%A7%D9%84%D9%82%D8%A7%D8%B6%D9%8A%3B036-006%2C%D9%85%D8%B2%D8%A8%D9%88%D8%AF%3B036-007%2C%D8%A7%D9%84%D8%B2%D9%88%D8%A7%D8%B1%D9%8A%D8%A8%3B036-010%2C%D9%83%D9%88%D8%A8%D8%A7%3B036-011%2C%D9%83%D9%81%D8%B1%D8%B4%D8%AE%D9%86%D8%A7%3B036-012%2C%D8%B9%D9%8A%D9%86+%D8%B9%D9%83%D8%B1%D9%8A%D9%86%3B036-013%2C%D9%83%D9%87%D9%81+%D8%A7%D9%84%D9%85%D9%84%D9%88%D9%84%3B036-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A8%D9%86%D9%8A%D8%AA%3B036-015%2C%D8%A7%D9%84%D8%B9%D9%82%D9%8A%D8%AF%D9%8A%D8%A9%3B036-016%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%BA%D8%B2%D8%A7%D9%84%3B036-017%2C%D9%85%D8%B4%D8%BA%D8%B1%D9%87+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B036-019%2C%D8%A7%D9%84%D9%85%D9%8A%D8%A9+%D9%88%D9%85%D9%8A%D8%A9%3B036-020%2C%D8%A8%D8%A7%D8%B1%D9%8A%D8%B4%3B036-021%2C%D8%B4%D9%88%D8%A7%D9%84%D9%8A%D9%82%3B036-022%2C%D8%B9%D8%B2%D9%87%3B036-024%2C%D9%85%D8%AD%D9%8A%D8%A8%D9%8A%D8%A8%3B036-025%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B037-001%2C%D8%B3%D9%87%D9%8A%D9%84%D9%87%3B037-002%2C%D8%A8%D9%85%D8%B1%D9%8A%D9%85%3B037-003%2C%D8%AD%D8%A7%D9%84%D8%A7%D8%AA%3B037-004%2C%D8%A8%D8%AD%D8%B1%D8%B5%D8%A7%D9%81%3B037-005%2C%D8%AD%D8%A8%D8%B1%D9%85%D9%88%D9%86%3B037-006%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B4%D9%88%D9%81%3B037-007%2C%D8%A7%D9%84%D8%B3%D9%85%D8%A7%D9%82%D9%8A%D8%A9%3B037-010%2C%D9%85%D8%A7%D8%B1+%D9%85%D8%A7%D9%85%D8%A7%3B037-011%2C%D9%83%D9%81%D8%B1%D8%B5%D8%BA%D8%A7%D8%A8%3B037-012%2C%D9%81%D9%8A%D8%B9%3B037-013%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D8%AC%3B037-014%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9+%D8%A7%D9%84%D8%AD%D9%8A+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B037-015%2C%D8%A7%D9%84%D8%B9%D9%84%D8%A7%D9%82%3B037-016%2C%D8%B1%D8%B9%D9%8A%D8%AA%3B037-019%2C%D8%A7%D9%84%D9%86%D8%AC%D8%A7%D8%B1%D9%8A%D8%A9%3B037-020%2C%D8%A8%D8%A7%D9%81%D9%84%D9%8A%D9%87%3B037-021%2C%D8%B5%D8%A8%D9%91%D8%A7%D8%AD%3B037-022%2C%D8%B9%D9%8A%D9%86+%D8%A8%D9%88%D8%B3%D9%88%D8%A7%D8%B1%3B037-024%2C%D9%85%D8%B1%D9%83%D8%A8%D8%A7%3B037-025%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B038-001%2C%D8%B4%D8%AD%D8%AA%D9%88%D9%84%3B038-002%2C%D8%AA%D8%AD%D9%88%D9%8A%D8%B7%D8%A9+%D8%A7%D9%84%D8%BA%D8%AF%D9%8A%D8%B1%3B038-003%2C%D8%AD%D8%A8%D8%A7%D9%84%D9%8A%D9%86%3B038-004%2C%D8%A8%D8%B1%D8%AC+%D8%AD%D9%85%D9%88%D8%AF%3B038-005%2C%D8%AD%D9%88%D9%85%D8%A7%D9%84%3B038-006%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B6%D9%87%D8%B1%3B038-007%2C%D8%A7%D9%84%D8%B3%D9%86%D8%AF%D9%8A%D8%A7%D9%86%D8%A9%3B038-010%2C%D9%85%D8%AD%D9%85%D8%B1%D8%B4%3B038-011%2C%D9%83%D9%81%D8%B1%D9%81%D9%88%3B038-012%2C%D9%82%D9%84%D8%AD%D8%A7%D8%AA%3B038-013%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B3%D9%81%D9%8A%D8%B1%D9%87%3B038-014%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D9%86%D8%A9%3B038-015%2C%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B038-016%2C%D8%B1%D9%8A%D8%A7%D9%82%3B038-019%2C%D8%A7%D9%84%D9%87%D9%84%D8%A7%D9%84%D9%8A%D8%A9%3B038-020%2C%D8%A8%D8%AF%D9%8A%D8%A7%D8%B3%3B038-021%2C%D8%B5%D9%81%D8%A7%D8%B1%D9%8A%D8%A9%3B038-022%2C%D8%B9%D9%8A%D9%86+%D9%82%D8%A7%D9%86%D8%A7%3B038-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B038-025%2C%D8%B9%D9%8A%D9%86%D8%A7%D8%AA%D8%A7%3B039-001%2C%D8%B4%D9%86%D9%86%D8%B9%D9%8A%D8%B1%3B039-002%2C%D8%AA%D8%AD%D9%88%D9%8A%D8%B7%D8%A9+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B039-003%2C%D8%AD%D8%AC%D9%88%D9%84%D8%A7%3B039-004%2C%D8%A8%D8%B1%D9%85%D8%A7%D9%86%D8%A7%3B039-005%2C%D8%AF%D9%81%D9%88%D9%86%3B039-006%2C%D9%85%D8%B2%D9%85%D9%88%D8%B1%D8%A9%3B039-007%2C%D8%A7%D9%84%D8%B3%D9%87%D9%84%D9%87%3B039-010%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%AD%D8%A7%D8%AC%3B039-011%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%D8%B4%D9%8A%D8%AA%3B039-012%2C%D9%83%D9%81%D8%AA%D9%88%D9%86%3B039-013%2C%D8%A7%D9%84%D8%A8%D8%AF%D8%A7%D9%88%D9%8A%3B039-015%2C%D8%A7%D9%84%D9%81%D8%A7%D9%83%D9%87%D9%87+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B039-016%2C%D8%B3%D8%B9%D8%AF%D9%86%D8%A7%D9%8A%D9%84%3B039-019%2C%D8%A7%D9%86%D8%B5%D8%A7%D8%B1%D9%8A%D8%A9%3B039-020%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B039-021%2C%D8%B5%D9%8A%D8%AF%D9%88%D9%86%3B039-022%2C%D9%82%D8%A7%D9%82%D8%B9%D9%8A%D8%A9+%D8%A7%D9%84%D8%AC%D8%B3%D8%B1%3B039-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%B4%D8%B1%D9%82%D9%8A%3B039-025%2C%D9%82%D9%84%D8%A7%D9%88%D9%8A%D9%87%3B040-001%2C%D8%B5%D8%B1%D8%A8%D8%A7%3B040-002%2C%D8%AA%D8%B1%D8%B4%D9%8A%D8%B4%3B040-003%2C%D8%AD%D8%B5%D8%A7%D8%B1%D8%A7%D8%AA%3B040-004%2C%D8%A8%D8%B5%D8%A7%D9%84%D9%8A%D9%85%3B040-005%2C%D8%AF%D9%82%D9%88%D9%86%3B040-006%2C%D9%85%D8%B9%D8%A7%D8%B5%D8%B1+%D8%A7%D9%84%D8%B4%D9%88%D9%81%3B040-007%2C%D8%A7%D9%84%D8%B3%D9%88%D9%8A%D8%B3%D8%A9%3B040-010%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B2%D9%8A%D8%A7%D8%AA%3B040-011%2C%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D8%A7%3B040-012%2C%D9%83%D9%81%D8%B1%D8%AD%D8%B2%D9%8A%D8%B1%3B040-013%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D9%8A%D9%88%D8%B4%D8%B9%3B040-015%2C%D8%A7%D9%84%D9%81%D8%A7%D9%83%D9%87%D9%87+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D8%AC%D8%B1%D8%AC%D8%B3%3B040-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%B3%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D9%86%D8%AC%D8%A7%D8%A9%3B040-019%2C%D8%A8%D9%82%D8%B3%D8%B7%D9%87%3B040-020%2C%D8%A8%D8%B1%D8%AC+%D8%B1%D8%AD%D8%A7%D9%84%3B040-021%2C%D8%B9%D8%A7%D8%B1%D8%A7%D9%8A%3B040-022%2C%D9%83%D9%81%D8%B1%D8%B1%D9%85%D8%A7%D9%86%3B040-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B040-025%2C%D9%83%D9%81%D8%B1%D8%A7%3B041-001%2C%D8%B7%D8%A8%D8%B1%D8%AC%D8%A7%3B041-002%2C%D8%AC%D9%88%D8%A7%D8%B1+%D8%A7%D9%84%D8%AD%D9%88%D8%B2%3B041-003%2C%D8%AD%D8%B5%D8%B1%D8%A7%D9%8A%D9%84%3B041-004%2C%D8%A8%D8%B9%D8%A8%D8%AF%D8%A7%D8%AA%3B041-005%2C%D8%AF%D9%88%D9%8A%D8%B1+%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%3B041-006%2C%D9%85%D8%B9%D8%A7%D8%B5%D8%B1+%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AF%D9%8A%D9%86%3B041-007%2C%D8%A7%D9%84%D8%B4%D9%82%D8%AF%D9%88%D9%81%3B041-010%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%B4%D8%AF%D9%8A%D8%AF%3B041-011%2C%D9%85%D8%B1%D9%8A%D8%A7%D8%B7%D9%87%3B041-012%2C%D9%83%D9%81%D8%B1%D8%B5%D8%A7%D8%B1%D9%88%D9%86%3B041-013%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%8A%D8%A9%3B041-015%2C%D8%A7%D9%84%D9%82%D8%A7%D8%B9%3B041-016%2C%D8%B4%D8%AA%D9%88%D8%B1%D9%87%3B041-019%2C%D8%A8%D9%86%D8%B9%D9%81%D9%88%D9%84%3B041-020%2C%D8%A8%D8%B3%D8%AA%D9%8A%D8%A7%D8%AA%3B041-021%2C%D8%B9%D8%B1%D9%85%D8%AA%D9%89%3B041-022%2C%D9%83%D9%81%D8%B1%D8%AA%D8%A8%D9%86%D9%8A%D8%AA%3B041-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%BA%D8%B1%D8%A8%D9%8A%3B041-025%2C%D9%83%D9%81%D8%B1%D8%AF%D9%88%D9%86%D9%8A%D9%86%3B042-001%2C%D8%B9%D8%AC%D9%84%D8%AA%D9%88%D9%86%3B042-002%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A7%D8%B1%D8%B5%D9%88%D9%86%3B042-003%2C%D8%AF%D9%85%D9%84%D8%B5%D8%A7%3B042-004%2C%D8%A8%D9%82%D9%86%D8%A7%D9%8A%D8%A7%3B042-005%2C%D8%B1%D8%B4%D9%85%D9%8A%D8%A7%3B042-006%2C%D9%86%D9%8A%D8%AD%D8%A7%3B042-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B2%D9%86%D8%A7%D8%AF%3B042-010%2C%D9%86%D8%AD%D9%84%D8%A7%3B042-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%AA%D9%81%D8%A7%D8%AD%3B042-012%2C%D9%83%D9%81%D8%B1%D8%B9%D9%82%D8%A7%3B042-013%2C%D8%A7%D9%84%D9%85%D9%86%D9%8A%D9%87%3B042-015%2C%D8%A7%D9%84%D9%82%D8%AF%D8%A7%D9%85%3B042-016%2C%D8%B9%D9%84%D9%8A+%D8%A7%D9%84%D9%86%D9%87%D8%B1%D9%8A%3B042-019%2C%D8%AA%D9%81%D8%A7%D8%AD%D8%AA%D8%A7%3B042-020%2C%D8%AC%D8%A8%D8%A7%D9%84+%D8%A7%D9%84%D8%A8%D8%B7%D9%85%3B042-021%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%85%D9%8A%D8%B1%3B042-022%2C%D9%83%D9%81%D8%B1%D8%B5%D9%8A%D8%B1%3B042-025%2C%D9%83%D9%88%D9%86%D9%8A%D9%86%3B043-001%2C%D8%B9%D8%B1%D8%A7%D9%85%D9%88%D9%86%3B043-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D8%A8%D8%B7%D9%85%3B043-003%2C%D8%B1%D8%A7%D8%B3+%D8%A7%D8%B3%D8%B7%D8%A7%3B043-004%2C%D8%A8%D9%83%D9%81%D9%8A%D8%A7%3B043-005%2C%D8%B1%D9%85%D8%AD%D8%A7%D9%84%D8%A7%3B043-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AF%D9%8A%D8%B1%3B043-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B7%D8%A7%D8%A8%D8%A7%3B043-010%2C%D9%86%D9%8A%D8%AD%D8%A7%3B043-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B043-012%2C%D9%83%D9%81%D8%B1%D9%82%D8%A7%D9%87%D9%84%3B043-013%2C%D8%A8%D8%AD%D9%86%D9%8A%D9%86%3B043-015%2C%D8%A7%D9%84%D9%84%D8%A8%D9%88%D9%87%3B043-016%2C%D8%B9%D9%8A%D9%86+%D9%83%D9%81%D8%B1%D8%B2%D8%A8%D8%AF%3B043-019%2C%D8%AC%D9%86%D8%AC%D9%84%D8%A7%D9%8A%D8%A7%3B043-020%2C%D8%AC%D9%88%D9%8A%D8%A7%3B043-021%2C%D8%B9%D9%8A%D9%86+%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D9%86%3B043-022%2C%D9%83%D9%81%D8%B1%D9%81%D9%8A%D9%84%D8%A7%3B043-025%2C%D9%85%D8%A7%D8%B1%D9%88%D9%86+%D8%A7%D9%84%D8%B1%D8%A7%D8%B3%3B044-001%2C%D8%B9%D8%B4%D9%82%D9%88%D8%AA%3B044-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D8%B3%D8%AA%3B044-003%2C%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B044-004%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%B4%D8%A7%D9%87%D9%8A%D9%86%3B044-005%2C%D8%B1%D9%88%D9%8A%D8%B3%D8%A9+%D8%A7%D9%84%D9%86%D8%B9%D9%85%D8%A7%D9%86%3B044-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B3%D8%AA%3B044-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D9%85%D8%AD%D9%85%D8%AF%3B044-010%2C%D9%88%D8%AC%D9%87+%D8%A7%D9%84%D8%AD%D8%AC%D8%B1%3B044-011%2C%D8%AD%D8%B1%D9%8A%D9%82%D8%B5%3B044-012%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B044-013%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D9%8A%D9%87%D9%88%D8%AF%D9%8A%D8%A9%3B044-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B1%D8%B4%D8%A7%D8%AF%D9%87%3B044-016%2C%D9%82%D8%A7%D8%B9+%D8%A7%D9%84%D8%B1%D9%8A%D9%85%3B044-019%2C%D8%AE%D8%B1%D8%B7%D9%88%D9%85%3B044-020%2C%D8%AD%D9%86%D9%88%D9%8A%D8%A9%3B044-021%2C%D9%82%D8%AA%D8%A7%D9%84%D9%8A%3B044-022%2C%D9%85%D9%8A%D9%81%D8%AF%D9%88%D9%86%3B044-025%2C%D9%8A%D8%A7%D8%B1%D9%88%D9%86%3B045-001%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AF%D9%84%D8%A8%D9%87%3B045-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D8%B1%D9%8A%D9%83+%D9%82%D8%B1%D8%A7%D9%86%D9%88%D8%AD%3B045-003%2C%D8%B3%D8%A7%D9%82%D9%8A%D8%A9+%D8%A7%D9%84%D8%AE%D9%8A%D8%B7%3B045-004%2C%D8%A8%D9%8A%D8%A7%D9%82%D9%88%D8%AA%3B045-005%2C%D8%B3%D8%B1%D8%AD%D9%85%D9%88%D9%84%3B045-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A8%D9%86%D8%AD%D9%84%D9%8A%D8%A9%3B045-007%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%AF%D9%87%3B045-010%2C%D9%88%D8%B7%D9%89+%D8%AD%D9%88%D8%A8%3B045-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%AD%D9%88%D9%82%D8%A7%3B045-012%2C%D9%83%D9%88%D8%B3%D8%A8%D8%A7%3B045-013%2C%D8%AA%D8%B1%D8%A8%D9%84%3B045-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B3%D8%A8%D8%A7%D8%B7%3B045-016%2C%D9%82%D8%A8+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B045-019%2C%D8%AE%D8%B2%D9%8A%D8%B2%3B045-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A7%D8%B1%D8%AB%D9%88%D8%B0%D9%83%D8%B3%3B045-021%2C%D9%82%D8%B7%D9%8A%D9%86+%D9%88%D8%AD%D9%8A%D8%AF%D8%A7%D8%A8%3B045-022%2C%D9%8A%D8%AD%D9%85%D8%B1%3B045-025%2C%D8%A8%D9%8A%D8%AA+%D9%8A%D8%A7%D8%AD%D9%88%D9%86%3B046-001%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%87%3B046-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D9%85%D8%B2%D8%A9%3B046-003%2C%D8%B3%D8%B1%D8%B9%D9%8A%D8%AA%D8%A7%3B046-004%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%B4%D8%B9%D8%A7%D8%B1%3B046-005%2C%D8%B3%D9%84%D9%81%D8%A7%D9%8A%D8%A7%3B046-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AF%D9%8A%D8%B1+%D8%AF%D9%88%D8%B1%D9%8A%D8%AA%3B046-007%2C%D8%A7%D9%84%D8%B9%D8%A8%D9%88%D8%AF%D9%8A%D8%A9%3B046-010%2C%D8%A7%D8%AF%D9%87%3B046-011%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D9%81%D9%88%D8%A7%D8%B1%3B046-012%2C%D9%85%D8%AA%D8%B1%D9%8A%D8%AA%3B046-013%2C%D8%AF%D9%8A%D8%B1+%D8%B9%D9%85%D8%A7%D8%B1%3B046-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B046-016%2C%D9%82%D8%A8+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B046-019%2C%D8%AF%D8%B1%D8%A8+%D8%A7%D9%84%D8%B3%D9%8A%D9%85%3B046-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B046-021%2C%D9%82%D9%8A%D8%AA%D9%88%D9%84%D9%8A%3B047-001%2C%D8%B9%D9%8A%D9%86%D8%B7%D9%88%D8%B1%D9%87%3B047-002%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7%3B047-003%2C%D8%B3%D9%82%D9%8A+%D8%B1%D8%B4%D9%85%D9%8A%D8%A7%3B047-004%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D9%83%D9%83%D9%88%3B047-005%2C%D8%B3%D9%88%D9%82+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%3B047-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D8%B3%D8%B7%D8%A7%D9%86%D9%8A%3B047-007%2C%D8%A7%D9%84%D8%B9%D8%B1%D9%8A%D8%B6%D8%A9%3B047-010%2C%D8%A2%D8%B3%D9%8A%D8%A7%3B047-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B047-012%2C%D9%83%D9%81%D8%B1%D8%AD%D8%A7%D8%AA%D8%A7%3B047-013%2C%D9%85%D8%B1%D9%83%D8%A8%D8%AA%D8%A7%3B047-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B047-016%2C%D8%A7%D9%84%D9%83%D8%B1%D9%85%D9%87%3B047-019%2C%D8%A7%D8%B1%D8%B2%D9%8A%3B047-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D9%88%D8%B1%D8%A9%3B047-021%2C%D9%83%D8%B1%D8%AE%D8%A7%3B048-001%2C%D8%BA%D8%A7%D8%AF%D9%8A%D8%B1%3B048-002%2C%D8%AD%D9%85%D8%A7%D9%86%D8%A7%3B048-003%2C%D8%B4%D8%A7%D9%85%D8%A7%D8%AA%3B048-004%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D8%A8%D8%A7%D8%A8+%D8%AA%D8%AD%D8%AA%D8%A7%D9%86%D9%8A%3B048-005%2C%D8%B4%D8%A7%D8%B1%D9%88%D9%86%3B048-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D8%AF%D9%88%D9%8A%3B048-007%2C%D8%A7%D9%84%D8%B9%D9%88%D9%8A%D9%86%D8%A7%D8%AA%3B048-010%2C%D8%A7%D9%84%D8%A8%D8%AA%D8%B1%D9%88%D9%86%3B048-011%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B048-013%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%86%D8%AD%D9%84%D9%87%3B048-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D8%B1%D9%8A%D8%B6%3B048-016%2C%D9%82%D9%88%D8%B3%D8%A7%D9%8A%D8%A7%3B048-019%2C%D8%A7%D8%B1%D9%83%D9%8A%3B048-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%B3%D9%8A%D9%86%D9%8A%D8%A9%3B048-021%2C%D9%83%D9%81%D8%B1%D8%AC%D8%B1%D8%A9%3B049-001%2C%D8%BA%D8%AF%D8%B1%D8%A7%D8%B3%3B049-002%2C%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%8A%D8%A7%D8%B6%D9%8A%D8%A9%3B049-003%2C%D8%B4%D9%85%D9%88%D8%AA%3B049-004%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D8%A8%D8%A7%D8%A8+%D9%81%D9%88%D9%82%D8%A7%D9%86%D9%8A%3B049-005%2C%D8%B4%D8%A7%D9%86%D9%8A%D9%87%3B049-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%8A%D8%A7%D8%AF%D8%B1%3B049-007%2C%D8%A7%D9%84%D8%B9%D9%8A%D9%88%D9%86%3B049-010%2C%D8%A7%D9%84%D9%85%D8%B3%D8%B1%D8%AD+%D9%88%D8%A7%D9%84%D8%A8%D9%82%D8%B9%D9%8A%D8%A9%3B049-011%2C%D9%85%D8%B2%D9%8A%D8%A7%D8%B1%D8%A9%3B049-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%82%D8%A8%D9%87%3B049-016%2C%D9%83%D8%A7%D8%A8%D9%88%D8%B3%D9%8A%D8%A9%3B049-019%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%A8%D9%84%D9%8A%D8%A9%3B049-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D8%A7%D8%AB%D9%88%D9%84%D9%8A%D9%83%3B049-021%2C%D9%83%D9%81%D8%B1%D9%81%D8%A7%D9%84%D9%88%D8%B3%3B050-001%2C%D8%BA%D8%B2%D9%8A%D8%B1+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B050-002%2C%D8%AE%D9%84%D9%88%D8%A7%D8%AA+%D9%81%D8%A7%D9%84%D9%88%D8%BA%D8%A7%3B050-003%2C%D8%B4%D9%8A%D8%AE%D8%A7%D9%86%3B050-004%2C%D8%A8%D9%8A%D8%AA+%D9%85%D8%B1%D9%8A%3B050-005%2C%D8%B4%D8%B1%D8%AA%D9%88%D9%86%3B050-006%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%B1%D9%88%D9%83%3B050-007%2C%D8%A7%D9%84%D8%BA%D8%B2%D9%8A%D9%84%D9%87%3B050-010%2C%D8%A7%D9%84%D8%AF%D9%88%D9%82%3B050-011%2C%D8%A7%D8%B3%D9%84%D9%88%D8%AA%3B050-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B050-016%2C%D9%83%D9%81%D8%B1%D8%B2%D8%A8%D8%AF%3B050-019%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B3%D8%A7%D8%B1%D9%8A%D9%87%3B050-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%86%D8%A7%D8%B1%D8%A9%3B050-021%2C%D9%84%D8%A8%D8%B9%D9%87%3B051-001%2C%D8%BA%D8%B2%D9%8A%D8%B1+%D8%A7%D9%84%D9%82%D9%86%D8%A7%D8%A9%3B051-002%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%AD%D8%B1%D9%81%3B051-003%2C%D8%B7%D9%88%D8%B1%D8%B2%D9%8A%D8%A7%3B051-004%2C%D8%AC%D9%84+%D8%A7%D9%84%D8%AF%D9%8A%D8%A8%3B051-005%2C%D8%B4%D9%85%D9%84%D8%A7%D9%86%3B051-006%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%AC%D9%8A%D9%86%3B051-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA%3B051-010%2C%D8%A7%D9%84%D8%B9%D9%84%D8%A7%D9%84%D9%8A%3B051-011%2C%D8%A8%D9%8A%D8%AA+%D8%B9%D8%A8%D9%8A%D8%AF%3B051-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA++%D8%AD%D9%8A+%D8%B7%D8%A8%D8%B4%D8%A7%D8%B1%3B051-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%85%D8%A7%D8%B1+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3%3B051-019%2C%D8%A7%D9%84%D8%AD%D8%A7%D8%B1%D8%A9%3B051-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%88%D8%A7%D8%B1%D9%86%D8%A9%3B051-021%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%AD%D8%A8%D8%A7%D8%B3%3B052-001%2C%D8%BA%D8%B2%D9%8A%D8%B1+%D8%A7%D9%84%D9%85%D8%B9%D8%A7%D9%85%D9%84%D8%AA%D9%8A%D9%86%3B052-002%2C%D8%AF%D9%8A%D8%B1+%D8%AE%D9%88%D9%86%D9%87+%D9%88%D8%AA%D9%84%D8%AA%D9%8A%D8%AA%D9%87%3B052-003%2C%D8%B9%D8%A8%D9%8A%D8%AF%D8%A7%D8%AA%3B052-004%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A7%D9%84%D8%A8%D9%84%D9%88%D8%B7%3B052-005%2C%D8%B5%D9%88%D9%81%D8%B1%3B052-006%2C%D8%A7%D9%84%D8%A8%D8%B7%D8%A7%D9%84%3B052-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D8%B0%D9%88%D9%82%3B052-010%2C%D8%A7%D9%84%D9%81%D8%AA%D8%A7%D8%AD%D8%A7%D8%AA+%D9%88%D9%87%D8%B1%D8%A8%D9%88%D9%86%D8%A7%3B052-011%2C%D8%B1%D8%A7%D8%B3%D9%83%D9%8A%D9%81%D8%A7%3B052-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B9%D8%AB%D9%85%D8%A7%D9%86%3B052-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%85%D8%A7%D8%B1+%D9%85%D8%AE%D8%A7%D9%8A%D9%84%3B052-019%2C%D8%A7%D9%84%D8%AD%D8%AC%D8%A9%3B052-020%2C%D8%AF%D8%A8%D8%B9%D8%A7%D9%84%3B052-021%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%85%D8%B7%D8%AD%D9%86%D8%A9%3B053-001%2C%D8%BA%D9%88%D8%B3%D8%B7%D8%A7%3B053-002%2C%D8%B1%D8%A7%D8%B3+%D8%A7%D9%84%D8%AD%D8%B1%D9%81%3B053-003%2C%D8%B9%D9%84%D9%85%D8%A7%D8%AA%2F%D8%AC%3B053-004%2C%D8%AD%D9%85%D9%84%D8%A7%D9%8A%D8%A7%3B053-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D8%BA%D8%B1%D8%A8%D9%8A%3B053-006%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%D9%87%3B053-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D8%B6%D9%87%D8%B1%3B053-010%2C%D8%A7%D9%84%D9%87%D8%B1%D9%8A%3B053-011%2C%D9%83%D9%81%D8%B1%D8%AD%D8%A7%D8%AA%D8%A7%3B053-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D9%86%D8%B9%D8%A7%D9%85%3B053-016%2C%D9%85%D8%A7%D8%B3%D8%A7%3B053-019%2C%D8%A7%D9%84%D8%AE%D8%B1%D8%A7%D9%8A%D8%A8%3B053-020%2C%D8%AF%D8%B1%D8%AF%D8%BA%D9%8A%D8%A7%3B053-021%2C%D9%85%D8%B4%D9%85%D9%88%D8%B4%D8%A9%3B054-001%2C%D9%81%D8%A7%D8%B1%D9%8A%D8%A7%3B054-002%2C%D8%B1%D8%A7%D8%B3+%D8%A7%D9%84%D9%85%D8%AA%D9%86%3B054-003%2C%D8%B9%D9%84%D9%85%D8%A7%D8%AA%2F%D8%B4%3B054-004%2C%D8%AF%D9%8A%D8%B1+%D8%B4%D9%85%D8%B1%D8%A7%3B054-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D9%88%D8%B3%D8%B7%D8%A7%D9%86%D9%8A%3B054-006%2C%D8%A7%D9%84%D8%AC%D8%A7%D9%87%D9%84%D9%8A%D8%A9%3B054-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%D8%A9%3B054-010%2C%D8%A8%D8%AC%D8%AF%D8%B1%D9%81%D9%84%3B054-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%81%D8%B1%D9%8A%D8%AF%D9%8A%D8%B3%3B054-015%2C%D8%A7%D9%84%D9%86%D9%82%D8%B1%D9%87%3B054-016%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%B9%D9%86%D8%AC%D8%B1%3B054-020%2C%D8%AF%D9%8A%D8%B1+%D8%B9%D8%A7%D9%85%D8%B5%3B054-021%2C%D9%85%D9%84%D9%8A%D8%AE%3B055-001%2C%D9%81%D8%AA%D9%82%D8%A7%3B055-002%2C%D8%B1%D9%88%D9%8A%D8%B3%D8%A9+%D8%A7%D9%84%D8%A8%D9%84%D9%88%D8%B7%3B055-003%2C%D8%B9%D9%85%D8%B4%D9%8A%D8%AA%3B055-004%2C%D8%AF%D9%8A%D9%83+%D8%A7%D9%84%D9%85%D8%AD%D8%AF%D9%8A%3B055-005%2C%D8%B9%D8%A8%D9%8A%D9%87%3B055-006%2C%D8%A7%D9%84%D8%AC%D9%84%D9%8A%D9%84%D9%8A%D8%A9%3B055-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D9%82%D8%B7%D9%84%D8%A8%D9%87%3B055-010%2C%D8%A8%D8%B4%D8%AA%D9%88%D8%AF%D8%A7%D8%B1%3B055-015%2C%D8%A7%D9%84%D9%8A%D9%85%D9%88%D9%86%D9%87%3B055-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D8%B9%D9%84%D9%82%D8%A9%3B055-020%2C%D8%AF%D9%8A%D8%B1+%D9%82%D8%A7%D9%86%D9%88%D9%86+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B055-021%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A8%D8%B9%D9%86%D9%82%D9%88%D8%AF%D9%8A%D9%86%3B056-001%2C%D9%81%D9%8A%D8%B7%D8%B1%D9%88%D9%86%3B056-002%2C%D8%B2%D9%86%D8%AF%D9%88%D9%82%D8%A9%3B056-003%2C%D8%B9%D9%86%D8%A7%D9%8A%D8%A7+%D9%88%D9%83%D9%81%D8%B1%D8%A8%D8%B9%D8%A7%D9%84%3B056-004%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D8%AE%D8%B1%D8%A7%D8%A8%3B056-005%2C%D8%B9%D8%B1%D9%85%D9%88%D9%86%3B056-006%2C%D8%A7%D9%84%D8%AC%D9%85%D9%8A%D9%84%D9%8A%D8%A9%3B056-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%BA%D9%88%D8%A7%D9%8A%D8%A7%3B056-010%2C%D8%A8%D8%B4%D8%B9%D9%84%D9%87%3B056-015%2C%D8%A7%D9%8A%D8%B9%D8%A7%D8%AA%3B056-016%2C%D9%85%D9%83%D8%B3%D8%A9%3B056-020%2C%D8%AF%D9%8A%D8%B1+%D9%82%D8%A7%D9%86%D9%88%D9%86+%D8%B1%D8%A3%D8%B3+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B056-021%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AC%D8%B2%D9%8A%D9%86%3B057-001%2C%D9%83%D9%81%D8%B1%D8%AA%D9%8A%D9%87%3B057-002%2C%D8%B3%D8%A8%D9%86%D9%8A%D9%87%3B057-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AF%D9%84%D8%A8%D9%87%3B057-004%2C%D8%B1%D9%88%D9%85%D9%8A%D9%87%3B057-005%2C%D8%B9%D9%8A%D8%AA%D8%A7%D8%AA%3B057-006%2C%D8%A7%D9%84%D8%AC%D9%8A%D9%87%3B057-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D9%85%D8%B1%D8%AA%D9%85%D9%88%D8%B1%D9%87%3B057-010%2C%D8%A8%D9%82%D8%B3%D9%85%D9%8A%D8%A7%3B057-015%2C%D8%A8%D8%AA%D8%AF%D8%B9%D9%8A%3B057-016%2C%D9%86%D9%8A%D8%AD%D8%A7%3B057-020%2C%D8%AF%D9%8A%D8%B1+%D9%83%D9%8A%D9%81%D8%A7%3B058-001%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A8%D9%8A%D8%A7%D9%86%3B058-002%2C%D8%B4%D9%88%D9%8A%D8%AA%3B058-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B4%D9%84%D8%A7%D9%84%3B058-004%2C%D8%B2%D8%A8%D9%88%D8%BA%D8%A7%3B058-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B058-006%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D8%A9%3B058-007%2C%D8%A7%D9%84%D9%82%D8%B1%D9%82%D9%81%3B058-010%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D9%84%D8%A7%D9%84%D8%A7%3B058-015%2C%D8%A8%D8%AF%D9%86%D8%A7%D9%8A%D9%84%3B058-016%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AF%D9%84%D9%85%3B058-020%2C%D8%B1%D8%B4%D9%83%D9%86%D8%A7%D9%86%D9%8A%D8%A9%3B059-001%2C%D9%85%D8%B9%D8%B1%D8%A7%D8%A8%3B059-002%2C%D8%B5%D9%84%D9%8A%D9%85%D8%A7%3B059-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%D8%A9%3B059-004%2C%D8%B2%D8%B1%D8%B9%D9%88%D9%86%3B059-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AD%D9%84%D8%B2%D9%88%D9%86%3B059-006%2C%D8%A7%D9%84%D8%AF%D8%A7%D9%85%D9%88%D8%B1%3B059-007%2C%D8%A7%D9%84%D9%82%D8%B1%D9%86%D8%A9%3B059-010%2C%D8%AA%D8%AD%D9%88%D9%85%3B059-015%2C%D8%A8%D8%B1%D9%82%D8%A7%3B059-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B9%D8%B1%D8%A7%D9%8A%D8%B4%3B059-020%2C%D8%B2%D8%A8%D9%82%D9%8A%D9%86%3B060-001%2C%D9%85%D9%8A%D8%B1%D9%88%D8%A8%D8%A7%3B060-002%2C%D8%B9%D8%A7%D8%B1%D9%8A%D8%A7%3B060-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%BA%D9%88%D9%8A%D8%A8%D9%87%3B060-004%2C%D8%B2%D9%83%D8%B1%D9%8A%D8%AA%3B060-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%D8%A9%3B060-006%2C%D8%A7%D9%84%D8%AF%D8%A8%D9%8A%D9%87%3B060-007%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D8%A7%D8%AA%3B060-010%2C%D8%AA%D9%86%D9%88%D8%B1%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B060-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%A7%D9%84%D9%8A%D9%88%D9%86%D8%B3%D9%8A%D8%A9%3B060-016%2C%D9%8A%D9%88%D8%BA%D9%88%D9%86+%D8%A7%D9%88%D9%84%D9%88%D9%83%3B060-020%2C%D8%B3%D9%84%D8%B9%D8%A7%3B061-001%2C%D9%86%D9%87%D8%B1+%D8%A7%D9%84%D8%B0%D9%87%D8%A8%3B061-002%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%D8%A9%3B061-003%2C%D8%B9%D9%8A%D9%86+%D8%AC%D8%B1%D9%8A%D9%86%3B061-004%2C%D8%B3%D8%A7%D9%82%D9%8A%D8%A9+%D8%A7%D9%84%D9%85%D8%B3%D9%83%3B061-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D8%B1%D8%AF%D9%8A%D8%B3%3B061-006%2C%D8%A7%D9%84%D8%B1%D9%85%D9%8A%D9%84%D9%87%3B061-007%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D8%B9%D8%A7%D8%AA%3B061-010%2C%D8%AA%D9%86%D9%88%D8%B1%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B061-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B4%D8%B1%D9%82%D9%8A%3B061-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B061-020%2C%D8%B4%D9%85%D8%B9%3B062-001%2C%D9%87%D8%B1%D9%87%D8%B1%D9%8A%D8%A7+%D9%88%D8%A7%D9%84%D9%82%D8%B7%D9%8A%D9%86%3B062-002%2C%D8%B9%D9%8A%D9%86+%D9%85%D9%88%D9%81%D9%82%3B062-003%2C%D8%B9%D9%8A%D9%86+%D9%83%D9%81%D8%A7%D8%B9%3B062-004%2C%D8%B3%D8%AF+%D8%A7%D9%84%D8%A8%D9%88%D8%B4%D8%B1%D9%8A%D8%A9%3B062-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%85%D8%B1%D8%AC%3B062-006%2C%D8%A7%D9%84%D8%B2%D8%B9%D8%B1%D9%88%D8%B1%D9%8A%D8%A9%3B062-007%2C%D8%A7%D9%84%D9%82%D9%86%D8%B7%D8%B1%D8%A9%3B062-010%2C%D8%AA%D9%88%D9%84%D8%A7%3B062-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B4%D9%85%D9%8A%D8%B3%3B062-020%2C%D8%B4%D9%8A%D8%AD%D9%8A%D9%86%3B063-001%2C%D9%88%D8%B7%D9%89+%D8%A7%D9%84%D8%AC%D9%88%D8%B2%3B063-002%2C%D9%81%D8%A7%D9%84%D9%88%D8%BA%D8%A7%3B063-003%2C%D8%BA%D8%B1%D8%B2%D9%88%D8%B2%3B063-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%84%D8%AF%D9%87%3B063-005%2C%D8%B9%D9%8A%D9%86+%D8%AA%D8%B1%D8%A7%D8%B2%3B063-006%2C%D8%A7%D9%84%D8%B3%D9%85%D9%82%D8%A7%D9%86%D9%8A%D8%A9%3B063-007%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B063-010%2C%D8%B1%D8%A7%D9%85%3B063-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B4%D9%85%D9%8A%D8%B3+%D8%BA%D8%B1%D8%A8%D9%8A%3B063-020%2C%D8%B5%D8%AF%D9%8A%D9%82%D9%8A%D9%86%3B064-001%2C%D9%8A%D8%AD%D8%B4%D9%88%D8%B4%3B064-002%2C%D9%82%D8%A8%D9%8A%D8%B9%3B064-003%2C%D8%BA%D8%B1%D9%81%D9%8A%D9%86%3B064-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%AC%D8%B3%D8%B1+%D8%A7%D9%84%D8%A8%D8%A7%D8%B4%D8%A7%3B064-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B064-006%2C%D8%A7%D9%84%D9%81%D8%B1%D9%8A%D8%AF%D9%8A%D8%B3%3B064-007%2C%D8%A7%D9%84%D9%83%D9%88%D8%A7%D8%B4%D8%B1%D9%87%3B064-010%2C%D8%B6%D9%87%D8%B1+%D8%A7%D8%A8%D9%88+%D9%8A%D8%A7%D8%BA%D9%8A%3B064-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%A8%D9%86%D9%8A%D9%87%3B064-020%2C%D8%B5%D8%B1%D9%8A%D9%81%D8%A7%3B065-001%2C%D8%A8%D8%B2%D9%85%D8%A7%D8%B1%3B065-002%2C%D9%82%D8%AA%D8%A7%D9%84%D9%87%3B065-003%2C%D8%BA%D9%84%D8%A8%D9%88%D9%86%3B065-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%3B065-005%2C%D8%B9%D9%8A%D9%86+%D8%AF%D8%A7%D8%B1%D9%87%3B065-006%2C%D8%A7%D9%84%D9%81%D9%88%D8%A7%D8%B1%D8%A9%3B065-007%2C%D8%A7%D9%84%D9%85%D8%AC%D8%AF%D9%84%3B065-010%2C%D9%83%D9%88%D8%B1%3B065-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AC%D9%88%D8%B2%3B065-020%2C%D8%B5%D9%88%D8%B1%3B066-001%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%B5%D8%AE%D8%B1%3B066-002%2C%D9%82%D8%B1%D8%B7%D8%A7%D8%B6%D9%87%3B066-003%2C%D9%81%D8%AA%D8%B1%D9%8A%3B066-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%B1%D8%AC%3B066-005%2C%D8%B9%D9%8A%D9%86+%D8%B9%D9%86%D9%88%D8%A8%3B066-006%2C%D8%A7%D9%84%D9%83%D8%AD%D9%84%D9%88%D9%86%D9%8A%D9%87%3B066-007%2C%D8%A7%D9%84%D9%85%D8%AD%D9%85%D8%B1%D8%A9%3B066-010%2C%D9%82%D9%86%D8%AF%D9%88%D9%84%D8%A7%3B066-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%BA%D8%B1%D8%A8%D9%8A%3B066-020%2C%D8%B7%D9%88%D8%B1%D8%A7%3B067-001%2C%D8%B3%D8%A7%D8%AD%D9%84+%D8%B9%D9%84%D9%85%D8%A7%3B067-002%2C%D9%82%D8%B1%D9%86%D8%A7%D9%8A%D9%84%3B067-003%2C%D9%81%D8%AF%D8%A7%D8%B1%3B067-004%2C%D8%B4%D8%B1%D9%8A%D9%86%3B067-005%2C%D8%B9%D9%8A%D9%86+%D9%83%D8%B3%D9%88%D8%B1%3B067-006%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B067-007%2C%D8%A7%D9%84%D9%85%D8%B3%D8%B9%D9%88%D8%AF%D9%8A%D8%A9%3B067-010%2C%D8%A7%D8%AC%D8%AF%D8%A8%D8%B1%D8%A7%3B067-015%2C%D8%A8%D8%B4%D9%88%D8%A7%D8%AA%3B067-020%2C%D8%B7%D9%8A%D8%B1+%D8%AD%D8%B1%D9%81%D8%A7%3B068-001%2C%D8%BA%D8%A8%D8%A7%D9%84%D9%87%3B068-002%2C%D9%83%D9%81%D8%B1%D8%B3%D9%84%D9%88%D8%A7%D9%86%3B068-003%2C%D9%81%D8%B1%D8%A7%D8%AA%3B068-004%2C%D8%B4%D9%88%D9%8A%D8%A7%3B068-005%2C%D8%B9%D9%8A%D9%86%D8%A7%D8%A8%3B068-006%2C%D8%A7%D9%84%D9%85%D8%AD%D8%AA%D9%82%D8%B1%D8%A9+%D9%88%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D9%85%D8%AE%D9%84%D8%B5%3B068-007%2C%D8%A7%D9%84%D9%85%D9%82%D9%8A%D8%A8%D9%84%D8%A9%3B068-010%2C%D8%AC%D8%A8%D9%84%D8%A7%3B068-015%2C%D8%A8%D9%88%D8%AF%D8%A7%D9%8A%3B068-020%2C%D8%B7%D9%8A%D8%B1+%D9%81%D9%84%D8%B3%D9%8A%D9%87%3B069-001%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%D8%B3%D9%8A%D9%86%3B069-002%2C%D9%83%D9%81%D8%B1%D8%B4%D9%8A%D9%85%D8%A7%3B069-003%2C%D9%81%D8%B1%D8%AD%D8%AA%3B069-004%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%3B069-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D9%82%D8%A8%D9%84%D9%8A%3B069-006%2C%D8%A7%D9%84%D9%85%D8%AE%D8%AA%D8%A7%D8%B1%D8%A9%3B069-007%2C%D8%A7%D9%84%D9%85%D9%82%D9%8A%D8%B7%D8%B9%3B069-015%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D8%A7%D9%85%D8%A7%3B069-020%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%A7%D8%B3%D9%8A%D9%87%3B070-002%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%B4%D8%AD%D8%B1%D9%88%D8%B1+%D8%A7%D9%84%D8%B3%D9%81%D9%84%D9%89%3B070-003%2C%D9%81%D8%BA%D8%A7%D9%84%3B070-004%2C%D8%B9%D9%85%D8%A7%D8%B1%D8%A9+%D8%B4%D9%84%D9%87%D9%88%D8%A8%3B070-005%2C%D9%83%D9%81%D8%B1%D8%B9%D9%85%D9%8A%D9%87%3B070-006%2C%D8%A7%D9%84%D9%85%D8%B4%D8%B1%D9%81%3B070-007%2C%D8%A7%D9%84%D9%85%D9%88%D9%86%D8%B3%D9%87%3B070-015%2C%D8%A8%D9%8A%D8%AA+%D8%B5%D9%84%D9%8A%D8%A8%D9%8A%3B070-020%2C%D8%B9%D9%84%D9%85%D8%A7+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B071-002%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%B4%D8%AD%D8%B1%D9%88%D8%B1+%D8%A7%D9%84%D8%B9%D9%84%D9%8A%D8%A7%3B071-003%2C%D9%82%D8%B1%D8%B7%D8%A8%D8%A7+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%D8%A9%3B071-004%2C%D8%B9%D9%88%D9%83%D8%B1%3B071-005%2C%D9%83%D9%81%D8%B1%D9%85%D8%AA%D9%89%3B071-006%2C%D8%A7%D9%84%D9%85%D8%B7%D9%84%D8%A9%3B071-007%2C%D8%A7%D9%84%D9%86%D9%81%D9%8A%D8%B3%D8%A9%3B071-015%2C%D8%A8%D9%8A%D8%AA+%D9%85%D8%B4%D9%8A%D9%83%3B071-020%2C%D8%B9%D9%8A%D8%AA%D9%8A%D8%AA%3B072-002%2C%D8%A8%D8%B9%D8%A8%D8%AF%D8%A7+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A9%3B072-003%2C%D9%82%D8%B1%D8%B7%D8%A8%D8%A7+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%D8%A9%3B072-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D9%81%D8%A7%D8%AD%D8%A9%3B072-005%2C%D9%83%D9%8A%D9%81%D9%88%D9%86%3B072-006%2C%D8%A7%D9%84%D9%85%D8%B9%D9%86%D9%8A%D9%87%3B072-007%2C%D8%A7%D9%84%D9%86%D9%88%D8%B1%D9%87%3B072-015%2C%D8%AA%D9%85%D9%86%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B072-020%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%88+%D8%B9%D8%A8%D8%AF+%D8%A7%D9%84%D9%84%D9%87%3B073-002%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%84%D9%85%3B073-003%2C%D9%82%D8%B1%D9%82%D8%B1%D9%8A%D8%A7%3B073-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AE%D8%B1%D9%88%D8%A8%D8%A9%3B073-005%2C%D9%85%D8%AC%D8%AF%D9%84%D8%A8%D8%B9%D9%86%D8%A7%3B073-006%2C%D8%A7%D9%84%D9%85%D8%BA%D9%8A%D8%B1%D9%8A%D8%A9%3B073-007%2C%D8%A7%D9%84%D9%87%D8%AF%3B073-015%2C%D8%AA%D9%85%D9%86%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B073-020%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B2%D8%B1%D9%82%D8%A7%3B074-003%2C%D9%82%D9%87%D9%85%D8%B2%3B074-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B2%D9%8A%D8%AA%D9%88%D9%86%D8%A9%3B074-005%2C%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D8%A7%3B074-006%2C%D8%A7%D9%84%D9%86%D8%A7%D8%B9%D9%85%D8%A9%3B074-007%2C%D8%A7%D9%8A%D9%84%D8%A7%D8%AA%3B074-015%2C%D8%AC%D8%A8%D8%B9%D8%A7%3B074-020%2C%D8%B9%D9%8A%D9%86+%D8%A8%D8%B9%D8%A7%D9%84%3B075-003%2C%D9%83%D9%81%D8%B1%D9%83%D8%AF%D9%87%3B075-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B3%D9%86%D8%AF%D9%8A%D8%A7%D9%86%D8%A9%3B075-005%2C%D9%85%D8%AD%D8%B7%D8%A9+%D8%A8%D8%AD%D9%85%D8%AF%D9%88%D9%86%3B075-006%2C%D8%A7%D9%84%D9%88%D8%B1%D8%AF%D8%A7%D9%86%D9%8A%D8%A9%3B075-007%2C%D8%A8%D8%A8%D9%86%D9%8A%D9%86%3B075-015%2C%D8%AC%D8%A8%D9%88%D9%84%D9%87%3B075-020%2C%D9%85%D8%AC%D8%AF%D9%84%D8%B2%D9%88%D9%86%3B076-003%2C%D9%83%D9%81%D8%B1%D9%85%D8%B3%D8%AD%D9%88%D9%86%3B076-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B5%D9%81%D8%B5%D8%A7%D9%81%3B076-005%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B076-006%2C%D8%A7%D9%84%D9%88%D8%B1%D9%87%D8%A7%D9%86%D9%8A%D8%A9%3B076-007%2C%D8%A8%D8%B1%D8%A8%D8%A7%D8%B1%D9%87%3B076-015%2C%D8%AC%D9%86%D8%AA%D8%A7%3B076-020%2C%D9%85%D8%AD%D8%B1%D9%88%D9%86%D9%87%3B077-003%2C%D9%83%D9%81%D9%88%D9%86%3B077-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%82%D8%A8%D9%88%3B077-005%2C%D9%85%D8%B9%D8%B5%D8%B1%D9%8A%D8%AA%D9%8A%3B077-006%2C%D8%A8%D8%A7%D8%AA%D8%B1%3B077-007%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%B9%D8%B1%D8%A8%3B077-015%2C%D8%AD%D8%A7%D9%85%3B077-020%2C%D9%85%D8%B1%D9%88%D8%AD%D9%8A%D9%86%3B078-003%2C%D9%84%D8%A7%D8%B3%D8%A7%3B078-004%2C%D8%B9%D9%8A%D9%86+%D8%B3%D8%B9%D8%A7%D8%AF%D9%87%3B078-006%2C%D8%A8%D8%AA%D9%84%D9%88%D9%86%3B078-007%2C%D8%A8%D8%B1%D9%82%D8%A7%D9%8A%D9%84%3B078-015%2C%D8%AD%D8%B1%D8%A8%D8%AA%D8%A7%3B078-020%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D9%85%D8%B4%D8%B1%D9%81%3B079-003%2C%D9%84%D8%AD%D9%81%D8%AF%3B079-004%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%A7%D8%B1%3B079-006%2C%D8%A8%D8%B1%D8%AC%D8%A7%3B079-007%2C%D8%A8%D8%B2%D8%A7%D9%84%3B079-015%2C%D8%AD%D8%B2%D9%8A%D9%86%3B079-020%2C%D9%85%D8%B9%D8%B1%D9%83%D8%A9%3B080-003%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B3%D9%8A%D8%A7%D8%AF%3B080-004%2C%D8%B9%D9%8A%D9%86+%D8%B9%D9%84%D9%82%3B080-006%2C%D8%A8%D8%B1%D9%8A%D8%AD%3B080-007%2C%D8%A8%D8%B2%D8%A8%D9%8A%D9%86%D8%A7%3B080-015%2C%D8%AD%D9%84%D8%A8%D8%AA%D8%A7%3B080-020%2C%D9%85%D8%B9%D8%B1%D9%88%D8%A8%3B081-003%2C%D9%85%D8%B4%D8%A7%D9%86%3B081-004%2C%D8%B9%D9%8A%D9%86%D8%B7%D9%88%D8%B1%D8%A9%3B081-006%2C%D8%A8%D8%B3%D8%A7%D8%A8%D8%A7%3B081-007%2C%D8%A8%D9%82%D8%B1%D8%B2%D9%84%D8%A7%3B081-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7%3B081-020%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AC%D9%8A%D9%84%D9%88%3B082-003%2C%D9%85%D8%B4%D9%85%D8%B4%3B082-004%2C%D9%82%D8%B1%D9%86%D8%A9+%D8%A7%D9%84%D8%AD%D9%85%D8%B1%D8%A7%3B082-006%2C%D8%A8%D8%B4%D8%AA%D9%81%D9%8A%D9%86%3B082-007%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AD%D8%A7%D8%AC%3B082-015%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B0%D9%87%D8%A8%3B082-020%2C%D9%8A%D8%A7%D9%86%D9%88%D8%AD%3B083-003%2C%D9%85%D8%B9%D8%A7%D8%AF%3B083-004%2C%D9%82%D8%B1%D9%86%D8%A9+%D8%B4%D9%87%D9%88%D8%A7%D9%86%3B083-006%2C%D8%A8%D8%B7%D9%85%D8%A9%3B083-007%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AD%D9%88%D8%B4%3B083-015%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B1%D8%A7%D9%81%D9%82%D8%A9%3B084-003%2C%D9%85%D9%8A%D9%81%D9%88%D9%82%3B084-004%2C%D9%82%D9%86%D8%A7%D8%A8%D8%A9+%D8%A8%D8%B1%D9%85%D8%A7%D9%86%D8%A7%3B084-006%2C%D8%A8%D8%B9%D8%A7%D8%B5%D9%8A%D8%B1%3B084-007%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%8A%D9%88%D8%A8%3B084-015%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D9%86%D8%A8%D9%8A%3B085-003%2C%D9%86%D9%87%D8%B1+%D8%A7%D8%A8%D8%B1%D8%A7%D9%87%D9%8A%D9%85%3B085-004%2C%D9%82%D9%86%D8%A7%D8%A8%D8%A9+%D8%B5%D9%84%D9%8A%D9%85%D8%A7%3B085-006%2C%D8%A8%D8%B9%D8%B0%D8%B1%D8%A7%D9%86%3B085-007%2C%D8%A8%D9%8A%D8%AA+%D8%BA%D8%B7%D8%A7%D8%B3%3B085-015%2C%D8%AD%D9%88%D8%B4+%D8%A8%D8%B1%D8%AF%D9%89%3B086-003%2C%D9%87%D8%A7%D8%A8%D9%8A%D9%84%3B086-004%2C%D9%83%D9%81%D8%B1%D8%AA%D9%8A%D9%87%3B086-006%2C%D8%A8%D8%B9%D9%82%D9%84%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B086-007%2C%D8%A8%D9%8A%D8%AA+%D9%85%D9%84%D8%A7%D8%AA%3B086-015%2C%D8%AD%D9%88%D8%B4+%D8%AA%D9%84+%D8%B5%D9%81%D9%8A%D8%A9%3B087-003%2C%D9%8A%D8%A7%D9%86%D9%88%D8%AD%3B087-004%2C%D9%83%D9%81%D8%B1%D8%B9%D9%82%D8%A7%D8%A8%3B087-006%2C%D8%A8%D8%B9%D9%82%D9%84%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B087-007%2C%D8%A8%D9%8A%D8%AA+%D9%8A%D9%88%D9%86%D8%B3%3B087-015%2C%D8%AD%D9%88%D8%B4+%D8%B3%D9%86%D9%8A%D8%AF%3B088-004%2C%D9%85%D8%A7%D8%B1+%D8%A8%D8%B7%D8%B1%D8%B3+%D9%83%D8%B1%D9%85+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%3B088-006%2C%D8%A8%D9%82%D8%B9%D8%A7%D8%AA%D8%A7%3B088-007%2C%D8%A8%D9%8A%D9%86%D9%88%3B088-015%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%B4+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B089-004%2C%D9%85%D8%A7%D8%B1+%D8%B4%D8%B9%D9%8A%D8%A7+%D9%88%D8%A7%D9%84%D9%85%D8%B2%D9%83%D9%87%3B089-006%2C%D8%A8%D9%83%D9%8A%D9%81%D8%A7%3B089-007%2C%D8%AA%D8%A7%D8%B4%D8%B9%3B089-015%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B5%D9%84%D8%AD%3B090-004%2C%D9%85%D8%A7%D8%B1+%D9%85%D8%AE%D8%A7%D9%8A%D9%84+%D8%A8%D9%86%D8%A7%D8%A8%D9%8A%D9%84%3B090-006%2C%D8%A8%D9%86%D9%88%D9%8A%D8%AA%D9%8A%3B090-007%2C%D8%AA%D9%83%D8%B1%D9%8A%D8%AA%3B090-015%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D8%A8%D8%A7%D8%B3%D9%8A%D9%87%3B091-004%2C%D9%85%D8%A7%D8%B1+%D9%85%D9%88%D8%B3%D9%89+%D8%A7%D9%84%D8%AF%D9%88%D8%A7%D8%B1%3B091-006%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AF%D9%8A%D9%86%3B091-007%2C%D8%AA%D9%84%D8%A8%D9%8A%D8%B1%D8%A9%3B091-015%2C%D8%AF%D8%A7%D8%B1+%D8%A7%D9%84%D9%88%D8%A7%D8%B3%D8%B9%D8%A9%3B092-004%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%AA%D8%B1%D8%B4%D9%8A%D8%B4%3B092-006%2C%D8%A8%D9%8A%D9%82%D9%88%D9%86%3B092-007%2C%D8%AA%D9%84%D8%A9+%D9%88%D8%B4%D8%B7%D8%A7%D8%AD%D9%87%3B092-015%2C%D8%AF%D9%88%D8%B1%D8%B3+%D8%A7%D9%84%D8%B4%D8%AD%D8%A7%D8%AF%D9%8A%D9%87%3B093-004%2C%D9%85%D8%B1%D8%AC%D8%A8%D8%A7%3B093-006%2C%D8%AC%D8%A8%D8%A7%D8%B9%3B093-007%2C%D8%AA%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D8%A9%3B093-015%2C%D8%AF%D9%88%D8%B1%D8%B3+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%3B094-004%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%86%D8%A7%D8%A8%D9%8A%D9%84%3B094-006%2C%D8%AC%D8%AF%D8%B1%D8%A7+-+%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B2%D9%8A%D9%86%D8%A9%3B094-007%2C%D8%AA%D9%84%D8%B9%D8%A8%D8%A7%D8%B3+%D8%B4%D8%B1%D9%82%D9%8A%3B094-015%2C%D8%AF%D9%88%D8%B1%D8%B3+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B095-004%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D9%8A%D8%B4%D9%88%D8%B9%3B095-006%2C%D8%AC%D8%AF%D9%8A%D8%AF%D9%87+%D8%A7%D9%84%D8%B4%D9%88%D9%81%3B095-007%2C%D8%AA%D9%84%D8%B9%D8%A8%D8%A7%D8%B3+%D8%BA%D8%B1%D8%A8%D9%8A%3B095-015%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%A7%D8%AD%D9%85%D8%B1%3B096-004%2C%D9%85%D8%B4%D9%8A%D8%AE%D8%A7%3B096-006%2C%D8%AC%D9%88%D9%86%3B096-007%2C%D8%AA%D9%84%D9%85%D8%B9%D9%8A%D8%A7%D9%86%3B096-015%2C%D8%B1%D8%A7%D8%B3+%D8%A8%D8%B9%D9%84%D8%A8%D9%83%3B097-004%2C%D9%86%D8%A7%D8%A8%D9%8A%D9%87%3B097-006%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D9%86%D8%A7%D8%B9%D9%85%D8%A9%3B097-007%2C%D8%AC%D8%A8%D8%B1%D8%A7%D8%A6%D9%8A%D9%84%3B097-015%2C%D8%B1%D9%85%D8%A7%D8%B3%D8%A7%3B098-004%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%83%D8%B1%D9%85%3B098-006%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A8%D8%B9%D8%A7%D8%B5%D9%8A%D8%B1%3B098-007%2C%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D9%82%D9%8A%D8%B7%D8%B9%3B098-015%2C%D8%B1%D9%8A%D8%AD%D8%A7%3B099-004%2C%D9%88%D8%B7%D9%89+%D8%A7%D9%84%D9%85%D8%B1%D9%88%D8%AC%3B099-006%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AC%D9%86%D8%AF%D9%84%3B099-007%2C%D8%AD%D8%A8%D8%B4%D9%8A%D8%AA%3B099-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B100-004%2C%D8%A8%D8%B3%D9%83%D9%86%D8%AA%D8%A7+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B100-006%2C%D8%AD%D8%B5%D8%B1%D9%88%D8%AA%3B100-007%2C%D8%AD%D8%B1%D8%A7%D8%B1%3B100-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%B4%D8%B1%D9%82%D9%8A%3B101-004%2C%D8%A8%D8%B3%D9%83%D9%86%D8%AA%D8%A7+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B101-006%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%A8%D8%B3%D8%B1%D9%8A%3B101-007%2C%D8%AD%D9%83%D8%B1+%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B7%D8%A7%D8%A8%D8%A7%3B101-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%BA%D8%B1%D8%A8%D9%8A%3B102-006%2C%D8%AF%D8%A7%D8%B1%D9%8A%D8%A7%3B102-007%2C%D8%AD%D9%83%D8%B1+%D8%A7%D9%84%D8%B6%D8%A7%D9%87%D8%B1%D9%8A%3B102-015%2C%D8%B4%D8%B9%D8%AB+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B103-006%2C%D8%AF%D9%84%D9%87%D9%88%D9%86%3B103-007%2C%D8%AD%D9%84%D8%A8%D8%A7%3B103-015%2C%D8%B4%D8%B9%D8%AB+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B6%D9%87%D8%B1%3B104-006%2C%D8%AF%D9%85%D9%8A%D8%AA%3B104-007%2C%D8%AD%D9%86%D9%8A%D8%AF%D8%B1%3B104-015%2C%D8%B4%D9%84%D9%8A%D9%81%D8%A7%3B105-006%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D9%82%D9%85%D8%B1%3B105-007%2C%D8%AD%D9%8A%D8%B2%D9%88%D9%82%3B105-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B106-007%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%AF%D8%A7%D9%88%D9%88%D8%AF%3B106-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B107-007%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%B4%D8%A7%D8%B1%3B107-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B108-007%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%A7%D9%84%D8%AC%D8%B1%D8%AF%3B108-015%2C%D8%B5%D8%A8%D9%88%D8%A8%D8%A7%3B109-007%2C%D8%AE%D8%B1%D9%8A%D8%A8%D8%A9+%D8%A7%D9%84%D8%AC%D9%86%D8%AF%D9%8A%3B109-015%2C%D8%B5%D9%81%D8%B1%D8%A7%3B110-007%2C%D8%AF%D8%A7%D8%B1%D9%8A%D9%86%3B110-015%2C%D8%B7%D8%A7%D8%B1%D9%8A%D8%A7+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B111-007%2C%D8%AF%D9%86%D8%A8%D9%88%3B111-015%2C%D8%B7%D8%A7%D8%B1%D9%8A%D8%A7+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B112-007%2C%D8%AF%D9%88%D9%8A%D8%B1+%D8%B9%D8%AF%D9%88%D9%8A%D9%87%3B112-015%2C%D8%B7%D9%81%D9%8A%D9%84%3B113-007%2C%D8%AF%D9%8A%D8%B1+%D8%AC%D9%86%D9%8A%D9%86%3B113-015%2C%D8%B7%D9%84%D9%8A%D8%A7%3B114-007%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D8%AD%D8%A8%D8%A7%D9%84%D8%B5%D8%A9%3B114-015%2C%D8%B9%D8%B1%D8%B3%D8%A7%D9%84+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B115-007%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D8%AD%D8%B5%D9%86%D9%8A%D8%A9%3B115-015%2C%D8%B9%D8%B1%D8%B3%D8%A7%D9%84+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B116-007%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D9%85%D9%82%D8%B4%D8%B1%D9%8A%D9%86%3B116-015%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B3%D9%88%D8%AF%D8%A7%D8%A1%3B117-007%2C%D8%B0%D9%88%D9%82+%D8%AD%D8%AF%D8%A7%D8%B1%D8%A9%3B117-015%2C%D8%B9%D9%8A%D9%86+%D8%A8%D9%88%D8%B1%D8%B6%D8%A7%D9%8A%3B118-007%2C%D8%B1%D8%AD%D8%A8%D8%A9%3B118-015%2C%D8%B9%D9%8A%D9%86%D8%A7%D8%AA%D8%A7%3B119-007%2C%D8%B1%D9%85%D8%A7%D8%AD%3B119-015%2C%D9%81%D9%84%D8%A7%D9%88%D9%8A%3B120-007%2C%D8%B3%D8%B1%D8%A7%D8%B1%3B120-015%2C%D9%82%D8%B1%D8%AD%D8%A7%3B121-007%2C%D8%B3%D8%B9%D8%AF%D9%8A%D9%86%3B121-015%2C%D9%82%D8%B5%D8%B1%D9%86%D8%A8%D8%A7%3B122-007%2C%D8%B3%D9%81%D9%8A%D9%86%D8%A9+%D8%A7%D9%84%D8%AF%D8%B1%D9%8A%D8%A8%3B122-015%2C%D9%82%D9%84%D8%AF+%D8%A7%D9%84%D8%B3%D8%A8%D8%B9%3B123-007%2C%D8%B3%D9%81%D9%8A%D9%86%D8%A9+%D8%A7%D9%84%D9%82%D9%8A%D8%B7%D8%B9%3B123-015%2C%D9%82%D9%84%D8%B9%D9%87%3B124-007%2C%D8%B3%D9%8A%D8%B3%D9%88%D9%82%3B124-015%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A7%D9%86%3B125-007%2C%D8%B4%D8%A7%D9%86%3B125-015%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A7%D9%86+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B126-007%2C%D8%B4%D8%AF%D8%B1%D9%87%3B126-015%2C%D9%85%D8%AC%D8%AF%D9%84%D9%88%D9%86%3B127-007%2C%D8%B4%D8%B1%D8%A8%D9%8A%D9%84%D8%A7%3B127-015%2C%D9%85%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D8%B3%D9%8A%D8%AD%D9%8A%D9%8A%D9%86%3B128-007%2C%D8%B4%D9%8A%D8%AE%D9%84%D8%A7%D8%B1%3B128-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A2%D9%84+%D8%B3%D9%88%D9%8A%D8%AF%D8%A7%D9%86%3B129-007%2C%D8%B8%D9%87%D8%B1+%D8%A7%D9%84%D9%84%D9%8A%D8%B3%D9%8A%D9%86%D8%A9%3B129-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D8%A8%D9%88+%D8%B5%D9%84%D9%8A%D8%A8%D9%8A%3B130-007%2C%D8%B9%D8%AF%D8%A8%D9%84%3B130-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%AA%D9%88%D8%AA%3B131-007%2C%D8%B9%D9%83%D8%A7%D8%B1+%D8%A7%D9%84%D8%B9%D8%AA%D9%8A%D9%82%D8%A9%3B131-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%3B132-007%2C%D8%B9%D9%85%D8%A7%D8%B1+%D8%A7%D9%84%D8%A8%D9%8A%D9%83%D8%A7%D8%AA%3B132-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B6%D9%84%D9%8A%D9%84%3B133-007%2C%D8%B9%D9%86%D8%AF%D9%82%D8%AA%3B133-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%8A%D8%AA+%D9%85%D8%B7%D8%B1%3B134-007%2C%D8%B9%D9%8A%D8%A7%D8%AA%3B134-015%2C%D9%85%D8%B5%D9%86%D8%B9+%D8%A7%D9%84%D8%B2%D9%87%D8%B1%D9%87%3B135-007%2C%D8%B9%D9%8A%D8%AF%D9%85%D9%88%D9%86%3B135-015%2C%D9%85%D9%82%D8%B1%D8%A7%D9%82%3B136-007%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B2%D9%8A%D8%AA%3B136-015%2C%D9%85%D9%82%D9%86%D9%87%3B137-007%2C%D8%B9%D9%8A%D9%86+%D8%AA%D9%86%D8%AA%D8%A7%3B137-015%2C%D9%86%D8%A8%D8%AD%D8%A7%3B138-007%2C%D8%B9%D9%8A%D9%86+%D9%8A%D8%B9%D9%82%D9%88%D8%A8%3B138-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D8%A7%D9%84%D8%AD%D8%B1%D9%81%D9%88%D8%B4%3B139-007%2C%D8%B9%D9%8A%D9%88%D9%86+%D8%A7%D9%84%D8%BA%D8%B2%D9%84%D8%A7%D9%86%3B139-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D8%A7%D9%84%D9%85%D8%AD%D9%81%D8%A7%D8%B1%D8%A9%3B140-007%2C%D9%81%D8%B1%D9%8A%D8%AF%D9%8A%D8%B3%3B140-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D9%82%D9%84%D9%8A%D9%84%D9%87%3B141-007%2C%D9%81%D9%86%D9%8A%D8%AF%D9%82%3B141-015%2C%D9%86%D8%AD%D9%84%D9%87%3B142-007%2C%D9%82%D8%A8%D8%A9+%D8%B4%D9%85%D8%B1%D8%A7%3B142-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B2%D9%8A%D9%86%3B143-007%2C%D9%82%D8%A8%D8%B9%D9%8A%D8%AA%3B143-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%85%D8%B4%D9%85%D8%B4%D9%87%3B144-007%2C%D9%82%D8%A8%D9%88%D9%84%D8%A7%3B144-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D9%81%D8%B9%D8%B1%D8%A9%3B145-007%2C%D9%82%D8%B1%D8%AD%D9%87%3B145-015%2C%D9%8A%D8%AD%D9%81%D9%88%D9%81%D8%A7%3B146-007%2C%D9%82%D8%B4%D9%84%D9%82%3B146-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B147-007%2C%D9%82%D9%86%D9%8A%D8%A9%3B147-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%B4%D8%B1%D9%82%D9%8A%3B148-007%2C%D9%83%D8%B1%D9%85+%D8%B9%D8%B5%D9%81%D9%88%D8%B1%3B148-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B149-007%2C%D9%83%D8%B1%D9%88%D9%85+%D8%B9%D8%B1%D8%A8%3B149-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%BA%D8%B1%D8%A8%D9%8A%3B150-007%2C%D9%83%D9%81%D8%B1%D8%AA%D9%88%D9%86%3B150-015%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D9%87%3B151-007%2C%D9%83%D9%81%D8%B1%D8%AD%D8%B1%D9%87%3B151-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B152-007%2C%D9%83%D9%81%D8%B1%D9%86%D9%88%D9%86%3B152-015%2C%D8%B2%D8%A8%D9%88%D8%AF%3B153-007%2C%D9%83%D9%88%D8%B4%D8%A7%3B153-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B154-007%2C%D9%85%D8%A7%D8%B1+%D8%AA%D9%88%D9%85%D8%A7%3B154-015%2C%D8%BA%D9%81%D8%B1%D9%87%3B155-007%2C%D9%85%D8%AC%D8%AF%D9%84%D8%A7%3B155-015%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A8%D8%B4%3B156-007%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%AE%D9%88%D8%AE%3B156-015%2C%D9%85%D8%B9%D8%B1%D8%A8%D9%88%D9%86%3B157-007%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%84%D8%AF%D8%A9%3B157-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B5%D9%81%D8%A7+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B158-007%2C%D9%85%D8%B4%D8%AA%D9%89+%D8%AD%D8%B3%D9%86%3B159-007%2C%D9%85%D8%B4%D8%AA%D9%89+%D8%AD%D9%85%D9%88%D8%AF%3B160-007%2C%D9%85%D8%B4%D8%AD%D8%A9%3B161-007%2C%D9%85%D8%B4%D9%85%D8%B4%3B162-007%2C%D9%85%D8%B4%D9%8A%D9%84%D8%AD%D8%A9+%D8%A7%D9%84%D8%AD%D8%A7%D9%83%D9%88%D8%B1%3B163-007%2C%D9%85%D9%85%D9%86%D8%B9%3B164-007%2C%D9%85%D9%86%D8%AC%D8%B2%3B165-007%2C%D9%85%D9%86%D9%8A%D8%A7%D8%B1%D8%A9%3B166-007%2C%D9%87%D9%8A%D8%AA%D9%84%D8%A7%3B167-007%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D9%88%D8%B3%3B168-007%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AD%D9%88%D8%B1%3B169-007%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AE%D8%A7%D9%84%D8%AF%3B170-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B9%D9%8A%D8%A7%D8%B4%3B171-007%2C%D8%A7%D9%84%D8%A8%D9%82%D9%8A%D8%B9%D9%87%3B&hiddensearch=________&hiddenIdGenerated={id}&hiddenIDExpdate=&hiddenIdtyp={id_type}&frmIDExpdate=%24frmIDExpdate&frmCategory=MICRO&hiddenCategory=MICRO&frmreservednb=%24frmreservednb&frmcatTyp=Bronze&frmnb1=&frmnb2=&frmnb3=&frmnb4=&frmnb5=&frmnb6=&frmnb7=&frmnb8=&frmGSM={gsm}&frmFName={first_name}&frmFatherName={father_name}&frmLName={last_name}&frmMothername={mother_name}&frmdobDay={birth_day}&frmdobMonth={birth_month}&frmdobYear={birth_year}&frmCode={ref_code}&frmrefnb={ref_number}'
+booking_info_payload = 'formName=OnlineReservationForm&justvalidate=0&formvalidated=0&hiddenregion=001-001%2C%D8%A7%D8%AF%D9%85%D8%A7+%D8%A7%D9%84%D8%AF%D9%81%D9%86%D9%87%3B001-002%2C%D8%A7%D9%84%D8%BA%D8%A8%D9%8A%D8%B1%D9%8A+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B001-003%2C%D8%A7%D9%81%D9%82%D8%A7%3B001-004%2C%D8%A7%D8%A8%D9%88+%D9%85%D9%8A%D8%B2%D8%A7%D9%86%3B001-005%2C%D8%A7%D9%84%D9%85%D8%B4%D8%B1%D9%81%D9%87%3B001-006%2C%D8%AF%D9%8A%D8%B1+%D8%A8%D8%A7%D8%A8%D8%A7%3B001-007%2C%D8%AA%D9%84%D8%A8%D9%8A%D8%A8%D8%A9%3B001-008%2C%D8%A7%D9%84%D9%85%D9%87%D8%A7%D8%AA%D8%B1%D9%87%3B001-009%2C%D8%A7%D9%84%D8%AF%D9%8A%D9%85%D8%A7%D9%86%3B001-010%2C%D8%AC%D8%B1%D8%A7%D9%86%3B001-011%2C%D8%A7%D8%AC%D8%A8%D8%B9%3B001-012%2C%D8%B6%D9%87%D9%88%D8%B1+%D8%A7%D9%84%D9%87%D9%88%D8%A7%3B001-013%2C%D8%B9%D8%B2%D9%82%D9%8A%3B001-014%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%AA%D8%A7%D9%86%3B001-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B001-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%85%D8%A7%D8%B1+%D8%A7%D9%86%D8%B7%D9%88%D9%86%D9%8A%D9%88%D8%B3%3B001-017%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D8%B1%D9%87%3B001-018%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%D9%87%3B001-019%2C%D9%83%D9%81%D8%B1%D8%A8%D9%8A%D8%AA%3B001-020%2C%D8%A7%D9%84%D9%86%D8%A7%D9%82%D9%88%D8%B1%D8%A9%3B001-021%2C%D8%B2%D8%AD%D9%84%D8%AA%D8%A7%3B001-022%2C%D8%A7%D8%B1%D9%86%D9%88%D9%86%3B001-023%2C%D8%A7%D9%84%D9%85%D8%AC%D9%8A%D8%AF%D9%8A%D8%A9%3B001-024%2C%D8%A7%D8%A8%D9%84+%D8%A7%D9%84%D8%B3%D9%82%D9%8A%3B001-025%2C%D8%A7%D9%84%D8%AC%D9%85%D9%8A%D8%AC%D9%85%D9%87%3B001-026%2C%D8%A7%D9%84%D8%B1%D9%85%D9%8A%D9%84%3B001-027%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%B4%D9%88%D8%B1%D8%A9%3B001-028%2C%D9%85%D9%8A%D9%86%D8%A7%D8%A1+%D8%A7%D9%84%D8%AD%D8%B5%D9%86%3B001-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AF%D9%83%D8%B1%D9%85%D8%A7%D9%86%3B002-001%2C%D8%A7%D8%BA%D8%A8%D9%87%3B002-002%2C%D8%A7%D9%84%D8%BA%D8%A8%D9%8A%D8%B1%D9%8A+%D8%A8%D8%A6%D8%B1+%D8%AD%D8%B3%D9%86%3B002-003%2C%D8%A7%D8%AF%D9%87%3B002-004%2C%D8%A7%D9%84%D8%A8%D9%88%D8%B4%D8%B1%D9%8A%D8%A9%3B002-005%2C%D8%A8%D8%B9%D9%88%D8%B1%D8%AA%D9%87%3B002-006%2C%D8%AF%D9%8A%D8%B1+%D8%AF%D9%88%D8%B1%D9%8A%D8%AA%3B002-007%2C%D8%A7%D9%84%D9%87%D9%8A%D8%B4%D9%87%3B002-008%2C%D8%A7%D9%84%D9%85%D9%8A%D9%86%D8%A7%D8%A1%3B002-009%2C%D8%A7%D9%84%D9%85%D8%BA%D8%B1+%D9%88%D8%A8%D9%84%D8%A7%3B002-010%2C%D8%AC%D8%B1%D8%A8%D8%AA%D8%A7%3B002-011%2C%D8%A7%D8%B1%D8%AF%D9%87%3B002-012%2C%D8%A7%D8%AC%D8%AF%D8%B9%D8%A8%D8%B1%D9%8A%D9%86%3B002-013%2C%D9%86%D9%85%D8%B1%D9%8A%D9%86%3B002-014%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9%3B002-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7+%D8%AD%D9%8A+%D8%AD%D9%82%D9%84+%D8%A7%D9%84%D8%B9%D8%B1%D8%AC%D8%A9%3B002-016%2C%D8%A7%D8%A8%D9%84%D8%AD%3B002-017%2C%D8%A7%D9%84%D8%AF%D9%83%D9%88%D8%A9%3B002-018%2C%D8%A7%D9%84%D8%AD%D9%88%D8%B4%3B002-019%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%B2%D9%8A%D8%A9%3B002-020%2C%D8%AC%D9%86%D8%A7%D8%AA%D8%A7%3B002-021%2C%D8%B9%D8%A7%D8%B2%D9%88%D8%B1%3B002-022%2C%D8%AC%D8%A8%D8%A7%D8%B9%3B002-023%2C%D8%A7%D8%A8%D9%88+%D9%82%D9%85%D8%AD%D8%A9%3B002-024%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9%3B002-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D8%B1%D9%83%D9%87%3B002-026%2C%D8%A7%D9%84%D8%B5%D9%8A%D9%81%D9%8A%3B002-027%2C%D8%A7%D9%84%D9%85%D8%AF%D9%88%D8%B1%3B002-028%2C%D8%A7%D9%84%D9%85%D8%B2%D8%B1%D8%B9%D8%A9%3B002-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D8%B3%D8%B7%D8%A7%D9%86%D9%8A%3B003-001%2C%D8%A7%D9%84%D8%A8%D9%88%D8%A7%D8%B1%3B003-002%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D8%AC%D9%86%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%86%D8%B4%D9%8A%D8%A9%3B003-003%2C%D8%A7%D8%AF%D9%88%D9%86%D9%8A%D8%B3+%D9%88%D8%B3%D9%86%D9%88%D8%B1%3B003-004%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B003-005%2C%D8%AF%D9%8A%D8%B1+%D9%82%D9%88%D8%A8%D9%84%3B003-006%2C%D8%AF%D9%8A%D8%B1+%D9%83%D9%88%D8%B4%D9%87%3B003-007%2C%D8%A7%D9%84%D8%B1%D8%A7%D9%85%D9%87%3B003-008%2C%D8%A7%D9%84%D8%B2%D9%87%D8%B1%D9%8A%D8%A9%3B003-009%2C%D8%A8%D8%A7%D9%86%3B003-010%2C%D8%AD%D8%A7%D9%85%D8%A7%D8%AA%3B003-011%2C%D8%A7%D8%B5%D9%86%D9%88%D9%86%3B003-012%2C%D8%A7%D9%84%D8%A8%D8%AD%D8%B5%D8%A7%D8%B5%3B003-013%2C%D8%A7%D9%84%D8%AD%D8%A7%D8%B2%D9%85%D9%8A%D8%A9%3B003-014%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%D8%A9%3B003-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B003-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D8%A8%D8%B1%D8%A8%D8%A7%D8%B1%D9%87%3B003-017%2C%D8%A7%D9%84%D8%B1%D9%88%D8%B6%D9%87%3B003-018%2C%D8%A7%D9%84%D8%B1%D9%81%D9%8A%D8%AF%3B003-019%2C%D8%A8%D8%B1%D8%AA%D9%8A%3B003-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B5%D8%A7%D8%B1%D9%88%D9%8A%3B003-021%2C%D9%83%D9%81%D8%B1%D8%AD%D9%88%D9%86%D8%A9%3B003-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86%3B003-023%2C%D8%A7%D9%84%D8%AE%D9%84%D9%88%D8%A7%D8%AA%3B003-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B003-025%2C%D8%B9%D9%8A%D8%AA%D8%B1%D9%88%D9%86%3B003-026%2C%D8%A7%D9%84%D8%A7%D8%B4%D8%B1%D9%81%D9%8A%D8%A9%3B003-027%2C%D8%A7%D9%84%D9%85%D8%B1%D9%81%D8%A3%3B003-028%2C%D8%A7%D9%84%D9%85%D8%B5%D9%8A%D8%B7%D8%A8%D8%A9%3B003-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D9%86%D9%82%D9%88%D9%84%D8%A7%3B004-001%2C%D8%A7%D9%84%D8%AD%D8%B5%D9%8A%D9%86%3B004-002%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D8%AC%D9%86%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%A7%D8%AF%3B004-003%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%A8%D8%A7%D8%B1%D9%87%3B004-004%2C%D8%A7%D9%84%D8%AC%D9%88%D8%A7%D8%B1%3B004-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B004-006%2C%D8%B3%D8%A8%D9%84%D9%8A%D9%86%3B004-007%2C%D8%B1%D8%AC%D9%85+%D8%B9%D9%8A%D8%B3%D9%89%3B004-008%2C%D8%A7%D9%84%D8%B3%D9%88%D9%8A%D9%82%D8%A9%3B004-009%2C%D8%A8%D8%B1%D8%AD%D9%84%D9%8A%D9%88%D9%86%3B004-010%2C%D8%AD%D8%AF%D8%AA%D9%88%D9%86%3B004-011%2C%D8%A7%D9%84%D8%A8%D8%AD%D9%8A%D8%B1%D9%87%3B004-012%2C%D8%A7%D9%84%D9%85%D8%AC%D8%AF%D9%84%3B004-013%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%86%D9%88%D8%A8%3B004-014%2C%D8%A7%D9%84%D8%AD%D8%B1%D9%8A%D9%82%D8%A9%3B004-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B004-016%2C%D8%A7%D9%84%D8%AA%D9%88%D9%8A%D8%AA%D8%A9%3B004-017%2C%D8%A7%D9%84%D8%B3%D9%84%D8%B7%D8%A7%D9%86+%D9%8A%D8%B9%D9%82%D9%88%D8%A8+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B004-018%2C%D8%A7%D9%84%D8%B9%D9%82%D8%A8%D8%A9%3B004-019%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D9%85%D9%8A%D8%A9%3B004-020%2C%D8%B4%D8%AD%D9%88%D8%B1%3B004-021%2C%D8%A7%D9%84%D8%AC%D8%B1%D9%85%D9%82%3B004-022%2C%D8%B2%D9%88%D8%B7%D8%B1+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%D8%A9%3B004-023%2C%D8%A7%D9%84%D8%AF%D9%84%D8%A7%D9%81%D9%87%3B004-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%8A%D9%88%D9%86%3B004-025%2C%D9%8A%D8%A7%D8%B7%D8%B1%3B004-028%2C%D8%B1%D8%A7%D8%B3+%D8%A8%D9%8A%D8%B1%D9%88%D8%AA%3B004-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B2%D9%88%D9%8A%D8%AA%D9%8A%D9%86%D9%8A%3B005-001%2C%D8%A7%D9%84%D8%B2%D8%B9%D9%8A%D8%AA%D8%B1%D9%87%3B005-002%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D8%AC%D9%86%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%86%D8%AF%D9%8A%D8%A7%D9%86%3B005-003%2C%D8%A7%D9%84%D8%AC%D9%84%D9%8A%D8%B3%D8%A9%3B005-004%2C%D8%A7%D9%84%D8%AE%D9%84%D9%87%3B005-005%2C%D8%B9%D9%8A%D9%86+%D8%AF%D8%B1%D8%A7%D9%81%D9%8A%D9%84%3B005-006%2C%D8%B3%D8%B1%D8%AC%D8%A8%D8%A7%D9%84%3B005-007%2C%D8%AE%D8%B7+%D8%A7%D9%84%D8%A8%D8%AA%D8%B1%D9%88%D9%84%3B005-008%2C%D8%A7%D9%84%D9%82%D8%A8%D8%A9%3B005-009%2C%D8%A8%D8%B1%D9%8A%D8%B3%D8%A7%D8%AA%3B005-010%2C%D8%AD%D8%B1%D8%AF%D9%8A%D9%86%3B005-011%2C%D8%A7%D9%84%D9%82%D8%A7%D8%AF%D8%B1%D9%8A%D9%87%3B005-012%2C%D8%A7%D9%84%D9%86%D8%AE%D9%84%D8%A9%3B005-013%2C%D8%A7%D9%84%D8%B1%D9%88%D8%B6%D8%A9%3B005-014%2C%D8%A7%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D9%8A%3B005-015%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D9%87+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B005-016%2C%D8%A7%D9%84%D8%AF%D9%84%D9%87%D9%85%D9%8A%D8%A9%3B005-017%2C%D8%A7%D9%84%D8%B3%D9%84%D8%B7%D8%A7%D9%86+%D9%8A%D8%B9%D9%82%D9%88%D8%A8+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B005-018%2C%D8%A7%D9%84%D9%85%D8%AD%D9%8A%D8%AF%D8%AB%D8%A9%3B005-020%2C%D8%B7%D9%8A%D8%B1+%D8%AF%D8%A8%D8%A7%3B005-021%2C%D8%A7%D9%84%D8%AD%D8%B1%D9%81%3B005-022%2C%D8%A7%D9%84%D8%AF%D9%88%D9%8A%D8%B1%3B005-023%2C%D8%A7%D9%84%D9%81%D8%B1%D8%AF%D9%8A%D8%B3%3B005-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%82%D9%84%D8%B9%D8%A9%3B005-025%2C%D8%A7%D9%84%D8%B3%D9%84%D8%B7%D8%A7%D9%86%D9%8A%D9%87%3B005-028%2C%D8%AF%D8%A7%D8%B1+%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%B3%D8%A9%3B005-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%A8%D9%8A%D9%84%3B006-001%2C%D8%A7%D9%84%D8%B5%D9%81%D8%B1%D8%A7%3B006-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D8%B1%D9%8A%D9%83+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B006-003%2C%D8%A7%D9%84%D8%AD%D8%B5%D9%88%D9%86%3B006-004%2C%D8%A7%D9%84%D8%AE%D9%86%D8%B4%D8%A7%D8%B1%D8%A9%3B006-005%2C%D8%A7%D8%BA%D9%85%D9%8A%D8%AF%3B006-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B006-007%2C%D8%A7%D9%84%D8%B9%D9%88%D8%A7%D8%AF%D9%87%3B006-008%2C%D8%A7%D9%84%D9%82%D9%84%D9%85%D9%88%D9%86%3B006-009%2C%D8%A8%D8%B2%D8%B9%D9%88%D9%86%3B006-010%2C%D8%AD%D9%84%D8%AA%D8%A7%3B006-011%2C%D8%A7%D9%8A%D8%B7%D9%88%3B006-012%2C%D8%A7%D9%85%D9%8A%D9%88%D9%86+%D8%B4%D8%B1%D9%82%D9%8A%3B006-013%2C%D8%A7%D9%84%D8%B3%D9%81%D9%8A%D8%B1%D8%A9%3B006-014%2C%D8%A7%D9%84%D8%AE%D8%B1%D8%A7%D9%8A%D8%A8%3B006-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B006-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D8%B1%D8%A7%D8%B3%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B006-017%2C%D8%A7%D9%84%D8%B4%D8%A8%D8%B1%D9%82%D9%8A%D8%A9%3B006-018%2C%D8%A8%D9%83%D8%A7%3B006-019%2C%D8%B2%D8%BA%D8%AF%D8%B1%D8%A7%D9%8A%D8%A7%3B006-020%2C%D9%82%D8%A7%D9%86%D8%A7%3B006-021%2C%D8%A7%D9%84%D8%AD%D8%B3%D8%A7%D9%86%D9%8A%D9%87%3B006-022%2C%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%D8%A9%3B006-023%2C%D8%A7%D9%84%D9%83%D9%81%D9%8A%D8%B1%3B006-024%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%AF%D8%A7%D8%B1%D8%B3%3B006-025%2C%D8%A7%D9%84%D8%B7%D9%8A%D8%B1%D9%8A%3B006-028%2C%D8%B2%D9%82%D8%A7%D9%82+%D8%A7%D9%84%D8%A8%D9%84%D8%A7%D8%B7%3B006-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B007-001%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%B1%D9%87+%D9%88%D8%B4%D9%88%D8%A7%D9%86%3B007-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D8%B1%D9%8A%D9%83+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B1%D9%88%D9%8A%D8%B3%3B007-003%2C%D8%A7%D9%84%D8%AE%D8%A7%D8%B1%D8%A8%D8%A9%3B007-004%2C%D8%A7%D9%84%D8%AF%D9%83%D9%88%D8%A7%D9%86%D9%87%3B007-005%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%A7%D8%AA%D9%8A%D9%86%3B007-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%87%D9%84%D8%A9%3B007-007%2C%D8%AC%D8%B1%D9%85%D9%86%D8%A7%D9%8A%D8%A7%3B007-008%2C%D8%A7%D9%84%D9%86%D9%88%D8%B1%D9%8A%3B007-009%2C%D8%A8%D9%82%D8%A7%D8%B9%D9%83%D9%81%D8%B1%D8%A7%3B007-010%2C%D8%AF%D8%A7%D8%B9%D9%84%3B007-011%2C%D8%A7%D9%8A%D8%B9%D8%A7%D9%84%3B007-012%2C%D8%A7%D9%85%D9%8A%D9%88%D9%86+%D8%BA%D8%B1%D8%A8%D9%8A%3B007-013%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D9%86%3B007-014%2C%D8%A7%D9%84%D8%B2%D9%88%D9%8A%D8%AA%D9%8A%D9%86%D9%8A%3B007-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%A7%D8%B1%D8%A9%3B007-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D8%B1%D8%A7%D8%B3%D9%8A%D8%A9+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B007-017%2C%D8%A7%D9%84%D8%B5%D9%88%D9%8A%D8%B1%D9%8A%3B007-018%2C%D8%A8%D9%83%D9%8A%D9%81%D8%A7%3B007-019%2C%D8%B2%D9%8A%D8%AA%D8%A7%3B007-020%2C%D9%8A%D8%A7%D8%B1%D9%8A%D9%86%3B007-021%2C%D8%A7%D9%84%D8%AD%D9%85%D8%B5%D9%8A%D9%87%3B007-022%2C%D8%A7%D9%84%D9%82%D8%B5%D9%8A%D8%A8%D8%A9%3B007-023%2C%D8%A7%D9%84%D9%87%D8%A8%D8%A7%D8%B1%D9%8A%D8%A9%3B007-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B007-025%2C%D8%A7%D9%84%D8%BA%D9%86%D8%AF%D9%88%D8%B1%D9%8A%D9%87%3B007-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%A7%D8%B1%D8%B9%3B008-001%2C%D8%A7%D9%84%D8%B9%D8%B0%D8%B1%D8%A7%3B008-002%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%A7%D8%AD+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B008-003%2C%D8%A7%D9%84%D8%B1%D8%A7%D9%85%D9%88%D8%B7%3B008-004%2C%D8%A7%D9%84%D8%AF%D9%88%D8%A7%D8%B1%3B008-005%2C%D8%A7%D9%84%D8%A8%D9%86%D9%8A%D9%87%3B008-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B1%D9%8A%D9%81%D8%A9%3B008-007%2C%D9%83%D8%B1%D9%85+%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B008-008%2C%D8%A7%D9%84%D8%AA%D8%A8%D8%A7%D9%86%D8%A9%3B008-009%2C%D8%A8%D9%82%D8%B1%D9%82%D8%A7%D8%B4%D8%A7%3B008-010%2C%D8%AF%D8%B1%D9%8A%D8%A7%3B008-011%2C%D8%A8%D8%B3%D9%84%D9%88%D9%82%D9%8A%D8%B7%3B008-012%2C%D8%A7%D9%86%D9%81%D9%87%3B008-013%2C%D8%A7%D9%84%D9%82%D8%B7%D9%8A%D9%86%3B008-014%2C%D8%A7%D9%84%D8%B3%D9%88%D9%8A%D8%B3%D8%A9%3B008-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B008-016%2C%D8%A7%D9%84%D9%81%D8%B1%D8%B2%D9%84+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B008-017%2C%D8%A7%D9%84%D9%82%D8%B1%D8%B9%D9%88%D9%86%3B008-018%2C%D8%A8%D9%8A%D8%AA+%D9%84%D9%87%D9%8A%D8%A7%3B008-019%2C%D8%B7%D8%A8%D8%A7%D9%8A%D8%A7%3B008-020%2C%D8%A7%D8%B1%D8%B2%D9%88%D9%86%3B008-021%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%3B008-022%2C%D8%A7%D9%84%D9%83%D9%81%D9%88%D8%B1%3B008-023%2C%D8%A8%D8%B1%D8%BA%D8%B2%3B008-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%B4%D8%B1%D9%82%D9%8A%3B008-025%2C%D8%A7%D9%84%D9%82%D9%88%D8%B2%D8%AD%3B008-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%82%D9%86%D8%A7%D9%8A%D8%A9%3B009-001%2C%D8%A7%D9%84%D8%B9%D9%82%D9%8A%D8%A8%D9%87%3B009-002%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%A7%D8%AD+%D8%AD%D9%8A+%D9%83%D8%B1%D9%85+%D8%A7%D9%84%D8%B2%D9%8A%D8%AA%D9%88%D9%86%3B009-003%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%87%3B009-004%2C%D8%A7%D9%84%D8%AF%D9%8A%D8%B4%D9%88%D9%86%D9%8A%D8%A9%3B009-005%2C%D8%A7%D9%84%D8%AA%D8%B9%D8%B2%D8%A7%D9%86%D9%8A%D9%87%3B009-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%B4%D8%AD%D8%B1%D9%88%D8%B1%3B009-007%2C%D8%A8%D9%86%D9%8A+%D8%B5%D8%AE%D8%B1%3B009-008%2C%D8%A7%D9%84%D8%AA%D9%84%3B009-009%2C%D8%A8%D9%84%D9%88%D8%B2%D8%A7%3B009-010%2C%D8%AF%D9%88%D9%85%D8%A7%3B009-011%2C%D8%A8%D8%B4%D9%86%D9%8A%D9%86%3B009-012%2C%D8%A8%D8%AA%D8%B1%D9%88%D9%85%D9%8A%D9%86%3B009-013%2C%D8%A7%D9%84%D9%82%D9%85%D8%A7%D9%85%D9%8A%D9%86%3B009-014%2C%D8%A7%D9%84%D8%B4%D8%B1%D8%A8%D9%8A%D9%86%3B009-015%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%AA%3B009-016%2C%D8%A7%D9%84%D9%81%D8%B1%D8%B2%D9%84+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B009-017%2C%D8%A7%D9%84%D9%85%D9%86%D8%A7%D8%B1%D9%87%3B009-018%2C%D8%AA%D9%86%D9%88%D8%B1%D9%87%3B009-019%2C%D8%B7%D9%86%D8%A8%D9%88%D8%B1%D9%8A%D8%AA%3B009-020%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%B2%D9%88%D8%B1%D9%8A%D8%A9%3B009-021%2C%D8%A7%D9%84%D8%B3%D8%B1%D9%8A%D8%B1%D8%A9%3B009-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B009-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B009-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B009-025%2C%D8%A8%D8%B1%D8%AC+%D9%82%D9%84%D8%A7%D9%88%D9%8A%D9%87%3B009-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D8%B4%D9%83%3B010-001%2C%D8%A7%D9%84%D8%BA%D9%8A%D9%86%D9%87%3B010-002%2C%D8%A7%D8%B1%D8%B5%D9%88%D9%86%3B010-003%2C%D8%A7%D9%84%D8%B9%D8%A7%D9%82%D9%88%D8%B1%D8%A9%3B010-004%2C%D8%A7%D9%84%D8%B1%D8%A7%D8%A8%D9%8A%D8%A9%3B010-005%2C%D8%A7%D9%84%D8%B1%D8%AC%D9%85%D8%A9%3B010-006%2C%D8%B4%D9%88%D8%B1%D9%8A%D8%AA%3B010-007%2C%D8%A7%D9%84%D9%81%D8%B1%D8%B6%3B010-008%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%A7%D8%AF%D9%8A%D9%86%3B010-009%2C%D8%A8%D9%8A%D8%AA+%D9%85%D9%86%D8%B0%D8%B1%3B010-010%2C%D8%AF%D9%8A%D8%B1+%D8%A8%D9%84%D8%A7%3B010-011%2C%D8%A8%D9%86%D8%B4%D8%B9%D9%8A%3B010-012%2C%D8%A8%D8%AA%D8%B9%D8%A8%D9%88%D8%B1%D8%A9%3B010-013%2C%D8%A7%D9%84%D9%88%D8%A7%D8%B7%D9%8A%D9%87%3B010-014%2C%D8%A7%D9%84%D8%B4%D9%88%D8%A7%D8%BA%D9%8A%D8%B1%3B010-015%2C%D8%A7%D9%84%D8%AD%D9%84%D8%A7%D9%86%D9%8A%D8%A9%3B010-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%83%D8%B1%D9%83+%D9%86%D9%88%D8%AD%3B010-017%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D8%A9%3B010-018%2C%D8%AD%D9%84%D9%88%D8%A9%3B010-019%2C%D8%B9%D8%A8%D8%B1%D8%A7%3B010-020%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%BA%D9%84%D9%8A%D8%A9%3B010-021%2C%D8%A7%D9%84%D8%B9%D9%8A%D8%B4%D9%8A%D9%87%3B010-022%2C%D8%A7%D9%84%D9%86%D9%85%D9%8A%D8%B1%D9%8A%D8%A9%3B010-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B010-024%2C%D8%A7%D9%84%D8%AE%D9%8A%D8%A7%D9%85+%D8%BA%D8%B1%D8%A8%D9%8A%3B010-025%2C%D8%A8%D8%B1%D8%B9%D8%B4%D9%8A%D8%AA%3B010-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D8%A7%D9%86%3B011-001%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D8%B9%D8%A7%D8%AA%3B011-002%2C%D8%A7%D9%84%D8%AD%D8%A7%D8%B2%D9%85%D9%8A%D8%A9%3B011-003%2C%D8%A7%D9%84%D8%B9%D8%A7%D9%82%D9%88%D8%B1%D8%A9+-+%D9%85%3B011-004%2C%D8%A7%D9%84%D8%B2%D8%BA%D8%B1%D9%8A%D9%86%3B011-005%2C%D8%A7%D9%84%D8%B1%D9%85%D9%84%D9%8A%D8%A9%3B011-006%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D9%85%D8%BA%D8%A7%D8%B1%D8%A9%3B011-007%2C%D8%B9%D9%85%D8%A7%D8%B1%D9%87%3B011-008%2C%D8%A7%D9%84%D8%AD%D8%AF%D9%8A%D8%AF%3B011-009%2C%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%AC%D8%A8%D8%A9%3B011-010%2C%D8%B1%D8%A7%D8%B3+%D9%86%D8%AD%D8%A7%D8%B4%3B011-011%2C%D8%A8%D9%88%D8%B3%D9%8A%D8%B7%3B011-012%2C%D8%A8%D8%AA%D9%88%D8%B1%D8%A7%D8%AA%D9%8A%D8%AC%3B011-013%2C%D8%A7%D9%8A%D8%B2%D8%A7%D9%84%3B011-014%2C%D8%A7%D9%84%D8%B4%D9%88%D8%A7%D8%BA%D9%8A%D8%B1+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B011-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D8%A7%D8%AF%D9%8A%3B011-016%2C%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%AC%D8%A7%D8%AA%3B011-017%2C%D8%A8%D8%A7%D8%A8+%D9%85%D8%A7%D8%B1%D8%B9%3B011-018%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%B1%D9%88%D8%AD%D8%A7%3B011-019%2C%D8%B9%D8%AF%D9%84%D9%88%D9%86%3B011-020%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%A7%D8%AA%D9%8A%D9%86%3B011-021%2C%D8%A7%D9%84%D8%BA%D8%A8%D8%A7%D8%B7%D9%8A%D8%A9%3B011-022%2C%D8%A7%D9%86%D8%B5%D8%A7%D8%B1%3B011-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%D9%86%D9%8A%3B011-024%2C%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%D8%A9%3B011-025%2C%D8%A8%D9%8A%D8%AA+%D9%84%D9%8A%D9%81%3B011-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%B1%D8%AC%D8%A7%D9%84+%D8%A7%D9%84%D8%A7%D8%B1%D8%A8%D8%B9%D9%8A%D9%86%3B012-001%2C%D8%A7%D9%84%D9%83%D9%81%D9%88%D8%B1%3B012-002%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B012-003%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%A8%D8%A7%D8%AA%3B012-004%2C%D8%A7%D9%84%D8%B2%D9%84%D9%82%D8%A7%3B012-005%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D9%81%D8%A7%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A7%D9%85%D8%B1%D8%A7%D8%A1%3B012-006%2C%D8%B9%D8%A7%D9%86%D9%88%D8%AA%3B012-007%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%A7%D8%AA%D9%8A%D9%86%3B012-008%2C%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%D8%A9%3B012-009%2C%D8%AD%D8%AF%D8%B4%D9%8A%D8%AA%3B012-010%2C%D8%B1%D8%A7%D8%B4%D8%A7%3B012-011%2C%D8%A8%D9%8A%D8%AA+%D8%B9%D9%88%D9%83%D8%B1%3B012-012%2C%D8%A8%D8%AD%D8%A8%D9%88%D8%B4%3B012-013%2C%D8%A8%D8%AD%D9%88%D9%8A%D8%AA%D8%A7%3B012-014%2C%D8%A7%D9%84%D8%B4%D9%88%D8%A7%D8%BA%D9%8A%D8%B1+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B012-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B012-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D8%B9%D9%84%D9%82%D8%A9+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B012-017%2C%D8%A8%D8%B9%D9%84%D9%88%D9%84%3B012-018%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%B9%D8%B4%D8%A7%D9%8A%D8%B1%3B012-019%2C%D8%B9%D8%B1%D8%A8+%D8%A7%D9%84%D8%AC%D9%84%3B012-020%2C%D8%A7%D9%84%D8%A8%D8%B3%D8%AA%D8%A7%D9%86%3B012-021%2C%D8%A7%D9%84%D9%82%D8%B7%D8%B1%D8%A7%D9%86%D9%8A%3B012-022%2C%D8%A8%D8%B1%D9%8A%D9%82%D8%B9%3B012-023%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%B5%D9%81%D9%8A%D9%81%D8%A9%3B012-024%2C%D8%A7%D9%84%D8%B7%D9%8A%D8%A8%D8%A9%3B012-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D8%A7%D8%AB%D9%88%D9%84%D9%8A%D9%83%3B012-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D9%85%D9%83%D8%B3%D8%B1+%D8%A7%D9%84%D8%B9%D8%A8%D8%AF%3B013-001%2C%D8%A7%D9%84%D9%85%D8%B1%D8%A7%D8%AF%D9%8A%D9%87%3B013-002%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D9%82%D8%A8%D9%84%D9%8A%3B013-003%2C%D8%A7%D9%84%D9%81%D9%8A%D8%AF%D8%A7%D8%B1%3B013-004%2C%D8%A7%D9%84%D8%B3%D9%81%D9%8A%D9%84%D8%A9%3B013-005%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D9%81%D8%A7%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%85%D8%B1%D9%88%D8%B3%D9%8A%D8%A9%3B013-006%2C%D8%B9%D8%AA%D8%B1%D9%8A%D9%86%3B013-007%2C%D8%AC%D8%A8%D9%84+%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%87%3B013-009%2C%D8%AD%D8%B5%D8%B1%D9%88%D9%86%3B013-010%2C%D8%B1%D8%A7%D8%B4%D8%A7%D9%86%D8%A7%3B013-011%2C%D8%AA%D9%88%D9%84%D8%A7+%D8%A7%D9%84%D8%AC%D8%A8%D9%87%3B013-012%2C%D8%A8%D8%AF%D8%A8%D8%A7%3B013-013%2C%D8%A8%D8%AE%D8%B9%D9%88%D9%86%3B013-014%2C%D8%A7%D9%84%D9%82%D8%B5%D8%B1%3B013-015%2C%D9%82%D8%A8%D8%A9+%D8%AF%D9%88%D8%B1%D8%B3%3B013-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B013-017%2C%D8%AA%D9%84+%D8%B0%D9%86%D9%88%D8%A8%3B013-018%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B013-019%2C%D8%B9%D9%82%D8%AA%D8%A7%D9%86%D9%8A%D8%AA%3B013-020%2C%D8%A7%D9%84%D8%A8%D8%B5+%D9%82%D8%B3%D9%85+1%3B013-021%2C%D8%A7%D9%84%D9%84%D9%88%D9%8A%D8%B2%D9%87%3B013-022%2C%D9%83%D9%81%D8%B1%D9%88%D9%87%3B013-023%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%A7%D9%84%D9%81%D8%AE%D8%A7%D8%B1%3B013-024%2C%D8%A7%D9%84%D9%82%D8%B5%D9%8A%D8%B1%3B013-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A2%D9%84+%D8%A8%D8%B1%D9%8A%3B013-029%2C%D8%B5%D9%8A%D8%AF%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B3%D8%A7%D9%84%D8%AE%D9%8A%D8%A9%3B014-001%2C%D8%A7%D9%84%D9%85%D8%B9%D9%8A%D8%B5%D8%B1%D9%87%3B014-002%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D9%87%3B014-003%2C%D8%A7%D9%84%D9%82%D8%B7%D8%A7%D8%B1%D9%87%3B014-004%2C%D8%A7%D9%84%D8%B4%D8%A7%D9%88%D9%8A%D9%87+%D9%88%D8%A7%D9%84%D9%82%D9%86%D9%8A%D8%B7%D8%B1%D9%87%3B014-005%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D9%81%D8%A7%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D9%82%D8%A8%D8%A9%3B014-006%2C%D8%B9%D9%84%D9%85%D8%A7%D9%86+%D9%88%D8%A7%D9%84%D8%A8%D8%B1%D8%BA%D9%88%D9%86%D9%8A%D8%A9%3B014-007%2C%D8%A7%D9%84%D8%B9%D9%85%D8%A7%D9%8A%D8%B1%3B014-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B014-010%2C%D8%B1%D8%A7%D8%B4%D9%83%D9%8A%D8%AF%D8%A7%3B014-011%2C%D8%AD%D8%B1%D9%81+%D8%A7%D8%B1%D8%AF%D9%87%3B014-012%2C%D8%A8%D8%AF%D8%A8%D9%87%D9%88%D9%86%3B014-013%2C%D8%A8%D8%B7%D8%B1%D9%85%D8%A7%D8%B2%3B014-014%2C%D8%A7%D9%84%D9%83%D9%88%D8%A7%D8%AE%3B014-015%2C%D9%82%D9%84%D8%B9%D9%87+%D8%BA%D8%B1%D8%A8%D9%8A%3B014-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B014-017%2C%D8%AC%D8%A8+%D8%AC%D9%86%D9%8A%D9%86%3B014-018%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86%3B014-019%2C%D8%B9%D9%86%D9%82%D9%88%D9%86%3B014-020%2C%D8%A7%D9%84%D8%A8%D8%B5+%D9%82%D8%B3%D9%85+3%3B014-021%2C%D8%A7%D9%84%D9%85%D8%AC%D9%8A%D8%AF%D9%84%3B014-022%2C%D8%AA%D9%88%D9%84%3B014-023%2C%D8%B4%D8%A8%D8%B9%D8%A7+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B014-024%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D8%B9%D8%A9%3B014-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%D9%86%D9%8A%3B015-001%2C%D8%A7%D9%84%D9%86%D9%85%D9%88%D8%B1%D8%A9+%D9%88+%D9%83%D9%81%D8%B1%D8%AC%D8%B1%D9%8A%D9%81%3B015-002%2C%D8%A7%D9%84%D8%AF%D9%84%D9%8A%D8%A8%D9%87%3B015-003%2C%D8%A7%D9%84%D9%83%D9%81%D8%B1%3B015-004%2C%D8%A7%D9%84%D8%B4%D9%88%D9%8A%D8%B1%3B015-005%2C%D8%A7%D9%84%D8%B9%D8%B2%D9%88%D9%86%D9%8A%D9%87%3B015-006%2C%D8%B9%D9%85%D8%A7%D8%B7%D9%88%D8%B1%3B015-007%2C%D9%83%D9%81%D8%B1+%D8%A7%D9%84%D9%81%D8%AA%D9%88%D8%AD%3B015-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%82%D8%AF%D9%85%D9%8A%D9%86%3B015-010%2C%D8%B1%D8%B4%D9%83%D8%AF%D9%87%3B015-011%2C%D8%AD%D8%B1%D9%81+%D9%85%D8%B2%D9%8A%D8%A7%D8%B1%D9%87%3B015-012%2C%D8%A8%D8%AF%D9%86%D8%A7%D9%8A%D9%84%3B015-013%2C%D8%A8%D9%82%D8%A7%D8%B9%D8%B5%D9%81%D8%B1%D9%8A%D9%86%3B015-014%2C%D8%A7%D9%84%D9%85%D8%B9%D8%A7%D8%B5%D8%B1%3B015-015%2C%D8%B9%D8%B1%D8%B3%D8%A7%D9%84+%D8%B4%D8%B1%D9%82%D9%8A%3B015-016%2C%D8%A7%D9%84%D9%86%D8%A7%D8%B5%D8%B1%D9%8A%D8%A9%3B015-017%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%AD%D8%B1%D9%8A%D9%85%D8%A9%3B015-018%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D8%A7%D8%AD%D9%85%D8%B1%3B015-019%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AF%D9%84%D8%A8%3B015-020%2C%D8%A7%D9%84%D8%A8%D8%B5+%D9%82%D8%B3%D9%85+5%3B015-021%2C%D8%A7%D9%84%D9%85%D8%AD%D8%A7%D8%B1%D8%A8%D9%8A%D9%87%3B015-022%2C%D8%AC%D8%A8%D8%B4%D9%8A%D8%AA%3B015-023%2C%D8%B4%D8%A8%D8%B9%D8%A7+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B015-024%2C%D8%A7%D9%84%D9%82%D9%86%D8%B7%D8%B1%D8%A9%3B015-025%2C%D8%AA%D8%A8%D9%86%D9%8A%D9%86+%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%D9%86%D9%8A%3B016-001%2C%D8%A8%D8%B2%D8%AD%D9%84%3B016-002%2C%D8%A7%D9%84%D8%B4%D8%A8%D8%A7%D9%86%D9%8A%D8%A9%3B016-003%2C%D8%A7%D9%84%D9%84%D9%82%D9%84%D9%88%D9%82%3B016-004%2C%D8%A7%D9%84%D8%B6%D8%A8%D9%8A%D9%87%3B016-005%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%A8%D9%88%D9%86%3B016-006%2C%D8%B9%D9%85%D9%8A%D9%82%3B016-007%2C%D9%82%D9%84%D9%88%D8%AF+%D8%A7%D9%84%D8%A8%D8%A7%D9%82%D9%8A%D8%A9%3B016-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D8%B3%D8%A7%D8%A8%D8%A7%3B016-010%2C%D8%B2%D8%A7%D9%86%3B016-011%2C%D8%AD%D9%85%D9%8A%D8%B5%3B016-012%2C%D8%A8%D8%B1%D8%B3%D8%A7%3B016-013%2C%D8%A8%D9%82%D8%B1%D8%B5%D9%88%D9%86%D8%A7%3B016-014%2C%D8%A7%D9%84%D9%85%D8%B9%D9%8A%D8%B5%D8%B1%D8%A9%3B016-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%AD%D9%8A+%D8%A2%D9%84+%D8%A7%D9%84%D8%A7%D8%B4%D8%B9%D9%84%3B016-016%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%A7%D9%8A%D9%84%D8%A7%3B016-017%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D9%82%D9%86%D8%A7%D9%81%D8%A7%D8%B1%3B016-018%2C%D8%B9%D9%8A%D8%AA%D8%A7+%D8%A7%D9%84%D9%81%D8%AE%D8%A7%D8%B1%3B016-019%2C%D9%82%D8%A7%D9%82%D8%B9%D9%8A%D8%A9+%D8%A7%D9%84%D8%B5%D9%86%D9%88%D8%A8%D8%B1%3B016-020%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%A7%D8%B6%3B016-021%2C%D8%A7%D9%84%D9%85%D9%83%D9%86%D9%88%D9%86%D9%8A%D8%A9%3B016-022%2C%D8%AC%D8%B1%D8%AC%D9%88%D8%B9%3B016-023%2C%D8%B4%D9%88%D9%8A%D8%A7%3B016-024%2C%D8%A7%D9%84%D9%88%D8%B2%D8%A7%D9%86%D9%8A%3B016-025%2C%D8%AD%D8%A7%D8%B1%D9%8A%D8%B5%3B017-001%2C%D8%A8%D8%B7%D8%AD%D8%A7%3B017-002%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%A7%D8%AD+%D8%A8%D8%A6%D8%B1+%D8%A7%D9%84%D8%B9%D8%A8%D8%AF%3B017-003%2C%D8%A7%D9%84%D9%85%D8%AC%D8%AF%D9%84%3B017-004%2C%D8%A7%D9%84%D8%B9%D8%B7%D8%B4%D8%A7%D9%86%D8%A9%3B017-005%2C%D8%A7%D9%84%D9%82%D9%85%D8%A7%D8%B7%D9%8A%D9%87%3B017-006%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%A7%D8%B3%D8%AF+%D8%A7%D9%84%D8%B4%D9%85%D9%8A%D8%B3%3B017-007%2C%D8%B9%D8%B1%D9%82%D8%A7%3B017-009%2C%D8%A8%D8%B4%D8%B1%D9%8A+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D9%8A%D9%88%D8%AD%D9%86%D8%A7%3B017-010%2C%D8%B3%D9%84%D8%B9%D8%A7%D8%AA%D8%A7%3B017-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B017-012%2C%D8%A8%D8%B1%D8%BA%D9%88%D9%86%3B017-013%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D9%81%D9%82%D8%B3%3B017-014%2C%D8%A8%D8%B1%D9%8A%D8%B5%D8%A7%3B017-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%3B017-016%2C%D8%A7%D9%84%D9%88%D9%82%D9%81%3B017-017%2C%D8%B2%D9%84%D8%A7%D9%8A%D8%A7%3B017-018%2C%D8%B9%D9%8A%D8%AD%D8%A7%3B017-019%2C%D9%82%D9%86%D8%A7%D8%B1%D9%8A%D8%AA%3B017-020%2C%D8%A7%D9%84%D8%AC%D8%A8%D9%8A%D9%86%3B017-021%2C%D8%A7%D9%84%D9%85%D9%8A%D8%AF%D8%A7%D9%86%3B017-022%2C%D8%AD%D8%A7%D8%B1%D9%88%D9%81%3B017-023%2C%D8%B9%D9%8A%D9%86+%D8%AC%D8%B1%D9%81%D8%A7%3B017-024%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D9%85%D9%84%D9%88%D9%83%3B017-025%2C%D8%AD%D8%A7%D9%86%D9%8A%D9%86%3B018-001%2C%D8%A8%D9%82%D8%B9%D8%A7%D8%AA%D8%A9+%D8%B9%D8%B4%D9%82%D9%88%D8%AA%3B018-002%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%A7%D8%AF%D9%8A%D8%A9%3B018-003%2C%D8%A7%D9%84%D9%85%D8%B2%D8%A7%D8%B1%D9%8A%D8%A8%3B018-004%2C%D8%A7%D9%84%D8%B9%D9%8A%D8%B1%D9%88%D9%86%3B018-005%2C%D8%A7%D9%84%D9%83%D8%AD%D8%A7%D9%84%D9%87%3B018-006%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AD%D9%88%D8%B1%3B018-007%2C%D8%AF%D9%8A%D8%B1+%D8%AF%D9%84%D9%88%D9%85%3B018-009%2C%D8%B7%D9%88%D8%B1%D8%B2%D8%A7%3B018-010%2C%D8%B3%D9%85%D8%A7%D8%B1+%D8%AC%D8%A8%D9%8A%D9%84%3B018-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B5%D9%84%D9%8A%D8%A8+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B018-012%2C%D8%A8%D8%B2%D9%8A%D8%B2%D8%A7%3B018-013%2C%D8%A8%D9%8A%D8%AA+%D8%AD%D8%A7%D9%88%D9%8A%D9%83%3B018-014%2C%D8%AC%D9%88%D8%A7%D8%B1+%D8%A7%D9%84%D8%AD%D8%B4%D9%8A%D8%B4%3B018-015%2C%D8%A7%D9%84%D8%A7%D9%86%D8%B5%D8%A7%D8%B1%3B018-016%2C%D8%A8%D8%AA%D9%8A%D8%A7%D8%B3%3B018-017%2C%D8%B3%D8%AD%D9%85%D8%B1%3B018-018%2C%D8%B9%D9%8A%D9%86+%D8%AD%D8%B1%D8%B4%D9%87%3B018-019%2C%D9%83%D9%81%D8%B1%D8%B4%D9%84%D8%A7%D9%84%3B018-020%2C%D8%A7%D9%84%D8%AD%D9%84%D9%88%D8%B3%D9%8A%D8%A9%3B018-021%2C%D8%A7%D9%86%D8%A7%D9%86%3B018-022%2C%D8%AD%D8%A8%D9%88%D8%B4%3B018-023%2C%D8%B9%D9%8A%D9%86+%D9%82%D9%86%D9%8A%D8%A7%3B018-024%2C%D8%A8%D9%84%D8%A7%D8%B7%3B018-025%2C%D8%AD%D8%AF%D8%A7%D8%AB%D8%A7%3B019-001%2C%D8%A8%D9%82%D8%B9%D8%A7%D8%AA%D8%A9+%D9%83%D9%86%D8%B9%D8%A7%D9%86%3B019-002%2C%D8%A7%D9%84%D8%B9%D8%B1%D8%A8%D8%A7%D9%86%D9%8A%D8%A9%3B019-003%2C%D8%A7%D9%84%D9%85%D8%BA%D9%8A%D8%B1%D9%8A%3B019-004%2C%D8%A7%D9%84%D8%B9%D9%8A%D9%88%D9%86%3B019-005%2C%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%AC%D8%A7%D8%AA%3B019-006%2C%D8%B9%D9%8A%D9%86+%D8%B2%D8%AD%D9%84%D8%AA%D8%A7%3B019-007%2C%D8%A7%D9%84%D9%83%D9%88%D9%8A%D8%AE%D8%A7%D8%AA%3B019-009%2C%D8%B9%D8%A8%D8%AF%D9%8A%D9%86%3B019-010%2C%D8%B4%D8%A7%D8%AA%D9%8A%D9%86%3B019-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B5%D9%84%D9%8A%D8%A8+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B019-012%2C%D8%A8%D8%B4%D9%85%D8%B2%D9%8A%D9%86%3B019-013%2C%D8%AD%D8%B1%D9%81+%D8%B3%D9%8A%D8%A7%D8%AF%3B019-014%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF+%D8%B9%D9%84%D9%8A%3B019-015%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%A7%D9%86%D9%8A%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B3%D9%8A%D8%AD%D9%8A%D9%8A%D9%86%3B019-016%2C%D8%A8%D8%B1+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3%3B019-017%2C%D8%B5%D8%BA%D8%A8%D9%8A%D9%86%3B019-018%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%B1%D8%A8%3B019-019%2C%D9%83%D9%81%D8%B1%D8%AD%D8%AA%D9%89%3B019-020%2C%D8%A7%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D9%8A%3B019-021%2C%D8%A8%D8%AA%D8%AF%D9%8A%D9%86+%D8%A7%D9%84%D9%84%D9%82%D8%B4%3B019-022%2C%D8%AD%D9%88%D9%85%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B019-023%2C%D9%83%D9%81%D8%B1+%D8%AD%D9%85%D8%A7%D9%85%3B019-024%2C%D8%A8%D9%84%D9%8A%D8%AF%D8%A7%3B019-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B020-001%2C%D8%A8%D9%82%D8%B9%D8%AA%D9%88%D8%AA%D9%87%3B020-002%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D8%A9%3B020-003%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%81%3B020-004%2C%D8%A7%D9%84%D8%BA%D8%A7%D8%A8%D8%A9%3B020-005%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%8A%D8%A9%3B020-006%2C%D8%B9%D9%8A%D9%86+%D9%82%D9%86%D9%8A%3B020-007%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D9%82%D9%86%D8%A8%D8%B1%3B020-009%2C%D9%82%D9%86%D8%A7%D8%AA%3B020-010%2C%D8%B4%D8%A8%D8%B7%D9%8A%D9%86%3B020-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B9%D8%A7%D8%B5%D8%B1%3B020-012%2C%D8%A8%D8%B5%D8%B1%D9%85%D8%A7%3B020-013%2C%D8%AD%D9%82%D9%84+%D8%A7%D9%84%D8%B9%D8%B2%D9%8A%D9%85%D8%A9%3B020-014%2C%D8%A7%D9%84%D9%87%D8%B1%D9%85%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%A7%D8%B1%D8%A9%3B020-015%2C%D8%A7%D9%84%D8%AA%D9%88%D9%81%D9%8A%D9%82%D9%8A%D9%87%3B020-016%2C%D8%A8%D9%88%D8%A7%D8%B1%D8%AC%3B020-017%2C%D8%B9%D8%A7%D9%86%D8%A7%3B020-018%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%B7%D8%A7%3B020-019%2C%D9%83%D9%81%D8%B1%D9%85%D9%84%D9%83%D9%8A%3B020-020%2C%D8%A7%D9%84%D8%AD%D9%86%D9%8A%D9%87%3B020-021%2C%D8%A8%D8%AD%D9%86%D9%8A%D9%86+%D9%88%D9%83%D9%81%D8%B1%D8%AA%D8%B9%D9%84%D8%A7%3B020-022%2C%D8%AD%D9%88%D9%85%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B020-023%2C%D9%83%D9%81%D8%B1%D8%B4%D9%88%D8%A8%D8%A7%3B020-024%2C%D8%A8%D9%86%D9%8A+%D8%AD%D9%8A%D8%A7%D9%86%3B020-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%B3%D9%8A%D9%86%D9%8A%D9%87%3B021-001%2C%D8%A8%D9%84%D9%88%D9%86%D9%87%3B021-002%2C%D8%A7%D9%84%D9%82%D8%B5%D9%8A%D8%A8%D8%A9%3B021-003%2C%D8%A7%D9%87%D9%85%D8%AC%3B021-004%2C%D8%A7%D9%84%D9%81%D8%B1%D9%8A%D9%83%D9%87%3B021-005%2C%D8%A8%D8%AA%D8%A7%D8%AA%D8%B1%3B021-006%2C%D8%B9%D9%8A%D9%86+%D9%88%D8%B2%D9%8A%D9%86%3B021-007%2C%D8%A7%D9%84%D9%86%D9%87%D8%B1%D9%8A%D9%87+%D9%88%D8%A8%D8%B3%D8%AA%D8%A7%D9%86+%D8%A7%D9%84%D8%AD%D8%B1%D8%B4%3B021-009%2C%D9%82%D9%86%D9%8A%D9%88%D8%B1%3B021-010%2C%D8%B4%D9%83%D8%A7%3B021-011%2C%D8%AD%D9%8A%D9%84%D8%A7%D9%86%3B021-012%2C%D8%A8%D8%B7%D8%B1%D8%A7%D9%85%3B021-013%2C%D8%AD%D9%88%D8%A7%D8%B1%D9%87%3B021-014%2C%D8%A7%D9%84%D9%87%D8%B1%D9%85%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D9%82%D9%81%3B021-015%2C%D8%A7%D9%84%D8%AC%D8%A8%D8%A7%D9%86%D9%8A%D9%87%3B021-016%2C%D8%AA%D8%B1%D8%A8%D9%84%3B021-017%2C%D8%B9%D9%8A%D8%AA%D9%86%D9%8A%D8%AA%3B021-018%2C%D9%83%D9%81%D8%B1%D8%AF%D9%86%D9%8A%D8%B3%3B021-019%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B021-020%2C%D8%A7%D9%84%D8%B1%D8%B4%D9%8A%D8%AF%D9%8A%D9%87%3B021-021%2C%D8%A8%D8%B3%D8%B1%D9%8A%3B021-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%8A%D8%A7%D8%B6%3B021-023%2C%D9%83%D9%88%D9%83%D8%A8%D8%A7%3B021-024%2C%D8%AA%D9%88%D9%84%D9%8A%D9%86%3B021-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D9%88%D8%A7%D8%B1%D8%A9%3B022-001%2C%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%BA%D8%B2%D9%8A%D8%B1%3B022-002%2C%D8%A7%D9%84%D9%82%D9%84%D8%B9%D8%A9%3B022-003%2C%D8%A8%D8%AC%D9%87%3B022-004%2C%D8%A7%D9%84%D9%81%D9%86%D8%A7%D8%B1%3B022-005%2C%D8%A8%D8%AD%D9%85%D8%AF%D9%88%D9%86%3B022-006%2C%D8%B9%D9%8A%D9%86%D8%A8%D8%A7%D9%84%3B022-007%2C%D8%A7%D9%83%D8%B1%D9%88%D9%85%3B022-009%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%86%D9%8A+%D8%B5%D8%B9%D8%A8%3B022-010%2C%D8%B5%D8%BA%D8%A7%D8%B1%3B022-011%2C%D8%AF%D8%A7%D8%B1%D9%8A%D8%A7%3B022-012%2C%D8%A8%D9%83%D9%81%D8%AA%D9%8A%D9%86%3B022-013%2C%D8%AF%D8%A8%D8%B9%D9%84%3B022-014%2C%D8%A7%D9%84%D9%87%D8%B1%D9%85%D9%84+%D8%AD%D9%8A+%D8%A8%D8%AF%D9%8A%D8%AA%D8%A7%3B022-015%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B022-016%2C%D8%AA%D8%B9%D9%84%D8%A8%D8%A7%D9%8A%D8%A7%3B022-017%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%D9%87%3B022-018%2C%D9%83%D9%81%D8%B1%D9%82%D9%88%D9%82%3B022-019%2C%D9%83%D9%88%D8%AB%D8%B1%D9%8A%D8%A9+%D8%A7%D9%84%D8%B3%D9%8A%D8%A7%D8%AF%3B022-020%2C%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D8%AF%D9%8A%D8%A9%3B022-021%2C%D8%A8%D8%B5%D9%84%D9%8A%D8%A7%3B022-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D9%8A%3B022-023%2C%D8%A7%D9%84%D9%85%D8%A7%D8%B1%D9%8A%3B022-024%2C%D8%AD%D9%88%D9%84%D8%A7%3B022-025%2C%D8%A8%D9%86%D8%AA+%D8%AC%D8%A8%D9%8A%D9%84+%D8%AD%D9%8A+%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B5%D8%BA%D9%8A%D8%B1%D9%87%3B023-001%2C%D8%AC%D8%B9%D9%8A%D8%AA%D8%A7%3B023-002%2C%D8%A7%D9%84%D9%83%D8%AD%D9%84%D9%88%D9%86%D9%8A%D8%A9%3B023-003%2C%D8%A8%D8%AD%D8%AF%D9%8A%D8%AF%D8%A7%D8%AA%3B023-004%2C%D8%A7%D9%84%D9%82%D8%B9%D9%82%D9%88%D8%B1%3B023-005%2C%D8%A8%D8%AD%D9%88%D8%A7%D8%B1%D9%87%3B023-006%2C%D8%BA%D8%B1%D9%8A%D9%81%D8%A9%3B023-007%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%AC%3B023-009%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%B9%D8%B3%D8%A7%D9%81%3B023-010%2C%D8%B5%D9%88%D8%B1%D8%A7%D8%AA%3B023-011%2C%D8%B1%D8%B4%D8%B9%D9%8A%D9%86%3B023-012%2C%D8%A8%D9%86%D9%87%D8%B1%D8%A7%D9%86%3B023-013%2C%D8%AF%D9%8A%D8%B1+%D9%86%D8%A8%D9%88%D8%AD%3B023-014%2C%D8%B2%D8%BA%D8%B1%D9%8A%D9%86%3B023-015%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B023-016%2C%D8%AA%D8%B9%D9%86%D8%A7%D9%8A%D9%84%3B023-017%2C%D8%B9%D9%8A%D9%86+%D8%B2%D8%A8%D8%AF%D9%87%3B023-018%2C%D9%83%D9%81%D8%B1%D9%85%D8%B4%D9%83%D9%8A%3B023-019%2C%D8%A7%D9%84%D9%84%D9%88%D8%A8%D9%8A%D9%87%3B023-020%2C%D8%A7%D9%84%D8%B2%D9%84%D9%88%D8%B7%D9%8A%D9%87%3B023-021%2C%D8%A8%D9%83%D8%A7%D8%B3%D9%8A%D9%86%3B023-022%2C%D8%A7%D9%84%D9%86%D8%A8%D8%B7%D9%8A%D8%A9+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D8%B3%D9%8A%D8%AD%D9%8A%D9%8A%D9%86%3B023-023%2C%D9%85%D8%B1%D8%AC+%D8%A7%D9%84%D8%B2%D9%87%D9%88%D8%B1%3B023-024%2C%D8%AF%D8%A8%D9%8A%D9%86%3B023-025%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%B3%D9%84%D9%85%3B024-001%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A7%D9%84%D8%AA%D8%B1%D9%85%D8%B3%3B024-002%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D9%87%3B024-003%2C%D8%A8%D8%AE%D8%B9%D8%A7%D8%B2%3B024-004%2C%D8%A7%D9%84%D9%85%D8%AA%D9%8A%D9%86%3B024-005%2C%D8%A8%D8%AE%D8%B4%D8%AA%D9%8A%D9%87%3B024-006%2C%D9%83%D8%AA%D8%B1%D9%85%D8%A7%D9%8A%D8%A7%3B024-007%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%D9%87%3B024-009%2C%D9%88%D8%A7%D8%AF%D9%8A+%D9%82%D9%86%D9%88%D8%A8%D9%8A%D9%86%3B024-010%2C%D8%B9%D8%A8%D8%AF%D9%84%D9%84%D9%8A%3B024-011%2C%D8%B3%D8%A8%D8%B9%D9%84%3B024-012%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D8%AE%D8%A7%D8%B5%D8%A9%3B024-013%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%BA%D8%B1%D9%8A%D9%86%3B024-014%2C%D8%B3%D9%87%D9%84%D8%A7%D8%AA+%D8%A7%D9%84%D9%85%D8%A7%D8%A1%3B024-015%2C%D8%A7%D9%84%D8%AD%D8%AF%D8%AB+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B024-016%2C%D8%AA%D9%84+%D8%A7%D9%84%D8%A7%D8%AE%D8%B6%D8%B1%3B024-017%2C%D8%BA%D8%B2%D9%87%3B024-018%2C%D9%83%D9%88%D9%83%D8%A8%D8%A7%3B024-019%2C%D8%A7%D9%84%D9%85%D8%B1%D9%88%D8%A7%D9%86%D9%8A%D8%A9%3B024-020%2C%D8%A7%D9%84%D8%B3%D9%85%D8%A7%D8%B9%D9%8A%D8%A9%3B024-021%2C%D8%A8%D9%86%D9%88%D8%A7%D8%AA%D9%8A%3B024-022%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%B2%D9%87%D8%B1%D8%A7%D9%86%D9%8A%3B024-023%2C%D9%85%D9%8A%D9%85%D8%B3%3B024-024%2C%D8%AF%D9%8A%D8%B1+%D8%B3%D8%B1%D9%8A%D8%A7%D9%86%3B024-025%2C%D9%81%D8%B1%D9%88%D9%86%3B025-001%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A8%D8%AF%D8%B1%D8%A7%D9%86%3B025-002%2C%D8%A7%D9%84%D9%84%D9%88%D9%8A%D8%B2%D9%87%3B025-003%2C%D8%A8%D8%B2%D9%8A%D9%88%D9%86%3B025-004%2C%D8%A7%D9%84%D9%85%D8%AC%D8%B0%D9%88%D8%A8+%D9%88+%D9%85%D8%B2%D9%87%D8%B1%3B025-005%2C%D8%A8%D8%AF%D8%A7%D8%AF%D9%88%D9%86%3B025-006%2C%D9%83%D9%81%D8%B1%D8%AD%D9%8A%3B025-007%2C%D8%A7%D9%84%D8%AA%D9%84%D9%8A%D9%84%3B025-010%2C%D8%B9%D8%A8%D8%B1%D9%8A%D9%86%3B025-011%2C%D8%B3%D8%B1%D8%B9%D9%84%3B025-012%2C%D8%AF%D8%A7%D8%B1+%D8%A8%D8%B9%D8%B4%D8%AA%D8%A7%D8%B1%3B025-013%2C%D8%B3%D9%8A%D8%B1%3B025-014%2C%D9%81%D9%8A%D8%B3%D8%A7%D9%86%3B025-015%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D8%A9%3B025-016%2C%D8%AC%D8%AF%D9%8A%D8%AA%D8%A7%3B025-017%2C%D9%82%D9%84%D9%8A%D8%A7%3B025-018%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%A8%D9%84%D9%87%D9%8A%D8%B5%3B025-019%2C%D8%A7%D9%84%D9%82%D9%86%D9%8A%D8%B7%D8%B1%D8%A9%3B025-020%2C%D8%B4%D8%A8%D8%B1%D9%8A%D8%AD%D8%A7%3B025-021%2C%D8%A8%D9%8A%D8%B5%D9%88%D8%B1%3B025-022%2C%D8%B1%D9%88%D9%85%D9%8A%D9%86%3B025-024%2C%D8%AF%D9%8A%D8%B1+%D9%85%D9%8A%D9%85%D8%A7%D8%B3%3B025-025%2C%D8%AF%D8%A8%D9%84%3B026-001%2C%D8%AD%D8%B1%D8%A7%D8%AC%D9%84%3B026-002%2C%D8%A7%D9%84%D9%84%D9%8A%D9%84%D9%83%D9%8A%3B026-003%2C%D8%A8%D8%B4%D8%AA%D9%84%D9%8A%D8%AF%D8%A7+%D9%88%D9%81%D8%AF%D8%A7%D8%B1%3B026-004%2C%D8%A7%D9%84%D9%85%D8%AD%D9%8A%D8%AF%D8%AB%D8%A9%3B026-005%2C%D8%A8%D8%AF%D8%BA%D8%A7%D9%86%3B026-006%2C%D9%83%D9%81%D8%B1%D8%AD%D9%8A%D9%85%3B026-007%2C%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B026-010%2C%D8%B9%D8%B1%D8%B7%D8%B2%3B026-011%2C%D8%B9%D8%B1%D8%A8%D8%A9+%D9%82%D8%B2%D8%AD%D9%8A%D8%A7%3B026-012%2C%D8%AF%D8%A7%D8%B1+%D8%B4%D9%85%D8%B2%D9%8A%D9%86%3B026-013%2C%D8%B7%D8%A7%D8%B1%D8%A7%D9%86%3B026-014%2C%D9%82%D9%86%D8%A7%D9%81%D8%B0%3B026-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%B4%D8%B1%D9%82%D9%8A%3B026-016%2C%D8%AC%D9%84%D8%A7%D9%84%D8%A7%3B026-017%2C%D9%83%D8%A7%D9%85%D8%AF+%D8%A7%D9%84%D9%84%D9%88%D8%B2%3B026-018%2C%D9%85%D8%AF%D9%88%D8%AE%D8%A7%3B026-019%2C%D8%A7%D9%84%D8%B2%D8%B1%D8%A7%D8%B1%D9%8A%D8%A9%3B026-020%2C%D8%A7%D9%84%D8%B4%D8%B9%D9%8A%D8%AA%D9%8A%D8%A9%3B026-021%2C%D8%AA%D8%B9%D9%8A%D8%AF%3B026-022%2C%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B026-024%2C%D8%B1%D8%A8%D8%AB%D9%84%D8%A7%D8%AB%D9%8A%D9%86%3B026-025%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%86%D8%B7%D8%A7%D8%B1%3B027-001%2C%D8%AD%D8%B1%D9%8A%D8%B5%D8%A7%3B027-002%2C%D8%A7%D9%84%D9%85%D8%B1%D8%AF%D8%A7%D8%B4%D8%A9%3B027-003%2C%D8%A8%D8%B4%D9%84%D9%84%D9%8A%3B027-004%2C%D8%A7%D9%84%D9%85%D8%B1%D9%88%D8%AC%3B027-005%2C%D8%A8%D8%B3%D8%B1%D9%8A%D9%86%3B027-006%2C%D9%83%D9%81%D8%B1%D9%81%D8%A7%D9%82%D9%88%D8%AF%3B027-007%2C%D8%A7%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D8%A9%3B027-010%2C%D8%B9%D9%88%D8%B1%D9%87%3B027-011%2C%D8%B9%D8%B1%D8%AC%D8%B3%3B027-012%2C%D8%AF%D8%AF%D9%87%3B027-013%2C%D8%B9%D8%A7%D8%B5%D9%88%D9%86%3B027-014%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B027-015%2C%D8%A7%D9%84%D8%AE%D8%B6%D8%B1+%D8%BA%D8%B1%D8%A8%D9%8A%3B027-016%2C%D8%AD%D8%A7%D8%AC%D9%8A+%D8%AC%D8%A8%D9%8A%D9%84%D9%8A%3B027-017%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B027-018%2C%D8%B3%D9%84%D8%B3%D8%A7%D8%AA%D8%A7%3B027-019%2C%D8%A7%D9%84%D8%B5%D8%A7%D9%84%D8%AD%D9%8A%D8%A9%3B027-020%2C%D8%A7%D9%84%D8%B4%D9%87%D8%A7%D8%A8%D9%8A%D9%87%3B027-021%2C%D8%AC%D8%B1%D9%86%D8%A7%D9%8A%D8%A7%3B027-022%2C%D8%B2%D9%81%D8%AA%D8%A7%3B027-024%2C%D8%B3%D8%B1%D8%AF%D8%A7+%D9%88%D8%A7%D9%84%D8%B9%D9%85%D8%B1%D8%A7%3B027-025%2C%D8%B1%D8%A7%D9%85%D9%8A%D9%87%3B028-001%2C%D8%AD%D9%8A%D8%A7%D8%B7%D8%A7%3B028-002%2C%D8%A7%D9%84%D9%85%D8%B1%D9%8A%D8%AC%D8%A9%3B028-003%2C%D8%A8%D9%84%D8%A7%D8%B7%3B028-004%2C%D8%A7%D9%84%D9%85%D8%B3%D9%82%D9%89%3B028-005%2C%D8%A8%D8%B3%D9%88%D8%B3%3B028-006%2C%D9%83%D9%81%D8%B1%D9%82%D8%B7%D8%B1%D8%A9%3B028-007%2C%D8%A7%D9%84%D8%AD%D9%88%D8%B4%D8%A8%3B028-010%2C%D8%BA%D9%88%D9%85%D8%A7%3B028-011%2C%D8%B9%D8%B4%D8%A7%D8%B4%3B028-012%2C%D8%B1%D8%A7%D8%B3+%D9%85%D8%B3%D9%82%D8%A7+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%D8%A9%3B028-013%2C%D8%B9%D9%8A%D9%85%D8%A7%D8%B1%3B028-014%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%B7%D8%B4%D9%85%3B028-015%2C%D8%A7%D9%84%D8%B1%D8%A7%D9%85%3B028-016%2C%D8%AD%D8%B2%D8%B1%D8%AA%D8%A7%3B028-017%2C%D9%84%D8%A7%D9%84%D8%A7%3B028-018%2C%D8%B1%D8%A7%D8%B4%D9%8A%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%88%D8%A7%D8%B3%D8%A8%D9%8A%3B028-019%2C%D8%A7%D9%84%D8%B5%D8%B1%D9%81%D9%86%D8%AF%3B028-020%2C%D8%A7%D9%84%D8%B8%D9%87%D9%8A%D8%B1%D8%A9%3B028-021%2C%D8%AC%D8%B2%D9%8A%D9%86%3B028-022%2C%D8%B2%D9%88%D8%B7%D8%B1+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%D8%A9%3B028-024%2C%D8%B7%D9%84%D9%88%D8%B3%D9%87%3B028-025%2C%D8%B1%D8%B4%D8%A7%D9%81%3B029-001%2C%D8%AF%D8%A7%D8%B1%D9%8A%D8%A7%3B029-002%2C%D8%A7%D9%84%D9%87%D9%84%D8%A7%D9%84%D9%8A%D8%A9%3B029-003%2C%D8%A8%D9%86%D8%AA%D8%A7%D8%B9%D9%84%3B029-004%2C%D8%A7%D9%84%D9%85%D8%B4%D8%B1%D8%B9%3B029-005%2C%D8%A8%D8%B4%D8%A7%D9%85%D9%88%D9%86%3B029-006%2C%D9%83%D9%81%D8%B1%D9%86%D8%A8%D8%B1%D8%AE%3B029-007%2C%D8%A7%D9%84%D8%AD%D9%88%D9%8A%D8%B4%3B029-010%2C%D9%83%D9%81%D8%B1%D8%AD%D8%AA%D9%86%D8%A7%3B029-011%2C%D8%B9%D9%84%D9%85%D8%A7%3B029-012%2C%D8%B1%D8%A7%D8%B3+%D9%85%D8%B3%D9%82%D8%A7+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%D8%A9%3B029-013%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%D9%87%3B029-014%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D9%81%D9%82%D9%8A%D9%87%3B029-015%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%B4+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B029-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%A7%D9%85%D8%B1%D8%A7%D8%A1%3B029-017%2C%D9%84%D8%A8%D8%A7%D9%8A%D8%A7%3B029-018%2C%D9%8A%D9%86%D8%B7%D8%A7%3B029-019%2C%D8%A7%D9%84%D8%B9%D8%AF%D9%88%D8%B3%D9%8A%D9%87%3B029-020%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D9%84%D8%A9%3B029-021%2C%D8%AC%D9%86%D8%B3%D9%86%D8%A7%D9%8A%D8%A7%3B029-022%2C%D8%B3%D9%8A%D9%86%D9%8A%3B029-024%2C%D8%B9%D8%AF%D8%B4%D9%8A%D8%AA%3B029-025%2C%D8%B1%D9%85%D9%8A%D8%B4%3B030-001%2C%D8%AF%D8%B1%D8%B9%D9%88%D9%86%3B030-002%2C%D8%A8%D8%AA%D8%A8%D9%8A%D8%A7%D8%AA%3B030-003%2C%D8%A8%D9%8A%D8%AA+%D8%AD%D8%A8%D8%A7%D9%82%3B030-004%2C%D8%A7%D9%84%D9%85%D8%B7%D9%8A%D9%84%D8%A8%3B030-005%2C%D8%A8%D8%B7%D9%84%D9%88%D9%86%3B030-006%2C%D9%83%D9%81%D8%B1%D9%86%D9%8A%D8%B3%3B030-007%2C%D8%A7%D9%84%D8%AD%D9%8A%D8%B5%D8%A7%3B030-010%2C%D9%83%D9%81%D8%B1%D8%AD%D9%84%D8%AF%D8%A7%3B030-011%2C%D8%B9%D9%8A%D9%86%D8%B7%D9%88%D8%B1%D9%8A%D9%86%3B030-012%2C%D8%B1%D8%B4%D8%AF%D8%A8%D9%8A%D9%86%3B030-013%2C%D9%82%D8%B1%D8%AD%D9%8A%D8%A7%3B030-014%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%B3%D8%AC%D8%AF%3B030-015%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%B4+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D9%85%D9%8A%D8%B3%3B030-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B2%D8%B1%D8%A7%D8%B9%D9%86%D8%A9%3B030-017%2C%D9%84%D9%88%D8%B3%D9%8A%D8%A7%3B030-019%2C%D8%A7%D9%84%D8%BA%D8%B3%D8%A7%D9%86%D9%8A%D9%87%3B030-020%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B030-021%2C%D8%AD%D9%8A%D8%AA%D9%88%D9%84%D9%8A+%D9%88%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%84%D9%8A%D9%85%D9%88%D9%86%3B030-022%2C%D8%B4%D9%88%D9%83%D9%8A%D9%86%3B030-024%2C%D8%B9%D8%AF%D9%8A%D8%B3%D8%A9%3B030-025%2C%D8%B4%D9%82%D8%B1%D8%A7%3B031-001%2C%D8%AF%D9%84%D8%A8%D8%AA%D8%A7%3B031-002%2C%D8%A8%D8%AA%D8%AE%D9%86%D9%8A%D9%87%3B031-003%2C%D8%AA%D8%B1%D8%AA%D8%AC%3B031-004%2C%D8%A7%D9%84%D9%85%D9%83%D9%84%D8%B3%3B031-005%2C%D8%A8%D9%84%D9%8A%D8%A8%D9%84%3B031-006%2C%D9%83%D9%84%D9%8A%D9%84%D9%8A%D9%87%3B031-007%2C%D8%A7%D9%84%D8%AF%D8%A8%D8%A7%D8%A8%D9%8A%D8%A9%3B031-010%2C%D9%83%D9%81%D8%B1%D8%AD%D9%8A%3B031-011%2C%D9%82%D8%B1%D9%87+%D8%A8%D8%A7%D8%B4%3B031-012%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%A7%D9%84%D9%85%D8%AA%D8%A7%D9%88%D9%84%D8%A9%3B031-013%2C%D9%82%D8%B1%D8%B5%D9%8A%D8%AA%D8%A7%3B031-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AA%D8%B1%D9%83%D9%85%D8%A7%D9%86%3B031-015%2C%D8%A7%D9%84%D8%B2%D8%B1%D8%A7%D8%B2%D9%8A%D8%B1%3B031-016%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%BA%D9%86%D9%85%3B031-017%2C%D9%85%D8%B4%D8%BA%D8%B1%D9%87+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B031-019%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D8%A9%3B031-020%2C%D8%A7%D9%84%D9%85%D8%A7%D9%84%D9%83%D9%8A%D9%87%3B031-021%2C%D8%AD%D9%8A%D8%B7%D9%88%D8%B1%D8%A9%3B031-022%2C%D8%B5%D8%B1%D8%A8%D8%A7%3B031-024%2C%D8%B9%D9%84%D9%85%D8%A7%D9%86%3B031-025%2C%D8%B5%D8%B1%D8%A8%D9%8A%D9%86%3B032-001%2C%D8%B2%D9%88%D9%82+%D9%85%D8%B5%D8%A8%D8%AD%3B032-002%2C%D8%A8%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B032-003%2C%D8%AC%D8%A7%D8%AC%3B032-004%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%8A%D8%A9%3B032-005%2C%D8%A8%D9%85%D9%83%D9%8A%D9%86%3B032-006%2C%D9%85%D8%AC%D8%AF+%D8%A7%D9%84%D9%85%D8%B9%D9%88%D8%B4%3B032-007%2C%D8%A7%D9%84%D8%AF%D8%BA%D9%84%D8%A9%3B032-010%2C%D9%83%D9%81%D8%B1%D8%B4%D9%84%D9%8A%D9%85%D8%A7%D9%86%3B032-011%2C%D9%83%D8%B1%D9%85+%D8%B3%D8%AF%D9%87%3B032-012%2C%D8%B2%D9%83%D8%B1%D9%88%D9%86%3B032-013%2C%D9%83%D8%B1%D9%85+%D8%A7%D9%84%D9%85%D9%87%D8%B1%3B032-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B1%D8%B7%D9%84%3B032-015%2C%D8%A7%D9%84%D8%B3%D8%B9%D9%8A%D8%AF%D9%87%3B032-016%2C%D8%AD%D9%88%D8%B4+%D8%AD%D8%A7%D9%84%D8%A7%3B032-017%2C%D9%85%D9%8A%D8%AF%D9%88%D9%86%3B032-019%2C%D8%A7%D9%84%D8%B3%D9%83%D8%B3%D9%83%D9%8A%D8%A9%3B032-020%2C%D8%A7%D9%84%D9%85%D8%AC%D8%A7%D8%AF%D9%84%3B032-021%2C%D8%B1%D9%88%D9%85%3B032-022%2C%D8%B5%D9%8A%D8%B1+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%D8%A9%3B032-024%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%B1%D8%A8%3B032-025%2C%D8%B5%D9%81%D8%AF+%D8%A7%D9%84%D8%A8%D8%B7%D9%8A%D8%AE%3B033-001%2C%D8%B2%D9%88%D9%82+%D9%85%D9%83%D8%A7%D9%8A%D9%84%3B033-002%2C%D8%A8%D8%B3%D8%A7%D8%A8%D8%A7%3B033-003%2C%D8%AC%D8%A8%D9%8A%D9%84%3B033-004%2C%D8%A7%D9%84%D9%85%D9%8A%D8%A7%D8%B3%D8%A9%3B033-005%2C%D8%A8%D9%85%D9%87%D8%B1%D9%8A%D9%87%3B033-006%2C%D9%85%D8%AC%D8%AF%D9%84%D9%88%D9%86%D8%A7%3B033-007%2C%D8%A7%D9%84%D8%AF%D9%88%D8%B1%D9%87%3B033-010%2C%D9%83%D9%81%D8%B1%D8%B9%D8%A8%D9%8A%D8%AF%D8%A7%3B033-011%2C%D9%83%D9%81%D8%B1%D8%AD%D9%88%D8%B1%D8%A7%3B033-012%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B033-013%2C%D9%83%D9%81%D8%B1%D8%A8%D9%86%D9%8A%D9%86%3B033-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B9%D8%B3%3B033-015%2C%D8%A7%D9%84%D8%B3%D9%81%D8%B1%D9%8A%3B033-017%2C%D9%8A%D8%AD%D9%85%D8%B1%3B033-019%2C%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D9%88%D9%86%3B033-020%2C%D8%A7%D9%84%D9%85%D9%86%D8%B5%D9%88%D8%B1%D9%8A%3B033-021%2C%D8%B1%D9%8A%D9%85%D8%A7%D8%AA+%D9%88%D8%B4%D9%82%D8%A7%D8%AF%D9%8A%D9%81%3B033-022%2C%D8%B9%D8%A8%D8%A7%3B033-024%2C%D9%82%D8%A8%D8%B1%D9%8A%D8%AE%D8%A7%3B033-025%2C%D8%B9%D9%8A%D8%AA%D8%A7+%D8%A7%D9%84%D8%AC%D8%A8%D9%84%3B034-001%2C%D8%B1%D8%B9%D8%B4%D9%8A%D9%86%3B034-002%2C%D8%A8%D8%B7%D8%B4%D9%8A%D9%87%3B034-003%2C%D8%AC%D8%AF%D8%A7%D9%8A%D9%84%3B034-004%2C%D8%A7%D9%84%D9%86%D9%82%D8%A7%D8%B4%3B034-005%2C%D8%A8%D9%88+%D8%B2%D8%B1%D9%8A%D8%AF%D9%87%3B034-006%2C%D9%85%D8%B1%D8%AC+%D8%A8%D8%B1%D8%AC%D8%A7%3B034-007%2C%D8%A7%D9%84%D8%AF%D9%88%D8%B3%D9%87%3B034-010%2C%D9%83%D9%81%D9%88%D8%B1+%D8%A7%D9%84%D8%B9%D8%B1%D8%A8%D9%8A%3B034-011%2C%D9%83%D9%81%D8%B1%D8%AF%D9%84%D8%A7%D9%82%D9%88%D8%B3%3B034-012%2C%D8%B9%D8%A7%D8%A8%D8%A7%3B034-013%2C%D9%83%D9%81%D8%B1%D8%AD%D8%A8%D9%88%3B034-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%83%D8%B1%D9%85%3B034-015%2C%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%D9%8A%D8%A9%3B034-016%2C%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%8A%D9%83%D8%A7%D9%86%D9%8A%3B034-017%2C%D8%A7%D9%84%D9%85%D8%B1%D8%AC%3B034-019%2C%D9%85%D8%BA%D8%AF%D9%88%D8%B4%D8%A9%3B034-020%2C%D8%A7%D9%84%D9%86%D9%81%D8%A7%D8%AE%D9%8A%D8%A9%3B034-021%2C%D8%B3%D8%AC%D8%AF%3B034-022%2C%D8%B9%D8%AF%D8%B4%D9%8A%D8%AA%3B034-024%2C%D9%83%D9%81%D8%B1%D9%83%D9%84%D8%A7%3B034-025%2C%D8%B9%D9%8A%D8%AA%D8%A7+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B035-001%2C%D8%B1%D9%8A%D9%81%D9%88%D9%86%3B035-002%2C%D8%A8%D8%B9%D8%A8%D8%AF%D8%A7%3B035-003%2C%D8%AC%D9%86%D9%87+%D9%88%D9%85%D8%A7%D8%B1+%D8%B3%D8%B1%D9%83%D9%8A%D8%B3%3B035-004%2C%D8%A7%D9%86%D8%B7%D9%84%D9%8A%D8%A7%D8%B3%3B035-005%2C%D8%A8%D9%8A%D8%B5%D9%88%D8%B1%3B035-006%2C%D9%85%D8%B1%D8%B3%D8%AA%D9%8A%3B035-007%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%8A%D8%A9%3B035-010%2C%D9%83%D9%81%D9%8A%D9%81%D8%A7%D9%86%3B035-011%2C%D9%83%D9%81%D8%B1%D8%B2%D9%8A%D9%86%D8%A7%3B035-012%2C%D8%B9%D9%81%D8%B5%D8%AF%D9%8A%D9%82%3B035-013%2C%D9%83%D9%81%D8%B1%D8%B4%D9%84%D8%A7%D9%86%3B035-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%86%D9%8A%D8%B1%D8%A9%3B035-015%2C%D8%A7%D9%84%D8%B7%D9%8A%D8%A8%D8%A9%3B035-016%2C%D8%AE%D8%B6%D8%B1%D8%A8%D9%83%3B035-017%2C%D8%B9%D9%85%D9%8A%D9%82%3B035-019%2C%D8%A7%D9%84%D9%85%D8%B9%D9%85%D8%B1%D9%8A%D8%A9%3B035-020%2C%D8%A8%D8%A7%D8%AA%D9%88%D9%84%D9%8A%D9%87%3B035-021%2C%D8%B3%D9%86%D9%8A%D8%A7%3B035-022%2C%D8%B9%D8%B1%D8%A8%D8%B5%D8%A7%D9%84%D9%8A%D9%85%3B035-024%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%A7%D9%84%D8%B3%D9%84%D9%85%3B035-025%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AF%D9%8A%D8%B1%3B036-001%2C%D8%B2%D9%8A%D8%AA%D9%88%D9%86%3B036-002%2C%D8%A8%D8%B9%D9%84%D8%B4%D9%85%D9%8A%D9%87%3B036-003%2C%D8%AD%D8%A7%D9%82%D9%84%3B036-004%2C%D8%A8%D8%AA%D8%BA%D8%B1%D9%8A%D9%86%3B036-005%2C%D8%AC%D8%B3%D8%B1+%D8%A7%D9%84%D9%82%D8%A7%D8%B6%D9%8A%3B036-006%2C%D9%85%D8%B2%D8%A8%D9%88%D8%AF%3B036-007%2C%D8%A7%D9%84%D8%B2%D9%88%D8%A7%D8%B1%D9%8A%D8%A8%3B036-010%2C%D9%83%D9%88%D8%A8%D8%A7%3B036-011%2C%D9%83%D9%81%D8%B1%D8%B4%D8%AE%D9%86%D8%A7%3B036-012%2C%D8%B9%D9%8A%D9%86+%D8%B9%D9%83%D8%B1%D9%8A%D9%86%3B036-013%2C%D9%83%D9%87%D9%81+%D8%A7%D9%84%D9%85%D9%84%D9%88%D9%84%3B036-014%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A8%D9%86%D9%8A%D8%AA%3B036-015%2C%D8%A7%D9%84%D8%B9%D9%82%D9%8A%D8%AF%D9%8A%D8%A9%3B036-016%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%BA%D8%B2%D8%A7%D9%84%3B036-017%2C%D9%85%D8%B4%D8%BA%D8%B1%D9%87+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B036-019%2C%D8%A7%D9%84%D9%85%D9%8A%D8%A9+%D9%88%D9%85%D9%8A%D8%A9%3B036-020%2C%D8%A8%D8%A7%D8%B1%D9%8A%D8%B4%3B036-021%2C%D8%B4%D9%88%D8%A7%D9%84%D9%8A%D9%82%3B036-022%2C%D8%B9%D8%B2%D9%87%3B036-024%2C%D9%85%D8%AD%D9%8A%D8%A8%D9%8A%D8%A8%3B036-025%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B037-001%2C%D8%B3%D9%87%D9%8A%D9%84%D9%87%3B037-002%2C%D8%A8%D9%85%D8%B1%D9%8A%D9%85%3B037-003%2C%D8%AD%D8%A7%D9%84%D8%A7%D8%AA%3B037-004%2C%D8%A8%D8%AD%D8%B1%D8%B5%D8%A7%D9%81%3B037-005%2C%D8%AD%D8%A8%D8%B1%D9%85%D9%88%D9%86%3B037-006%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B4%D9%88%D9%81%3B037-007%2C%D8%A7%D9%84%D8%B3%D9%85%D8%A7%D9%82%D9%8A%D8%A9%3B037-010%2C%D9%85%D8%A7%D8%B1+%D9%85%D8%A7%D9%85%D8%A7%3B037-011%2C%D9%83%D9%81%D8%B1%D8%B5%D8%BA%D8%A7%D8%A8%3B037-012%2C%D9%81%D9%8A%D8%B9%3B037-013%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B3%D8%B1%D8%A7%D8%AC%3B037-014%2C%D8%A7%D9%84%D8%A8%D9%88%D9%8A%D8%B6%D8%A9+%D8%A7%D9%84%D8%AD%D9%8A+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B037-015%2C%D8%A7%D9%84%D8%B9%D9%84%D8%A7%D9%82%3B037-016%2C%D8%B1%D8%B9%D9%8A%D8%AA%3B037-019%2C%D8%A7%D9%84%D9%86%D8%AC%D8%A7%D8%B1%D9%8A%D8%A9%3B037-020%2C%D8%A8%D8%A7%D9%81%D9%84%D9%8A%D9%87%3B037-021%2C%D8%B5%D8%A8%D9%91%D8%A7%D8%AD%3B037-022%2C%D8%B9%D9%8A%D9%86+%D8%A8%D9%88%D8%B3%D9%88%D8%A7%D8%B1%3B037-024%2C%D9%85%D8%B1%D9%83%D8%A8%D8%A7%3B037-025%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B038-001%2C%D8%B4%D8%AD%D8%AA%D9%88%D9%84%3B038-002%2C%D8%AA%D8%AD%D9%88%D9%8A%D8%B7%D8%A9+%D8%A7%D9%84%D8%BA%D8%AF%D9%8A%D8%B1%3B038-003%2C%D8%AD%D8%A8%D8%A7%D9%84%D9%8A%D9%86%3B038-004%2C%D8%A8%D8%B1%D8%AC+%D8%AD%D9%85%D9%88%D8%AF%3B038-005%2C%D8%AD%D9%88%D9%85%D8%A7%D9%84%3B038-006%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B6%D9%87%D8%B1%3B038-007%2C%D8%A7%D9%84%D8%B3%D9%86%D8%AF%D9%8A%D8%A7%D9%86%D8%A9%3B038-010%2C%D9%85%D8%AD%D9%85%D8%B1%D8%B4%3B038-011%2C%D9%83%D9%81%D8%B1%D9%81%D9%88%3B038-012%2C%D9%82%D9%84%D8%AD%D8%A7%D8%AA%3B038-013%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B3%D9%81%D9%8A%D8%B1%D9%87%3B038-014%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D9%86%D8%A9%3B038-015%2C%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B038-016%2C%D8%B1%D9%8A%D8%A7%D9%82%3B038-019%2C%D8%A7%D9%84%D9%87%D9%84%D8%A7%D9%84%D9%8A%D8%A9%3B038-020%2C%D8%A8%D8%AF%D9%8A%D8%A7%D8%B3%3B038-021%2C%D8%B5%D9%81%D8%A7%D8%B1%D9%8A%D8%A9%3B038-022%2C%D8%B9%D9%8A%D9%86+%D9%82%D8%A7%D9%86%D8%A7%3B038-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B038-025%2C%D8%B9%D9%8A%D9%86%D8%A7%D8%AA%D8%A7%3B039-001%2C%D8%B4%D9%86%D9%86%D8%B9%D9%8A%D8%B1%3B039-002%2C%D8%AA%D8%AD%D9%88%D9%8A%D8%B7%D8%A9+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B039-003%2C%D8%AD%D8%AC%D9%88%D9%84%D8%A7%3B039-004%2C%D8%A8%D8%B1%D9%85%D8%A7%D9%86%D8%A7%3B039-005%2C%D8%AF%D9%81%D9%88%D9%86%3B039-006%2C%D9%85%D8%B2%D9%85%D9%88%D8%B1%D8%A9%3B039-007%2C%D8%A7%D9%84%D8%B3%D9%87%D9%84%D9%87%3B039-010%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%AD%D8%A7%D8%AC%3B039-011%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%D8%B4%D9%8A%D8%AA%3B039-012%2C%D9%83%D9%81%D8%AA%D9%88%D9%86%3B039-013%2C%D8%A7%D9%84%D8%A8%D8%AF%D8%A7%D9%88%D9%8A%3B039-015%2C%D8%A7%D9%84%D9%81%D8%A7%D9%83%D9%87%D9%87+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B039-016%2C%D8%B3%D8%B9%D8%AF%D9%86%D8%A7%D9%8A%D9%84%3B039-019%2C%D8%A7%D9%86%D8%B5%D8%A7%D8%B1%D9%8A%D8%A9%3B039-020%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B039-021%2C%D8%B5%D9%8A%D8%AF%D9%88%D9%86%3B039-022%2C%D9%82%D8%A7%D9%82%D8%B9%D9%8A%D8%A9+%D8%A7%D9%84%D8%AC%D8%B3%D8%B1%3B039-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%B4%D8%B1%D9%82%D9%8A%3B039-025%2C%D9%82%D9%84%D8%A7%D9%88%D9%8A%D9%87%3B040-001%2C%D8%B5%D8%B1%D8%A8%D8%A7%3B040-002%2C%D8%AA%D8%B1%D8%B4%D9%8A%D8%B4%3B040-003%2C%D8%AD%D8%B5%D8%A7%D8%B1%D8%A7%D8%AA%3B040-004%2C%D8%A8%D8%B5%D8%A7%D9%84%D9%8A%D9%85%3B040-005%2C%D8%AF%D9%82%D9%88%D9%86%3B040-006%2C%D9%85%D8%B9%D8%A7%D8%B5%D8%B1+%D8%A7%D9%84%D8%B4%D9%88%D9%81%3B040-007%2C%D8%A7%D9%84%D8%B3%D9%88%D9%8A%D8%B3%D8%A9%3B040-010%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%B2%D9%8A%D8%A7%D8%AA%3B040-011%2C%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D8%A7%3B040-012%2C%D9%83%D9%81%D8%B1%D8%AD%D8%B2%D9%8A%D8%B1%3B040-013%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D9%8A%D9%88%D8%B4%D8%B9%3B040-015%2C%D8%A7%D9%84%D9%81%D8%A7%D9%83%D9%87%D9%87+%D8%AD%D9%8A+%D9%85%D8%A7%D8%B1+%D8%AC%D8%B1%D8%AC%D8%B3%3B040-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%B3%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D9%86%D8%AC%D8%A7%D8%A9%3B040-019%2C%D8%A8%D9%82%D8%B3%D8%B7%D9%87%3B040-020%2C%D8%A8%D8%B1%D8%AC+%D8%B1%D8%AD%D8%A7%D9%84%3B040-021%2C%D8%B9%D8%A7%D8%B1%D8%A7%D9%8A%3B040-022%2C%D9%83%D9%81%D8%B1%D8%B1%D9%85%D8%A7%D9%86%3B040-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B040-025%2C%D9%83%D9%81%D8%B1%D8%A7%3B041-001%2C%D8%B7%D8%A8%D8%B1%D8%AC%D8%A7%3B041-002%2C%D8%AC%D9%88%D8%A7%D8%B1+%D8%A7%D9%84%D8%AD%D9%88%D8%B2%3B041-003%2C%D8%AD%D8%B5%D8%B1%D8%A7%D9%8A%D9%84%3B041-004%2C%D8%A8%D8%B9%D8%A8%D8%AF%D8%A7%D8%AA%3B041-005%2C%D8%AF%D9%88%D9%8A%D8%B1+%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%3B041-006%2C%D9%85%D8%B9%D8%A7%D8%B5%D8%B1+%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AF%D9%8A%D9%86%3B041-007%2C%D8%A7%D9%84%D8%B4%D9%82%D8%AF%D9%88%D9%81%3B041-010%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%B4%D8%AF%D9%8A%D8%AF%3B041-011%2C%D9%85%D8%B1%D9%8A%D8%A7%D8%B7%D9%87%3B041-012%2C%D9%83%D9%81%D8%B1%D8%B5%D8%A7%D8%B1%D9%88%D9%86%3B041-013%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%8A%D8%A9%3B041-015%2C%D8%A7%D9%84%D9%82%D8%A7%D8%B9%3B041-016%2C%D8%B4%D8%AA%D9%88%D8%B1%D9%87%3B041-019%2C%D8%A8%D9%86%D8%B9%D9%81%D9%88%D9%84%3B041-020%2C%D8%A8%D8%B3%D8%AA%D9%8A%D8%A7%D8%AA%3B041-021%2C%D8%B9%D8%B1%D9%85%D8%AA%D9%89%3B041-022%2C%D9%83%D9%81%D8%B1%D8%AA%D8%A8%D9%86%D9%8A%D8%AA%3B041-024%2C%D9%85%D9%8A%D8%B3+%D8%A7%D9%84%D8%AC%D8%A8%D9%84+%D8%BA%D8%B1%D8%A8%D9%8A%3B041-025%2C%D9%83%D9%81%D8%B1%D8%AF%D9%88%D9%86%D9%8A%D9%86%3B042-001%2C%D8%B9%D8%AC%D9%84%D8%AA%D9%88%D9%86%3B042-002%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A7%D8%B1%D8%B5%D9%88%D9%86%3B042-003%2C%D8%AF%D9%85%D9%84%D8%B5%D8%A7%3B042-004%2C%D8%A8%D9%82%D9%86%D8%A7%D9%8A%D8%A7%3B042-005%2C%D8%B1%D8%B4%D9%85%D9%8A%D8%A7%3B042-006%2C%D9%86%D9%8A%D8%AD%D8%A7%3B042-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B2%D9%86%D8%A7%D8%AF%3B042-010%2C%D9%86%D8%AD%D9%84%D8%A7%3B042-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%AA%D9%81%D8%A7%D8%AD%3B042-012%2C%D9%83%D9%81%D8%B1%D8%B9%D9%82%D8%A7%3B042-013%2C%D8%A7%D9%84%D9%85%D9%86%D9%8A%D9%87%3B042-015%2C%D8%A7%D9%84%D9%82%D8%AF%D8%A7%D9%85%3B042-016%2C%D8%B9%D9%84%D9%8A+%D8%A7%D9%84%D9%86%D9%87%D8%B1%D9%8A%3B042-019%2C%D8%AA%D9%81%D8%A7%D8%AD%D8%AA%D8%A7%3B042-020%2C%D8%AC%D8%A8%D8%A7%D9%84+%D8%A7%D9%84%D8%A8%D8%B7%D9%85%3B042-021%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%85%D9%8A%D8%B1%3B042-022%2C%D9%83%D9%81%D8%B1%D8%B5%D9%8A%D8%B1%3B042-025%2C%D9%83%D9%88%D9%86%D9%8A%D9%86%3B043-001%2C%D8%B9%D8%B1%D8%A7%D9%85%D9%88%D9%86%3B043-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D8%A8%D8%B7%D9%85%3B043-003%2C%D8%B1%D8%A7%D8%B3+%D8%A7%D8%B3%D8%B7%D8%A7%3B043-004%2C%D8%A8%D9%83%D9%81%D9%8A%D8%A7%3B043-005%2C%D8%B1%D9%85%D8%AD%D8%A7%D9%84%D8%A7%3B043-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AF%D9%8A%D8%B1%3B043-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B7%D8%A7%D8%A8%D8%A7%3B043-010%2C%D9%86%D9%8A%D8%AD%D8%A7%3B043-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B043-012%2C%D9%83%D9%81%D8%B1%D9%82%D8%A7%D9%87%D9%84%3B043-013%2C%D8%A8%D8%AD%D9%86%D9%8A%D9%86%3B043-015%2C%D8%A7%D9%84%D9%84%D8%A8%D9%88%D9%87%3B043-016%2C%D8%B9%D9%8A%D9%86+%D9%83%D9%81%D8%B1%D8%B2%D8%A8%D8%AF%3B043-019%2C%D8%AC%D9%86%D8%AC%D9%84%D8%A7%D9%8A%D8%A7%3B043-020%2C%D8%AC%D9%88%D9%8A%D8%A7%3B043-021%2C%D8%B9%D9%8A%D9%86+%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D9%86%3B043-022%2C%D9%83%D9%81%D8%B1%D9%81%D9%8A%D9%84%D8%A7%3B043-025%2C%D9%85%D8%A7%D8%B1%D9%88%D9%86+%D8%A7%D9%84%D8%B1%D8%A7%D8%B3%3B044-001%2C%D8%B9%D8%B4%D9%82%D9%88%D8%AA%3B044-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D8%B3%D8%AA%3B044-003%2C%D8%B2%D8%A8%D8%AF%D9%8A%D9%86%3B044-004%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%B4%D8%A7%D9%87%D9%8A%D9%86%3B044-005%2C%D8%B1%D9%88%D9%8A%D8%B3%D8%A9+%D8%A7%D9%84%D9%86%D8%B9%D9%85%D8%A7%D9%86%3B044-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B3%D8%AA%3B044-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D9%85%D8%AD%D9%85%D8%AF%3B044-010%2C%D9%88%D8%AC%D9%87+%D8%A7%D9%84%D8%AD%D8%AC%D8%B1%3B044-011%2C%D8%AD%D8%B1%D9%8A%D9%82%D8%B5%3B044-012%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B044-013%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D9%8A%D9%87%D9%88%D8%AF%D9%8A%D8%A9%3B044-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B1%D8%B4%D8%A7%D8%AF%D9%87%3B044-016%2C%D9%82%D8%A7%D8%B9+%D8%A7%D9%84%D8%B1%D9%8A%D9%85%3B044-019%2C%D8%AE%D8%B1%D8%B7%D9%88%D9%85%3B044-020%2C%D8%AD%D9%86%D9%88%D9%8A%D8%A9%3B044-021%2C%D9%82%D8%AA%D8%A7%D9%84%D9%8A%3B044-022%2C%D9%85%D9%8A%D9%81%D8%AF%D9%88%D9%86%3B044-025%2C%D9%8A%D8%A7%D8%B1%D9%88%D9%86%3B045-001%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AF%D9%84%D8%A8%D9%87%3B045-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D8%B1%D9%8A%D9%83+%D9%82%D8%B1%D8%A7%D9%86%D9%88%D8%AD%3B045-003%2C%D8%B3%D8%A7%D9%82%D9%8A%D8%A9+%D8%A7%D9%84%D8%AE%D9%8A%D8%B7%3B045-004%2C%D8%A8%D9%8A%D8%A7%D9%82%D9%88%D8%AA%3B045-005%2C%D8%B3%D8%B1%D8%AD%D9%85%D9%88%D9%84%3B045-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A8%D9%86%D8%AD%D9%84%D9%8A%D8%A9%3B045-007%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%AF%D9%87%3B045-010%2C%D9%88%D8%B7%D9%89+%D8%AD%D9%88%D8%A8%3B045-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%AD%D9%88%D9%82%D8%A7%3B045-012%2C%D9%83%D9%88%D8%B3%D8%A8%D8%A7%3B045-013%2C%D8%AA%D8%B1%D8%A8%D9%84%3B045-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B3%D8%A8%D8%A7%D8%B7%3B045-016%2C%D9%82%D8%A8+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B045-019%2C%D8%AE%D8%B2%D9%8A%D8%B2%3B045-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A7%D8%B1%D8%AB%D9%88%D8%B0%D9%83%D8%B3%3B045-021%2C%D9%82%D8%B7%D9%8A%D9%86+%D9%88%D8%AD%D9%8A%D8%AF%D8%A7%D8%A8%3B045-022%2C%D9%8A%D8%AD%D9%85%D8%B1%3B045-025%2C%D8%A8%D9%8A%D8%AA+%D9%8A%D8%A7%D8%AD%D9%88%D9%86%3B046-001%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B1%D9%8A%D8%AD%D8%A7%D9%86%D9%87%3B046-002%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AD%D9%85%D8%B2%D8%A9%3B046-003%2C%D8%B3%D8%B1%D8%B9%D9%8A%D8%AA%D8%A7%3B046-004%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%B4%D8%B9%D8%A7%D8%B1%3B046-005%2C%D8%B3%D9%84%D9%81%D8%A7%D9%8A%D8%A7%3B046-006%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AF%D9%8A%D8%B1+%D8%AF%D9%88%D8%B1%D9%8A%D8%AA%3B046-007%2C%D8%A7%D9%84%D8%B9%D8%A8%D9%88%D8%AF%D9%8A%D8%A9%3B046-010%2C%D8%A7%D8%AF%D9%87%3B046-011%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D9%81%D9%88%D8%A7%D8%B1%3B046-012%2C%D9%85%D8%AA%D8%B1%D9%8A%D8%AA%3B046-013%2C%D8%AF%D9%8A%D8%B1+%D8%B9%D9%85%D8%A7%D8%B1%3B046-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B046-016%2C%D9%82%D8%A8+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B046-019%2C%D8%AF%D8%B1%D8%A8+%D8%A7%D9%84%D8%B3%D9%8A%D9%85%3B046-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B046-021%2C%D9%82%D9%8A%D8%AA%D9%88%D9%84%D9%8A%3B047-001%2C%D8%B9%D9%8A%D9%86%D8%B7%D9%88%D8%B1%D9%87%3B047-002%2C%D8%AD%D8%A7%D8%B5%D8%A8%D9%8A%D8%A7%3B047-003%2C%D8%B3%D9%82%D9%8A+%D8%B1%D8%B4%D9%85%D9%8A%D8%A7%3B047-004%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D9%83%D9%83%D9%88%3B047-005%2C%D8%B3%D9%88%D9%82+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%3B047-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D9%88%D8%B3%D8%B7%D8%A7%D9%86%D9%8A%3B047-007%2C%D8%A7%D9%84%D8%B9%D8%B1%D9%8A%D8%B6%D8%A9%3B047-010%2C%D8%A2%D8%B3%D9%8A%D8%A7%3B047-011%2C%D8%B2%D8%BA%D8%B1%D8%AA%D8%A7+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B047-012%2C%D9%83%D9%81%D8%B1%D8%AD%D8%A7%D8%AA%D8%A7%3B047-013%2C%D9%85%D8%B1%D9%83%D8%A8%D8%AA%D8%A7%3B047-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B047-016%2C%D8%A7%D9%84%D9%83%D8%B1%D9%85%D9%87%3B047-019%2C%D8%A7%D8%B1%D8%B2%D9%8A%3B047-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D9%88%D8%B1%D8%A9%3B047-021%2C%D9%83%D8%B1%D8%AE%D8%A7%3B048-001%2C%D8%BA%D8%A7%D8%AF%D9%8A%D8%B1%3B048-002%2C%D8%AD%D9%85%D8%A7%D9%86%D8%A7%3B048-003%2C%D8%B4%D8%A7%D9%85%D8%A7%D8%AA%3B048-004%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D8%A8%D8%A7%D8%A8+%D8%AA%D8%AD%D8%AA%D8%A7%D9%86%D9%8A%3B048-005%2C%D8%B4%D8%A7%D8%B1%D9%88%D9%86%3B048-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D8%AF%D9%88%D9%8A%3B048-007%2C%D8%A7%D9%84%D8%B9%D9%88%D9%8A%D9%86%D8%A7%D8%AA%3B048-010%2C%D8%A7%D9%84%D8%A8%D8%AA%D8%B1%D9%88%D9%86%3B048-011%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%3B048-013%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%86%D8%AD%D9%84%D9%87%3B048-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D8%B1%D9%8A%D8%B6%3B048-016%2C%D9%82%D9%88%D8%B3%D8%A7%D9%8A%D8%A7%3B048-019%2C%D8%A7%D8%B1%D9%83%D9%8A%3B048-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%B3%D9%8A%D9%86%D9%8A%D8%A9%3B048-021%2C%D9%83%D9%81%D8%B1%D8%AC%D8%B1%D8%A9%3B049-001%2C%D8%BA%D8%AF%D8%B1%D8%A7%D8%B3%3B049-002%2C%D8%AD%D9%8A+%D8%A7%D9%84%D9%81%D9%8A%D8%A7%D8%B6%D9%8A%D8%A9%3B049-003%2C%D8%B4%D9%85%D9%88%D8%AA%3B049-004%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D8%A8%D8%A7%D8%A8+%D9%81%D9%88%D9%82%D8%A7%D9%86%D9%8A%3B049-005%2C%D8%B4%D8%A7%D9%86%D9%8A%D9%87%3B049-006%2C%D8%B4%D8%AD%D9%8A%D9%85+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%8A%D8%A7%D8%AF%D8%B1%3B049-007%2C%D8%A7%D9%84%D8%B9%D9%8A%D9%88%D9%86%3B049-010%2C%D8%A7%D9%84%D9%85%D8%B3%D8%B1%D8%AD+%D9%88%D8%A7%D9%84%D8%A8%D9%82%D8%B9%D9%8A%D8%A9%3B049-011%2C%D9%85%D8%B2%D9%8A%D8%A7%D8%B1%D8%A9%3B049-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D9%82%D8%A8%D9%87%3B049-016%2C%D9%83%D8%A7%D8%A8%D9%88%D8%B3%D9%8A%D8%A9%3B049-019%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%A8%D9%84%D9%8A%D8%A9%3B049-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%83%D8%A7%D8%AB%D9%88%D9%84%D9%8A%D9%83%3B049-021%2C%D9%83%D9%81%D8%B1%D9%81%D8%A7%D9%84%D9%88%D8%B3%3B050-001%2C%D8%BA%D8%B2%D9%8A%D8%B1+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B050-002%2C%D8%AE%D9%84%D9%88%D8%A7%D8%AA+%D9%81%D8%A7%D9%84%D9%88%D8%BA%D8%A7%3B050-003%2C%D8%B4%D9%8A%D8%AE%D8%A7%D9%86%3B050-004%2C%D8%A8%D9%8A%D8%AA+%D9%85%D8%B1%D9%8A%3B050-005%2C%D8%B4%D8%B1%D8%AA%D9%88%D9%86%3B050-006%2C%D8%A7%D9%84%D8%A8%D8%A7%D8%B1%D9%88%D9%83%3B050-007%2C%D8%A7%D9%84%D8%BA%D8%B2%D9%8A%D9%84%D9%87%3B050-010%2C%D8%A7%D9%84%D8%AF%D9%88%D9%82%3B050-011%2C%D8%A7%D8%B3%D9%84%D9%88%D8%AA%3B050-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B050-016%2C%D9%83%D9%81%D8%B1%D8%B2%D8%A8%D8%AF%3B050-019%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B3%D8%A7%D8%B1%D9%8A%D9%87%3B050-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%86%D8%A7%D8%B1%D8%A9%3B050-021%2C%D9%84%D8%A8%D8%B9%D9%87%3B051-001%2C%D8%BA%D8%B2%D9%8A%D8%B1+%D8%A7%D9%84%D9%82%D9%86%D8%A7%D8%A9%3B051-002%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%AD%D8%B1%D9%81%3B051-003%2C%D8%B7%D9%88%D8%B1%D8%B2%D9%8A%D8%A7%3B051-004%2C%D8%AC%D9%84+%D8%A7%D9%84%D8%AF%D9%8A%D8%A8%3B051-005%2C%D8%B4%D9%85%D9%84%D8%A7%D9%86%3B051-006%2C%D8%A7%D9%84%D8%A8%D8%B1%D8%AC%D9%8A%D9%86%3B051-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA%3B051-010%2C%D8%A7%D9%84%D8%B9%D9%84%D8%A7%D9%84%D9%8A%3B051-011%2C%D8%A8%D9%8A%D8%AA+%D8%B9%D8%A8%D9%8A%D8%AF%3B051-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA++%D8%AD%D9%8A+%D8%B7%D8%A8%D8%B4%D8%A7%D8%B1%3B051-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%85%D8%A7%D8%B1+%D8%A7%D9%84%D9%8A%D8%A7%D8%B3%3B051-019%2C%D8%A7%D9%84%D8%AD%D8%A7%D8%B1%D8%A9%3B051-020%2C%D8%B5%D9%88%D8%B1+%D8%AD%D9%8A+%D8%A7%D9%84%D9%85%D9%88%D8%A7%D8%B1%D9%86%D8%A9%3B051-021%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%AD%D8%A8%D8%A7%D8%B3%3B052-001%2C%D8%BA%D8%B2%D9%8A%D8%B1+%D8%A7%D9%84%D9%85%D8%B9%D8%A7%D9%85%D9%84%D8%AA%D9%8A%D9%86%3B052-002%2C%D8%AF%D9%8A%D8%B1+%D8%AE%D9%88%D9%86%D9%87+%D9%88%D8%AA%D9%84%D8%AA%D9%8A%D8%AA%D9%87%3B052-003%2C%D8%B9%D8%A8%D9%8A%D8%AF%D8%A7%D8%AA%3B052-004%2C%D8%AC%D9%88%D8%B1%D8%A9+%D8%A7%D9%84%D8%A8%D9%84%D9%88%D8%B7%3B052-005%2C%D8%B5%D9%88%D9%81%D8%B1%3B052-006%2C%D8%A7%D9%84%D8%A8%D8%B7%D8%A7%D9%84%3B052-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D8%B0%D9%88%D9%82%3B052-010%2C%D8%A7%D9%84%D9%81%D8%AA%D8%A7%D8%AD%D8%A7%D8%AA+%D9%88%D9%87%D8%B1%D8%A8%D9%88%D9%86%D8%A7%3B052-011%2C%D8%B1%D8%A7%D8%B3%D9%83%D9%8A%D9%81%D8%A7%3B052-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B9%D8%AB%D9%85%D8%A7%D9%86%3B052-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%85%D8%A7%D8%B1+%D9%85%D8%AE%D8%A7%D9%8A%D9%84%3B052-019%2C%D8%A7%D9%84%D8%AD%D8%AC%D8%A9%3B052-020%2C%D8%AF%D8%A8%D8%B9%D8%A7%D9%84%3B052-021%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%85%D8%B7%D8%AD%D9%86%D8%A9%3B053-001%2C%D8%BA%D9%88%D8%B3%D8%B7%D8%A7%3B053-002%2C%D8%B1%D8%A7%D8%B3+%D8%A7%D9%84%D8%AD%D8%B1%D9%81%3B053-003%2C%D8%B9%D9%84%D9%85%D8%A7%D8%AA%2F%D8%AC%3B053-004%2C%D8%AD%D9%85%D9%84%D8%A7%D9%8A%D8%A7%3B053-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D8%BA%D8%B1%D8%A8%D9%8A%3B053-006%2C%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%D9%87%3B053-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D8%B6%D9%87%D8%B1%3B053-010%2C%D8%A7%D9%84%D9%87%D8%B1%D9%8A%3B053-011%2C%D9%83%D9%81%D8%B1%D8%AD%D8%A7%D8%AA%D8%A7%3B053-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D9%86%D8%B9%D8%A7%D9%85%3B053-016%2C%D9%85%D8%A7%D8%B3%D8%A7%3B053-019%2C%D8%A7%D9%84%D8%AE%D8%B1%D8%A7%D9%8A%D8%A8%3B053-020%2C%D8%AF%D8%B1%D8%AF%D8%BA%D9%8A%D8%A7%3B053-021%2C%D9%85%D8%B4%D9%85%D9%88%D8%B4%D8%A9%3B054-001%2C%D9%81%D8%A7%D8%B1%D9%8A%D8%A7%3B054-002%2C%D8%B1%D8%A7%D8%B3+%D8%A7%D9%84%D9%85%D8%AA%D9%86%3B054-003%2C%D8%B9%D9%84%D9%85%D8%A7%D8%AA%2F%D8%B4%3B054-004%2C%D8%AF%D9%8A%D8%B1+%D8%B4%D9%85%D8%B1%D8%A7%3B054-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D9%88%D8%B3%D8%B7%D8%A7%D9%86%D9%8A%3B054-006%2C%D8%A7%D9%84%D8%AC%D8%A7%D9%87%D9%84%D9%8A%D8%A9%3B054-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%D8%A9%3B054-010%2C%D8%A8%D8%AC%D8%AF%D8%B1%D9%81%D9%84%3B054-011%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%81%D8%B1%D9%8A%D8%AF%D9%8A%D8%B3%3B054-015%2C%D8%A7%D9%84%D9%86%D9%82%D8%B1%D9%87%3B054-016%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%B9%D9%86%D8%AC%D8%B1%3B054-020%2C%D8%AF%D9%8A%D8%B1+%D8%B9%D8%A7%D9%85%D8%B5%3B054-021%2C%D9%85%D9%84%D9%8A%D8%AE%3B055-001%2C%D9%81%D8%AA%D9%82%D8%A7%3B055-002%2C%D8%B1%D9%88%D9%8A%D8%B3%D8%A9+%D8%A7%D9%84%D8%A8%D9%84%D9%88%D8%B7%3B055-003%2C%D8%B9%D9%85%D8%B4%D9%8A%D8%AA%3B055-004%2C%D8%AF%D9%8A%D9%83+%D8%A7%D9%84%D9%85%D8%AD%D8%AF%D9%8A%3B055-005%2C%D8%B9%D8%A8%D9%8A%D9%87%3B055-006%2C%D8%A7%D9%84%D8%AC%D9%84%D9%8A%D9%84%D9%8A%D8%A9%3B055-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%A7%D9%84%D9%82%D8%B7%D9%84%D8%A8%D9%87%3B055-010%2C%D8%A8%D8%B4%D8%AA%D9%88%D8%AF%D8%A7%D8%B1%3B055-015%2C%D8%A7%D9%84%D9%8A%D9%85%D9%88%D9%86%D9%87%3B055-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D8%B9%D9%84%D9%82%D8%A9%3B055-020%2C%D8%AF%D9%8A%D8%B1+%D9%82%D8%A7%D9%86%D9%88%D9%86+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B055-021%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A8%D8%B9%D9%86%D9%82%D9%88%D8%AF%D9%8A%D9%86%3B056-001%2C%D9%81%D9%8A%D8%B7%D8%B1%D9%88%D9%86%3B056-002%2C%D8%B2%D9%86%D8%AF%D9%88%D9%82%D8%A9%3B056-003%2C%D8%B9%D9%86%D8%A7%D9%8A%D8%A7+%D9%88%D9%83%D9%81%D8%B1%D8%A8%D8%B9%D8%A7%D9%84%3B056-004%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D8%AE%D8%B1%D8%A7%D8%A8%3B056-005%2C%D8%B9%D8%B1%D9%85%D9%88%D9%86%3B056-006%2C%D8%A7%D9%84%D8%AC%D9%85%D9%8A%D9%84%D9%8A%D8%A9%3B056-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D8%BA%D9%88%D8%A7%D9%8A%D8%A7%3B056-010%2C%D8%A8%D8%B4%D8%B9%D9%84%D9%87%3B056-015%2C%D8%A7%D9%8A%D8%B9%D8%A7%D8%AA%3B056-016%2C%D9%85%D9%83%D8%B3%D8%A9%3B056-020%2C%D8%AF%D9%8A%D8%B1+%D9%82%D8%A7%D9%86%D9%88%D9%86+%D8%B1%D8%A3%D8%B3+%D8%A7%D9%84%D8%B9%D9%8A%D9%86%3B056-021%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AC%D8%B2%D9%8A%D9%86%3B057-001%2C%D9%83%D9%81%D8%B1%D8%AA%D9%8A%D9%87%3B057-002%2C%D8%B3%D8%A8%D9%86%D9%8A%D9%87%3B057-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AF%D9%84%D8%A8%D9%87%3B057-004%2C%D8%B1%D9%88%D9%85%D9%8A%D9%87%3B057-005%2C%D8%B9%D9%8A%D8%AA%D8%A7%D8%AA%3B057-006%2C%D8%A7%D9%84%D8%AC%D9%8A%D9%87%3B057-007%2C%D8%A7%D9%84%D9%82%D8%A8%D9%8A%D8%A7%D8%AA+%D9%85%D8%B1%D8%AA%D9%85%D9%88%D8%B1%D9%87%3B057-010%2C%D8%A8%D9%82%D8%B3%D9%85%D9%8A%D8%A7%3B057-015%2C%D8%A8%D8%AA%D8%AF%D8%B9%D9%8A%3B057-016%2C%D9%86%D9%8A%D8%AD%D8%A7%3B057-020%2C%D8%AF%D9%8A%D8%B1+%D9%83%D9%8A%D9%81%D8%A7%3B058-001%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A8%D9%8A%D8%A7%D9%86%3B058-002%2C%D8%B4%D9%88%D9%8A%D8%AA%3B058-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B4%D9%84%D8%A7%D9%84%3B058-004%2C%D8%B2%D8%A8%D9%88%D8%BA%D8%A7%3B058-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9%3B058-006%2C%D8%A7%D9%84%D8%AE%D8%B1%D9%8A%D8%A8%D8%A9%3B058-007%2C%D8%A7%D9%84%D9%82%D8%B1%D9%82%D9%81%3B058-010%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D9%84%D8%A7%D9%84%D8%A7%3B058-015%2C%D8%A8%D8%AF%D9%86%D8%A7%D9%8A%D9%84%3B058-016%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AF%D9%84%D9%85%3B058-020%2C%D8%B1%D8%B4%D9%83%D9%86%D8%A7%D9%86%D9%8A%D8%A9%3B059-001%2C%D9%85%D8%B9%D8%B1%D8%A7%D8%A8%3B059-002%2C%D8%B5%D9%84%D9%8A%D9%85%D8%A7%3B059-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%D8%A9%3B059-004%2C%D8%B2%D8%B1%D8%B9%D9%88%D9%86%3B059-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AD%D9%84%D8%B2%D9%88%D9%86%3B059-006%2C%D8%A7%D9%84%D8%AF%D8%A7%D9%85%D9%88%D8%B1%3B059-007%2C%D8%A7%D9%84%D9%82%D8%B1%D9%86%D8%A9%3B059-010%2C%D8%AA%D8%AD%D9%88%D9%85%3B059-015%2C%D8%A8%D8%B1%D9%82%D8%A7%3B059-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B9%D8%B1%D8%A7%D9%8A%D8%B4%3B059-020%2C%D8%B2%D8%A8%D9%82%D9%8A%D9%86%3B060-001%2C%D9%85%D9%8A%D8%B1%D9%88%D8%A8%D8%A7%3B060-002%2C%D8%B9%D8%A7%D8%B1%D9%8A%D8%A7%3B060-003%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%BA%D9%88%D9%8A%D8%A8%D9%87%3B060-004%2C%D8%B2%D9%83%D8%B1%D9%8A%D8%AA%3B060-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%D8%A9%3B060-006%2C%D8%A7%D9%84%D8%AF%D8%A8%D9%8A%D9%87%3B060-007%2C%D8%A7%D9%84%D9%82%D8%B1%D9%8A%D8%A7%D8%AA%3B060-010%2C%D8%AA%D9%86%D9%88%D8%B1%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B060-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%A7%D9%84%D9%8A%D9%88%D9%86%D8%B3%D9%8A%D8%A9%3B060-016%2C%D9%8A%D9%88%D8%BA%D9%88%D9%86+%D8%A7%D9%88%D9%84%D9%88%D9%83%3B060-020%2C%D8%B3%D9%84%D8%B9%D8%A7%3B061-001%2C%D9%86%D9%87%D8%B1+%D8%A7%D9%84%D8%B0%D9%87%D8%A8%3B061-002%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B1%D9%85%D8%A7%D9%86%D8%A9%3B061-003%2C%D8%B9%D9%8A%D9%86+%D8%AC%D8%B1%D9%8A%D9%86%3B061-004%2C%D8%B3%D8%A7%D9%82%D9%8A%D8%A9+%D8%A7%D9%84%D9%85%D8%B3%D9%83%3B061-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D8%B1%D8%AF%D9%8A%D8%B3%3B061-006%2C%D8%A7%D9%84%D8%B1%D9%85%D9%8A%D9%84%D9%87%3B061-007%2C%D8%A7%D9%84%D9%82%D9%84%D9%8A%D8%B9%D8%A7%D8%AA%3B061-010%2C%D8%AA%D9%86%D9%88%D8%B1%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B061-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B4%D8%B1%D9%82%D9%8A%3B061-016%2C%D8%B2%D8%AD%D9%84%D8%A9+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B061-020%2C%D8%B4%D9%85%D8%B9%3B062-001%2C%D9%87%D8%B1%D9%87%D8%B1%D9%8A%D8%A7+%D9%88%D8%A7%D9%84%D9%82%D8%B7%D9%8A%D9%86%3B062-002%2C%D8%B9%D9%8A%D9%86+%D9%85%D9%88%D9%81%D9%82%3B062-003%2C%D8%B9%D9%8A%D9%86+%D9%83%D9%81%D8%A7%D8%B9%3B062-004%2C%D8%B3%D8%AF+%D8%A7%D9%84%D8%A8%D9%88%D8%B4%D8%B1%D9%8A%D8%A9%3B062-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%85%D8%B1%D8%AC%3B062-006%2C%D8%A7%D9%84%D8%B2%D8%B9%D8%B1%D9%88%D8%B1%D9%8A%D8%A9%3B062-007%2C%D8%A7%D9%84%D9%82%D9%86%D8%B7%D8%B1%D8%A9%3B062-010%2C%D8%AA%D9%88%D9%84%D8%A7%3B062-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B4%D9%85%D9%8A%D8%B3%3B062-020%2C%D8%B4%D9%8A%D8%AD%D9%8A%D9%86%3B063-001%2C%D9%88%D8%B7%D9%89+%D8%A7%D9%84%D8%AC%D9%88%D8%B2%3B063-002%2C%D9%81%D8%A7%D9%84%D9%88%D8%BA%D8%A7%3B063-003%2C%D8%BA%D8%B1%D8%B2%D9%88%D8%B2%3B063-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%84%D8%AF%D9%87%3B063-005%2C%D8%B9%D9%8A%D9%86+%D8%AA%D8%B1%D8%A7%D8%B2%3B063-006%2C%D8%A7%D9%84%D8%B3%D9%85%D9%82%D8%A7%D9%86%D9%8A%D8%A9%3B063-007%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B063-010%2C%D8%B1%D8%A7%D9%85%3B063-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B4%D9%85%D9%8A%D8%B3+%D8%BA%D8%B1%D8%A8%D9%8A%3B063-020%2C%D8%B5%D8%AF%D9%8A%D9%82%D9%8A%D9%86%3B064-001%2C%D9%8A%D8%AD%D8%B4%D9%88%D8%B4%3B064-002%2C%D9%82%D8%A8%D9%8A%D8%B9%3B064-003%2C%D8%BA%D8%B1%D9%81%D9%8A%D9%86%3B064-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%AC%D8%B3%D8%B1+%D8%A7%D9%84%D8%A8%D8%A7%D8%B4%D8%A7%3B064-005%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B064-006%2C%D8%A7%D9%84%D9%81%D8%B1%D9%8A%D8%AF%D9%8A%D8%B3%3B064-007%2C%D8%A7%D9%84%D9%83%D9%88%D8%A7%D8%B4%D8%B1%D9%87%3B064-010%2C%D8%B6%D9%87%D8%B1+%D8%A7%D8%A8%D9%88+%D9%8A%D8%A7%D8%BA%D9%8A%3B064-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%A8%D9%86%D9%8A%D9%87%3B064-020%2C%D8%B5%D8%B1%D9%8A%D9%81%D8%A7%3B065-001%2C%D8%A8%D8%B2%D9%85%D8%A7%D8%B1%3B065-002%2C%D9%82%D8%AA%D8%A7%D9%84%D9%87%3B065-003%2C%D8%BA%D9%84%D8%A8%D9%88%D9%86%3B065-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%AF%D9%8A%D8%AF%3B065-005%2C%D8%B9%D9%8A%D9%86+%D8%AF%D8%A7%D8%B1%D9%87%3B065-006%2C%D8%A7%D9%84%D9%81%D9%88%D8%A7%D8%B1%D8%A9%3B065-007%2C%D8%A7%D9%84%D9%85%D8%AC%D8%AF%D9%84%3B065-010%2C%D9%83%D9%88%D8%B1%3B065-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AC%D9%88%D8%B2%3B065-020%2C%D8%B5%D9%88%D8%B1%3B066-001%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%B5%D8%AE%D8%B1%3B066-002%2C%D9%82%D8%B1%D8%B7%D8%A7%D8%B6%D9%87%3B066-003%2C%D9%81%D8%AA%D8%B1%D9%8A%3B066-004%2C%D8%B3%D9%86+%D8%A7%D9%84%D9%81%D9%8A%D9%84+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AD%D8%B1%D8%AC%3B066-005%2C%D8%B9%D9%8A%D9%86+%D8%B9%D9%86%D9%88%D8%A8%3B066-006%2C%D8%A7%D9%84%D9%83%D8%AD%D9%84%D9%88%D9%86%D9%8A%D9%87%3B066-007%2C%D8%A7%D9%84%D9%85%D8%AD%D9%85%D8%B1%D8%A9%3B066-010%2C%D9%82%D9%86%D8%AF%D9%88%D9%84%D8%A7%3B066-015%2C%D8%A8%D8%B1%D9%8A%D8%AA%D8%A7%D9%84+%D8%BA%D8%B1%D8%A8%D9%8A%3B066-020%2C%D8%B7%D9%88%D8%B1%D8%A7%3B067-001%2C%D8%B3%D8%A7%D8%AD%D9%84+%D8%B9%D9%84%D9%85%D8%A7%3B067-002%2C%D9%82%D8%B1%D9%86%D8%A7%D9%8A%D9%84%3B067-003%2C%D9%81%D8%AF%D8%A7%D8%B1%3B067-004%2C%D8%B4%D8%B1%D9%8A%D9%86%3B067-005%2C%D8%B9%D9%8A%D9%86+%D9%83%D8%B3%D9%88%D8%B1%3B067-006%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D8%A9%3B067-007%2C%D8%A7%D9%84%D9%85%D8%B3%D8%B9%D9%88%D8%AF%D9%8A%D8%A9%3B067-010%2C%D8%A7%D8%AC%D8%AF%D8%A8%D8%B1%D8%A7%3B067-015%2C%D8%A8%D8%B4%D9%88%D8%A7%D8%AA%3B067-020%2C%D8%B7%D9%8A%D8%B1+%D8%AD%D8%B1%D9%81%D8%A7%3B068-001%2C%D8%BA%D8%A8%D8%A7%D9%84%D9%87%3B068-002%2C%D9%83%D9%81%D8%B1%D8%B3%D9%84%D9%88%D8%A7%D9%86%3B068-003%2C%D9%81%D8%B1%D8%A7%D8%AA%3B068-004%2C%D8%B4%D9%88%D9%8A%D8%A7%3B068-005%2C%D8%B9%D9%8A%D9%86%D8%A7%D8%A8%3B068-006%2C%D8%A7%D9%84%D9%85%D8%AD%D8%AA%D9%82%D8%B1%D8%A9+%D9%88%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D9%85%D8%AE%D9%84%D8%B5%3B068-007%2C%D8%A7%D9%84%D9%85%D9%82%D9%8A%D8%A8%D9%84%D8%A9%3B068-010%2C%D8%AC%D8%A8%D9%84%D8%A7%3B068-015%2C%D8%A8%D9%88%D8%AF%D8%A7%D9%8A%3B068-020%2C%D8%B7%D9%8A%D8%B1+%D9%81%D9%84%D8%B3%D9%8A%D9%87%3B069-001%2C%D9%83%D9%81%D8%B1%D9%8A%D8%A7%D8%B3%D9%8A%D9%86%3B069-002%2C%D9%83%D9%81%D8%B1%D8%B4%D9%8A%D9%85%D8%A7%3B069-003%2C%D9%81%D8%B1%D8%AD%D8%AA%3B069-004%2C%D8%B6%D9%87%D8%B1+%D8%A7%D9%84%D8%B5%D9%88%D8%A7%D9%86%3B069-005%2C%D8%B9%D8%A7%D9%84%D9%8A%D9%87+%D9%82%D8%A8%D9%84%D9%8A%3B069-006%2C%D8%A7%D9%84%D9%85%D8%AE%D8%AA%D8%A7%D8%B1%D8%A9%3B069-007%2C%D8%A7%D9%84%D9%85%D9%82%D9%8A%D8%B7%D8%B9%3B069-015%2C%D8%A8%D9%8A%D8%AA+%D8%B4%D8%A7%D9%85%D8%A7%3B069-020%2C%D8%A7%D9%84%D8%B9%D8%A8%D8%A7%D8%B3%D9%8A%D9%87%3B070-002%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%B4%D8%AD%D8%B1%D9%88%D8%B1+%D8%A7%D9%84%D8%B3%D9%81%D9%84%D9%89%3B070-003%2C%D9%81%D8%BA%D8%A7%D9%84%3B070-004%2C%D8%B9%D9%85%D8%A7%D8%B1%D8%A9+%D8%B4%D9%84%D9%87%D9%88%D8%A8%3B070-005%2C%D9%83%D9%81%D8%B1%D8%B9%D9%85%D9%8A%D9%87%3B070-006%2C%D8%A7%D9%84%D9%85%D8%B4%D8%B1%D9%81%3B070-007%2C%D8%A7%D9%84%D9%85%D9%88%D9%86%D8%B3%D9%87%3B070-015%2C%D8%A8%D9%8A%D8%AA+%D8%B5%D9%84%D9%8A%D8%A8%D9%8A%3B070-020%2C%D8%B9%D9%84%D9%85%D8%A7+%D8%A7%D9%84%D8%B4%D8%B9%D8%A8%3B071-002%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%B4%D8%AD%D8%B1%D9%88%D8%B1+%D8%A7%D9%84%D8%B9%D9%84%D9%8A%D8%A7%3B071-003%2C%D9%82%D8%B1%D8%B7%D8%A8%D8%A7+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%D8%A9%3B071-004%2C%D8%B9%D9%88%D9%83%D8%B1%3B071-005%2C%D9%83%D9%81%D8%B1%D9%85%D8%AA%D9%89%3B071-006%2C%D8%A7%D9%84%D9%85%D8%B7%D9%84%D8%A9%3B071-007%2C%D8%A7%D9%84%D9%86%D9%81%D9%8A%D8%B3%D8%A9%3B071-015%2C%D8%A8%D9%8A%D8%AA+%D9%85%D8%B4%D9%8A%D9%83%3B071-020%2C%D8%B9%D9%8A%D8%AA%D9%8A%D8%AA%3B072-002%2C%D8%A8%D8%B9%D8%A8%D8%AF%D8%A7+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A9%3B072-003%2C%D9%82%D8%B1%D8%B7%D8%A8%D8%A7+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%D8%A9%3B072-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D9%81%D8%A7%D8%AD%D8%A9%3B072-005%2C%D9%83%D9%8A%D9%81%D9%88%D9%86%3B072-006%2C%D8%A7%D9%84%D9%85%D8%B9%D9%86%D9%8A%D9%87%3B072-007%2C%D8%A7%D9%84%D9%86%D9%88%D8%B1%D9%87%3B072-015%2C%D8%AA%D9%85%D9%86%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B072-020%2C%D8%B9%D9%8A%D9%86+%D8%A7%D8%A8%D9%88+%D8%B9%D8%A8%D8%AF+%D8%A7%D9%84%D9%84%D9%87%3B073-002%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%84%D9%85%3B073-003%2C%D9%82%D8%B1%D9%82%D8%B1%D9%8A%D8%A7%3B073-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AE%D8%B1%D9%88%D8%A8%D8%A9%3B073-005%2C%D9%85%D8%AC%D8%AF%D9%84%D8%A8%D8%B9%D9%86%D8%A7%3B073-006%2C%D8%A7%D9%84%D9%85%D8%BA%D9%8A%D8%B1%D9%8A%D8%A9%3B073-007%2C%D8%A7%D9%84%D9%87%D8%AF%3B073-015%2C%D8%AA%D9%85%D9%86%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B073-020%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B2%D8%B1%D9%82%D8%A7%3B074-003%2C%D9%82%D9%87%D9%85%D8%B2%3B074-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B2%D9%8A%D8%AA%D9%88%D9%86%D8%A9%3B074-005%2C%D9%85%D8%AC%D8%AF%D9%84%D9%8A%D8%A7%3B074-006%2C%D8%A7%D9%84%D9%86%D8%A7%D8%B9%D9%85%D8%A9%3B074-007%2C%D8%A7%D9%8A%D9%84%D8%A7%D8%AA%3B074-015%2C%D8%AC%D8%A8%D8%B9%D8%A7%3B074-020%2C%D8%B9%D9%8A%D9%86+%D8%A8%D8%B9%D8%A7%D9%84%3B075-003%2C%D9%83%D9%81%D8%B1%D9%83%D8%AF%D9%87%3B075-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B3%D9%86%D8%AF%D9%8A%D8%A7%D9%86%D8%A9%3B075-005%2C%D9%85%D8%AD%D8%B7%D8%A9+%D8%A8%D8%AD%D9%85%D8%AF%D9%88%D9%86%3B075-006%2C%D8%A7%D9%84%D9%88%D8%B1%D8%AF%D8%A7%D9%86%D9%8A%D8%A9%3B075-007%2C%D8%A8%D8%A8%D9%86%D9%8A%D9%86%3B075-015%2C%D8%AC%D8%A8%D9%88%D9%84%D9%87%3B075-020%2C%D9%85%D8%AC%D8%AF%D9%84%D8%B2%D9%88%D9%86%3B076-003%2C%D9%83%D9%81%D8%B1%D9%85%D8%B3%D8%AD%D9%88%D9%86%3B076-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B5%D9%81%D8%B5%D8%A7%D9%81%3B076-005%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D9%86%D9%87%D8%B1%3B076-006%2C%D8%A7%D9%84%D9%88%D8%B1%D9%87%D8%A7%D9%86%D9%8A%D8%A9%3B076-007%2C%D8%A8%D8%B1%D8%A8%D8%A7%D8%B1%D9%87%3B076-015%2C%D8%AC%D9%86%D8%AA%D8%A7%3B076-020%2C%D9%85%D8%AD%D8%B1%D9%88%D9%86%D9%87%3B077-003%2C%D9%83%D9%81%D9%88%D9%86%3B077-004%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%82%D8%A8%D9%88%3B077-005%2C%D9%85%D8%B9%D8%B5%D8%B1%D9%8A%D8%AA%D9%8A%3B077-006%2C%D8%A8%D8%A7%D8%AA%D8%B1%3B077-007%2C%D8%A8%D8%B1%D8%AC+%D8%A7%D9%84%D8%B9%D8%B1%D8%A8%3B077-015%2C%D8%AD%D8%A7%D9%85%3B077-020%2C%D9%85%D8%B1%D9%88%D8%AD%D9%8A%D9%86%3B078-003%2C%D9%84%D8%A7%D8%B3%D8%A7%3B078-004%2C%D8%B9%D9%8A%D9%86+%D8%B3%D8%B9%D8%A7%D8%AF%D9%87%3B078-006%2C%D8%A8%D8%AA%D9%84%D9%88%D9%86%3B078-007%2C%D8%A8%D8%B1%D9%82%D8%A7%D9%8A%D9%84%3B078-015%2C%D8%AD%D8%B1%D8%A8%D8%AA%D8%A7%3B078-020%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D9%85%D8%B4%D8%B1%D9%81%3B079-003%2C%D9%84%D8%AD%D9%81%D8%AF%3B079-004%2C%D8%B9%D9%8A%D9%86+%D8%B9%D8%A7%D8%B1%3B079-006%2C%D8%A8%D8%B1%D8%AC%D8%A7%3B079-007%2C%D8%A8%D8%B2%D8%A7%D9%84%3B079-015%2C%D8%AD%D8%B2%D9%8A%D9%86%3B079-020%2C%D9%85%D8%B9%D8%B1%D9%83%D8%A9%3B080-003%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B3%D9%8A%D8%A7%D8%AF%3B080-004%2C%D8%B9%D9%8A%D9%86+%D8%B9%D9%84%D9%82%3B080-006%2C%D8%A8%D8%B1%D9%8A%D8%AD%3B080-007%2C%D8%A8%D8%B2%D8%A8%D9%8A%D9%86%D8%A7%3B080-015%2C%D8%AD%D9%84%D8%A8%D8%AA%D8%A7%3B080-020%2C%D9%85%D8%B9%D8%B1%D9%88%D8%A8%3B081-003%2C%D9%85%D8%B4%D8%A7%D9%86%3B081-004%2C%D8%B9%D9%8A%D9%86%D8%B7%D9%88%D8%B1%D8%A9%3B081-006%2C%D8%A8%D8%B3%D8%A7%D8%A8%D8%A7%3B081-007%2C%D8%A8%D9%82%D8%B1%D8%B2%D9%84%D8%A7%3B081-015%2C%D8%AD%D9%88%D8%B1+%D8%AA%D8%B9%D9%84%D8%A7%3B081-020%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AC%D9%8A%D9%84%D9%88%3B082-003%2C%D9%85%D8%B4%D9%85%D8%B4%3B082-004%2C%D9%82%D8%B1%D9%86%D8%A9+%D8%A7%D9%84%D8%AD%D9%85%D8%B1%D8%A7%3B082-006%2C%D8%A8%D8%B4%D8%AA%D9%81%D9%8A%D9%86%3B082-007%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AD%D8%A7%D8%AC%3B082-015%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B0%D9%87%D8%A8%3B082-020%2C%D9%8A%D8%A7%D9%86%D9%88%D8%AD%3B083-003%2C%D9%85%D8%B9%D8%A7%D8%AF%3B083-004%2C%D9%82%D8%B1%D9%86%D8%A9+%D8%B4%D9%87%D9%88%D8%A7%D9%86%3B083-006%2C%D8%A8%D8%B7%D9%85%D8%A9%3B083-007%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AD%D9%88%D8%B4%3B083-015%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D8%B1%D8%A7%D9%81%D9%82%D8%A9%3B084-003%2C%D9%85%D9%8A%D9%81%D9%88%D9%82%3B084-004%2C%D9%82%D9%86%D8%A7%D8%A8%D8%A9+%D8%A8%D8%B1%D9%85%D8%A7%D9%86%D8%A7%3B084-006%2C%D8%A8%D8%B9%D8%A7%D8%B5%D9%8A%D8%B1%3B084-007%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%8A%D9%88%D8%A8%3B084-015%2C%D8%AD%D9%88%D8%B4+%D8%A7%D9%84%D9%86%D8%A8%D9%8A%3B085-003%2C%D9%86%D9%87%D8%B1+%D8%A7%D8%A8%D8%B1%D8%A7%D9%87%D9%8A%D9%85%3B085-004%2C%D9%82%D9%86%D8%A7%D8%A8%D8%A9+%D8%B5%D9%84%D9%8A%D9%85%D8%A7%3B085-006%2C%D8%A8%D8%B9%D8%B0%D8%B1%D8%A7%D9%86%3B085-007%2C%D8%A8%D9%8A%D8%AA+%D8%BA%D8%B7%D8%A7%D8%B3%3B085-015%2C%D8%AD%D9%88%D8%B4+%D8%A8%D8%B1%D8%AF%D9%89%3B086-003%2C%D9%87%D8%A7%D8%A8%D9%8A%D9%84%3B086-004%2C%D9%83%D9%81%D8%B1%D8%AA%D9%8A%D9%87%3B086-006%2C%D8%A8%D8%B9%D9%82%D9%84%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B086-007%2C%D8%A8%D9%8A%D8%AA+%D9%85%D9%84%D8%A7%D8%AA%3B086-015%2C%D8%AD%D9%88%D8%B4+%D8%AA%D9%84+%D8%B5%D9%81%D9%8A%D8%A9%3B087-003%2C%D9%8A%D8%A7%D9%86%D9%88%D8%AD%3B087-004%2C%D9%83%D9%81%D8%B1%D8%B9%D9%82%D8%A7%D8%A8%3B087-006%2C%D8%A8%D8%B9%D9%82%D9%84%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7%3B087-007%2C%D8%A8%D9%8A%D8%AA+%D9%8A%D9%88%D9%86%D8%B3%3B087-015%2C%D8%AD%D9%88%D8%B4+%D8%B3%D9%86%D9%8A%D8%AF%3B088-004%2C%D9%85%D8%A7%D8%B1+%D8%A8%D8%B7%D8%B1%D8%B3+%D9%83%D8%B1%D9%85+%D8%A7%D9%84%D8%AA%D9%8A%D9%86%3B088-006%2C%D8%A8%D9%82%D8%B9%D8%A7%D8%AA%D8%A7%3B088-007%2C%D8%A8%D9%8A%D9%86%D9%88%3B088-015%2C%D8%A7%D9%84%D8%B1%D9%8A%D8%B4+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B089-004%2C%D9%85%D8%A7%D8%B1+%D8%B4%D8%B9%D9%8A%D8%A7+%D9%88%D8%A7%D9%84%D9%85%D8%B2%D9%83%D9%87%3B089-006%2C%D8%A8%D9%83%D9%8A%D9%81%D8%A7%3B089-007%2C%D8%AA%D8%A7%D8%B4%D8%B9%3B089-015%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B5%D9%84%D8%AD%3B090-004%2C%D9%85%D8%A7%D8%B1+%D9%85%D8%AE%D8%A7%D9%8A%D9%84+%D8%A8%D9%86%D8%A7%D8%A8%D9%8A%D9%84%3B090-006%2C%D8%A8%D9%86%D9%88%D9%8A%D8%AA%D9%8A%3B090-007%2C%D8%AA%D9%83%D8%B1%D9%8A%D8%AA%3B090-015%2C%D8%AD%D9%8A+%D8%A7%D9%84%D8%B9%D8%A8%D8%A7%D8%B3%D9%8A%D9%87%3B091-004%2C%D9%85%D8%A7%D8%B1+%D9%85%D9%88%D8%B3%D9%89+%D8%A7%D9%84%D8%AF%D9%88%D8%A7%D8%B1%3B091-006%2C%D8%A8%D9%8A%D8%AA+%D8%A7%D9%84%D8%AF%D9%8A%D9%86%3B091-007%2C%D8%AA%D9%84%D8%A8%D9%8A%D8%B1%D8%A9%3B091-015%2C%D8%AF%D8%A7%D8%B1+%D8%A7%D9%84%D9%88%D8%A7%D8%B3%D8%B9%D8%A9%3B092-004%2C%D9%85%D8%AC%D8%AF%D9%84+%D8%AA%D8%B1%D8%B4%D9%8A%D8%B4%3B092-006%2C%D8%A8%D9%8A%D9%82%D9%88%D9%86%3B092-007%2C%D8%AA%D9%84%D8%A9+%D9%88%D8%B4%D8%B7%D8%A7%D8%AD%D9%87%3B092-015%2C%D8%AF%D9%88%D8%B1%D8%B3+%D8%A7%D9%84%D8%B4%D8%AD%D8%A7%D8%AF%D9%8A%D9%87%3B093-004%2C%D9%85%D8%B1%D8%AC%D8%A8%D8%A7%3B093-006%2C%D8%AC%D8%A8%D8%A7%D8%B9%3B093-007%2C%D8%AA%D9%84%D8%AD%D9%85%D9%8A%D8%B1%D8%A9%3B093-015%2C%D8%AF%D9%88%D8%B1%D8%B3+%D8%AD%D9%8A+%D8%A7%D9%84%D8%A8%D9%8A%D8%B1%3B094-004%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%86%D8%A7%D8%A8%D9%8A%D9%84%3B094-006%2C%D8%AC%D8%AF%D8%B1%D8%A7+-+%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B2%D9%8A%D9%86%D8%A9%3B094-007%2C%D8%AA%D9%84%D8%B9%D8%A8%D8%A7%D8%B3+%D8%B4%D8%B1%D9%82%D9%8A%3B094-015%2C%D8%AF%D9%88%D8%B1%D8%B3+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%D8%A9%3B095-004%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D9%8A%D8%B4%D9%88%D8%B9%3B095-006%2C%D8%AC%D8%AF%D9%8A%D8%AF%D9%87+%D8%A7%D9%84%D8%B4%D9%88%D9%81%3B095-007%2C%D8%AA%D9%84%D8%B9%D8%A8%D8%A7%D8%B3+%D8%BA%D8%B1%D8%A8%D9%8A%3B095-015%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D8%A7%D8%AD%D9%85%D8%B1%3B096-004%2C%D9%85%D8%B4%D9%8A%D8%AE%D8%A7%3B096-006%2C%D8%AC%D9%88%D9%86%3B096-007%2C%D8%AA%D9%84%D9%85%D8%B9%D9%8A%D8%A7%D9%86%3B096-015%2C%D8%B1%D8%A7%D8%B3+%D8%A8%D8%B9%D9%84%D8%A8%D9%83%3B097-004%2C%D9%86%D8%A7%D8%A8%D9%8A%D9%87%3B097-006%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A7%D9%84%D9%86%D8%A7%D8%B9%D9%85%D8%A9%3B097-007%2C%D8%AC%D8%A8%D8%B1%D8%A7%D8%A6%D9%8A%D9%84%3B097-015%2C%D8%B1%D9%85%D8%A7%D8%B3%D8%A7%3B098-004%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%83%D8%B1%D9%85%3B098-006%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%A8%D8%B9%D8%A7%D8%B5%D9%8A%D8%B1%3B098-007%2C%D8%AC%D8%AF%D9%8A%D8%AF%D8%A9+%D8%A7%D9%84%D9%82%D9%8A%D8%B7%D8%B9%3B098-015%2C%D8%B1%D9%8A%D8%AD%D8%A7%3B099-004%2C%D9%88%D8%B7%D9%89+%D8%A7%D9%84%D9%85%D8%B1%D9%88%D8%AC%3B099-006%2C%D8%AD%D8%A7%D8%B1%D8%A9+%D8%AC%D9%86%D8%AF%D9%84%3B099-007%2C%D8%AD%D8%A8%D8%B4%D9%8A%D8%AA%3B099-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%AA%D8%AD%D8%AA%D8%A7%3B100-004%2C%D8%A8%D8%B3%D9%83%D9%86%D8%AA%D8%A7+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B100-006%2C%D8%AD%D8%B5%D8%B1%D9%88%D8%AA%3B100-007%2C%D8%AD%D8%B1%D8%A7%D8%B1%3B100-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%B4%D8%B1%D9%82%D9%8A%3B101-004%2C%D8%A8%D8%B3%D9%83%D9%86%D8%AA%D8%A7+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B101-006%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%A8%D8%B3%D8%B1%D9%8A%3B101-007%2C%D8%AD%D9%83%D8%B1+%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B7%D8%A7%D8%A8%D8%A7%3B101-015%2C%D8%B3%D8%B1%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D9%81%D9%88%D9%82%D8%A7+%D8%BA%D8%B1%D8%A8%D9%8A%3B102-006%2C%D8%AF%D8%A7%D8%B1%D9%8A%D8%A7%3B102-007%2C%D8%AD%D9%83%D8%B1+%D8%A7%D9%84%D8%B6%D8%A7%D9%87%D8%B1%D9%8A%3B102-015%2C%D8%B4%D8%B9%D8%AB+%D8%AD%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D8%B9%3B103-006%2C%D8%AF%D9%84%D9%87%D9%88%D9%86%3B103-007%2C%D8%AD%D9%84%D8%A8%D8%A7%3B103-015%2C%D8%B4%D8%B9%D8%AB+%D8%AD%D9%8A+%D8%A7%D9%84%D8%B6%D9%87%D8%B1%3B104-006%2C%D8%AF%D9%85%D9%8A%D8%AA%3B104-007%2C%D8%AD%D9%86%D9%8A%D8%AF%D8%B1%3B104-015%2C%D8%B4%D9%84%D9%8A%D9%81%D8%A7%3B105-006%2C%D8%AF%D9%8A%D8%B1+%D8%A7%D9%84%D9%82%D9%85%D8%B1%3B105-007%2C%D8%AD%D9%8A%D8%B2%D9%88%D9%82%3B105-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B106-007%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%AF%D8%A7%D9%88%D9%88%D8%AF%3B106-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B107-007%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%B4%D8%A7%D8%B1%3B107-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B108-007%2C%D8%AE%D8%B1%D8%A8%D8%A9+%D8%A7%D9%84%D8%AC%D8%B1%D8%AF%3B108-015%2C%D8%B5%D8%A8%D9%88%D8%A8%D8%A7%3B109-007%2C%D8%AE%D8%B1%D9%8A%D8%A8%D8%A9+%D8%A7%D9%84%D8%AC%D9%86%D8%AF%D9%8A%3B109-015%2C%D8%B5%D9%81%D8%B1%D8%A7%3B110-007%2C%D8%AF%D8%A7%D8%B1%D9%8A%D9%86%3B110-015%2C%D8%B7%D8%A7%D8%B1%D9%8A%D8%A7+%D8%A7%D9%84%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B111-007%2C%D8%AF%D9%86%D8%A8%D9%88%3B111-015%2C%D8%B7%D8%A7%D8%B1%D9%8A%D8%A7+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B112-007%2C%D8%AF%D9%88%D9%8A%D8%B1+%D8%B9%D8%AF%D9%88%D9%8A%D9%87%3B112-015%2C%D8%B7%D9%81%D9%8A%D9%84%3B113-007%2C%D8%AF%D9%8A%D8%B1+%D8%AC%D9%86%D9%8A%D9%86%3B113-015%2C%D8%B7%D9%84%D9%8A%D8%A7%3B114-007%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D8%AD%D8%A8%D8%A7%D9%84%D8%B5%D8%A9%3B114-015%2C%D8%B9%D8%B1%D8%B3%D8%A7%D9%84+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B115-007%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D8%AD%D8%B5%D9%86%D9%8A%D8%A9%3B115-015%2C%D8%B9%D8%B1%D8%B3%D8%A7%D9%84+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B116-007%2C%D8%B0%D9%88%D9%82+%D8%A7%D9%84%D9%85%D9%82%D8%B4%D8%B1%D9%8A%D9%86%3B116-015%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B3%D9%88%D8%AF%D8%A7%D8%A1%3B117-007%2C%D8%B0%D9%88%D9%82+%D8%AD%D8%AF%D8%A7%D8%B1%D8%A9%3B117-015%2C%D8%B9%D9%8A%D9%86+%D8%A8%D9%88%D8%B1%D8%B6%D8%A7%D9%8A%3B118-007%2C%D8%B1%D8%AD%D8%A8%D8%A9%3B118-015%2C%D8%B9%D9%8A%D9%86%D8%A7%D8%AA%D8%A7%3B119-007%2C%D8%B1%D9%85%D8%A7%D8%AD%3B119-015%2C%D9%81%D9%84%D8%A7%D9%88%D9%8A%3B120-007%2C%D8%B3%D8%B1%D8%A7%D8%B1%3B120-015%2C%D9%82%D8%B1%D8%AD%D8%A7%3B121-007%2C%D8%B3%D8%B9%D8%AF%D9%8A%D9%86%3B121-015%2C%D9%82%D8%B5%D8%B1%D9%86%D8%A8%D8%A7%3B122-007%2C%D8%B3%D9%81%D9%8A%D9%86%D8%A9+%D8%A7%D9%84%D8%AF%D8%B1%D9%8A%D8%A8%3B122-015%2C%D9%82%D9%84%D8%AF+%D8%A7%D9%84%D8%B3%D8%A8%D8%B9%3B123-007%2C%D8%B3%D9%81%D9%8A%D9%86%D8%A9+%D8%A7%D9%84%D9%82%D9%8A%D8%B7%D8%B9%3B123-015%2C%D9%82%D9%84%D8%B9%D9%87%3B124-007%2C%D8%B3%D9%8A%D8%B3%D9%88%D9%82%3B124-015%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A7%D9%86%3B125-007%2C%D8%B4%D8%A7%D9%86%3B125-015%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A7%D9%86+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B126-007%2C%D8%B4%D8%AF%D8%B1%D9%87%3B126-015%2C%D9%85%D8%AC%D8%AF%D9%84%D9%88%D9%86%3B127-007%2C%D8%B4%D8%B1%D8%A8%D9%8A%D9%84%D8%A7%3B127-015%2C%D9%85%D8%AD%D9%84%D8%A9+%D8%A7%D9%84%D9%85%D8%B3%D9%8A%D8%AD%D9%8A%D9%8A%D9%86%3B128-007%2C%D8%B4%D9%8A%D8%AE%D9%84%D8%A7%D8%B1%3B128-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A2%D9%84+%D8%B3%D9%88%D9%8A%D8%AF%D8%A7%D9%86%3B129-007%2C%D8%B8%D9%87%D8%B1+%D8%A7%D9%84%D9%84%D9%8A%D8%B3%D9%8A%D9%86%D8%A9%3B129-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D8%A8%D9%88+%D8%B5%D9%84%D9%8A%D8%A8%D9%8A%3B130-007%2C%D8%B9%D8%AF%D8%A8%D9%84%3B130-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%AA%D9%88%D8%AA%3B131-007%2C%D8%B9%D9%83%D8%A7%D8%B1+%D8%A7%D9%84%D8%B9%D8%AA%D9%8A%D9%82%D8%A9%3B131-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B3%D9%8A%D8%AF%3B132-007%2C%D8%B9%D9%85%D8%A7%D8%B1+%D8%A7%D9%84%D8%A8%D9%8A%D9%83%D8%A7%D8%AA%3B132-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A7%D9%84%D8%B6%D9%84%D9%8A%D9%84%3B133-007%2C%D8%B9%D9%86%D8%AF%D9%82%D8%AA%3B133-015%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%8A%D8%AA+%D9%85%D8%B7%D8%B1%3B134-007%2C%D8%B9%D9%8A%D8%A7%D8%AA%3B134-015%2C%D9%85%D8%B5%D9%86%D8%B9+%D8%A7%D9%84%D8%B2%D9%87%D8%B1%D9%87%3B135-007%2C%D8%B9%D9%8A%D8%AF%D9%85%D9%88%D9%86%3B135-015%2C%D9%85%D9%82%D8%B1%D8%A7%D9%82%3B136-007%2C%D8%B9%D9%8A%D9%86+%D8%A7%D9%84%D8%B2%D9%8A%D8%AA%3B136-015%2C%D9%85%D9%82%D9%86%D9%87%3B137-007%2C%D8%B9%D9%8A%D9%86+%D8%AA%D9%86%D8%AA%D8%A7%3B137-015%2C%D9%86%D8%A8%D8%AD%D8%A7%3B138-007%2C%D8%B9%D9%8A%D9%86+%D9%8A%D8%B9%D9%82%D9%88%D8%A8%3B138-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D8%A7%D9%84%D8%AD%D8%B1%D9%81%D9%88%D8%B4%3B139-007%2C%D8%B9%D9%8A%D9%88%D9%86+%D8%A7%D9%84%D8%BA%D8%B2%D9%84%D8%A7%D9%86%3B139-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D8%A7%D9%84%D9%85%D8%AD%D9%81%D8%A7%D8%B1%D8%A9%3B140-007%2C%D9%81%D8%B1%D9%8A%D8%AF%D9%8A%D8%B3%3B140-015%2C%D9%86%D8%A8%D8%AD%D8%A7+%D9%82%D9%84%D9%8A%D9%84%D9%87%3B141-007%2C%D9%81%D9%86%D9%8A%D8%AF%D9%82%3B141-015%2C%D9%86%D8%AD%D9%84%D9%87%3B142-007%2C%D9%82%D8%A8%D8%A9+%D8%B4%D9%85%D8%B1%D8%A7%3B142-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B2%D9%8A%D9%86%3B143-007%2C%D9%82%D8%A8%D8%B9%D9%8A%D8%AA%3B143-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D9%85%D8%B4%D9%85%D8%B4%D9%87%3B144-007%2C%D9%82%D8%A8%D9%88%D9%84%D8%A7%3B144-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D9%81%D8%B9%D8%B1%D8%A9%3B145-007%2C%D9%82%D8%B1%D8%AD%D9%87%3B145-015%2C%D9%8A%D8%AD%D9%81%D9%88%D9%81%D8%A7%3B146-007%2C%D9%82%D8%B4%D9%84%D9%82%3B146-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%AC%D9%86%D9%88%D8%A8%D9%8A%3B147-007%2C%D9%82%D9%86%D9%8A%D8%A9%3B147-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%B4%D8%B1%D9%82%D9%8A%3B148-007%2C%D9%83%D8%B1%D9%85+%D8%B9%D8%B5%D9%81%D9%88%D8%B1%3B148-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B149-007%2C%D9%83%D8%B1%D9%88%D9%85+%D8%B9%D8%B1%D8%A8%3B149-015%2C%D9%8A%D9%88%D9%86%D9%8A%D9%86+%D8%BA%D8%B1%D8%A8%D9%8A%3B150-007%2C%D9%83%D9%81%D8%B1%D8%AA%D9%88%D9%86%3B150-015%2C%D8%A7%D9%84%D9%83%D9%86%D9%8A%D8%B3%D9%87%3B151-007%2C%D9%83%D9%81%D8%B1%D8%AD%D8%B1%D9%87%3B151-015%2C%D8%A7%D9%84%D9%86%D8%A8%D9%8A+%D8%B4%D9%8A%D8%AA+%D8%AD%D9%8A+%D8%A7%D9%84%D8%BA%D8%B1%D8%A8%D9%8A%3B152-007%2C%D9%83%D9%81%D8%B1%D9%86%D9%88%D9%86%3B152-015%2C%D8%B2%D8%A8%D9%88%D8%AF%3B153-007%2C%D9%83%D9%88%D8%B4%D8%A7%3B153-015%2C%D8%B4%D9%85%D8%B3%D8%B7%D8%A7%D8%B1+%D8%A7%D9%84%D8%B4%D9%85%D8%A7%D9%84%D9%8A%3B154-007%2C%D9%85%D8%A7%D8%B1+%D8%AA%D9%88%D9%85%D8%A7%3B154-015%2C%D8%BA%D9%81%D8%B1%D9%87%3B155-007%2C%D9%85%D8%AC%D8%AF%D9%84%D8%A7%3B155-015%2C%D9%83%D9%81%D8%B1%D8%AF%D8%A8%D8%B4%3B156-007%2C%D9%85%D8%B1%D8%A7%D8%AD+%D8%A7%D9%84%D8%AE%D9%88%D8%AE%3B156-015%2C%D9%85%D8%B9%D8%B1%D8%A8%D9%88%D9%86%3B157-007%2C%D9%85%D8%B2%D8%B1%D8%B9%D8%A9+%D8%A8%D9%84%D8%AF%D8%A9%3B157-015%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%B5%D9%81%D8%A7+%D8%A7%D9%84%D8%B4%D8%B1%D9%82%D9%8A%3B158-007%2C%D9%85%D8%B4%D8%AA%D9%89+%D8%AD%D8%B3%D9%86%3B159-007%2C%D9%85%D8%B4%D8%AA%D9%89+%D8%AD%D9%85%D9%88%D8%AF%3B160-007%2C%D9%85%D8%B4%D8%AD%D8%A9%3B161-007%2C%D9%85%D8%B4%D9%85%D8%B4%3B162-007%2C%D9%85%D8%B4%D9%8A%D9%84%D8%AD%D8%A9+%D8%A7%D9%84%D8%AD%D8%A7%D9%83%D9%88%D8%B1%3B163-007%2C%D9%85%D9%85%D9%86%D8%B9%3B164-007%2C%D9%85%D9%86%D8%AC%D8%B2%3B165-007%2C%D9%85%D9%86%D9%8A%D8%A7%D8%B1%D8%A9%3B166-007%2C%D9%87%D9%8A%D8%AA%D9%84%D8%A7%3B167-007%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AC%D8%A7%D9%85%D9%88%D8%B3%3B168-007%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%A7%D9%84%D8%AD%D9%88%D8%B1%3B169-007%2C%D9%88%D8%A7%D8%AF%D9%8A+%D8%AE%D8%A7%D9%84%D8%AF%3B170-007%2C%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D8%B9%D9%8A%D8%A7%D8%B4%3B171-007%2C%D8%A7%D9%84%D8%A8%D9%82%D9%8A%D8%B9%D9%87%3B&hiddensearch=________&hiddenIdGenerated={id}&hiddenIDExpdate=&hiddenIdtyp={id_type}&frmIDExpdate=%24frmIDExpdate&frmCategory={category}&hiddenCategory={category}&frmreservednb=%24frmreservednb&frmcatTyp=Bronze&frmnb1=&frmnb2=&frmnb3=&frmnb4=&frmnb5=&frmnb6=&frmnb7=&frmnb8=&frmGSM={gsm}&frmFName={first_name}&frmFatherName={father_name}&frmLName={last_name}&frmMothername={mother_name}&frmdobDay={birth_day}&frmdobMonth={birth_month}&frmdobYear={birth_year}&frmCode={ref_code}&frmrefnb={ref_number}'
 
 booking_confirmation_payload = 'code={confirmation_code}&reservednb={gsm}&typ=3'
 
@@ -26,9 +35,9 @@ headers = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
     'Accept-Encoding': 'gzip, deflate, br, zstd',
-    'Referer': 'https://touch.com.lb/autoforms/portal/touch/onlinereservation',
+    'Referer': url,
     'Content-Type': 'application/x-www-form-urlencoded',
-    'Origin': 'https://touch.com.lb',
+    'Origin': '{0.scheme}://{0.netloc}'.format(urlsplit(url)),
     'Connection': 'keep-alive',
     'Upgrade-Insecure-Requests': '1',
     'Sec-Fetch-Dest': 'document',
@@ -39,20 +48,332 @@ headers = {
 }
 
 
+class PayloadTemplate:
+    """
+    A request body template split once into its encoded static segments and its placeholders, so that rendering it
+    is a bytes join without scanning or encoding the template again.
+    """
+
+    def __init__(self, template: str):
+        self.segments = []
+        self.fields = []
+        # The escaped braces split the literal text, so it is joined up to the next placeholder
+        literals = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if format_spec or conversion:
+                raise ValueError(f'Unsupported placeholder in payload template: {field_name}')
+            literals.append(literal)
+            if field_name is not None:
+                self.segments.append(''.join(literals).encode())
+                self.fields.append(field_name)
+                literals = []
+        self.segments.append(''.join(literals).encode())
+
+    def render(self, **values) -> bytes:
+        """
+        Render the template, the bytes values being inserted as they are and the other ones encoded from their string.
+
+        :Example:
+        >>> templates = [(booking_page_payload, booking_page_template), (gsm_booking_payload, gsm_booking_template),
+        ...              (booking_info_payload, booking_info_template),
+        ...              (booking_confirmation_payload, booking_confirmation_template)]
+        >>> values = {name: f'{name} é&{index}' for payload, template in templates
+        ...           for index, name in enumerate(template.fields)}
+        >>> [template.render(**values) == payload.format(**values).encode() for payload, template in templates]
+        [True, True, True, True]
+        >>> quoted_values = {name: quote(value) for name, value in values.items()}
+        >>> [template.render(**{name: quote_bytes(value) for name, value in values.items()})
+        ...  == payload.format(**quoted_values).encode() for payload, template in templates]
+        [True, True, True, True]
+        >>> PayloadTemplate('a={{b}}&c={c}').render(c=1)
+        b'a={b}&c=1'
+        >>> PayloadTemplate('a={a:>5}')
+        Traceback (most recent call last):
+        ...
+        ValueError: Unsupported placeholder in payload template: a
+        """
+        values = {name: value if isinstance(value, bytes) else str(value).encode() for name, value in values.items()}
+        parts = [self.segments[0]]
+        for field_name, segment in zip(self.fields, self.segments[1:]):
+            parts.append(values[field_name])
+            parts.append(segment)
+        return b''.join(parts)
+
+
+@lru_cache(maxsize=1024)
+def quote_bytes(value: str) -> bytes:
+    return quote(value).encode()
+
+
+booking_page_template = PayloadTemplate(booking_page_payload)
+gsm_booking_template = PayloadTemplate(gsm_booking_payload)
+booking_info_template = PayloadTemplate(booking_info_payload)
+booking_confirmation_template = PayloadTemplate(booking_confirmation_payload)
+
+
+@lru_cache
+def get_booking_page_body(category: str) -> bytes:
+    return booking_page_template.render(category=quote_bytes(category))
+
+
+connection_pool_size = 10
+poll_session: aiohttp.ClientSession | None = None
+
+
+def open_poll_session() -> aiohttp.ClientSession:
+    """
+    Create the session of the polls, owning the connection pool shared with the booking sessions. It must be created
+    and closed in the running event loop.
+    """
+    global poll_session
+    poll_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=connection_pool_size), headers=headers,
+                                         cookie_jar=aiohttp.CookieJar(unsafe=True))
+    return poll_session
+
+
+def create_session() -> aiohttp.ClientSession:
+    # The booking sessions share the connection pool of the poll session but each one has its own cookies, and closing
+    # them leaves the pool open
+    return aiohttp.ClientSession(connector=poll_session.connector, connector_owner=False, headers=headers,
+                                 cookie_jar=aiohttp.CookieJar(unsafe=True))
+
+
+def configure_connection_pool(pool_size: int):
+    """
+    :param pool_size: the count of the connections open at once, the requests waiting for one beyond it.
+    """
+    global connection_pool_size
+    connection_pool_size = pool_size
+
+
+# The count of the booking page requests sent, the ones of the polls, the hedges and the bookings together
+booking_page_requests = 0
+booking_page_requests_lock = threading.Lock()
+
+request_timeout = 10.0
+hedge_delay = None
+
+
+def configure_timeouts(timeout: float, hedge_after: float | None = None):
+    """
+    :param timeout: the longest wait in seconds for the connection and for each response read.
+    :param hedge_after: the delay in seconds after which a booking page request still waiting is sent again, or None
+    to never send it again.
+    """
+    global request_timeout, hedge_delay
+    request_timeout = timeout
+    hedge_delay = hedge_after
+
+
+def get_timeout(deadline: float | None = None) -> float:
+    """
+    Get the timeout of a request, shortened to end at the deadline.
+    :param deadline: the time.monotonic() time at which the whole operation must end.
+    """
+    if deadline is None:
+        return request_timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError('Deadline exceeded')
+    return min(request_timeout, remaining)
+
+
+def get_client_timeout(timeout: float | None = None) -> aiohttp.ClientTimeout:
+    # As with the requests timeouts, the longest wait for a connection and for each read, not for the whole response
+    timeout = timeout or request_timeout
+    return aiohttp.ClientTimeout(total=None, connect=timeout, sock_read=timeout)
+
+
+def count_booking_page_request():
+    global booking_page_requests
+    with booking_page_requests_lock:
+        booking_page_requests += 1
+
+
+def get_booking_page_request_count() -> int:
+    return booking_page_requests
+
+
+async def get_hedged(function, delay: float):
+    """
+    Call a read-only coroutine function and, if it has not returned after the delay, call it again concurrently. The
+    call still running when the other one succeeds is cancelled.
+    :return: the result of the call that succeeds first, the error of the last one if both fail.
+
+    :Example:
+    >>> delays = iter([0.5, 0])
+    >>> async def fetch():
+    ...     delay = next(delays)
+    ...     await asyncio.sleep(delay)
+    ...     return f'after {delay}'
+    >>> asyncio.run(get_hedged(fetch, 0.1))
+    'after 0'
+    >>> async def fail():
+    ...     await asyncio.sleep(0.2)
+    ...     raise aiohttp.ClientConnectionError('refused')
+    >>> asyncio.run(get_hedged(fail, 0.1))
+    Traceback (most recent call last):
+    ...
+    aiohttp.client_exceptions.ClientConnectionError: refused
+    """
+    pending = {asyncio.ensure_future(function())}
+    done, pending = await asyncio.wait(pending, timeout=delay)
+    if not done:
+        metrics.increment('hedged_requests_total')
+        pending.add(asyncio.ensure_future(function()))
+    try:
+        while True:
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+            if not pending:
+                raise task.exception()
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def configure_url(reservation_url: str):
+    """
+    Send the requests to another online reservation form URL, such as the one of the local simulator. It must be
+    called before the poll session is opened.
+    """
+    global url
+    url = reservation_url
+    headers['Referer'] = url
+    headers['Origin'] = '{0.scheme}://{0.netloc}'.format(urlsplit(url))
+
+
+class GSMSelectEnd(Exception):
+    pass
+
+
+class GSMOptionsParser(HTMLParser):
+    """Collect the options of the frmGSM select, stopping at the end of the select."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_select = False
+        self.in_option = False
+        self.option_value = ''
+        self.option_text = []
+        self.options = []
+
+    def close_option(self):
+        if self.in_option:
+            self.options.append((''.join(self.option_text).strip(), self.option_value))
+            self.in_option = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'select' and ('name', 'frmGSM') in attrs:
+            self.in_select = True
+        elif tag == 'option' and self.in_select:
+            self.close_option()
+            self.in_option = True
+            self.option_value = dict(attrs).get('value') or ''
+            self.option_text = []
+
+    def handle_data(self, data):
+        if self.in_option:
+            self.option_text.append(data)
+
+    def handle_endtag(self, tag):
+        if self.in_select and tag in ('option', 'select'):
+            self.close_option()
+            if tag == 'select':
+                raise GSMSelectEnd
+
+
+def get_gsm_options(page_content: str) -> tuple[list[int], dict[int, str]]:
+    """
+    Get the available numbers and their GSM IDs from the options of the frmGSM select, the options whose text is not a
+    number being skipped.
+    :return: the numbers in the order of the page, and a dict mapping them to their GSM ID.
+
+    :Example:
+    >>> page = '''<select name="CatReg"><option value="MICRO">MICRO</option><option value="71999999">71999999</select>
+    ... <select name="frmGSM" size="10"><option value="">Select a number
+    ... <option value="0001|71111111"> 71111111 </option>
+    ... <option value="0002|3222222">3222222
+    ... <option value="0003|81333333">
+    ...   81333333
+    ... </select><select name="other"><option value="0004|71444444">71444444</option></select>'''
+    >>> get_gsm_options(page)
+    ([71111111, 3222222, 81333333], {71111111: '0001|71111111', 3222222: '0002|3222222', 81333333: '0003|81333333'})
+
+    The same as the frmGSM select found with BeautifulSoup on the recorded booking page:
+
+    >>> with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'booking_page.html')) as page_file:
+    ...     page = page_file.read()
+    >>> select = BeautifulSoup(page, 'html.parser').find('select', {'name': 'frmGSM'})
+    >>> get_gsm_options(page) == ([int(option.text) for option in select.find_all('option')],
+    ...                           {int(option.text): option.get('value') for option in select.find_all('option')})
+    True
+    """
+    parser = GSMOptionsParser()
+    with metrics.timer('parse_seconds'):
+        try:
+            parser.feed(page_content)
+            parser.close()
+        except GSMSelectEnd:
+            pass
+    numbers = [int(text) for text, _ in parser.options if text.isdigit()]
+    gsm_values = {int(text): value for text, value in parser.options if text.isdigit()}
+    return numbers, gsm_values
+
+
+frm_gsm_re = re.compile(r'<select[^>]*\bname=["\']?frmGSM\b.*?</select\s*>', re.DOTALL | re.IGNORECASE)
+
+
+@dataclass
+class AvailabilitySnapshot:
+    numbers: list[int]
+    gsm_values: dict[int, str]
+    fetched_at: float = field(default_factory=time.monotonic)
+    digest: bytes = b''
+    etag: str | None = None
+    last_modified: str | None = None
+    changed: bool = True
+    # The reservation category of each number
+    categories: dict[int, str] = field(default_factory=dict)
+    # The time each category was fetched at, when the snapshot merges several ones
+    category_fetched_at: dict[str, float] = field(default_factory=dict)
+
+    def get_fetched_at(self, category: str | None = None) -> float:
+        return self.category_fetched_at.get(category, self.fetched_at)
+
+    def age(self, category: str | None = None) -> float:
+        """
+        :param category: the category whose age is wanted, the age of the oldest one by default.
+        """
+        return time.monotonic() - self.get_fetched_at(category)
+
+
 def get_selected_gsm(page_content: str, number_to_book: int) -> str:
-    soup = BeautifulSoup(page_content, 'html.parser')
-    select = soup.find('select', {'name': 'frmGSM'})
-    if option := select.find('option', text=str(number_to_book)):
-        return option.get('value')
-    return ''
+    _, gsm_values = get_gsm_options(page_content)
+    return gsm_values.get(number_to_book, '')
+
 
+async def post(session: aiohttp.ClientSession | None, data: bytes, timeout: float | None = None,
+               request_headers: dict | None = None) -> aiohttp.ClientResponse:
+    """
+    Post a form to the reservation URL, the response being read before it is returned.
+    """
+    async with (session or poll_session).post(url, data=data, headers=request_headers,
+                                              timeout=get_client_timeout(timeout)) as response:
+        await response.read()
+    return response
 
-def book_gsm(gsm: str, id: str, id_type: str) -> str:
-    response = requests.request("POST", url, headers=headers, data=gsm_booking_payload.format(
-        gsm=quote(gsm), id=id, id_type=get_id_value(id_type)
-    ))
+
+async def book_gsm(gsm: str, id: str, id_type: str, session: aiohttp.ClientSession | None = None,
+                   category: str = default_category, timeout: float | None = None) -> str:
+    with metrics.timer('request_seconds', stage='book_gsm'):
+        response = await post(session, gsm_booking_template.render(
+            gsm=quote_bytes(gsm), id=id, id_type=get_id_value(id_type), category=quote_bytes(category)
+        ), timeout)
     response.raise_for_status()
-    return response.text
+    return await response.text()
 
 
 def get_id_value(id_type: str):
@@ -73,28 +394,34 @@ def get_id_value(id_type: str):
     return id_value
 
 
-def send_booking_information(
+async def send_booking_information(
         first_name: str, father_name: str, last_name: str, mother_name: str, birth_day: str, birth_month: str,
-        birth_year: str, id: str, gsm: str, ref_code: str, ref_number: str, id_type: str
+        birth_year: str, id: str, gsm: str, ref_code: str, ref_number: str, id_type: str,
+        session: aiohttp.ClientSession | None = None, category: str = default_category, timeout: float | None = None
 ) -> str:
-    response = requests.request("POST", url, headers=headers, data=booking_info_payload.format(
-        first_name=quote(first_name), father_name=quote(father_name), last_name=quote(last_name),
-        mother_name=quote(mother_name), birth_day=birth_day, birth_month=birth_month, birth_year=birth_year, id=id,
-        gsm=quote(gsm), ref_code=ref_code, ref_number=ref_number, id_type=get_id_value(id_type)
-    ))
+    with metrics.timer('request_seconds', stage='booking_information'):
+        response = await post(session, booking_info_template.render(
+            first_name=quote_bytes(first_name), father_name=quote_bytes(father_name), last_name=quote_bytes(last_name),
+            mother_name=quote_bytes(mother_name), birth_day=birth_day, birth_month=birth_month, birth_year=birth_year,
+            id=id, gsm=quote_bytes(gsm), ref_code=ref_code, ref_number=ref_number, id_type=get_id_value(id_type),
+            category=quote_bytes(category)
+        ), timeout)
     response.raise_for_status()
-    if "<label>Reservation Code</label>" not in response.text:
-        soup = BeautifulSoup(response.text, 'html.parser')
+    text = await response.text()
+    if "<label>Reservation Code</label>" not in text:
+        soup = BeautifulSoup(text, 'html.parser')
         raise ValueError(soup.find(class_='errorStrip').text)
-    return response.text
+    return text
 
 
-def confirm_booking(gsm: str, confirmation_code: str) -> str:
-    response = requests.request("POST", url, headers=headers, data=booking_confirmation_payload.format(
-        confirmation_code=confirmation_code, gsm=quote(gsm)
-    ))
+async def confirm_booking(gsm: str, confirmation_code: str, session: aiohttp.ClientSession | None = None,
+                          timeout: float | None = None) -> str:
+    with metrics.timer('request_seconds', stage='confirmation'):
+        response = await post(session, booking_confirmation_template.render(
+            confirmation_code=confirmation_code, gsm=quote_bytes(gsm)
+        ), timeout)
     response.raise_for_status()
-    return response.text
+    return await response.text()
 
 
 def get_confirmation_result_text(page_content: str) -> str:
@@ -104,45 +431,242 @@ def get_confirmation_result_text(page_content: str) -> str:
     return paragraph.text
 
 
-def get_booking_page_content() -> str:
-    response = requests.request("POST", url, headers=headers, data=booking_page_payload)
+async def get_booking_page_response(session: aiohttp.ClientSession | None = None,
+                                    previous: AvailabilitySnapshot | None = None, category: str = default_category,
+                                    timeout: float | None = None) -> aiohttp.ClientResponse:
+    conditional_headers = {}
+    if previous and previous.etag:
+        conditional_headers['If-None-Match'] = previous.etag
+    if previous and previous.last_modified:
+        conditional_headers['If-Modified-Since'] = previous.last_modified
+
+    async def post_booking_page():
+        count_booking_page_request()
+        with metrics.timer('request_seconds', stage='booking_page', category=category):
+            return await post(session, get_booking_page_body(category), timeout, conditional_headers)
+
+    # The booking page is only read, so a slow request can be raced with a second one
+    response = await (post_booking_page() if hedge_delay is None else get_hedged(post_booking_page, hedge_delay))
     response.raise_for_status()
-    return response.text
+    return response
+
+
+async def get_booking_page_content(session: aiohttp.ClientSession | None = None) -> str:
+    return await (await get_booking_page_response(session)).text()
+
+
+async def get_availability_snapshot(session: aiohttp.ClientSession | None = None,
+                                    previous: AvailabilitySnapshot | None = None, category: str = default_category,
+                                    timeout: float | None = None) -> AvailabilitySnapshot:
+    """
+    Fetch and parse the booking page of a category. When the previous snapshot is given, an unchanged frmGSM select
+    is not parsed again and the previous snapshot is returned refreshed with changed set to False.
+
+    :Example:
+    >>> class StubResponse:
+    ...     def __init__(self, status, text='', headers=None):
+    ...         self.status, self.body, self.headers = status, text, headers or {}
+    ...     async def __aenter__(self):
+    ...         return self
+    ...     async def __aexit__(self, *exc_info):
+    ...         pass
+    ...     async def read(self):
+    ...         return self.body.encode()
+    ...     async def text(self):
+    ...         return self.body
+    ...     def raise_for_status(self):
+    ...         pass
+    >>> class StubSession:
+    ...     def __init__(self, *responses):
+    ...         self.responses = list(responses)
+    ...         self.sent_headers = []
+    ...     def post(self, url, headers, **kwargs):
+    ...         self.sent_headers.append(headers)
+    ...         return self.responses.pop(0)
+    >>> page = '<select name="frmGSM"><option value="0001|71111111">71111111</option></select>'
+    >>> session = StubSession(StubResponse(200, page, {'ETag': '"1"'}), StubResponse(304),
+    ...                       StubResponse(200, '<p>Another banner</p>' + page))
+    >>> first = asyncio.run(get_availability_snapshot(session))
+    >>> first.numbers, first.changed
+    ([71111111], True)
+
+    A 304 response and a page with the same frmGSM select both keep the parsed numbers:
+
+    >>> second = asyncio.run(get_availability_snapshot(session, replace(first, fetched_at=0)))
+    >>> session.sent_headers[1], second.changed, second.fetched_at > 0, second.numbers is first.numbers
+    ({'If-None-Match': '"1"'}, False, True, True)
+    >>> third = asyncio.run(get_availability_snapshot(session, replace(second, fetched_at=0)))
+    >>> third.changed, third.fetched_at > 0, third.numbers is first.numbers
+    (False, True, True)
+    """
+    response = await get_booking_page_response(session, previous, category, timeout)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if previous and response.status == 304:
+        return replace(previous, fetched_at=time.monotonic(), changed=False)
+    match = frm_gsm_re.search(await response.text())
+    select = match.group() if match else ''
+    digest = hashlib.blake2b(select.encode(), digest_size=16).digest()
+    if previous and digest == previous.digest:
+        return replace(previous, fetched_at=time.monotonic(), etag=etag, last_modified=last_modified, changed=False)
+    numbers, gsm_values = get_gsm_options(select)
+    return AvailabilitySnapshot(numbers, gsm_values, digest=digest, etag=etag, last_modified=last_modified,
+                                categories=dict.fromkeys(numbers, category))
+
+
+def merge_snapshots(snapshots: dict[str, AvailabilitySnapshot]) -> AvailabilitySnapshot:
+    """
+    Merge the snapshots of several categories, a number listed in several of them keeping its first category.
+    The merged snapshot is as old as the oldest one but keeps the age of each category, so that a category failing
+    to be fetched again does not age the others, and it is changed if any of them changed.
+    :param snapshots: a dict mapping the categories to their snapshot.
+
+    :Example:
+    >>> merged = merge_snapshots({
+    ...     'MICRO': AvailabilitySnapshot([71111111], {71111111: '1'}, categories={71111111: 'MICRO'}),
+    ...     'GOLD': AvailabilitySnapshot([3222222], {3222222: '2'}, time.monotonic() - 60, changed=False,
+    ...                                  categories={3222222: 'GOLD'})
+    ... })
+    >>> merged.numbers, merged.changed, merged.age() > 60, merged.age('GOLD') > 60, merged.age('MICRO') < 60
+    ([71111111, 3222222], True, True, True, True)
+    """
+    gsm_values = {}
+    categories = {}
+    for snapshot in snapshots.values():
+        for number in snapshot.numbers:
+            if number not in gsm_values:
+                gsm_values[number] = snapshot.gsm_values.get(number, '')
+                categories[number] = snapshot.categories.get(number, default_category)
+    category_fetched_at = {category: snapshot.fetched_at for category, snapshot in snapshots.items()}
+    return AvailabilitySnapshot(list(gsm_values), gsm_values, min(category_fetched_at.values()),
+                                changed=any(snapshot.changed for snapshot in snapshots.values()), categories=categories,
+                                category_fetched_at=category_fetched_at)
 
 
 def get_numbers():
-    booking_page = get_booking_page_content()
-    soup = BeautifulSoup(booking_page, 'html.parser')
-    numbers = []
-    select = soup.find(name='select', attrs={'name': 'frmGSM'})
-    if select:
-        for option in select.find_all('option'):
-            numbers.append(int(option.text))
-    return numbers
+    async def get_snapshot():
+        async with open_poll_session():
+            return await get_availability_snapshot()
+
+    return asyncio.run(get_snapshot()).numbers
+
+
+def is_retryable(error: Exception, idempotent: bool) -> bool:
+    """
+    Tell whether a failed request can be sent again: a request that may have been processed is only sent again if
+    processing it twice has the same effect as once.
+
+    :Example:
+    >>> is_retryable(aiohttp.ConnectionTimeoutError(), idempotent=False)
+    True
+    >>> is_retryable(aiohttp.SocketTimeoutError(), idempotent=False)
+    False
+    >>> is_retryable(aiohttp.ClientResponseError(None, (), status=503), idempotent=True)
+    True
+    >>> is_retryable(aiohttp.ClientResponseError(None, (), status=503), idempotent=False)
+    False
+    """
+    if isinstance(error, aiohttp.ConnectionTimeoutError):
+        # The connection was never established, so the request was not sent
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return idempotent and error.status >= 500
+    return idempotent and isinstance(error, (aiohttp.ClientConnectionError, TimeoutError))
+
+
+async def run_step(step, idempotent: bool, deadline: float | None, retries: int, *args, **kwargs):
+    """
+    Run a booking step, retrying it alone when it fails with a retryable error until the retries or the deadline
+    are exhausted.
+
+    :Example:
+    >>> from yarl import URL
+    >>> calls = []
+    >>> async def send_booking_information(error, timeout):
+    ...     calls.append(timeout)
+    ...     raise error
+    >>> asyncio.run(run_step(send_booking_information, False, None, 2, aiohttp.ConnectionTimeoutError('not connected')))
+    Traceback (most recent call last):
+    ...
+    aiohttp.client_exceptions.ConnectionTimeoutError: not connected
+    >>> len(calls)
+    3
+    >>> calls.clear()
+    >>> asyncio.run(run_step(send_booking_information, False, None, 2, aiohttp.SocketTimeoutError('no response')))
+    Traceback (most recent call last):
+    ...
+    aiohttp.client_exceptions.SocketTimeoutError: no response
+    >>> len(calls)
+    1
+    >>> request_info = aiohttp.RequestInfo(URL(url), 'POST', {}, URL(url))
+    >>> async def book_gsm(timeout):
+    ...     calls.append(timeout)
+    ...     if len(calls) < 3:
+    ...         raise aiohttp.ClientResponseError(request_info, (), status=502)
+    ...     return 'selected'
+    >>> calls.clear()
+    >>> asyncio.run(run_step(book_gsm, True, None, 2)), len(calls)
+    ('selected', 3)
+    >>> async def confirm_booking(timeout):
+    ...     await asyncio.sleep(0.2)
+    ...     raise aiohttp.ClientConnectionError('reset')
+    >>> asyncio.run(run_step(confirm_booking, True, time.monotonic() + 0.1, 2))
+    Traceback (most recent call last):
+    ...
+    TimeoutError: Deadline exceeded
+    """
+    for attempt in range(retries + 1):
+        timeout = get_timeout(deadline)
+        try:
+            return await step(*args, **kwargs, timeout=timeout)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            if attempt == retries or not is_retryable(e, idempotent):
+                raise
+            logger.warning('Retrying %s after error: %s', step.__name__, e)
+            metrics.increment('booking_retries_total', stage=step.__name__)
+            await asyncio.sleep(min(0.1 * 2 ** attempt, get_timeout(deadline)))
 
 
-def do_number_booking(number_to_book: int, first_name: str, father_name: str, last_name: str, mother_name: str,
+async def do_number_booking(number_to_book: int, first_name: str, father_name: str, last_name: str, mother_name: str,
                       birth_day: str, birth_month: str, birth_year: str, id: str, ref_number: str,
-                      confirmation_code: str, id_type: str):
+                      confirmation_code: str, id_type: str, snapshot: AvailabilitySnapshot | None = None,
+                      max_snapshot_age: float = 10, detected_at: float | None = None, deadline: float | None = None,
+                      retries: int = 2, category: str | None = None):
+    """
+    Book a number in four steps (getting its GSM ID, selecting it, sending the information and confirming), each
+    step being retried alone instead of starting over.
+    :param deadline: the time.monotonic() time at which the booking is given up.
+    :param retries: the count of retries of each step.
+    :param category: the category of the number, the one of the snapshot by default.
+    """
     ref_code = '961'
-    logger.info('Booking number: %s', number_to_book)
-    booking_page = get_booking_page_content()
-    gsm = get_selected_gsm(booking_page, number_to_book)
-    if not gsm:
-        logger.warning('Number %s is not available', number_to_book)
-        return None
-    logger.info('Booking GSM ID: %s', gsm)
-    book_gsm(gsm, id, id_type)
-    logger.info(
-        'Booking with information:\nFirst name: %s\nFather name: %s\nLast name: %s\nMother name: %s\nBirth date:'
-        ' %s-%s-%s\nID: %s (%s)\nReference phone number %s-%s',
-        first_name, father_name, last_name, mother_name, birth_day, birth_month, birth_year, id, id_type,
-        ref_code, ref_number
-    )
-    send_booking_information(first_name, father_name, last_name, mother_name, birth_day, birth_month, birth_year, id,
-                             gsm, ref_code, ref_number, id_type)
-    logger.info('Confirming booking with confirmation code: %s', confirmation_code)
-    confirmation_page = confirm_booking(gsm, confirmation_code)
-    result = get_confirmation_result_text(confirmation_page)
-    logger.info('Confirmation: %s', result)
-    return result
+    async with create_session() as session:
+        if category is None:
+            category = snapshot.categories.get(number_to_book, default_category) if snapshot else default_category
+        # A number missing from the snapshot may have been found by another worker, in another category
+        if snapshot is None or snapshot.age(category) > max_snapshot_age or number_to_book not in snapshot.gsm_values:
+            snapshot = await run_step(get_availability_snapshot, True, deadline, retries, session, category=category)
+        gsm = snapshot.gsm_values.get(number_to_book, '')
+        if not gsm:
+            logger.warning('Number %s is not available', number_to_book)
+            return None
+        if detected_at is not None:
+            metrics.observe('detection_to_book_gsm_seconds', time.monotonic() - detected_at)
+        await run_step(book_gsm, True, deadline, retries, gsm, id, id_type, session, category)
+        # Logged once the number is selected, so it does not delay it
+        logger.info('Selected number %s: GSM ID %s (%s)', number_to_book, gsm, category)
+        logger.info(
+            'Booking with information:\nFirst name: %s\nFather name: %s\nLast name: %s\nMother name: %s\nBirth date:'
+            ' %s-%s-%s\nID: %s (%s)\nReference phone number %s-%s',
+            first_name, father_name, last_name, mother_name, birth_day, birth_month, birth_year, id, id_type,
+            ref_code, ref_number
+        )
+        # Sending the information twice could be rejected as the number is then reserved
+        await run_step(send_booking_information, False, deadline, retries, first_name, father_name, last_name,
+                       mother_name, birth_day, birth_month, birth_year, id, gsm, ref_code, ref_number, id_type, session,
+                       category)
+        logger.info('Confirming booking with confirmation code: %s', confirmation_code)
+        confirmation_page = await run_step(confirm_booking, True, deadline, retries, gsm, confirmation_code, session)
+        result = get_confirmation_result_text(confirmation_page)
+        logger.info('Confirmation: %s', result)
+        return result
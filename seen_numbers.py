@@ -0,0 +1,116 @@
+import json
+import mmap
+import os
+import re
+from logging import getLogger
+
+try:
+    import fcntl
+except ImportError:
+    # Without file locks (on Windows), the store must not be shared by several processes
+    fcntl = None
+
+logger = getLogger(__name__)
+
+
+class SeenNumbersStore:
+    """
+    A memory-mapped bitset of the numbers already seen, one bit per number of the 8-digit space (12.5 MB).
+
+    The bits are only ever set and the changes are written in place, so a crash can at worst lose the latest bits
+    (their numbers are then seen as new again) but never corrupt the others. The processes sharing the file add the
+    numbers under an exclusive file lock, so each new number is reported as new to only one of them.
+    """
+
+    size = 10 ** 8
+
+    def __init__(self, file_name):
+        """
+        :param file_name: the bitset file, created empty if it does not exist.
+        """
+        self.file_name = file_name
+        self.created = not os.path.exists(file_name)
+        self.bits_file = open(file_name, 'a+b')
+        if os.fstat(self.bits_file.fileno()).st_size < self.size // 8:
+            self.bits_file.truncate(self.size // 8)
+        self.bits = mmap.mmap(self.bits_file.fileno(), self.size // 8)
+
+    def __contains__(self, number):
+        number = int(number)
+        return 0 <= number < self.size and bool(self.bits[number >> 3] & (1 << (number & 7)))
+
+    def __iter__(self):
+        for match in re.finditer(rb'[^\x00]', self.bits):
+            byte_index = match.start()
+            byte = match.group()[0]
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield (byte_index << 3) | bit
+
+    def add(self, number):
+        """
+        Mark a number as seen.
+        :param number: the number, an integer lower than 10^8.
+        :return: True if the number was not seen before, False otherwise.
+        """
+        number = int(number)
+        if not 0 <= number < self.size:
+            raise ValueError(f'{number} is not an 8-digit number')
+        index, mask = number >> 3, 1 << (number & 7)
+        byte = self.bits[index]
+        if byte & mask:
+            return False
+        self.bits[index] = byte | mask
+        return True
+
+    def add_new(self, numbers):
+        """
+        Mark numbers as seen and persist them. The numbers out of the 8-digit space cannot be stored, so they are
+        skipped without failing the others.
+        :param numbers: the numbers to add.
+        :return: the set of the numbers that were not seen before.
+
+        :Example:
+        >>> import tempfile
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> seen_numbers = SeenNumbersStore(os.path.join(directory.name, 'seen_numbers.bits'))
+        >>> sorted(seen_numbers.add_new([71111111, 123456789, 3333333])), 71111111 in seen_numbers
+        ([3333333, 71111111], True)
+        >>> seen_numbers.add_new([71111111])
+        set()
+        >>> seen_numbers.close()
+        >>> directory.cleanup()
+        """
+        in_range = [number for number in numbers if 0 <= int(number) < self.size]
+        if len(in_range) < len(numbers):
+            logger.warning('Numbers out of the 8-digit space not recorded: %s',
+                           [number for number in numbers if not 0 <= int(number) < self.size])
+        if fcntl is not None:
+            fcntl.flock(self.bits_file, fcntl.LOCK_EX)
+        try:
+            new_numbers = {number for number in in_range if self.add(number)}
+            if new_numbers:
+                self.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self.bits_file, fcntl.LOCK_UN)
+        return new_numbers
+
+    def flush(self):
+        self.bits.flush()
+
+    def close(self):
+        self.bits.close()
+        self.bits_file.close()
+
+    def import_json(self, file_name):
+        """
+        Add the numbers of a JSON list file (the format of the old numbers file).
+        :return: the count of the numbers that were not seen before.
+        """
+        with open(file_name) as numbers_file:
+            return len(self.add_new(json.load(numbers_file)))
+
+    def export_json(self, file_name):
+        with open(file_name, 'w') as numbers_file:
+            json.dump(list(self), numbers_file, indent=4)
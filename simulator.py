@@ -0,0 +1,316 @@
+"""
+A local stand-in for the touch.com.lb online reservation form, to load-test the polling and booking pipeline.
+
+It answers the steps driven by scraping.py: the booking page (typ=1) listing the available numbers in the frmGSM
+select, the GSM selection (typ=2), the booking information (formName=OnlineReservationForm) and the confirmation
+(typ=3). The numbers are spread over the reservation categories, a share of them is replaced regularly, and latency,
+stalled responses, server errors and errorStrip rejections can be injected.
+
+Run `python simulator.py` to only serve it, then point touch_lb_numbers.py to it with
+`--url http://127.0.0.1:8080/onlinereservation --telegram_token ''`. With `--drive`, the simulator runs
+touch_lb_numbers.py itself in a temporary directory and reports the polls/s, the bookings/s and the percentiles of the
+latency from the first time a number is served to its booking confirmation. The categories are polled by
+touch_lb_numbers.py too, and the unknown arguments are passed to it. With `--clients`, several workers share the
+directory, and the conflicts count the numbers reserved again once already reserved.
+"""
+import argparse
+import math
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import premium_numbers
+from booking_queue import applicant_fields
+
+booking_page_template = '''<html><head><title>Online Reservation</title></head><body>
+<form class="forms" method="post"><input type="hidden" name="typ" value="1">
+<select name="CatReg"><option value="{category}" selected>{category}</option></select>
+<select name="frmGSM" size="10">
+{options}
+</select></form></body></html>'''
+
+information_page = ('<html><body><form class="forms" method="post"><input type="hidden" name="formName" '
+                    'value="OnlineReservationForm"></form></body></html>')
+
+reservation_page = ('<html><body><form class="forms" method="post"><label>Reservation Code</label>'
+                    '<input type="text" name="code"></form></body></html>')
+
+confirmation_page = '<html><body><form class="forms" method="post"><p>{message}</p></form></body></html>'
+
+error_page = '<html><body><div class="errorStrip">{message}</div></body></html>'
+
+
+class SimulatedSite:
+    """
+    The state of the simulated reservation form: the available numbers, the reserved ones and the statistics.
+    """
+
+    def __init__(self, options=500, churn=0.05, churn_interval=5.0, premium_ratio=0.1, latency=0.05,
+                 latency_jitter=0.02, error_rate=0.0, rejection_rate=0.0, categories=('MICRO',), slow_rate=0.0,
+                 slow_latency=5.0, seed=None):
+        """
+        :param options: the count of the available numbers.
+        :param churn: the share of the available numbers replaced every churn interval.
+        :param churn_interval: the interval in seconds between two replacements.
+        :param premium_ratio: the share of the new numbers that are premium ones.
+        :param latency: the mean delay in seconds added to every response.
+        :param latency_jitter: the largest random deviation from the mean delay.
+        :param error_rate: the share of the requests answered with a server error.
+        :param rejection_rate: the share of the booking information steps rejected with an errorStrip.
+        :param categories: the reservation categories the numbers are spread over.
+        :param slow_rate: the share of the responses stalled.
+        :param slow_latency: the delay in seconds added to the stalled responses.
+        """
+        self.options = options
+        self.churn = churn
+        self.churn_interval = churn_interval
+        self.premium_ratio = premium_ratio
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rejection_rate = rejection_rate
+        self.categories = categories
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.premium_suffixes = {}
+        self.available = {}
+        self.number_categories = {}
+        self.reserved = set()
+        self.booked = set()
+        self.served_at = {}
+        self.next_index = 0
+        self.polls = 0
+        self.bookings = 0
+        self.errors = 0
+        self.rejections = 0
+        # The attempts to reserve a number already reserved, as done by two workers booking the same number
+        self.conflicts = 0
+        self.latencies = []
+        for _ in range(options):
+            self.add_number()
+        self.churned_at = time.monotonic()
+
+    def get_premium_suffixes(self, code):
+        if code not in self.premium_suffixes:
+            table = premium_numbers.get_category_tables()[code]
+            self.premium_suffixes[code] = [suffix for suffix, mask in enumerate(table) if mask]
+        return self.premium_suffixes[code]
+
+    def add_number(self):
+        while True:
+            code = self.random.choice(premium_numbers.operator_codes)
+            if self.random.random() < self.premium_ratio:
+                suffix = self.random.choice(self.get_premium_suffixes(code))
+            else:
+                suffix = self.random.randrange(1000000)
+            number = code * 1000000 + suffix
+            if number not in self.available and number not in self.reserved and number not in self.served_at:
+                break
+        self.available[number] = f'{self.next_index:06}|{number}'
+        self.number_categories[number] = self.random.choice(self.categories)
+        self.next_index += 1
+
+    def update_numbers(self):
+        now = time.monotonic()
+        while now - self.churned_at >= self.churn_interval:
+            self.churned_at += self.churn_interval
+            for number in self.random.sample(list(self.available), min(len(self.available),
+                                                                       math.ceil(self.options * self.churn))):
+                del self.available[number]
+            while len(self.available) < self.options:
+                self.add_number()
+
+    def get_booking_page(self, category):
+        with self.lock:
+            self.update_numbers()
+            self.polls += 1
+            now = time.monotonic()
+            numbers = [number for number in self.available if self.number_categories[number] == category]
+            for number in numbers:
+                self.served_at.setdefault(number, now)
+            options = '\n'.join(f'<option value="{self.available[number]}">{number}</option>' for number in numbers)
+        return booking_page_template.format(category=category, options=options)
+
+    def reserve(self, gsm, category):
+        number = int(gsm.rpartition('|')[2] or 0)
+        with self.lock:
+            if number in self.reserved or number in self.booked:
+                self.conflicts += 1
+            if self.available.get(number) != gsm or self.number_categories[number] != category:
+                return error_page.format(message='The selected number is not available anymore')
+            if self.random.random() < self.rejection_rate:
+                self.rejections += 1
+                return error_page.format(message='The information you entered is not valid')
+            del self.available[number]
+            self.reserved.add(number)
+        return reservation_page
+
+    def confirm(self, gsm):
+        number = int(gsm.rpartition('|')[2] or 0)
+        with self.lock:
+            if number not in self.reserved:
+                return confirmation_page.format(message='No reservation was found')
+            self.reserved.discard(number)
+            self.booked.add(number)
+            self.bookings += 1
+            self.latencies.append(time.monotonic() - self.served_at[number])
+        return confirmation_page.format(message=f'The number {number} is reserved')
+
+    def handle(self, form):
+        """
+        Answer a form submission.
+        :param form: the submitted fields, as returned by parse_qs.
+        :return: the HTTP status and the page.
+        """
+        delay = max(0.0, self.random.uniform(self.latency - self.latency_jitter, self.latency + self.latency_jitter))
+        if self.random.random() < self.slow_rate:
+            delay += self.slow_latency
+        time.sleep(delay)
+        if self.random.random() < self.error_rate:
+            with self.lock:
+                self.errors += 1
+            return 503, error_page.format(message='Service unavailable')
+        field = lambda name: form.get(name, [''])[0]
+        if field('formName') == 'OnlineReservationForm':
+            return 200, self.reserve(field('frmGSM'), field('frmCategory'))
+        typ = field('typ')
+        if typ == '1':
+            return 200, self.get_booking_page(field('CatReg'))
+        if typ == '2':
+            return 200, information_page
+        if typ == '3':
+            return 200, self.confirm(field('reservednb'))
+        return 400, error_page.format(message='Unknown form')
+
+    def get_report(self, duration):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            report = {
+                'polls_per_second': self.polls / duration,
+                'bookings_per_second': self.bookings / duration,
+                'polls': self.polls,
+                'bookings': self.bookings,
+                'errors': self.errors,
+                'rejections': self.rejections,
+                'conflicts': self.conflicts,
+            }
+        if len(latencies) > 1:
+            percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+            report.update(latency_p50=percentiles[49], latency_p90=percentiles[89], latency_p99=percentiles[98])
+        elif latencies:
+            report.update(latency_p50=latencies[0], latency_p90=latencies[0], latency_p99=latencies[0])
+        return report
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    site: SimulatedSite = None
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        status, page = self.site.handle(parse_qs(body.decode(), keep_blank_values=True))
+        content = page.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(site, port, host='127.0.0.1'):
+    """
+    Serve the simulated site from a background thread.
+    """
+    handler = type('SiteHandler', (SimulatorHandler,), {'site': site})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='simulator', daemon=True).start()
+    return server
+
+
+def write_applicants(file_name, count):
+    with open(file_name, 'w') as applicants_file:
+        for index in range(count):
+            applicant = {'id': str(index), 'first_name': f'First{index}', 'last_name': 'Last', 'father_name': 'Father',
+                         'mother_name': 'Mother', 'ref_number': '3123456', 'birth_day': '1', 'birth_month': '1',
+                         'birth_year': '1990', 'confirmation_code': str(index), 'id_type': 'national'}
+            applicants_file.write(','.join(applicant[field] for field in applicant_fields) + '\n')
+
+
+def drive(site, reservation_url, duration, applicants, client_args, clients=1):
+    """
+    Run touch_lb_numbers.py against the simulated site in a temporary directory.
+    :param clients: the count of touch_lb_numbers.py workers sharing the directory.
+    :return: the report of the site over the run.
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'touch_lb_numbers.py')
+    with tempfile.TemporaryDirectory() as directory:
+        write_applicants(os.path.join(directory, 'numbers_to_book.csv'), applicants)
+        start = time.monotonic()
+        processes = [subprocess.Popen([sys.executable, script, '--url', reservation_url, '--telegram_token', '',
+                                       '--categories', ','.join(site.categories), '--workers', str(clients),
+                                       '--worker-id', f'worker{index}', *client_args],
+                                      cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                     for index in range(clients)]
+        deadline = time.monotonic() + duration
+        for client in processes:
+            try:
+                client.wait(max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                client.send_signal(signal.SIGINT)
+        for client in processes:
+            client.wait()
+        return site.get_report(time.monotonic() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulate the touch.com.lb online reservation form')
+    parser.add_argument('--port', type=int, default=8080, help='Port to serve the simulated form on')
+    parser.add_argument('--options', type=int, default=500, help='Count of available numbers')
+    parser.add_argument('--churn', type=float, default=0.05,
+                        help='Share of the available numbers replaced every churn interval')
+    parser.add_argument('--churn-interval', type=float, default=5, help='Interval in seconds between replacements')
+    parser.add_argument('--premium-ratio', type=float, default=0.1, help='Share of premium numbers among the new ones')
+    parser.add_argument('--latency', type=float, default=0.05, help='Mean response delay in seconds')
+    parser.add_argument('--latency-jitter', type=float, default=0.02, help='Largest deviation from the mean delay')
+    parser.add_argument('--slow-rate', type=float, default=0, help='Share of the responses stalled')
+    parser.add_argument('--slow-latency', type=float, default=5, help='Delay in seconds added to the stalled responses')
+    parser.add_argument('--error-rate', type=float, default=0, help='Share of the requests failing with an error 503')
+    parser.add_argument('--rejection-rate', type=float, default=0,
+                        help='Share of the booking information steps rejected with an errorStrip')
+    parser.add_argument('--categories', type=lambda categories: categories.split(','), default=['MICRO'],
+                        help='Comma separated reservation categories the numbers are spread over')
+    parser.add_argument('--seed', type=int, help='Random seed of the generated numbers')
+    parser.add_argument('--drive', action='store_true', help='Run touch_lb_numbers.py against the simulator')
+    parser.add_argument('--duration', type=float, default=60, help='Duration in seconds of the driven run')
+    parser.add_argument('--applicants', type=int, default=1000, help='Count of applicants of the driven run')
+    parser.add_argument('--clients', type=int, default=1, help='Count of workers of the driven run')
+    args, client_args = parser.parse_known_args()
+    site = SimulatedSite(args.options, args.churn, args.churn_interval, args.premium_ratio, args.latency,
+                         args.latency_jitter, args.error_rate, args.rejection_rate, args.categories, args.slow_rate,
+                         args.slow_latency, args.seed)
+    server = serve(site, args.port)
+    reservation_url = f'http://127.0.0.1:{server.server_port}/onlinereservation'
+    if args.drive:
+        for name, value in drive(site, reservation_url, args.duration, args.applicants, client_args,
+                                 args.clients).items():
+            print(f'{name}: {value:.3f}' if isinstance(value, float) else f'{name}: {value}')
+    else:
+        print(f'Serving on {reservation_url}')
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
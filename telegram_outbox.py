@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+import time
+from logging import getLogger
+
+from telebot.util import smart_split
+
+import metrics
+from leases import acquire_lease, release_lease, schema as leases_schema
+
+logger = getLogger(__name__)
+
+max_message_length = 4096
+
+
+class TokenBucket:
+    """Allow `rate` actions per second on average, with bursts of up to `capacity` actions."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def take(self):
+        """
+        Take a token, waiting until one is available.
+        """
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) / self.rate)
+
+
+def pack_messages(messages, limit=max_message_length):
+    """
+    Merge consecutive messages into as few chunks as possible, splitting only the messages longer than the limit.
+    :param messages: (message ID, text) pairs.
+    :param limit: the maximal length of a chunk.
+    :return: (text, message IDs) pairs, the IDs being the ones of the messages completely sent with the chunk.
+
+    :Example:
+    >>> pack_messages([(1, 'a' * 10), (2, 'b' * 10), (3, 'c' * 10)], limit=25)
+    [('aaaaaaaaaa\\n\\nbbbbbbbbbb', [1, 2]), ('cccccccccc', [3])]
+    """
+    chunks = []
+    for message_id, text in messages:
+        if chunks and len(chunks[-1][0]) + 2 + len(text) <= limit:
+            chunks[-1] = (f'{chunks[-1][0]}\n\n{text}', chunks[-1][1] + [message_id])
+        else:
+            parts = smart_split(text, limit) if len(text) > limit else [text]
+            chunks.extend((part, []) for part in parts[:-1])
+            chunks.append((parts[-1], [message_id]))
+    return chunks
+
+
+class TelegramOutbox:
+    """
+    Send the Telegram messages from a background thread.
+
+    The messages are stored in SQLite until they are delivered, so they survive a restart or a Telegram outage. The
+    thread merges the pending messages with `pack_messages` and paces the sending with a `TokenBucket`.
+
+    When the database is shared by several workers, each message is only sent by the one holding the sender lease,
+    which checks the table every `check_interval` seconds for the messages put by the others. The lease is renewed
+    before each chunk and outlasts the wait for a token and the slowest send, so that it never expires while a chunk
+    is being sent.
+    """
+
+    lease_name = 'telegram-sender'
+
+    def __init__(self, file_name, send, rate=1 / 3, capacity=3, max_retry_delay=60, owner=None, send_timeout=45,
+                 check_interval=1):
+        """
+        :param file_name: the SQLite database storing the pending messages.
+        :param send: the function sending one chunk of text.
+        :param rate: the count of chunks sent per second on average.
+        :param capacity: the maximal count of chunks sent in a burst.
+        :param max_retry_delay: the longest delay in seconds between two attempts after failures.
+        :param owner: the ID of the worker, None if the database is not shared.
+        :param send_timeout: the longest time in seconds a send can take before failing.
+        :param check_interval: the interval in seconds between two checks of the table by a shared outbox.
+        """
+        self.file_name = file_name
+        self.send = send
+        self.bucket = TokenBucket(rate, capacity)
+        self.max_retry_delay = max_retry_delay
+        self.owner = owner
+        self.lease_duration = send_timeout + 1 / rate + check_interval
+        self.check_interval = check_interval
+        self.local = threading.local()
+        self.pending = threading.Event()
+        self.connection.execute('CREATE TABLE IF NOT EXISTS messages (id INTEGER PRIMARY KEY AUTOINCREMENT, text TEXT)')
+        self.connection.execute(leases_schema)
+        self.thread = threading.Thread(target=self.run, name='telegram-outbox', daemon=True)
+
+    @property
+    def connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.file_name, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self.local.connection = connection
+        return connection
+
+    def start(self):
+        self.pending.set()
+        self.thread.start()
+        return self
+
+    def put(self, *messages):
+        self.connection.executemany('INSERT INTO messages (text) VALUES (?)', [(message,) for message in messages])
+        self.pending.set()
+
+    def acquire_lease(self):
+        return self.owner is None or acquire_lease(self.connection, self.lease_name, self.owner, self.lease_duration)
+
+    def release_lease(self):
+        if self.owner is not None:
+            release_lease(self.connection, self.lease_name, self.owner)
+
+    def run(self):
+        retry_delay = 1
+        while True:
+            self.pending.wait(None if self.owner is None else self.check_interval)
+            self.pending.clear()
+            try:
+                # A locked database is retried as a failed send, instead of ending the thread
+                if not self.acquire_lease():
+                    continue
+                messages = self.connection.execute('SELECT id, text FROM messages ORDER BY id').fetchall()
+                for text, message_ids in pack_messages(messages):
+                    self.bucket.take()
+                    # Renewed before each chunk, so another worker never takes over while a chunk is sent
+                    if not self.acquire_lease():
+                        break
+                    with metrics.timer('telegram_send_seconds'):
+                        self.send(text)
+                    self.connection.executemany('DELETE FROM messages WHERE id = ?',
+                                                [(message_id,) for message_id in message_ids])
+            except Exception as e:
+                # Telegram tells how long to wait when the rate limit is exceeded
+                result_json = getattr(e, 'result_json', None)
+                retry_after = result_json.get('parameters', {}).get('retry_after') \
+                    if isinstance(result_json, dict) else None
+                logger.error('Error on sending Telegram message: %s', e)
+                metrics.increment('telegram_errors_total')
+                time.sleep(retry_after or retry_delay)
+                retry_delay = min(retry_delay * 2, self.max_retry_delay)
+                self.pending.set()
+            else:
+                retry_delay = 1
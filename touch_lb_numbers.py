@@ -1,219 +1,162 @@
-import csv
-import json
 import argparse
-import time
 import os
-
-import re
-from http.client import HTTPException
-from itertools import chain
 import platform
-from threading import Lock
-from concurrent.futures import ThreadPoolExecutor
-from typing import Iterable
-
-try:
-    import requests
-    from bs4 import BeautifulSoup
-    from telebot import TeleBot
-except ImportError:
-    os.system('pip install requests beautifulsoup4 pyTelegramBotAPI')
-    import requests
-    from bs4 import BeautifulSoup
-    from telebot import TeleBot
-from telebot.util import smart_split
-
-from scraping import get_numbers, do_number_booking, logger
-from premium_numbers import get_premium_numbers
-
-
-source_csv_fieldnames = ['id', 'first_name', 'last_name', 'father_name', 'mother_name',
-                         'ref_number', 'birth_day', 'birth_month', 'birth_year', 'confirmation_code', 'id_type']
-
-destination_csv_fieldnames = ['booked_number'] + source_csv_fieldnames
-
-lock = Lock()
-
-
-def load_info_to_book(file_name):
-    with lock:
-        with open(file_name) as info_file:
-            reader = csv.DictReader(info_file, fieldnames=source_csv_fieldnames)
-            return list(reader)
+import re
+import mmap
+from collections import deque
+from itertools import chain, islice
+from logging import getLogger, basicConfig, FileHandler, StreamHandler
 
+from premium_numbers import get_premium_number_categories, get_excluded_abc_only, get_category_tables, categories
 
-def remove_saved_info(numbers_to_book_file_name, booked_numbers_file_name):
-    with lock:
-        with open(numbers_to_book_file_name, 'r') as numbers_to_book_file:
-            to_book_reader = csv.DictReader(numbers_to_book_file, fieldnames=source_csv_fieldnames)
-            to_book_list = list(to_book_reader)
-        with open(booked_numbers_file_name, 'r') as booked_numbers_file:
-            booked_reader = csv.DictReader(
-                booked_numbers_file,
-                fieldnames=destination_csv_fieldnames
-            )
-            booked_list = list(booked_reader)
-        with open(numbers_to_book_file_name, 'w') as numbers_to_book_file:
-            writer = csv.DictWriter(numbers_to_book_file, fieldnames=source_csv_fieldnames)
-            for row in to_book_list:
-                if row['id'] not in [booked_row['id'] for booked_row in booked_list]:
-                    writer.writerow(row)
+logger = getLogger(__name__)
 
 
-def save_booked_info(file_name, id, first_name, last_name, father_name, mother_name, ref_number, birth_day,
-                     birth_month, birth_year, confirmation_code, booked_number, id_type):
-    with lock:
-        with open(file_name, 'a') as numbers_file:
-            writer = csv.DictWriter(
-                numbers_file,
-                fieldnames=destination_csv_fieldnames
-            )
-            writer.writerow({
-                'booked_number': booked_number, 'id': id, 'first_name': first_name, 'last_name': last_name,
-                'father_name': father_name, 'mother_name': mother_name, 'ref_number': ref_number,
-                'birth_day': birth_day, 'birth_month': birth_month, 'birth_year': birth_year,
-                'confirmation_code': confirmation_code, 'id_type': id_type
-            })
+def configure_logging(log_file=None):
+    handlers = [StreamHandler()]
+    if log_file:
+        handlers.insert(0, FileHandler(log_file))
+    basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'), format='%(asctime)s [%(levelname)s]: %(message)s',
+                handlers=handlers)
 
 
-def load_numbers(numbers_file_name):
-    with lock:
+def read_number_chunks(file_name, chunk_size):
+    with open(file_name, 'rb') as numbers_file:
         try:
-            with open(numbers_file_name) as numbers_file:
-                return json.load(numbers_file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-
-
-def save_numbers(numbers, file_name):
-    with lock:
-        with open(file_name, 'w') as numbers_file:
-            json.dump(numbers, numbers_file, indent=4)
-
-
-def get_new_numbers(numbers, old_numbers):
-    return set(numbers) - set(old_numbers)
-
-
-def send_numbers(numbers, old_numbers, notification_bot, args):
-    new_numbers = get_new_numbers(numbers, old_numbers)
-    save_numbers(list(set(old_numbers).union(new_numbers)), args.old_numbers_file_name)
-    if new_numbers:
-        premium_number_categories, other_numbers = get_premium_numbers(new_numbers)
-        premium_numbers_set = set(chain(*premium_number_categories.values()))
-        if len(premium_numbers_set) > 0:
-            logger.info('Premium numbers:')
-            for category, p_numbers in premium_number_categories.items():
-                if len(p_numbers) > 0:
-                    logger.info(f'{category}: {p_numbers}')
-            premium_numbers_set.update(load_numbers(args.available_premium_numbers))
-            excluded_abc_only = get_excluded_abc_only(premium_number_categories)
-            premium_numbers_set.difference_update(excluded_abc_only)
-            save_numbers(list(premium_numbers_set), args.available_premium_numbers)
-        logger.info('Other new numbers:')
-        for number in other_numbers:
-            logger.info('Number: %s', number)
-        for category, p_numbers in premium_number_categories.items():
-            if len(p_numbers) > 0:
-                send_telegram_message(
-                    notification_bot, args.telegram_channel_id,
-                    f'Premium numbers: {category}\n{" ".join(map(str, p_numbers))}'
-                )
-        if other_numbers:
-            for start_index in range(0, len(other_numbers), 30):
-                send_telegram_message(
-                    notification_bot, args.telegram_channel_id,
-                    " ".join([str(x) for x in other_numbers[start_index:start_index + 30]])
-                )
-    else:
-        logger.info('No new numbers')
-
-
-def send_telegram_message(bot, channel_id, message):
-    for part in smart_split(message):
-        if platform.node() == 'Hamza-XPS-15-7590':
-            print('TELEGRAM:', message)
-        else:
-            bot.send_message(channel_id, part)
-
-
-def booking_process(premium_number, info_row, notification_bot, args):
-    booked_message = do_number_booking(premium_number, **info_row)
-    if booked_message:
-        send_telegram_message(notification_bot, args.telegram_channel_id, booked_message)
-        save_booked_info(args.booked_numbers, booked_number=premium_number, **info_row)
-        return premium_number
-    return False
-
-
-def get_excluded_abc_only(premium_number_categories: dict[str, Iterable[int]]) -> set[int]:
-    premium_number_categories_without_abc_only = premium_number_categories.copy()
-    del premium_number_categories_without_abc_only['abc_only']
-    excluded_abc_only = set(premium_number_categories['abc_only']).difference(
-        *premium_number_categories_without_abc_only.values()
-    )
-    return excluded_abc_only
+            numbers_map = mmap.mmap(numbers_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            return
+        with numbers_map:
+            chunk = []
+            for match in re.finditer(rb'\d+', numbers_map):
+                chunk.append(int(match.group()))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+
+def get_file_premium_numbers(file_name, chunk_size, processes=None):
+    processes = processes or os.cpu_count() or 1
+    premium_number_categories = {category: [] for category in categories}
+    chunks = read_number_chunks(file_name, chunk_size)
+    first_chunks = list(islice(chunks, 2))
+
+    def merge(chunk_premium_number_categories):
+        for category, p_numbers in chunk_premium_number_categories.items():
+            premium_number_categories[category].extend(p_numbers)
+
+    # Starting the processes takes longer than classifying a single chunk
+    if processes == 1 or len(first_chunks) < 2:
+        for chunk in chain(first_chunks, chunks):
+            merge(get_premium_number_categories(chunk))
+        return premium_number_categories
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    if multiprocessing.get_start_method() == 'fork':
+        # The forked processes inherit the lookup tables instead of building them each
+        get_category_tables()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = deque()
+        for chunk in chain(first_chunks, chunks):
+            futures.append(executor.submit(get_premium_number_categories, chunk))
+            if len(futures) >= 2 * processes:
+                merge(futures.popleft().result())
+        while futures:
+            merge(futures.popleft().result())
+    return premium_number_categories
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Get the new numbers from touch.com.lb')
-    parser.add_argument('--interval', '-i', type=int, default=3, help='Refresh interval in seconds')
+    parser.add_argument('--url', '-u', type=str,
+                        help='Online reservation form URL, the TOUCH_LB_URL environment variable or touch.com.lb by '
+                             'default')
+    parser.add_argument('--categories', type=lambda categories: categories.split(','), default=['MICRO'],
+                        help='Comma separated reservation categories polled at once')
+    parser.add_argument('--interval', '-i', type=float, default=30,
+                        help='Longest refresh interval in seconds, used when the numbers do not change')
+    parser.add_argument('--min-interval', type=float, default=1,
+                        help='Shortest refresh interval in seconds, used right after the numbers change')
+    parser.add_argument('--requests-per-minute', type=float, default=60,
+                        help='Maximal count of booking page requests per minute, the ones of all the categories, the '
+                             'hedges and the bookings included')
     parser.add_argument('--old_numbers_file_name', '-o', type=str, default='old_numbers.json',
-                        help='Old numbers file name')
-    parser.add_argument('--telegram_token', '-t', type=str, help='Telegram bot token',
+                        help='Old numbers JSON file name, imported into the seen numbers file when it is created')
+    parser.add_argument('--seen-numbers', type=str, default='seen_numbers.bits', help='Seen numbers file name')
+    parser.add_argument('--export-old-numbers', action='store_true',
+                        help='Export the seen numbers to the old numbers JSON file and exit')
+    parser.add_argument('--telegram_token', '-t', type=str, help='Telegram bot token, empty to only log the messages',
                         default='7380584915:AAFLp7ZTfnyBhqMPND5_D3V6Cbi7s-Y97To')
     parser.add_argument('--telegram_channel_id', '-c', type=str, help='Telegram channel id',
                         default='-1002224397023')
+    parser.add_argument('--telegram-outbox', type=str, default='telegram_outbox.sqlite3',
+                        help='File name of the database of the Telegram messages waiting to be sent')
+    parser.add_argument('--telegram-rate', type=float, default=1 / 3, help='Count of Telegram messages sent per second')
+    parser.add_argument('--telegram-burst', type=int, default=3,
+                        help='Count of Telegram messages that can be sent at once before pacing them')
     parser.add_argument('--numbers-to-book', '-b', type=str, help='Numbers to book file',
                         default='numbers_to_book.csv')
     parser.add_argument('--booked-numbers', '-k', type=str, help='Booked numbers file',
                         default='booked_numbers.csv')
     parser.add_argument('--available-premium-numbers', '-p', type=str,
                         help='Available premium numbers file', default='available_premium_numbers.json')
+    parser.add_argument('--booking-queue', type=str, default='booking_queue.sqlite3',
+                        help='Booking queue database file name, the CSV and available premium numbers files are '
+                             'imported into it when it is created')
+    parser.add_argument('--export-booking-queue', action='store_true',
+                        help='Export the booking queue to the CSV and available premium numbers files and exit')
+    parser.add_argument('--watchlist', type=str, default='watchlist.txt',
+                        help='Watchlist file of numbers, x wildcard patterns and category names to book first, each '
+                             'followed by its priority')
     parser.add_argument('--numbers-source', '-s', type=str, help='Number source file')
+    parser.add_argument('--booking-workers', '-w', type=int, default=2, help='Count of concurrent bookings')
+    parser.add_argument('--request-timeout', type=float, default=10,
+                        help='Longest wait in seconds for a connection or a response')
+    parser.add_argument('--hedge-delay', type=float,
+                        help='Delay in seconds after which a slow booking page request is sent again, the first '
+                             'response being used')
+    parser.add_argument('--booking-deadline', type=float, default=30,
+                        help='Time in seconds after which a booking is given up')
+    parser.add_argument('--booking-retries', type=int, default=2,
+                        help='Count of retries of each failed booking step')
+    parser.add_argument('--worker-id', type=str, default=f'{platform.node()}-{os.getpid()}',
+                        help='ID of this worker among the ones sharing the state files')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Expected count of workers sharing the state files, among which the categories are '
+                             'split to be polled')
+    parser.add_argument('--lease-duration', type=float, default=10,
+                        help='Time in seconds after which the claims of a stopped worker are released and its '
+                             'categories are polled by a worker below its share, a worker already at its share taking '
+                             'them over after twice this time')
+    parser.add_argument('--max-snapshot-age', type=float, default=10,
+                        help='Age in seconds after which the bookings fetch the available numbers again')
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help='Count of numbers classified at once from the number source file')
+    parser.add_argument('--processes', type=int, help='Count of processes classifying the number source file')
+    parser.add_argument('--metrics-file', type=str,
+                        help='File the metrics are written to in the Prometheus text format')
+    parser.add_argument('--metrics-interval', type=float, default=15, help='Interval in seconds between metrics writes')
+    parser.add_argument('--metrics-port', type=int, help='Local port serving the metrics over HTTP')
+    parser.add_argument('--log-file', type=str, default='touch_lb_numbers.log',
+                        help='Log file name, empty to only log to the console')
     args = parser.parse_args()
-    logger.info('Getting numbers from %s...', args.numbers_source or 'touch.com.lb')
-    while True:
-        try:
-            if args.numbers_source:
-                with open(args.numbers_source) as f:
-                    numbers = [int(x) for x in re.findall(r'\d+', f.read())]
-                premium_number_categories, _ = get_premium_numbers(numbers)
-                for category, p_numbers in premium_number_categories.items():
-                    if len(p_numbers) > 0:
-                        logger.info(f'{category}: {p_numbers}')
-                logger.info('Excluded abc_only: %s', get_excluded_abc_only(premium_number_categories))
-                break
-            else:
-                numbers = get_numbers()
-            if numbers:
-                old_numbers = load_numbers(args.old_numbers_file_name)
-                notification_bot = TeleBot(args.telegram_token, threaded=False)
-                send_numbers(numbers, old_numbers, notification_bot, args)
-                premium_numbers_list = load_numbers(args.available_premium_numbers)
-                if len(premium_numbers_list):
-                    executor = ThreadPoolExecutor(max_workers=2)
-                    info = load_info_to_book(args.numbers_to_book)
-                    futures = []
-                    for premium_number, info_row in zip(premium_numbers_list, info):
-                        futures.append(executor.submit(booking_process, premium_number, info_row, notification_bot, args))
-                    for future in futures:
-                        try:
-                            if p_number := future.result():
-                                premium_numbers_list.remove(p_number)
-                                save_numbers([int(n) for n in premium_numbers_list], args.available_premium_numbers)
-                        except Exception as e:
-                            logger.error('Error on booking: %s', e)
-                    remove_saved_info(args.numbers_to_book, args.booked_numbers)
-                    for premium_number in premium_numbers_list:
-                        logger.warning('Premium number %s was not booked', premium_number)
-            else:
-                logger.warning('No numbers found!')
-                time.sleep(args.interval)
-        except KeyboardInterrupt:
-            logger.info('Stopped.')
-            break
-        except (requests.RequestException, HTTPException) as e:
-            logger.error('Request failed: %s', e)
-        except Exception as e:
-            logger.exception('Unknown error occurred: %s', e)
+    configure_logging(args.log_file)
+    logger.info('Getting numbers from %s...', args.numbers_source or args.url or 'touch.com.lb')
+    # Only the offline classification is imported by default, the engine loads the network and bot libraries
+    if args.export_old_numbers:
+        from booking_engine import open_seen_numbers
+        open_seen_numbers(args).export_json(args.old_numbers_file_name)
+    elif args.export_booking_queue:
+        from booking_engine import export_booking_queue
+        export_booking_queue(args)
+    elif args.numbers_source:
+        premium_number_categories = get_file_premium_numbers(args.numbers_source, args.chunk_size, args.processes)
+        for category, p_numbers in premium_number_categories.items():
+            if len(p_numbers) > 0:
+                logger.info(f'{category}: {p_numbers}')
+        logger.info('Excluded abc_only: %s', get_excluded_abc_only(premium_number_categories))
+    else:
+        from booking_engine import run
+        run(args)
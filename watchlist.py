@@ -0,0 +1,109 @@
+import re
+
+from premium_numbers import categories
+
+entry_separator_re = re.compile(r'[\s,]+')
+
+
+class Watchlist:
+    """
+    Numbers to book in priority, compiled once into a hash map of the exact numbers and a digit trie of the wildcard
+    patterns, so matching a number costs one lookup and one walk of its digits whatever the count of entries.
+
+    An entry is an exact number (71123456), a pattern where x matches any digit (71xx1234) and a trailing * matches
+    any end (7112*), or a category name of premium_numbers.py (aab_ccb). It may be followed by its priority, 0 by
+    default: the numbers with the highest priority are booked first.
+    """
+
+    def __init__(self, entries=()):
+        """
+        :param entries: (entry, priority) pairs.
+        """
+        self.numbers = {}
+        self.trie = {}
+        self.categories = {}
+        for entry, priority in entries:
+            self.add(entry, priority)
+
+    def add(self, entry, priority=0):
+        entry = entry.strip().lower()
+        if entry in categories:
+            self.categories[entry] = max(self.categories.get(entry, priority), priority)
+            return
+        # The numbers are compared as integers, so the leading zeros of the 03 numbers are ignored
+        pattern = entry.lstrip('0')
+        if not re.fullmatch(r'[\dx]+\*?', pattern):
+            raise ValueError(f'Invalid watchlist entry: {entry}')
+        if pattern.isdigit():
+            number = int(pattern)
+            self.numbers[number] = max(self.numbers.get(number, priority), priority)
+            return
+        node = self.trie
+        for char in pattern.rstrip('*'):
+            node = node.setdefault(char, {})
+        key = '*' if pattern.endswith('*') else None
+        node[key] = max(node.get(key, priority), priority)
+
+    @classmethod
+    def load(cls, file_name):
+        """
+        Load a watchlist file: one entry per line followed by its optional priority, # starting a comment.
+        """
+        entries = []
+        with open(file_name) as watchlist_file:
+            for line in watchlist_file:
+                fields = entry_separator_re.split(line.partition('#')[0].strip())
+                if fields[0]:
+                    entries.append((fields[0], int(fields[1]) if len(fields) > 1 else 0))
+        return cls(entries)
+
+    def __bool__(self):
+        return bool(self.numbers or self.trie or self.categories)
+
+    def match(self, number):
+        """
+        Get the priority of a number from the exact numbers and the patterns.
+        :param number: the number as an integer.
+        :return: the highest priority of the matching entries, or None if none matches.
+
+        :Example:
+        >>> watchlist = Watchlist([('71123456', 5), ('71xx1234', 2), ('7655*', 1), ('aab_ccb', 3)])
+        >>> watchlist.match(71123456), watchlist.match(71991234), watchlist.match(76551234), watchlist.match(71991235)
+        (5, 2, 1, None)
+        """
+        priority = self.numbers.get(number)
+        nodes = [self.trie]
+        for digit in str(number):
+            next_nodes = []
+            for node in nodes:
+                if '*' in node:
+                    priority = node['*'] if priority is None else max(priority, node['*'])
+                for child in (node.get(digit), node.get('x')):
+                    if child is not None:
+                        next_nodes.append(child)
+            nodes = next_nodes
+            if not nodes:
+                return priority
+        for node in nodes:
+            for key in (None, '*'):
+                if key in node:
+                    priority = node[key] if priority is None else max(priority, node[key])
+        return priority
+
+    def get_priorities(self, numbers, premium_number_categories):
+        """
+        Get the priorities of the watched numbers among new numbers.
+        :param numbers: the new numbers.
+        :param premium_number_categories: the new premium numbers per category, as returned by get_premium_numbers.
+        :return: a dict mapping the watched numbers to their priority.
+        """
+        priorities = {}
+        for category, priority in self.categories.items():
+            for number in premium_number_categories.get(category, ()):
+                priorities[number] = max(priorities.get(number, priority), priority)
+        if self.numbers or self.trie:
+            for number in map(int, numbers):
+                priority = self.match(number)
+                if priority is not None:
+                    priorities[number] = max(priorities.get(number, priority), priority)
+        return priorities